@@ -3,6 +3,7 @@ import type { WorldSpec, Entity } from "../types/world_spec";
 import { RoomSpace } from "./primitives/RoomSpace";
 import { PrimitiveEntity } from "./primitives/PrimitiveEntity";
 import { GlbEntity } from "./primitives/GlbEntity";
+import { InstancedEntity } from "./primitives/InstancedEntity";
 
 interface WorldRendererProps {
   worldSpec: WorldSpec;
@@ -43,6 +44,13 @@ function EntityRenderer({ entity }: EntityRendererProps) {
           <GlbEntity entity={entity} />
         </Suspense>
       );
+    case "instanced":
+      // 반복 엔티티 묶음 - 그룹(GLB는 메시)마다 draw call 하나
+      return (
+        <Suspense fallback={null}>
+          <InstancedEntity entity={entity} />
+        </Suspense>
+      );
     case "splat":
       // TODO: Implement Splat loader
       return null;
@@ -1,4 +1,5 @@
-import { useRef, useEffect } from "react";
+import { useRef, useMemo, useState, Suspense } from "react";
+import { useFrame } from "@react-three/fiber";
 import { useGLTF } from "@react-three/drei";
 import * as THREE from "three";
 import type { GlbEntity as GlbEntityType } from "../../types/world_spec";
@@ -7,30 +8,70 @@ interface GlbEntityProps {
   entity: GlbEntityType;
 }
 
+interface LodSource {
+  src: string;
+  distance: number;
+}
+
+// LOD 전환 경계에서 깜빡이지 않도록 두는 여유 거리 (m)
+const LOD_HYSTERESIS = 1;
+
+const _worldPosition = new THREE.Vector3();
+
+// src에서 public 경로 추출 (assets/models/... 형태)
+export function toModelPath(src: string) {
+  return src.startsWith("/") ? src : `/${src}`;
+}
+
+function GlbModel({ src }: { src: string }) {
+  // GLTF 로드
+  const { scene } = useGLTF(toModelPath(src));
+
+  // 씬 클론 (같은 모델을 여러 번 사용할 수 있도록) + 그림자 설정
+  const clonedScene = useMemo(() => {
+    const cloned = scene.clone();
+    cloned.traverse((child) => {
+      if (child instanceof THREE.Mesh) {
+        child.castShadow = true;
+        child.receiveShadow = true;
+      }
+    });
+    return cloned;
+  }, [scene]);
+
+  return <primitive object={clonedScene} />;
+}
+
 export function GlbEntity({ entity }: GlbEntityProps) {
-  const { src, position, rotation, scale } = entity;
+  const { src, lods, position, rotation, scale } = entity;
   const groupRef = useRef<THREE.Group>(null);
 
-  // src에서 public 경로 추출 (assets/models/... 형태)
-  const modelPath = src.startsWith("/") ? src : `/${src}`;
+  // LOD0(src) + 저해상도 단계를 거리순으로 정렬
+  const levels = useMemo<LodSource[]>(
+    () => [{ src, distance: 0 }, ...(lods ?? [])].sort((a, b) => a.distance - b.distance),
+    [src, lods]
+  );
 
-  // GLTF 로드
-  const { scene } = useGLTF(modelPath);
-
-  // 씬 클론 (같은 모델을 여러 번 사용할 수 있도록)
-  const clonedScene = scene.clone();
-
-  // 그림자 설정
-  useEffect(() => {
-    if (groupRef.current) {
-      groupRef.current.traverse((child) => {
-        if (child instanceof THREE.Mesh) {
-          child.castShadow = true;
-          child.receiveShadow = true;
-        }
-      });
+  // 가장 가벼운 단계부터 받고, 카메라가 가까워질 때만 상세 단계를 로드
+  const [level, setLevel] = useState(levels.length - 1);
+
+  useFrame(({ camera }) => {
+    if (levels.length < 2 || !groupRef.current) return;
+
+    groupRef.current.getWorldPosition(_worldPosition);
+    const distance = camera.position.distanceTo(_worldPosition);
+
+    let next = 0;
+    for (let i = levels.length - 1; i > 0; i--) {
+      // 현재보다 상세한 단계로 가려면 경계보다 여유 거리만큼 더 가까워져야 함
+      const threshold = levels[i].distance - (i <= level ? LOD_HYSTERESIS : 0);
+      if (distance >= threshold) {
+        next = i;
+        break;
+      }
     }
-  }, []);
+    if (next !== level) setLevel(next);
+  });
 
   // 위치/회전/스케일 계산
   const meshPosition: [number, number, number] = position
@@ -45,9 +86,14 @@ export function GlbEntity({ entity }: GlbEntityProps) {
     ? [scale[0], scale[1], scale[2]]
     : [1, 1, 1];
 
+  const coarsest = levels[levels.length - 1].src;
+
   return (
     <group ref={groupRef} position={meshPosition} rotation={meshRotation} scale={meshScale}>
-      <primitive object={clonedScene} />
+      {/* 상세 단계를 받는 동안 이미 로드된 가장 가벼운 단계를 표시 */}
+      <Suspense fallback={level !== levels.length - 1 ? <GlbModel src={coarsest} /> : null}>
+        <GlbModel src={levels[level].src} />
+      </Suspense>
     </group>
   );
 }
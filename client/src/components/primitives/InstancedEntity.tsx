@@ -0,0 +1,123 @@
+import { useEffect, useLayoutEffect, useMemo, useRef } from "react";
+import { useGLTF } from "@react-three/drei";
+import * as THREE from "three";
+import type {
+  GlbTemplate,
+  InstancedEntity as InstancedEntityType,
+  PrimitiveTemplate,
+} from "../../types/world_spec";
+import { PrimitiveGeometry, getDefaultColor, getDefaultSize } from "./PrimitiveEntity";
+import { toModelPath } from "./GlbEntity";
+
+interface InstancedEntityProps {
+  entity: InstancedEntityType;
+}
+
+interface InstancesProps<T> {
+  template: T;
+  transforms: number[];
+  stride: number;
+}
+
+const _position = new THREE.Vector3();
+const _euler = new THREE.Euler();
+const _quaternion = new THREE.Quaternion();
+const _scale = new THREE.Vector3();
+const _matrix = new THREE.Matrix4();
+
+// transforms의 i번째 인스턴스 (position, +rotation, +scale) → 행렬
+function instanceMatrix(transforms: number[], stride: number, i: number, offsetY: number, target: THREE.Matrix4) {
+  const o = i * stride;
+  _position.set(transforms[o], transforms[o + 1] + offsetY, transforms[o + 2]);
+  _euler.set(stride >= 6 ? transforms[o + 3] : 0, stride >= 6 ? transforms[o + 4] : 0, stride >= 6 ? transforms[o + 5] : 0);
+  _quaternion.setFromEuler(_euler);
+  if (stride === 9) {
+    _scale.set(transforms[o + 6], transforms[o + 7], transforms[o + 8]);
+  } else {
+    _scale.set(1, 1, 1);
+  }
+  return target.compose(_position, _quaternion, _scale);
+}
+
+function InstancedPrimitive({ template, transforms, stride }: InstancesProps<PrimitiveTemplate>) {
+  const { primitive, size, color, role } = template;
+  const meshRef = useRef<THREE.InstancedMesh>(null);
+  const count = Math.floor(transforms.length / stride);
+
+  const entitySize = useMemo(() => size || getDefaultSize(primitive, role), [size, primitive, role]);
+
+  useLayoutEffect(() => {
+    const mesh = meshRef.current;
+    if (!mesh) return;
+    // PrimitiveEntity와 같이 바닥 기준 위치 → 메시 중심은 size.y / 2 위
+    for (let i = 0; i < count; i++) {
+      mesh.setMatrixAt(i, instanceMatrix(transforms, stride, i, entitySize[1] / 2, _matrix));
+    }
+    mesh.instanceMatrix.needsUpdate = true;
+    mesh.computeBoundingSphere();
+  }, [transforms, stride, count, entitySize]);
+
+  return (
+    <instancedMesh ref={meshRef} args={[undefined, undefined, count]} castShadow receiveShadow>
+      <PrimitiveGeometry type={primitive} size={entitySize} />
+      <meshStandardMaterial color={color || getDefaultColor(role)} />
+    </instancedMesh>
+  );
+}
+
+function InstancedGlb({ template, transforms, stride }: InstancesProps<GlbTemplate>) {
+  const { scene } = useGLTF(toModelPath(template.src));
+  const count = Math.floor(transforms.length / stride);
+
+  // 모델 안의 메시마다 InstancedMesh 하나 (geometry/material은 GLTF 캐시와 공유)
+  const meshes = useMemo(() => {
+    scene.updateMatrixWorld(true);
+    const parts: THREE.InstancedMesh[] = [];
+    scene.traverse((child) => {
+      if (!(child instanceof THREE.Mesh)) return;
+      const mesh = new THREE.InstancedMesh(child.geometry, child.material, count);
+      mesh.castShadow = true;
+      mesh.receiveShadow = true;
+      for (let i = 0; i < count; i++) {
+        mesh.setMatrixAt(i, instanceMatrix(transforms, stride, i, 0, _matrix).multiply(child.matrixWorld));
+      }
+      mesh.computeBoundingSphere();
+      parts.push(mesh);
+    });
+    return parts;
+  }, [scene, transforms, stride, count]);
+
+  // 인스턴스 버퍼만 해제 (공유 geometry/material은 그대로)
+  useEffect(() => () => meshes.forEach((mesh) => mesh.dispose()), [meshes]);
+
+  return (
+    <>
+      {meshes.map((mesh) => (
+        <primitive key={mesh.uuid} object={mesh} />
+      ))}
+    </>
+  );
+}
+
+export function InstancedEntity({ entity }: InstancedEntityProps) {
+  const { template, transforms, stride, position, rotation, scale } = entity;
+
+  // 그룹 변환 → 인스턴스 변환 순서로 적용
+  const groupRotation: [number, number, number] = rotation
+    ? [rotation[0], rotation[1], rotation[2]]
+    : [0, 0, 0];
+
+  const groupScale: [number, number, number] = scale
+    ? [scale[0], scale[1], scale[2]]
+    : [1, 1, 1];
+
+  return (
+    <group position={position} rotation={groupRotation} scale={groupScale}>
+      {template.assetType === "primitive" ? (
+        <InstancedPrimitive template={template} transforms={transforms} stride={stride} />
+      ) : (
+        <InstancedGlb template={template} transforms={transforms} stride={stride} />
+      )}
+    </group>
+  );
+}
@@ -46,7 +46,7 @@ interface PrimitiveGeometryProps {
   size: [number, number, number];
 }
 
-function PrimitiveGeometry({ type, size }: PrimitiveGeometryProps) {
+export function PrimitiveGeometry({ type, size }: PrimitiveGeometryProps) {
   const [width, height, depth] = size;
 
   switch (type) {
@@ -73,7 +73,7 @@ function PrimitiveGeometry({ type, size }: PrimitiveGeometryProps) {
   }
 }
 
-function getDefaultSize(
+export function getDefaultSize(
   primitive: string,
   role?: string
 ): [number, number, number] {
@@ -98,7 +98,7 @@ function getDefaultSize(
   }
 }
 
-function getDefaultColor(role?: string): string {
+export function getDefaultColor(role?: string): string {
   switch (role) {
     case "character":
       return "#4A90D9"; // Blue
@@ -1,3 +1,4 @@
 export { RoomSpace } from "./RoomSpace";
 export { PrimitiveEntity } from "./PrimitiveEntity";
 export { GlbEntity } from "./GlbEntity";
+export { InstancedEntity } from "./InstancedEntity";
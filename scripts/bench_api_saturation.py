@@ -0,0 +1,145 @@
+"""
+API Saturation Benchmark
+스텁 파이프라인(CPU)으로 워커 큐를 포화시킨 상태에서 API 응답 지연을 측정합니다.
+
+사용법:
+    python scripts/bench_api_saturation.py --requests 50 --workers 2 --queue-size 4 --delay 2
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def start_server(port: int, workers: int, queue_size: int, delay: float) -> subprocess.Popen:
+    """스텁 워커로 API 서버 실행"""
+    env = {
+        **os.environ,
+        "WORKER_PIPELINE": "stub",
+        "WORKER_STUB_DELAY": str(delay),
+        "GPU_WORKERS": str(workers),
+        "GPU_QUEUE_SIZE": str(queue_size),
+        "GPU_JOB_SECONDS": str(delay),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=PROJECT_ROOT / "server",
+        env=env,
+    )
+
+
+async def wait_ready(client: httpx.AsyncClient, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("Server did not start")
+
+
+async def probe_latency(client: httpx.AsyncClient, path: str, stop: asyncio.Event, samples: list[float]):
+    """포화 상태 동안 주기적으로 GET 요청 지연 측정"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(path)
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.05)
+
+
+async def run(args):
+    base_url = f"http://127.0.0.1:{args.port}"
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+        await wait_ready(client)
+
+        post_latencies: list[float] = []
+        statuses: dict[int, int] = {}
+        retry_afters: list[int] = []
+        job_ids: list[str] = []
+
+        async def submit(i: int):
+            start = time.perf_counter()
+            response = await client.post("/api/generate", json={"prompt": f"bench object {i}"})
+            post_latencies.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                job_ids.append(response.json()["job_id"])
+            elif "retry-after" in response.headers:
+                retry_afters.append(int(response.headers["retry-after"]))
+
+        await asyncio.gather(*(submit(i) for i in range(args.requests)))
+
+        stop = asyncio.Event()
+        root_samples: list[float] = []
+        status_samples: list[float] = []
+        probes = [
+            asyncio.create_task(probe_latency(client, "/", stop, root_samples)),
+            asyncio.create_task(probe_latency(client, f"/api/generate/{job_ids[0]}", stop, status_samples)),
+        ]
+
+        # 수락된 작업이 모두 끝날 때까지 대기
+        start = time.perf_counter()
+        pending = set(job_ids)
+        while pending:
+            for job_id in list(pending):
+                job = (await client.get(f"/api/generate/{job_id}")).json()
+                if job["status"] in ("completed", "failed"):
+                    pending.discard(job_id)
+            await asyncio.sleep(0.2)
+        drain_seconds = time.perf_counter() - start
+
+        stop.set()
+        await asyncio.gather(*probes)
+
+    print("=" * 60)
+    print(f"Requests: {args.requests}, workers: {args.workers}, queue: {args.queue_size}, delay: {args.delay}s")
+    print(f"Status codes: {statuses}")
+    if retry_afters:
+        print(f"Retry-After: min {min(retry_afters)}s, max {max(retry_afters)}s")
+    print(f"POST latency    p50 {percentile(post_latencies, 50):7.2f} ms  p99 {percentile(post_latencies, 99):7.2f} ms")
+    print(f"GET / latency   p50 {percentile(root_samples, 50):7.2f} ms  p99 {percentile(root_samples, 99):7.2f} ms")
+    print(f"GET job latency p50 {percentile(status_samples, 50):7.2f} ms  p99 {percentile(status_samples, 99):7.2f} ms")
+    if status_samples:
+        print(f"GET job mean    {statistics.mean(status_samples):7.2f} ms over {len(status_samples)} samples")
+    print(f"Queue drained in {drain_seconds:.1f}s")
+    print("=" * 60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API latency under worker queue saturation")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=4)
+    parser.add_argument("--delay", type=float, default=2.0, help="스텁 작업 소요 시간 (초)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = start_server(args.port, args.workers, args.queue_size, args.delay)
+    try:
+        asyncio.run(run(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Asset Index Benchmark
+합성 키워드(한국어/영어)로 10만 개 규모의 AssetIndex를 만들고 정확 일치/오타/자리 바뀜/여러 단어 문구의
+검색 지연과 top-1 정확도를 측정합니다. 비교용으로 전체 키워드 선형 탐색 지연도 측정합니다.
+
+사용법:
+    python scripts/bench_asset_index.py --keywords 100000 --queries 2000
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server"))
+
+from services.asset_index import AssetIndex, normalize_keyword, ngrams  # noqa: E402
+
+ENGLISH_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+KEYWORDS_PER_ASSET = 4
+
+
+def random_hangul(rng: random.Random, syllables: int) -> str:
+    return "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(syllables))
+
+
+def random_english(rng: random.Random) -> str:
+    return "".join(rng.choice(ENGLISH_LETTERS) for _ in range(rng.randint(4, 10)))
+
+
+def hangul_typo(rng: random.Random, word: str) -> str:
+    """음절 하나의 중성을 바꾼 오타 (자모 하나 차이)"""
+    i = rng.randrange(len(word))
+    code = ord(word[i]) - 0xAC00
+    jung = (code % 588 // 28 + rng.choice([-1, 1])) % 21
+    typo = chr(0xAC00 + code // 588 * 588 + jung * 28 + code % 28)
+    return word[:i] + typo + word[i + 1:]
+
+
+def english_typo(rng: random.Random, word: str) -> str:
+    """문자 하나를 바꾼 오타"""
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + rng.choice(ENGLISH_LETTERS.replace(word[i], "")) + word[i + 1:]
+
+
+def transposition_typo(rng: random.Random, word: str) -> str:
+    """붙은 두 문자를 바꾼 오타"""
+    i = rng.randrange(len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def make_assets(count: int, rng: random.Random) -> list[dict]:
+    assets, seen = [], set()
+    for i in range(count):
+        keywords = []
+        while len(keywords) < KEYWORDS_PER_ASSET:
+            keyword = random_hangul(rng, rng.randint(2, 4)) if len(keywords) % 2 == 0 else random_english(rng)
+            if keyword not in seen:
+                seen.add(keyword)
+                keywords.append(keyword)
+        assets.append({"path": f"synthetic/{i}.glb", "category": "synthetic", "name": keywords[0], "keywords": keywords})
+    return assets
+
+
+def make_queries(assets: list[dict], count: int, rng: random.Random) -> dict[str, list[tuple[str, str]]]:
+    """종류별 (검색어, 정답 경로) 목록"""
+    queries = {"exact": [], "hangul typo": [], "english typo": [], "transposition": [], "phrase": []}
+    for _ in range(count):
+        asset = rng.choice(assets)
+        korean, english = asset["keywords"][0], asset["keywords"][1]
+        queries["exact"].append((rng.choice(asset["keywords"]), asset["path"]))
+        queries["hangul typo"].append((hangul_typo(rng, korean), asset["path"]))
+        queries["english typo"].append((english_typo(rng, english), asset["path"]))
+        queries["transposition"].append((transposition_typo(rng, english), asset["path"]))
+        queries["phrase"].append((f"{random_english(rng)} {english} {random_hangul(rng, 2)}", asset["path"]))
+    return queries
+
+
+def linear_scan(keywords: list[tuple[str, set]], query: str) -> int:
+    """색인 없이 모든 키워드와 Dice 계수 비교"""
+    grams = ngrams(normalize_keyword(query))
+    best, best_id = 0.0, -1
+    for i, (_, keyword_grams) in enumerate(keywords):
+        score = 2 * len(grams & keyword_grams) / (len(grams) + len(keyword_grams))
+        if score > best:
+            best, best_id = score, i
+    return best_id
+
+
+def percentile(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AssetIndex latency/accuracy at scale")
+    parser.add_argument("--keywords", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--linear-queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    assets = make_assets(args.keywords // KEYWORDS_PER_ASSET, rng)
+
+    start = time.perf_counter()
+    index = AssetIndex(assets=assets)
+    build_seconds = time.perf_counter() - start
+    stats = index.stats()
+
+    queries = make_queries(assets, args.queries, rng)
+
+    print("=" * 78)
+    print(f"Assets: {stats['assets']}, keywords: {stats['keywords']}, n-grams: {stats['ngrams']}, "
+          f"build {build_seconds:.2f}s")
+    print("-" * 78)
+    print(f"{'query kind':<14} {'p50 us':>9} {'p99 us':>9} {'cached us':>10} {'top-1':>7}")
+    for kind, items in queries.items():
+        latencies, hits = [], 0
+        for query, expected in items:
+            t = time.perf_counter()
+            results = index.search(query, k=5)
+            latencies.append((time.perf_counter() - t) * 1e6)
+            hits += bool(results) and results[0]["path"] == expected
+
+        cached = []
+        for query, _ in items[:200]:
+            t = time.perf_counter()
+            index.search(query, k=5)
+            cached.append((time.perf_counter() - t) * 1e6)
+
+        print(f"{kind:<14} {percentile(latencies, 0.5):9.1f} {percentile(latencies, 0.99):9.1f} "
+              f"{percentile(cached, 0.5):10.1f} {hits / len(items):7.1%}")
+
+    keywords = [(k, ngrams(k)) for k in index._current().keywords]
+    linear = []
+    for query, _ in queries["hangul typo"][:args.linear_queries]:
+        t = time.perf_counter()
+        linear_scan(keywords, query)
+        linear.append((time.perf_counter() - t) * 1e6)
+    print("-" * 78)
+    print(f"{'linear scan':<14} {percentile(linear, 0.5):9.1f} {percentile(linear, 0.99):9.1f}")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
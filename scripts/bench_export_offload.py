@@ -0,0 +1,120 @@
+"""
+GLB Export Offload Benchmark
+스텁 파이프라인(CPU)으로 GLB 후처리를 워커 스레드에서 실행할 때와 별도 프로세스 풀에서 실행할 때의
+재구성(GPU) 단계 처리량을 비교합니다.
+
+스텁 작업의 cpu_fraction 만큼은 GIL을 잡은 Python 연산이므로, 같은 프로세스의 내보내기 스레드가
+재구성 스레드와 GIL을 두고 경합하는 상황을 재현합니다.
+
+사용법:
+    python scripts/bench_export_offload.py --jobs 12 --delay 1.0 --export-delay 1.0 --cpu-fraction 0.8
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server"))
+
+from services.worker import StubPipeline, build_generation_pipeline, create_export_pool  # noqa: E402
+
+
+def make_jobs(count: int, output_dir: Path) -> list[dict]:
+    return [
+        {
+            "job_id": f"job-{i}",
+            "kind": "image",
+            "image_path": str(output_dir / "input.png"),
+            "output_path": str(output_dir / f"job-{i}.glb"),
+            "started_at": time.perf_counter(),
+        }
+        for i in range(count)
+    ]
+
+
+def run(pipeline: StubPipeline, jobs: list[dict], export_pool, export_workers: int) -> tuple[float, dict]:
+    finished = threading.Semaphore(0)
+    failures = []
+
+    def on_finished(job: dict, status: str):
+        if status != "completed":
+            failures.append(job["job_id"])
+        finished.release()
+
+    staged = build_generation_pipeline(
+        pipeline,
+        emit=lambda event: None,
+        on_finished=on_finished,
+        export_pool=export_pool,
+        export_workers=export_workers,
+    )
+    staged.start()
+
+    start = time.perf_counter()
+    for job in jobs:
+        staged.submit(job)
+    for _ in jobs:
+        finished.acquire()
+    elapsed = time.perf_counter() - start
+
+    stats = staged.stats()
+    staged.stop()
+    if failures:
+        raise RuntimeError(f"{len(failures)} jobs failed")
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-process vs process-pool GLB export")
+    parser.add_argument("--jobs", type=int, default=12)
+    parser.add_argument("--delay", type=float, default=1.0, help="스텁 작업 1건의 기준 시간 (초, 재구성 = 50%%)")
+    parser.add_argument("--export-delay", type=float, default=1.0, help="GLB 후처리 시간 (초)")
+    parser.add_argument("--cpu-fraction", type=float, default=0.8, help="GIL을 잡고 Python 연산하는 시간 비율")
+    parser.add_argument("--export-processes", type=int, default=2)
+    args = parser.parse_args()
+
+    pipeline = StubPipeline(delay=args.delay, cpu_fraction=args.cpu_fraction)
+    pipeline.image_to_3d.export_delay = args.export_delay
+    reconstruct_delay = pipeline.image_to_3d.reconstruct_delay
+
+    from PIL import Image
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        Image.new("RGB", (64, 64), (255, 255, 255)).save(Path(tmp_dir) / "input.png")
+
+        results["in-process"] = run(pipeline, make_jobs(args.jobs, Path(tmp_dir)), None, 1)
+
+        export_pool = create_export_pool(
+            "stub",
+            processes=args.export_processes,
+            stub_options={"export_delay": args.export_delay, "cpu_fraction": args.cpu_fraction},
+        )
+        # 프로세스 기동 시간은 측정에서 제외
+        export_pool.submit(time.sleep, 0).result()
+        results["process-pool"] = run(pipeline, make_jobs(args.jobs, Path(tmp_dir)), export_pool, args.export_processes)
+        export_pool.shutdown()
+
+    print("=" * 72)
+    print(
+        f"Jobs: {args.jobs}, reconstruct {reconstruct_delay:.2f}s, export {args.export_delay:.2f}s, "
+        f"cpu fraction {args.cpu_fraction}, export processes {args.export_processes}"
+    )
+    print(f"GPU-bound limit: {args.jobs * reconstruct_delay:.2f}s ({1 / reconstruct_delay:.2f} jobs/s)")
+    print("-" * 72)
+    for name, (elapsed, stats) in results.items():
+        reconstruct = stats["reconstruct"]
+        print(
+            f"{name:>13}: total {elapsed:6.2f}s  {args.jobs / elapsed:5.2f} jobs/s  "
+            f"reconstruct avg {reconstruct['avg_seconds']:.3f}s  "
+            f"GPU-stage throughput {1 / reconstruct['avg_seconds']:5.2f} jobs/s  "
+            f"utilization {reconstruct['utilization']:.2f}"
+        )
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Image Model Hedging Benchmark
+로컬 가짜 Gemini/Imagen 클라이언트로 순차 폴백과 헤징 모드의 지연을 비교합니다.
+
+사용법:
+    python scripts/bench_image_hedging.py --runs 50 --hedge-delay 0.5
+"""
+
+import io
+import sys
+import time
+import random
+import asyncio
+import argparse
+import contextlib
+from types import SimpleNamespace
+from pathlib import Path
+
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from text_to_3d_pipeline import TextToImageGenerator, CircuitBreaker, IMAGE_MODELS  # noqa: E402
+
+
+def _png_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (255, 255, 255)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+PNG = _png_bytes()
+
+
+class FakeModels:
+    """모델별 지연/실패율을 흉내내는 genai aio.models 대체"""
+
+    def __init__(self, profiles: dict, rng: random.Random):
+        self.profiles = profiles
+        self.rng = rng
+        self.calls: dict[str, int] = {}
+
+    async def _simulate(self, model: str) -> bool:
+        self.calls[model] = self.calls.get(model, 0) + 1
+        mean, tail_prob, tail, fail_rate = self.profiles[model]
+        latency = tail if self.rng.random() < tail_prob else self.rng.uniform(0.5 * mean, 1.5 * mean)
+        await asyncio.sleep(latency)
+        return self.rng.random() >= fail_rate
+
+    async def generate_content(self, model, contents, config):
+        if not await self._simulate(model):
+            raise RuntimeError("429 RESOURCE_EXHAUSTED")
+        part = SimpleNamespace(inline_data=SimpleNamespace(data=PNG), text=None)
+        return SimpleNamespace(candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
+
+    async def generate_images(self, model, prompt, config):
+        if not await self._simulate(model):
+            raise RuntimeError("503 UNAVAILABLE")
+        image = SimpleNamespace(image=SimpleNamespace(image_bytes=PNG))
+        return SimpleNamespace(generated_images=[image])
+
+
+FAKE_TYPES = SimpleNamespace(
+    GenerateContentConfig=lambda **kwargs: kwargs,
+    GenerateImagesConfig=lambda **kwargs: kwargs,
+)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def run_mode(hedge: bool, breaker: bool, args, profiles: dict) -> tuple[list[float], int, dict]:
+    models = FakeModels(profiles, random.Random(args.seed))
+    client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    generator = TextToImageGenerator(
+        api_key=None,
+        client=client,
+        types=FAKE_TYPES,
+        hedge=hedge,
+        hedge_delay=args.hedge_delay,
+        model_timeouts={model: args.timeout for model in IMAGE_MODELS},
+    )
+    if not breaker:
+        generator.breakers = {model: CircuitBreaker(failure_threshold=10**9) for model in IMAGE_MODELS}
+    else:
+        generator.breakers = {model: CircuitBreaker(cooldown=args.cooldown) for model in IMAGE_MODELS}
+
+    latencies = []
+    failures = 0
+    output_path = Path(args.output_dir) / "bench_image.png"
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            image = generator.generate("a wooden chair", str(output_path))
+        latencies.append(time.perf_counter() - start)
+        failures += image is None
+    output_path.unlink(missing_ok=True)
+    return latencies, failures, models.calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs hedged image model fallback")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--hedge-delay", type=float, default=0.5)
+    parser.add_argument("--timeout", type=float, default=2.0, help="모델별 타임아웃 (초)")
+    parser.add_argument("--cooldown", type=float, default=3.0, help="서킷 브레이커 차단 시간 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output-dir", default="/tmp")
+    args = parser.parse_args()
+
+    # 모델별 (평균 지연, 꼬리 지연 확률, 꼬리 지연, 실패율)
+    profiles = {
+        IMAGE_MODELS[0]: (0.3, 0.25, 3.0, 0.2),
+        IMAGE_MODELS[1]: (0.4, 0.05, 2.5, 0.05),
+        IMAGE_MODELS[2]: (0.6, 0.0, 0.0, 0.02),
+    }
+
+    print("=" * 60)
+    print(f"Runs: {args.runs}, hedge delay: {args.hedge_delay}s, timeout: {args.timeout}s, cooldown: {args.cooldown}s")
+    modes = [
+        ("sequential", False, False),
+        ("sequential+breaker", False, True),
+        ("hedged+breaker", True, True),
+    ]
+    for name, hedge, breaker in modes:
+        latencies, failures, calls = run_mode(hedge, breaker, args, profiles)
+        print(
+            f"{name:>18}: p50 {percentile(latencies, 50):5.2f}s  p95 {percentile(latencies, 95):5.2f}s  "
+            f"max {max(latencies):5.2f}s  failures {failures}  calls {sum(calls.values())}"
+        )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Staged Pipeline Benchmark
+스텁 파이프라인(CPU)으로 순차 실행과 단계별 파이프라인 실행의 처리량을 비교합니다.
+
+사용법:
+    python scripts/bench_staged_pipeline.py --jobs 20 --delay 1.0
+"""
+
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server"))
+
+from services.worker import StubPipeline, build_generation_pipeline  # noqa: E402
+
+
+def make_jobs(count: int, output_dir: Path) -> list[dict]:
+    return [
+        {
+            "job_id": f"job-{i}",
+            "kind": "text",
+            "prompt": f"object {i}",
+            "output_path": str(output_dir / f"job-{i}.glb"),
+            "image_output_path": str(output_dir / f"job-{i}.png"),
+            "started_at": time.perf_counter(),
+        }
+        for i in range(count)
+    ]
+
+
+def run_sequential(pipeline: StubPipeline, jobs: list[dict]) -> float:
+    start = time.perf_counter()
+    for job in jobs:
+        image = pipeline.generate_image(job["prompt"], job["image_output_path"])
+        mesh = pipeline.image_to_3d.reconstruct(image)
+        pipeline.image_to_3d.export_glb(mesh, job["output_path"])
+    return time.perf_counter() - start
+
+
+def run_staged(pipeline: StubPipeline, jobs: list[dict]) -> tuple[float, dict]:
+    finished = threading.Semaphore(0)
+    staged = build_generation_pipeline(pipeline, emit=lambda event: None, on_finished=lambda job, status: finished.release())
+    staged.start()
+
+    start = time.perf_counter()
+    for job in jobs:
+        staged.submit(job)
+    for _ in jobs:
+        finished.acquire()
+    elapsed = time.perf_counter() - start
+
+    stats = staged.stats()
+    staged.stop()
+    return elapsed, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs staged generation throughput")
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=1.0, help="스텁 작업 1건의 총 소요 시간 (초)")
+    args = parser.parse_args()
+
+    pipeline = StubPipeline(delay=args.delay)
+    gpu_bound = args.jobs * pipeline.image_to_3d.reconstruct_delay
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        sequential = run_sequential(pipeline, make_jobs(args.jobs, Path(tmp_dir)))
+        staged, stats = run_staged(pipeline, make_jobs(args.jobs, Path(tmp_dir)))
+
+    print("=" * 60)
+    print(f"Jobs: {args.jobs}, per-job delay: {args.delay}s (GPU-bound limit {gpu_bound:.1f}s)")
+    print(f"Sequential: {sequential:6.2f}s  ({args.jobs / sequential:.2f} jobs/s)")
+    print(f"Staged:     {staged:6.2f}s  ({args.jobs / staged:.2f} jobs/s)")
+    print("-" * 60)
+    for name, stage in stats.items():
+        print(
+            f"{name:>12}: workers {stage['workers']}  processed {stage['processed']:3d}  "
+            f"utilization {stage['utilization']:.2f}  avg {stage['avg_seconds']}s"
+        )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+World Binary Benchmark
+같은 월드를 JSON과 바이너리 WorldSpec(application/vnd.worldspec+binary)으로 보냈을 때의
+전송 크기(gzip 포함)와 인코딩/파싱 시간을 비교합니다.
+파이썬 모델과의 왕복 변환(벡터는 float32 정밀도)이 같은지 함께 확인하고, node가 있으면
+클라이언트 디코더(client/src/types/world_spec.ts)의 결과와 파싱 시간도 측정합니다.
+형식 자체의 테스트(모든 필드 조합, 잘린/잘못된 입력)는 tests/test_world_binary.py에 있습니다.
+
+사용법:
+    python scripts/bench_world_binary.py --entities 1000 10000 100000
+    # 타입 제거를 지원하지 않는 node (< 22.6)에서는 빌드된 JS 디코더 지정
+    python scripts/bench_world_binary.py --decoder /tmp/world_spec.mjs
+"""
+
+import gc
+import sys
+import json
+import gzip
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_binary import encode_world, decode_world  # noqa: E402
+from bench_world_store import make_world  # noqa: E402
+
+CLIENT_DECODER = PROJECT_ROOT / "client" / "src" / "types" / "world_spec.ts"
+
+# node에서 JSON.parse와 디코더를 번갈아 실행해 중앙값 시간과 결과 일치 여부를 출력
+NODE_BENCH = """
+import { readFileSync } from "node:fs";
+const { decodeWorldSpecBinary } = await import(process.argv[2]);
+const [jsonPath, binaryPath, expectedPath, repeat] = process.argv.slice(3);
+const text = readFileSync(jsonPath, "utf8");
+const file = readFileSync(binaryPath);
+const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength);
+const canonical = (value) => Array.isArray(value) ? value.map(canonical)
+  : value && typeof value === "object"
+    ? Object.fromEntries(Object.keys(value).sort().map((key) => [key, canonical(value[key])]))
+    : value;
+const median = (fn) => {
+  const times = [];
+  for (let i = 0; i < Number(repeat); i++) {
+    const start = performance.now();
+    fn();
+    times.push(performance.now() - start);
+  }
+  return times.sort((a, b) => a - b)[Math.floor(times.length / 2)];
+};
+const decoded = decodeWorldSpecBinary(buffer).worldSpec;
+const expected = JSON.parse(readFileSync(expectedPath, "utf8"));
+console.log(JSON.stringify({
+  json_ms: median(() => JSON.parse(text)),
+  binary_ms: median(() => decodeWorldSpecBinary(buffer)),
+  match: JSON.stringify(canonical(decoded)) === JSON.stringify(canonical(expected)),
+}));
+"""
+
+
+def float32_rounded(value):
+    """바이너리 전송 후 기대값 (모든 실수를 float32로 반올림)"""
+    if isinstance(value, float):
+        return float(np.float32(value))
+    if isinstance(value, (list, tuple)):
+        return [float32_rounded(v) for v in value]
+    if isinstance(value, dict):
+        return {k: float32_rounded(v) for k, v in value.items()}
+    return value
+
+
+def timed(fn, repeat: int = 3) -> float:
+    """중앙값 초"""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def node_command(decoder: str | None) -> list[str] | None:
+    """클라이언트 디코더를 실행할 node 명령 (실행할 수 없으면 None)"""
+    node = shutil.which("node")
+    if node is None:
+        return None
+    if decoder:
+        return [node]
+    probe = subprocess.run([node, "--experimental-strip-types", "-e", ""], capture_output=True)
+    return [node, "--experimental-strip-types", "--no-warnings"] if probe.returncode == 0 else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Binary WorldSpec vs JSON transport")
+    parser.add_argument("--entities", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--decoder", help="클라이언트 디코더 모듈 (기본: client/src/types/world_spec.ts)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    node = node_command(args.decoder)
+    decoder = Path(args.decoder or CLIENT_DECODER).resolve().as_uri()
+    if node is None:
+        print("node with TypeScript type stripping not found - client decoder skipped (use --decoder)")
+
+    print("=" * 108)
+    print(f"{'entities':>9} {'json KB':>9} {'bin KB':>8} {'json gz':>8} {'bin gz':>8} {'encode ms':>10} "
+          f"{'py json ms':>11} {'py bin ms':>10} {'js json ms':>11} {'js bin ms':>10} {'round-trip':>11}")
+    print("-" * 108)
+    for count in args.entities:
+        spec = WorldSpec.model_validate(make_world(count, rng))
+        spec_dict = spec.model_dump(by_alias=True, exclude_none=True)
+        expected = spec.model_dump(mode="json", by_alias=True, exclude_none=True)
+        # 서버 JSON 응답과 같은 직렬화 (FastAPI/Starlette JSONResponse)
+        text = json.dumps(expected, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        binary = encode_world(spec_dict)
+
+        # 파이썬 모델과 왕복 변환 확인
+        store, meta = decode_world(binary)
+        rounded = float32_rounded(expected)
+        assert meta is None
+        assert store.to_dict() == rounded, "decoded WorldSpec differs"
+        assert store.to_spec() == WorldSpec.model_validate(rounded), "decoded WorldSpec model differs"
+        assert decode_world(encode_world(spec_dict, {"world_id": "w"}))[1] == {"world_id": "w"}, "meta differs"
+        status = "ok"
+
+        encode_ms = timed(lambda: encode_world(spec_dict), args.repeat) * 1000
+        py_json_ms = timed(lambda: json.loads(text), args.repeat) * 1000
+        py_binary_ms = timed(lambda: decode_world(binary), args.repeat) * 1000
+
+        js_json, js_binary = "-", "-"
+        if node is not None:
+            with tempfile.TemporaryDirectory() as tmp:
+                paths = {name: Path(tmp) / name for name in ("bench.mjs", "world.json", "world.bin", "expected.json")}
+                paths["bench.mjs"].write_text(NODE_BENCH)
+                paths["world.json"].write_bytes(text)
+                paths["world.bin"].write_bytes(binary)
+                paths["expected.json"].write_text(json.dumps(rounded))
+                result = subprocess.run(
+                    [*node, str(paths["bench.mjs"]), decoder, str(paths["world.json"]),
+                     str(paths["world.bin"]), str(paths["expected.json"]), str(args.repeat)],
+                    capture_output=True, text=True,
+                )
+            if result.returncode != 0:
+                print(result.stderr.strip())
+                sys.exit(1)
+            client = json.loads(result.stdout)
+            js_json, js_binary = f"{client['json_ms']:.1f}", f"{client['binary_ms']:.1f}"
+            if not client["match"]:
+                status = "JS MISMATCH"
+
+        print(f"{count:>9} {len(text) / 1024:9.1f} {len(binary) / 1024:8.1f} {len(gzip.compress(text)) / 1024:8.1f} "
+              f"{len(gzip.compress(binary)) / 1024:8.1f} {encode_ms:10.1f} {py_json_ms:11.1f} {py_binary_ms:10.1f} "
+              f"{js_json:>11} {js_binary:>10} {status:>11}")
+        if status != "ok":
+            sys.exit(1)
+    print("=" * 108)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+World Chunk Benchmark
+큰 월드를 청크로 나눴을 때 분할 시간, 플레이어 주변 청크 조회 시간과 전송 크기를
+월드 전체 JSON과 비교합니다. 플레이어가 이동하며 이미 받은 청크 ETag를 보내면
+새로 받아야 하는 크기가 얼마나 줄어드는지도 측정합니다.
+
+사용법:
+    python scripts/bench_world_chunks.py --entities 10000 100000 --radius 32
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_chunks import ChunkIndex  # noqa: E402
+from bench_world_store import make_world  # noqa: E402
+
+
+def payload(index: ChunkIndex, center, radius: float, known: set[str]) -> tuple[int, set[str], float]:
+    """(응답 크기 bytes, 응답에 담긴 ETag, 조회 초) - 라우터와 같은 형태로 직렬화"""
+    start = time.perf_counter()
+    chunks = []
+    for key, distance in index.nearest(center, radius):
+        etag = index.etag(key)
+        chunk = {"key": key, "etag": etag, "distance": round(distance, 3), "bounds": index.bounds(key)}
+        if etag in known:
+            chunk["unchanged"] = True
+        else:
+            chunk.update(index.chunk(key))
+        chunks.append(chunk)
+    body = json.dumps({"world": index.header, "chunks": chunks}, separators=(",", ":"), ensure_ascii=False)
+    seconds = time.perf_counter() - start
+    return len(body.encode("utf-8")), {chunk["etag"] for chunk in chunks}, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunked world streaming vs full WorldSpec")
+    parser.add_argument("--entities", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--radius", type=float, default=32.0)
+    parser.add_argument("--steps", type=int, default=20, help="플레이어 이동 횟수")
+    parser.add_argument("--step-size", type=float, default=4.0, help="한 번 이동 거리 (m)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("=" * 104)
+    print(f"{'entities':>9} {'full KB':>9} {'build ms':>9} {'chunks':>7} {'first KB':>9} {'first ms':>9} "
+          f"{'walk KB':>9} {'walk no-etag KB':>16} {'walk ms/step':>13}")
+    print("-" * 104)
+    for count in args.entities:
+        spec = WorldSpec.model_validate(make_world(count, rng)).model_dump(by_alias=True, exclude_none=True)
+        full = len(json.dumps(spec, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+        start = time.perf_counter()
+        index = ChunkIndex(spec)
+        build = time.perf_counter() - start
+        assert sum(len(index.chunk(key)["entities"]) for key in index.keys) == count, "entities lost in chunking"
+
+        center = list(spec["spawnpoint"])
+        first, known, first_seconds = payload(index, center, args.radius, set())
+
+        # 한 방향으로 걸으며 매번 주변 청크 요청 (ETag 재사용 vs 매번 전체 전송)
+        walked, walked_plain, walk_seconds = 0, 0, 0.0
+        for _ in range(args.steps):
+            center[0] += args.step_size
+            size, etags, seconds = payload(index, center, args.radius, known)
+            walked += size
+            walk_seconds += seconds
+            known |= etags
+            walked_plain += payload(index, center, args.radius, set())[0]
+
+        print(f"{count:>9} {full / 1024:9.1f} {build * 1000:9.1f} {len(index):>7} {first / 1024:9.1f} "
+              f"{first_seconds * 1000:9.2f} {walked / 1024:9.1f} {walked_plain / 1024:16.1f} "
+              f"{walk_seconds / args.steps * 1000:13.2f}")
+    print("=" * 104)
+
+
+if __name__ == "__main__":
+    main()
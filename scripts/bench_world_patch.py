@@ -0,0 +1,118 @@
+"""
+World Patch Benchmark
+JSON Patch 한 번(엔티티 이동/추가/삭제)의 증분 검증 지연을 전체 재검증(WorldSpec 파싱 +
+validate_world)과 비교합니다. 증분 검증은 월드 크기와 무관하게 거의 일정해야 합니다.
+이동한 엔티티의 겹침 보고가 모든 엔티티와 직접 비교한 결과와 같은지도 확인합니다.
+
+사용법:
+    python scripts/bench_world_patch.py --entities 1000 10000 100000 --patches 200
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_delta import DeltaIndex  # noqa: E402
+from services.world_validator import OVERLAP_EPSILON, EntityBounds, validate_world  # noqa: E402
+from bench_world_validator import bench_bounds, make_world  # noqa: E402
+
+
+def random_patch(spec: dict, rng: random.Random, serial: int) -> list[dict]:
+    """이동 / 추가 / 삭제 중 하나"""
+    half = spec["space"]["size"][0] / 2 - 2
+    position = [rng.uniform(-half, half), 0.0, rng.uniform(-half, half)]
+    kind = serial % 3
+    if kind == 0:
+        index = rng.randrange(len(spec["entities"]))
+        return [{"op": "replace", "path": f"/entities/{index}/position", "value": position}]
+    if kind == 1:
+        return [{"op": "add", "path": "/entities/-", "value": {
+            "id": f"added_{serial}", "assetType": "primitive", "primitive": "box",
+            "position": position, "size": [1.0, 1.0, 1.0], "role": "prop",
+        }}]
+    index = rng.randrange(len(spec["entities"]))
+    return [{"op": "remove", "path": f"/entities/{index}"}]
+
+
+def reported_partners(errors: list[str], entity_id: str) -> set[str]:
+    partners = set()
+    for error in errors:
+        if " overlaps " in error and f"'{entity_id}'" in error:
+            partners |= {name for name in error.split("'")[1::2] if name != entity_id}
+    return partners
+
+
+def actual_partners(spec: dict, entity_id: str) -> set[str]:
+    """모든 엔티티와 직접 비교한 겹침 상대 (structure/비고체 제외)"""
+    bounds = EntityBounds(WorldSpec.model_validate(spec), bench_bounds)
+    i = bounds.ids.index(entity_id)
+    if not bounds.solid[i] or bounds.structure[i]:
+        return set()
+    depth = np.minimum(bounds.maxs, bounds.maxs[i]) - np.maximum(bounds.mins, bounds.mins[i])
+    hits = np.all(depth > OVERLAP_EPSILON, axis=1) & bounds.solid & ~bounds.structure
+    hits[i] = False
+    return {bounds.ids[j] for j in np.flatnonzero(hits).tolist()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental JSON Patch validation vs full revalidation")
+    parser.add_argument("--entities", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--patches", type=int, default=200, help="월드마다 적용할 patch 수")
+    parser.add_argument("--checks", type=int, default=20, help="직접 비교로 확인할 이동 patch 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("=" * 96)
+    print(f"{'entities':>9} {'index ms':>9} {'patch ms':>9} {'p99 ms':>8} {'full ms':>9} {'speedup':>8} "
+          f"{'move':>7} {'add':>7} {'remove':>7} {'checked':>8}")
+    print("-" * 96)
+    for count in args.entities:
+        spec = make_world(count, rng).model_dump(mode="json", by_alias=True, exclude_none=True)
+
+        start = time.perf_counter()
+        delta = DeltaIndex(spec, bench_bounds)
+        index_seconds = time.perf_counter() - start
+
+        # 전체 재검증: 클라이언트가 월드 전체를 다시 보내는 경우와 같은 비용
+        start = time.perf_counter()
+        validate_world(WorldSpec.model_validate(spec), auto_fix=False, bounds_resolver=bench_bounds)
+        full_seconds = time.perf_counter() - start
+
+        latencies = {0: [], 1: [], 2: []}
+        checked = mismatched = 0
+        for serial in range(args.patches):
+            operations = random_patch(spec, rng, serial)
+            start = time.perf_counter()
+            result = delta.apply(spec, operations)
+            latencies[serial % 3].append(time.perf_counter() - start)
+
+            if serial % 3 == 0 and checked < args.checks and result["touched"]:
+                entity_id = result["touched"][0]
+                checked += 1
+                if reported_partners(result["validation"].errors, entity_id) != actual_partners(spec, entity_id):
+                    mismatched += 1
+
+        every = np.array(latencies[0] + latencies[1] + latencies[2]) * 1000
+        mean = {kind: np.mean(values) * 1000 if values else 0.0 for kind, values in latencies.items()}
+        print(f"{count:>9} {index_seconds * 1000:9.1f} {every.mean():9.3f} {np.percentile(every, 99):8.3f} "
+              f"{full_seconds * 1000:9.1f} {full_seconds * 1000 / every.mean():7.0f}x "
+              f"{mean[0]:7.3f} {mean[1]:7.3f} {mean[2]:7.3f} {f'{checked - mismatched}/{checked}':>8}")
+        if mismatched:
+            print(f"  MISMATCH: {mismatched} moved entities reported different overlaps than a direct check")
+            sys.exit(1)
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    main()
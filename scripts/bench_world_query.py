@@ -0,0 +1,142 @@
+"""
+World Query Benchmark
+R-tree 공간 질의(점/상자/반경/k-최근접/zone, role 필터)의 구성 시간과 질의 지연을
+모든 엔티티 AABB를 numpy로 한 번에 비교하는 선형 탐색과 비교하고, 결과가 같은지 확인합니다.
+
+사용법:
+    python scripts/bench_world_query.py --entities 10000 100000 --queries 500
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_query import ROLES, WorldQuery  # noqa: E402
+from bench_world_validator import bench_bounds, make_world  # noqa: E402
+
+# 방을 이 수만큼 나눈 격자 zone
+ZONES_PER_SIDE = 10
+
+
+def with_zones(spec: WorldSpec) -> WorldSpec:
+    half = spec.space.size[0] / 2
+    step = 2 * half / ZONES_PER_SIDE
+    zones = [
+        {"id": f"zone_{i}_{j}", "name": f"zone {i} {j}",
+         "bounds": [[-half + i * step, 0, -half + j * step], [-half + (i + 1) * step, 3, -half + (j + 1) * step]]}
+        for i in range(ZONES_PER_SIDE) for j in range(ZONES_PER_SIDE)
+    ]
+    return spec.model_copy(update={"zones": WorldSpec.model_validate({**spec.model_dump(by_alias=True), "zones": zones}).zones})
+
+
+class Linear:
+    """선형 탐색 기준 구현 (numpy로 전체 AABB 비교)"""
+
+    def __init__(self, query: WorldQuery):
+        self.query = query
+
+    def distance(self, point):
+        gap = np.maximum(np.maximum(self.query.mins - point, point - self.query.maxs), 0.0)
+        return np.sqrt((gap ** 2).sum(axis=1))
+
+    def mask(self, roles):
+        return np.isin(self.query.roles, [ROLES.index(r) for r in roles]) if roles else np.ones(len(self.query), bool)
+
+    def point(self, point, roles=None):
+        hit = np.all(self.query.mins <= point, axis=1) & np.all(self.query.maxs >= point, axis=1) & self.mask(roles)
+        return [self.query.ids[i] for i in np.flatnonzero(hit).tolist()]
+
+    def box(self, low, high, roles=None):
+        hit = np.all(self.query.mins <= high, axis=1) & np.all(self.query.maxs >= low, axis=1) & self.mask(roles)
+        return [self.query.ids[i] for i in np.flatnonzero(hit).tolist()]
+
+    def radius(self, point, radius, roles=None):
+        distance = self.distance(point)
+        hit = np.flatnonzero((distance <= radius) & self.mask(roles))
+        hit = hit[np.argsort(distance[hit], kind="stable")]
+        return [(self.query.ids[i], float(distance[i])) for i in hit.tolist()]
+
+    def nearest(self, point, k, roles=None):
+        distance = np.where(self.mask(roles), self.distance(point), np.inf)
+        hit = np.argsort(distance, kind="stable")[:k]
+        return [(self.query.ids[i], float(distance[i])) for i in hit.tolist() if np.isfinite(distance[i])]
+
+
+def same(a, b) -> bool:
+    """결과 비교 - 거리 목록은 거리가 같은 항목의 순서 차이를 허용"""
+    if a and isinstance(a[0], tuple):
+        return len(a) == len(b) and np.allclose([d for _, d in a], [d for _, d in b])
+    return a == b
+
+
+def timed_all(fn, points) -> tuple[list, float]:
+    start = time.perf_counter()
+    results = [fn(p) for p in points]
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="R-tree world queries vs linear scan")
+    parser.add_argument("--entities", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--queries", type=int, default=500, help="질의 종류마다 실행할 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("=" * 78)
+    print(f"{'entities':>9} {'query':>18} {'rtree ms':>10} {'linear ms':>10} {'speedup':>8} {'hits':>8} {'match':>6}")
+    for count in args.entities:
+        spec = with_zones(make_world(count, rng))
+        start = time.perf_counter()
+        query = WorldQuery(spec, bench_bounds)
+        build = time.perf_counter() - start
+        linear = Linear(query)
+        half = spec.space.size[0] / 2
+        print("-" * 78)
+        print(f"{count:>9} {'build':>18} {build * 1000:10.1f}")
+
+        def random_point():
+            return np.array([rng.uniform(-half, half), rng.uniform(0, 2), rng.uniform(-half, half)])
+
+        zone_ids = [zone.id for zone in spec.zones]
+        # (R-tree 질의, 선형 탐색) - zone 질의는 기준 구현 없이 지연만 측정
+        cases = {
+            "point": (query.point, linear.point),
+            "box 10m": (lambda p: query.box(p - 5, p + 5), lambda p: linear.box(p - 5, p + 5)),
+            "radius 5m": (lambda p: query.radius(p, 5.0), lambda p: linear.radius(p, 5.0)),
+            "nearest k=10": (lambda p: query.nearest(p, 10), lambda p: linear.nearest(p, 10)),
+            "nearest structure": (lambda p: query.nearest(p, 1, roles=["structure"]),
+                                  lambda p: linear.nearest(p, 1, roles=["structure"])),
+            "entities in zone": (lambda p: query.in_zone(zone_ids[int(p[0] * 7) % len(zone_ids)]), None),
+            "zones at point": (query.zones_at, None),
+        }
+        for name, (run, baseline) in cases.items():
+            points = [random_point() for _ in range(args.queries)]
+            results, rtree_seconds = timed_all(run, points)
+            rtree_ms = rtree_seconds / args.queries * 1000
+            hits = sum(len(result) for result in results) / args.queries
+            if baseline is None:
+                print(f"{'':>9} {name:>18} {rtree_ms:10.3f} {'-':>10} {'-':>8} {hits:8.1f} {'-':>6}")
+                continue
+            expected, linear_seconds = timed_all(baseline, points)
+            linear_ms = linear_seconds / args.queries * 1000
+            matched = all(same(a, b) for a, b in zip(results, expected))
+            print(f"{'':>9} {name:>18} {rtree_ms:10.3f} {linear_ms:10.3f} {linear_ms / rtree_ms:7.1f}x "
+                  f"{hits:8.1f} {'yes' if matched else 'NO':>6}")
+            if not matched:
+                sys.exit(1)
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
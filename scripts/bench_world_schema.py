@@ -0,0 +1,99 @@
+"""
+World Schema Validation Benchmark
+스키마에서 생성한 검증기(파싱된 JSON을 그대로 검사)와 pydantic WorldSpec 검증의 처리량을 비교합니다.
+엔티티 일부에 오류를 넣은 월드에서는 두 검증기가 같은 엔티티들을 잘못됐다고 보는지도 확인합니다.
+
+사용법:
+    python scripts/bench_world_schema.py --entities 1000 10000 100000 --invalid 0.01
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+from pathlib import Path
+
+from pydantic import ValidationError
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_schema import validate_world_json  # noqa: E402
+from bench_world_store import make_world  # noqa: E402
+
+
+# 두 검증기 모두 거절해야 하는 엔티티 오류
+FAULTS = [
+    lambda entity: entity.update(position=entity["position"][:2]),
+    lambda entity: entity.update(id=7),
+    lambda entity: entity.pop("assetType"),
+    lambda entity: entity.update(scale=[1, "big", 1]),
+    lambda entity: entity.update(assetType="glb", src="a.glb", lods=[{"src": "b.glb", "distance": -1}]),
+]
+
+
+def timed(fn, repeat: int) -> tuple[object, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def pydantic_errors(data) -> list[dict]:
+    try:
+        WorldSpec.model_validate(data)
+        return []
+    except ValidationError as e:
+        return e.errors()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generated schema validator vs pydantic WorldSpec")
+    parser.add_argument("--entities", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--invalid", type=float, default=0.01, help="오류를 넣을 엔티티 비율")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("=" * 100)
+    print(f"{'entities':>9} {'schema ms':>10} {'pydantic ms':>12} {'speedup':>8} {'loads+schema ms':>16} "
+          f"{'pydantic json ms':>17} {'bad':>6} {'schema errs':>12} {'pyd errs':>9} {'same':>5}")
+    print("-" * 100)
+    for count in args.entities:
+        data = make_world(count, rng)
+        text = json.dumps(data)
+
+        errors, schema_seconds = timed(lambda: validate_world_json(data), args.repeat)
+        assert not errors, errors[:5]
+        _, pydantic_seconds = timed(lambda: WorldSpec.model_validate(data), args.repeat)
+        _, loads_seconds = timed(lambda: validate_world_json(json.loads(text)), args.repeat)
+        _, json_seconds = timed(lambda: WorldSpec.model_validate_json(text), args.repeat)
+
+        # 오류가 있는 월드: 두 검증기가 같은 엔티티를 잘못됐다고 보는지
+        broken = json.loads(text)
+        bad = sorted(rng.sample(range(count), max(1, int(count * args.invalid))))
+        for i in bad:
+            rng.choice(FAULTS)(broken["entities"][i])
+        schema_found = validate_world_json(broken)
+        pydantic_found = pydantic_errors(broken)
+        schema_bad = {int(pointer.split("/")[2]) for pointer, _ in schema_found if pointer.startswith("/entities/")}
+        pydantic_bad = {error["loc"][1] for error in pydantic_found if error["loc"][:1] == ("entities",)}
+        same = schema_bad == pydantic_bad == set(bad)
+
+        print(f"{count:>9} {schema_seconds * 1000:10.1f} {pydantic_seconds * 1000:12.1f} "
+              f"{pydantic_seconds / schema_seconds:7.1f}x {loads_seconds * 1000:16.1f} {json_seconds * 1000:17.1f} "
+              f"{len(bad):>6} {len(schema_found):>12} {len(pydantic_found):>9} {'yes' if same else 'NO':>5}")
+        if not same:
+            sys.exit(1)
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+World Store Benchmark
+같은 월드를 pydantic WorldSpec과 열 단위 WorldStore로 읽었을 때의 메모리와
+JSON 로드/덤프, 일괄 이동, 역할 필터, 바운딩 박스 계산 시간을 비교합니다.
+WorldStore ↔ WorldSpec/JSON 변환이 손실 없는지도 함께 확인합니다.
+
+사용법:
+    python scripts/bench_world_store.py --entities 10000 100000
+"""
+
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from shared.types.world_store import WorldStore  # noqa: E402
+
+ROLES = ["character", "prop", "structure"]
+PRIMITIVES = ["box", "plane", "capsule", "sphere", "cylinder"]
+SOURCES = [f"assets/models/decor/asset_{i}.glb" for i in range(50)]
+
+
+def make_world(count: int, rng: random.Random) -> dict:
+    """프리미티브/GLB/스플랫이 섞인 월드 JSON dict"""
+    entities = []
+    for i in range(count):
+        position = [round(rng.uniform(-500, 500), 3), 0.0, round(rng.uniform(-500, 500), 3)]
+        kind = i % 10
+        if kind < 6:
+            entity = {
+                "id": f"prim_{i}", "assetType": "primitive", "primitive": rng.choice(PRIMITIVES),
+                "position": position, "role": rng.choice(ROLES),
+                "size": [rng.uniform(0.2, 3), rng.uniform(0.2, 3), rng.uniform(0.2, 3)],
+                "color": rng.choice(["#808080", "#8B4513", "#4A90D9"]),
+            }
+        elif kind < 9:
+            entity = {
+                "id": f"glb_{i}", "name": f"object {i % 100}", "assetType": "glb", "src": rng.choice(SOURCES),
+                "position": position, "rotation": [0.0, rng.uniform(0, 6.28), 0.0], "role": "prop",
+            }
+            if kind == 8:
+                entity["scale"] = [1.5, 1.5, 1.5]
+                entity["lods"] = [{"src": "lod1.glb", "distance": 15.0}, {"src": "lod2.glb", "distance": 40.0}]
+        else:
+            entity = {"id": f"splat_{i}", "assetType": "splat", "src": "scans/room.spz", "format": "spz", "position": position}
+        entities.append(entity)
+    return {
+        "version": "1.0",
+        "name": f"bench {count}",
+        "space": {"type": "room", "size": [1000.0, 10.0, 1000.0]},
+        "spawnpoint": [0.0, 1.6, 0.0],
+        "entities": entities,
+        "zones": [{"id": "center", "name": "center", "bounds": [[-5.0, 0.0, -5.0], [5.0, 3.0, 5.0]]}],
+    }
+
+
+def measure(fn):
+    """(결과, 초, 유지 메모리 bytes, 최대 메모리 bytes) - tracemalloc이 느리므로 시간은 따로 잼"""
+    gc.collect()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, retained, peak
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def pydantic_translate(spec: WorldSpec, offset) -> WorldSpec:
+    entities = [
+        e.model_copy(update={"position": (e.position[0] + offset[0], e.position[1] + offset[1], e.position[2] + offset[2])})
+        for e in spec.entities
+    ]
+    return spec.model_copy(update={"entities": entities})
+
+
+def pydantic_bounds(spec: WorldSpec):
+    xs, ys, zs = zip(*(e.position for e in spec.entities))
+    return [min(xs), min(ys), min(zs)], [max(xs), max(ys), max(zs)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Columnar WorldStore vs pydantic WorldSpec")
+    parser.add_argument("--entities", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print("=" * 96)
+    print(f"{'entities':>9} {'path':<9} {'load ms':>9} {'retained MB':>12} {'peak MB':>9} {'dump ms':>9} "
+          f"{'translate ms':>13} {'filter ms':>10} {'bounds ms':>10}")
+    print("-" * 96)
+    for count in args.entities:
+        data = make_world(count, rng)
+        text = json.dumps(data)
+
+        spec, spec_load, spec_mem, spec_peak = measure(lambda: WorldSpec.model_validate_json(text))
+        store, store_load, store_mem, store_peak = measure(lambda: WorldStore.from_json(text))
+
+        # 손실 없는 변환 확인
+        expected = spec.model_dump(mode="json", by_alias=True, exclude_none=True)
+        assert store.to_dict() == expected, "WorldStore.to_dict() differs from WorldSpec"
+        assert WorldStore.from_spec(spec).to_dict() == expected, "from_spec round-trip differs"
+        assert store.to_spec() == spec, "to_spec() differs"
+        assert WorldStore.from_json(store.to_json()).to_dict() == expected, "JSON round-trip differs"
+
+        offset = (1.0, 0.0, -2.0)
+        rows = {
+            "pydantic": (
+                spec_load, spec_mem, spec_peak,
+                timed(lambda: spec.model_dump_json(by_alias=True, exclude_none=True)),
+                timed(lambda: pydantic_translate(spec, offset)),
+                timed(lambda: [e for e in spec.entities if getattr(e, "role", None) == "structure"]),
+                timed(lambda: pydantic_bounds(spec)),
+            ),
+            "store": (
+                store_load, store_mem, store_peak,
+                timed(store.to_json),
+                timed(lambda: store.translate(offset)),
+                timed(lambda: store.filter(store.mask(role="structure"))),
+                timed(store.bounds),
+            ),
+        }
+        for path, (load, mem, peak, dump, translate, filtered, bounds) in rows.items():
+            print(f"{count:>9} {path:<9} {load * 1000:9.1f} {mem / 1e6:12.1f} {peak / 1e6:9.1f} {dump * 1000:9.1f} "
+                  f"{translate * 1000:13.2f} {filtered * 1000:10.2f} {bounds * 1000:10.2f}")
+        print(f"{'':>9} {'ratio':<9} {spec_load / store_load:8.1f}x {spec_mem / store_mem:11.1f}x "
+              f"(store arrays + strings: {store.nbytes() / 1e6:.1f}MB), round-trip ok")
+        print("-" * 96)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+World Validator Benchmark
+무작위로 배치한 1만/10만 엔티티 월드에서 격자 기반 검증(겹침/방 밖/시작 위치/zone)과
+자동 수정 시간을 측정합니다. 작은 월드에서는 모든 쌍을 비교하는 기준 구현과 겹침 쌍이
+같은지 확인하고, 기준 구현 시간도 함께 측정합니다.
+
+사용법:
+    python scripts/bench_world_validator.py --entities 10000 100000 --naive 2000
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_validator import (  # noqa: E402
+    EntityBounds,
+    overlapping_pairs,
+    naive_overlapping_pairs,
+    validate_world,
+)
+
+# 엔티티 하나당 바닥 면적 (m²) - 밀도가 같도록 방 크기를 정함
+AREA_PER_ENTITY = 4.0
+
+
+def bench_bounds(src: str):
+    """에셋 인덱스 없이 GLB를 1m 정육면체로 가정"""
+    return (-0.5, 0.0, -0.5), (0.5, 1.0, 0.5)
+
+
+def make_world(count: int, rng: random.Random) -> WorldSpec:
+    side = (count * AREA_PER_ENTITY) ** 0.5
+    entities = []
+    for i in range(count):
+        x, z = rng.uniform(-side / 2, side / 2), rng.uniform(-side / 2, side / 2)
+        if i % 3 == 0:
+            entities.append({
+                "id": f"glb_{i}", "assetType": "glb", "src": "assets/models/furniture/chair.glb",
+                "position": [x, 0, z], "rotation": [0, rng.uniform(0, 6.28), 0],
+            })
+        else:
+            size = [rng.uniform(0.3, 1.5), rng.uniform(0.3, 2.0), rng.uniform(0.3, 1.5)]
+            entities.append({
+                "id": f"box_{i}", "assetType": "primitive", "primitive": "box",
+                "position": [x, 0, z], "size": size, "role": "prop",
+            })
+    # 큰 structure 몇 개 (격자 대신 직접 비교 경로)
+    for i in range(4):
+        entities.append({
+            "id": f"wall_{i}", "assetType": "primitive", "primitive": "box", "role": "structure",
+            "position": [0, 0, -side / 2 + i * side / 3], "size": [side, 3, 0.2],
+        })
+    return WorldSpec.model_validate({
+        "version": "1.0",
+        "name": f"bench {count}",
+        "space": {"type": "room", "size": [side, 3, side]},
+        "spawnpoint": [0, 1.6, 0],
+        "entities": entities,
+        "zones": [{"id": "center", "name": "center", "bounds": [[-2, 0, -2], [2, 3, 2]]}],
+    })
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid-based WorldSpec validation at scale")
+    parser.add_argument("--entities", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--naive", type=int, default=2000, help="기준 구현(O(n²))으로 비교할 엔티티 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    # 정확도: 격자 결과 == 모든 쌍 비교 결과
+    small = make_world(args.naive, rng)
+    bounds = EntityBounds(small, bench_bounds)
+    (grid_pairs, _), grid_seconds = timed(overlapping_pairs, bounds)
+    naive_pairs, naive_seconds = timed(naive_overlapping_pairs, bounds)
+    same = {tuple(p) for p in grid_pairs.tolist()} == {tuple(p) for p in naive_pairs.tolist()}
+    print("=" * 88)
+    print(f"{args.naive + 4} entities: grid {len(grid_pairs)} overlaps in {grid_seconds * 1000:.1f}ms, "
+          f"naive {len(naive_pairs)} in {naive_seconds * 1000:.1f}ms - {'match' if same else 'MISMATCH'}")
+    if not same:
+        sys.exit(1)
+
+    print("-" * 88)
+    print(f"{'entities':>9} {'bounds ms':>10} {'pairs ms':>9} {'validate ms':>12} {'fix ms':>9} "
+          f"{'overlaps':>9} {'left':>6} {'naive est s':>12}")
+    for count in args.entities:
+        spec = make_world(count, rng)
+        bounds, bounds_seconds = timed(EntityBounds, spec, bench_bounds)
+        (pairs, _), pairs_seconds = timed(overlapping_pairs, bounds)
+        checked, check_seconds = timed(validate_world, spec, auto_fix=False, bounds_resolver=bench_bounds)
+        fixed, fix_seconds = timed(validate_world, spec, auto_fix=True, bounds_resolver=bench_bounds)
+
+        left = "-"
+        if fixed.auto_fixed is not None:
+            fixed_bounds = EntityBounds(fixed.auto_fixed, bench_bounds)
+            left = str(len(overlapping_pairs(fixed_bounds, fixed_bounds.solid & ~fixed_bounds.structure)[0]))
+        # 모든 쌍 비교 시간은 n²에 비례
+        naive_estimate = naive_seconds * (count / args.naive) ** 2
+        print(f"{count:>9} {bounds_seconds * 1000:10.1f} {pairs_seconds * 1000:9.1f} {check_seconds * 1000:12.1f} "
+              f"{(fix_seconds - check_seconds) * 1000:9.1f} {len(pairs):>9} {left:>6} {naive_estimate:12.1f}")
+    print("=" * 88)
+
+
+if __name__ == "__main__":
+    main()
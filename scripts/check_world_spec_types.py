@@ -0,0 +1,283 @@
+"""
+WorldSpec 타입 정의 교차 확인
+shared/schemas/world-spec.schema.json, shared/types/world_spec.py(pydantic),
+shared/types/world_spec.ts / client/src/types/world_spec.ts가 같은 구조를 설명하는지 비교합니다.
+
+세 정의를 같은 형태(객체 필드/필수 여부, 배열/튜플, 열거값, 숫자 범위)로 바꾼 뒤 WorldSpec부터
+재귀적으로 비교하며, 다른 곳을 경로와 함께 출력합니다. TS는 숫자 범위를 표현할 수 없으므로
+범위는 스키마와 pydantic끼리만 비교합니다. 다른 곳이 있으면 종료 코드 1.
+
+사용법:
+    python scripts/check_world_spec_types.py
+    python scripts/check_world_spec_types.py --source   # 생성된 검증기 소스 출력
+"""
+
+import re
+import sys
+import types
+import argparse
+from pathlib import Path
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from services.world_schema import WORLD_SCHEMA_SOURCE, _Compiler, load_world_schema  # noqa: E402
+
+TS_FILES = [PROJECT_ROOT / "shared" / "types" / "world_spec.ts", PROJECT_ROOT / "client" / "src" / "types" / "world_spec.ts"]
+
+# 공통 형태
+#   ("string",) ("boolean",) ("number", 범위 dict) ("integer", 범위 dict) ("enum", 값 tuple)
+#   ("array", 항목) ("tuple", 항목 tuple) ("union", 분기 tuple) ("object", {필드: (필수 여부, 형태)})
+_BOUNDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+
+
+# ----------------------------------------------------------------------
+# JSON Schema
+# ----------------------------------------------------------------------
+
+def from_schema(schema: dict, compiler: _Compiler) -> tuple:
+    schema = compiler.resolve(schema)
+    for keyword in ("oneOf", "anyOf"):
+        if keyword in schema:
+            return ("union", tuple(from_schema(branch, compiler) for branch in schema[keyword]))
+    if "const" in schema:
+        return ("enum", (schema["const"],))
+    if "enum" in schema:
+        return ("enum", tuple(sorted(schema["enum"])))
+    kind = schema.get("type")
+    if kind == "object":
+        required = set(schema.get("required", []))
+        return ("object", {
+            name: (name in required, from_schema(child, compiler))
+            for name, child in schema.get("properties", {}).items()
+        })
+    if kind == "array":
+        item = from_schema(schema.get("items", {}), compiler)
+        size = schema.get("minItems")
+        if size is not None and size == schema.get("maxItems"):
+            return ("tuple", (item,) * size)
+        return ("array", item)
+    if kind in ("number", "integer"):
+        return (kind, {key: schema[key] for key in _BOUNDS if key in schema})
+    if kind in ("string", "boolean"):
+        return (kind,)
+    return ("any",)
+
+
+# ----------------------------------------------------------------------
+# pydantic
+# ----------------------------------------------------------------------
+
+def _bounds(metadata) -> dict:
+    names = {"ge": "minimum", "le": "maximum", "gt": "exclusiveMinimum", "lt": "exclusiveMaximum"}
+    found = {}
+    for item in metadata or []:
+        for attribute, keyword in names.items():
+            value = getattr(item, attribute, None)
+            if value is not None:
+                found[keyword] = value
+    return found
+
+
+def from_pydantic(annotation: Any, metadata=None) -> tuple:
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (Union, types.UnionType):
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return from_pydantic(members[0], metadata)
+        return ("union", tuple(from_pydantic(arg) for arg in members))
+    if origin is Literal:
+        return ("enum", tuple(sorted(args)))
+    if origin is tuple:
+        return ("tuple", tuple(from_pydantic(arg) for arg in args))
+    if origin is list:
+        return ("array", from_pydantic(args[0]))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return ("object", {
+            field.alias or name: (field.is_required(), from_pydantic(field.annotation, field.metadata))
+            for name, field in annotation.model_fields.items()
+        })
+    if annotation is bool:
+        return ("boolean",)
+    if annotation is float:
+        return ("number", _bounds(metadata))
+    if annotation is int:
+        return ("integer", _bounds(metadata))
+    if annotation is str:
+        return ("string",)
+    return ("any",)
+
+
+# ----------------------------------------------------------------------
+# TypeScript (이 파일들이 쓰는 interface / type 별칭 범위만 해석)
+# ----------------------------------------------------------------------
+
+def _split(text: str, separator: str) -> list[str]:
+    """괄호 밖의 separator로 분리"""
+    parts, depth, current = [], 0, ""
+    for char in text:
+        depth += char in "[({<"
+        depth -= char in "])}>"
+        if char == separator and depth == 0:
+            parts.append(current.strip())
+            current = ""
+        else:
+            current += char
+    parts.append(current.strip())
+    return parts
+
+
+class TypeScriptTypes:
+    def __init__(self, source: str):
+        self.interfaces: dict[str, tuple[list[str], dict[str, tuple[bool, str]]]] = {}
+        self.aliases: dict[str, str] = {}
+        for name, extends, body in re.findall(r"export interface (\w+)(?: extends ([\w, ]+))? \{(.*?)\n\}", source, re.S):
+            fields = {}
+            for field, optional, expression in re.findall(r"^\s*(\w+)(\?)?: (.+?);", body, re.M):
+                fields[field] = (not optional, expression)
+            self.interfaces[name] = ([base.strip() for base in extends.split(",")] if extends else [], fields)
+        for name, expression in re.findall(r"^export type (\w+) = (.+?);", source, re.M):
+            self.aliases[name] = expression
+
+    def fields(self, name: str) -> dict[str, tuple[bool, str]]:
+        bases, own = self.interfaces[name]
+        merged = {}
+        for base in bases:
+            merged.update(self.fields(base))
+        merged.update(own)
+        return merged
+
+    @staticmethod
+    def literal(expression: str) -> Any:
+        """문자열/정수 리터럴 타입의 값 (리터럴이 아니면 None)"""
+        if expression.startswith('"'):
+            return expression.strip('"')
+        if re.fullmatch(r"-?\d+", expression):
+            return int(expression)
+        return None
+
+    def convert(self, expression: str) -> tuple:
+        expression = expression.strip()
+        members = _split(expression, "|")
+        if len(members) > 1:
+            values = [self.literal(member) for member in members]
+            if all(value is not None for value in values):
+                return ("enum", tuple(sorted(values)))
+            return ("union", tuple(self.convert(member) for member in members))
+        if self.literal(expression) is not None:
+            return ("enum", (self.literal(expression),))
+        if expression.endswith("[]"):
+            return ("array", self.convert(expression[:-2]))
+        if expression.startswith("["):
+            return ("tuple", tuple(self.convert(item) for item in _split(expression[1:-1], ",")))
+        if expression in ("string", "boolean"):
+            return (expression,)
+        if expression == "number":
+            return ("number", {})
+        if expression in self.aliases:
+            return self.convert(self.aliases[expression])
+        if expression in self.interfaces:
+            return ("object", {
+                name: (required, self.convert(field))
+                for name, (required, field) in self.fields(expression).items()
+            })
+        return ("any",)
+
+
+# ----------------------------------------------------------------------
+# 비교
+# ----------------------------------------------------------------------
+
+def describe(shape: tuple) -> str:
+    kind = shape[0]
+    if kind == "enum":
+        return "enum(" + ", ".join(map(str, shape[1])) + ")"
+    if kind in ("number", "integer"):
+        return kind + (str(shape[1]) if shape[1] else "")
+    if kind == "tuple":
+        return f"tuple[{len(shape[1])}]"
+    return kind
+
+
+def _tag(shape: tuple) -> Any:
+    """union 분기 짝짓기용 키 - 값이 하나뿐인 enum 필드 (assetType 등)"""
+    if shape[0] == "object":
+        for name, (_, field) in sorted(shape[1].items()):
+            if field[0] == "enum" and len(field[1]) == 1:
+                return f"{name}={field[1][0]}"
+    return None
+
+
+def compare(a: tuple, b: tuple, path: str, names: tuple[str, str], bounds: bool, diffs: list[str]):
+    if a[0] != b[0]:
+        diffs.append(f"{path or '/'}: {names[0]} {describe(a)} vs {names[1]} {describe(b)}")
+        return
+    kind = a[0]
+    if kind == "enum" and set(a[1]) != set(b[1]):
+        diffs.append(f"{path or '/'}: {names[0]} {describe(a)} vs {names[1]} {describe(b)}")
+    elif kind in ("number", "integer") and bounds and a[1] != b[1]:
+        diffs.append(f"{path or '/'}: {names[0]} {describe(a)} vs {names[1]} {describe(b)}")
+    elif kind == "array":
+        compare(a[1], b[1], f"{path}/[]", names, bounds, diffs)
+    elif kind == "tuple":
+        if len(a[1]) != len(b[1]):
+            diffs.append(f"{path or '/'}: {names[0]} {describe(a)} vs {names[1]} {describe(b)}")
+            return
+        for i, (x, y) in enumerate(zip(a[1], b[1])):
+            compare(x, y, f"{path}/{i}", names, bounds, diffs)
+    elif kind == "union":
+        left = {(_tag(shape) or i): shape for i, shape in enumerate(a[1])}
+        right = {(_tag(shape) or i): shape for i, shape in enumerate(b[1])}
+        for key in sorted(set(left) | set(right), key=str):
+            if key not in left or key not in right:
+                side = names[0] if key in left else names[1]
+                diffs.append(f"{path}/<{key}>: only in {side}")
+            else:
+                compare(left[key], right[key], f"{path}/<{key}>", names, bounds, diffs)
+    elif kind == "object":
+        for name in sorted(set(a[1]) | set(b[1])):
+            if name not in a[1] or name not in b[1]:
+                side = names[0] if name in a[1] else names[1]
+                diffs.append(f"{path}/{name}: only in {side}")
+                continue
+            (required_a, shape_a), (required_b, shape_b) = a[1][name], b[1][name]
+            if required_a != required_b:
+                state = lambda required: "required" if required else "optional"  # noqa: E731
+                diffs.append(f"{path}/{name}: {state(required_a)} in {names[0]} vs {state(required_b)} in {names[1]}")
+            compare(shape_a, shape_b, f"{path}/{name}", names, bounds, diffs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-check WorldSpec JSON Schema, pydantic and TypeScript types")
+    parser.add_argument("--source", action="store_true", help="스키마에서 생성된 검증기 소스 출력")
+    args = parser.parse_args()
+
+    if args.source:
+        print(WORLD_SCHEMA_SOURCE)
+        return
+
+    schema = load_world_schema()
+    reference = from_schema(schema, _Compiler(schema))
+    others = [("pydantic", from_pydantic(WorldSpec), True)]
+    for path in TS_FILES:
+        types_ = TypeScriptTypes(path.read_text(encoding="utf-8"))
+        others.append((str(path.relative_to(PROJECT_ROOT)), types_.convert("WorldSpec"), False))
+
+    failed = False
+    for name, shape, bounds in others:
+        diffs: list[str] = []
+        compare(reference, shape, "", ("schema", name), bounds, diffs)
+        print(f"schema vs {name}: {'OK' if not diffs else f'{len(diffs)} difference(s)'}")
+        for diff in diffs:
+            print(f"  {diff}")
+        failed |= bool(diffs)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Asset Metadata Indexer
+manifest.json의 에셋에서 GLB JSON 청크만 읽어 바운딩 박스/삼각형 수/텍스처 크기/애니메이션 여부를
+사이드카 인덱스(client/public/assets/asset_index.json)에 기록합니다.
+인덱스는 git에 넣지 않는 생성 파일이며, 서버 시작 시에도 없거나 오래되었으면 자동으로 만들어집니다.
+바뀐 파일(mtime/크기 → 내용 해시)만 다시 읽으므로 반복 실행 비용이 작습니다.
+
+사용법:
+    python scripts/index_assets.py
+    python scripts/index_assets.py --full --status placeholder
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "server"))
+
+from services.asset_metadata import (  # noqa: E402
+    AssetMetadataIndex,
+    ASSET_MANIFEST_PATH,
+    ASSET_MODELS_DIR,
+    ASSET_INDEX_PATH,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the asset metadata sidecar index")
+    parser.add_argument("--manifest", type=Path, default=ASSET_MANIFEST_PATH)
+    parser.add_argument("--models-dir", type=Path, default=ASSET_MODELS_DIR)
+    parser.add_argument("--output", type=Path, default=ASSET_INDEX_PATH)
+    parser.add_argument("--full", action="store_true", help="기존 인덱스를 무시하고 모두 다시 읽기")
+    parser.add_argument("--status", default=None, help="이 상태의 에셋만 출력 (ok, placeholder, broken, missing)")
+    args = parser.parse_args()
+
+    index = AssetMetadataIndex(args.manifest, args.models_dir, args.output)
+    stats = index.build(full=args.full)
+
+    print("=" * 96)
+    print(f"{'asset':<40} {'status':<12} {'tris':>9} {'verts':>9} {'tex MB':>7}  size (m)")
+    print("-" * 96)
+    for asset in index.query(status=args.status):
+        if asset["status"] != "ok":
+            print(f"{asset['path']:<40} {asset['status']:<12} {asset.get('error', '')}")
+            continue
+        aabb = asset["aabb"]
+        size = "x".join(f"{hi - lo:.2f}" for lo, hi in zip(aabb["min"], aabb["max"])) if aabb else "-"
+        print(
+            f"{asset['path']:<40} {asset['status']:<12} {asset['triangles']:9d} {asset['vertices']:9d} "
+            f"{asset['texture_bytes'] / 1e6:7.1f}  {size}{'  (animated)' if asset['animated'] else ''}"
+        )
+    print("-" * 96)
+    print(
+        f"{stats['assets']} assets {stats['status']} - inspected {stats['inspected']}, "
+        f"hashed {stats['hashed']}, reused {stats['reused']} in {stats['seconds']:.3f}s"
+    )
+    print(f"Index: {args.output}")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    main()
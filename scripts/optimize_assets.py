@@ -0,0 +1,130 @@
+"""
+Asset Library Optimizer
+manifest.json에 등록된 번들 GLB(와 생성된 GLB 디렉토리)를 여러 프로세스에서 병렬로 최적화해
+별도 디렉토리에 복사본을 쓰고 파일 크기/삼각형 수 보고서를 남깁니다.
+
+- 정점 용접 + 접근자/bufferView 중복 제거
+- 위치 16bit / 노멀·탄젠트 8bit / UV 16bit 양자화 (KHR_mesh_quantization)
+- 정점 캐시 지역성을 위한 삼각형 재정렬 (Tipsify) + 정점 fetch 순서 재배치
+- 긴 변이 --max-texture-size보다 큰 PNG/JPEG 텍스처 축소
+
+사용법:
+    python scripts/optimize_assets.py --max-texture-size 1024
+    python scripts/optimize_assets.py --include assets/models --output /tmp/optimized_assets
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+
+from services.glb_optimizer import optimize_file  # noqa: E402
+
+
+def manifest_paths(manifest_path: Path) -> list[str]:
+    """manifest.json의 에셋/기본값 경로 (models 디렉토리 기준 상대 경로, 중복 제거)"""
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    paths = [item["path"] for category in manifest.get("assets", {}).values() for item in category.values()]
+    paths += list(manifest.get("defaults", {}).values())
+    return list(dict.fromkeys(paths))
+
+
+def collect_jobs(args) -> list[tuple[str, str, str]]:
+    """(보고서용 이름, 원본 경로, 출력 경로) 목록"""
+    jobs = [
+        (rel, str(args.models_dir / rel), str(args.output / rel))
+        for rel in manifest_paths(args.manifest)
+    ]
+    for directory in args.include:
+        directory = Path(directory)
+        for path in sorted(directory.rglob("*.glb")):
+            rel = str(Path(directory.name) / path.relative_to(directory))
+            jobs.append((rel, str(path), str(args.output / rel)))
+    return jobs
+
+
+def run_job(name: str, src: str, dst: str, options: dict) -> dict:
+    if not os.path.exists(src):
+        return {"name": name, "path": src, "skipped": "missing"}
+    return {"name": name, **optimize_file(src, dst, **options)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch GLB optimization for the asset library")
+    parser.add_argument("--manifest", type=Path, default=PROJECT_ROOT / "client/public/assets/manifest.json")
+    parser.add_argument("--models-dir", type=Path, default=PROJECT_ROOT / "client/public/assets/models")
+    parser.add_argument("--include", action="append", default=[], help="추가로 최적화할 GLB 디렉토리 (예: assets/models)")
+    parser.add_argument("--output", type=Path, default=PROJECT_ROOT / "client/public/assets/models_optimized")
+    parser.add_argument("--max-texture-size", type=int, default=2048, help="텍스처 긴 변 최대 크기 (0이면 축소 안 함)")
+    parser.add_argument("--no-quantize", action="store_true", help="정점 속성 양자화 끄기")
+    parser.add_argument("--no-reorder", action="store_true", help="정점 캐시 재정렬 끄기")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--report", type=Path, default=None, help="보고서 경로 (기본: {output}/report.json)")
+    args = parser.parse_args()
+
+    options = {
+        "max_texture_size": args.max_texture_size,
+        "quantize": not args.no_quantize,
+        "reorder": not args.no_reorder,
+    }
+    jobs = collect_jobs(args)
+    # 큰 파일부터 시작해 마지막에 한 프로세스만 오래 도는 일을 줄임
+    jobs.sort(key=lambda job: os.path.getsize(job[1]) if os.path.exists(job[1]) else 0, reverse=True)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(run_job, name, src, dst, options) for name, src, dst in jobs]
+        results = sorted((future.result() for future in futures), key=lambda r: r["name"])
+    elapsed = time.perf_counter() - start
+
+    optimized = [r for r in results if "bytes_in" in r]
+    totals = {
+        "files": len(results),
+        "optimized": sum(1 for r in optimized if not r.get("skipped")),
+        "missing": sum(1 for r in results if r.get("skipped") == "missing"),
+        "bytes_in": sum(r["bytes_in"] for r in optimized),
+        "bytes_out": sum(r["bytes_out"] for r in optimized),
+        "triangles_in": sum(r.get("triangles_in") or 0 for r in optimized),
+        "triangles_out": sum(r.get("triangles_out") or r.get("triangles_in") or 0 for r in optimized),
+        "seconds": round(elapsed, 2),
+    }
+
+    print("=" * 100)
+    print(f"{'asset':<40} {'in KB':>9} {'out KB':>9} {'ratio':>6} {'tris':>9} {'ACMR':>12}  note")
+    print("-" * 100)
+    for r in results:
+        if "bytes_in" not in r:
+            print(f"{r['name']:<40} {'-':>9} {'-':>9} {'-':>6} {'-':>9} {'-':>12}  {r['skipped']}")
+            continue
+        acmr = f"{r['acmr_before']:.2f}→{r['acmr_after']:.2f}" if r.get("acmr_before") is not None else "-"
+        note = r.get("skipped") or (f"{len(r['textures_resized'])} textures resized" if r.get("textures_resized") else "")
+        print(
+            f"{r['name']:<40} {r['bytes_in'] / 1024:9.1f} {r['bytes_out'] / 1024:9.1f} "
+            f"{r['bytes_out'] / max(r['bytes_in'], 1):6.2f} {r.get('triangles_out') or r.get('triangles_in') or 0:9d} "
+            f"{acmr:>12}  {note}"
+        )
+    print("-" * 100)
+    print(
+        f"{totals['optimized']} optimized / {totals['files']} files ({totals['missing']} missing), "
+        f"{totals['bytes_in'] / 1e6:.1f}MB → {totals['bytes_out'] / 1e6:.1f}MB "
+        f"({1 - totals['bytes_out'] / max(totals['bytes_in'], 1):.0%} smaller) in {elapsed:.1f}s, {args.workers} workers"
+    )
+    print("=" * 100)
+
+    report_path = args.report or args.output / "report.json"
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump({"options": options, "totals": totals, "files": results}, f, ensure_ascii=False, indent=2)
+    print(f"Report: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+World Instancing Report
+샘플 월드에 인스턴싱 패스(services/world_instancing.py)를 적용해 draw call과 JSON 크기가 얼마나 줄어드는지 보고합니다.
+GLB draw call은 파일의 씬에 배치된 메시 프리미티브 수(three.js에서 Mesh 하나 = draw call 하나)로 세고,
+파일이 없는 GLB(생성 모델 등)와 프리미티브/스플랫은 1로 셉니다. 그림자 패스는 제외합니다.
+결과 월드가 스키마를 통과하고 expand_instances로 원래 엔티티가 그대로 복원되는지도 확인합니다.
+
+사용법:
+    python scripts/report_world_instancing.py --entities 10000 --min-count 4
+"""
+
+import sys
+import gzip
+import json
+import time
+import random
+import argparse
+from functools import lru_cache
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from shared.types.world_instances import expand_instances  # noqa: E402
+from services.asset_metadata import ASSET_MODELS_DIR, read_gltf_json, _mesh_instances  # noqa: E402
+from services.world_builder import LIBRARY_SRC_PREFIX  # noqa: E402
+from services.world_instancing import INSTANCE_MIN_COUNT, instance_world  # noqa: E402
+from services.world_schema import validate_world_json  # noqa: E402
+from bench_world_store import make_world  # noqa: E402
+
+
+@lru_cache(maxsize=None)
+def glb_draw_calls(src: str) -> int:
+    """GLB 하나를 그리는 draw call 수 (씬의 메시 인스턴스 × 프리미티브)"""
+    if not src.startswith(LIBRARY_SRC_PREFIX):
+        return 1
+    try:
+        gltf, _ = read_gltf_json(ASSET_MODELS_DIR / src[len(LIBRARY_SRC_PREFIX):])
+    except Exception:
+        return 1
+    meshes = gltf.get("meshes", [])
+    return max(1, sum(len(meshes[m]["primitives"]) for m, _ in _mesh_instances(gltf)))
+
+
+def draw_calls(spec: dict) -> int:
+    total = 0
+    for entity in spec["entities"]:
+        asset = entity["template"] if entity["assetType"] == "instanced" else entity
+        total += glb_draw_calls(asset["src"]) if asset["assetType"] == "glb" else 1
+    return total
+
+
+def payload(spec: dict) -> tuple[int, int]:
+    """(JSON bytes, gzip bytes) - API 응답과 같은 구분자 없는 JSON 기준"""
+    text = json.dumps(spec, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return len(text), len(gzip.compress(text, 6))
+
+
+def _without_identity(entity: dict) -> dict:
+    """항등 rotation/scale 제거 - 인스턴싱 후 펼치면 없는 값과 구분되지 않음 (렌더링 결과는 같음)"""
+    identity = {"rotation": [0.0, 0.0, 0.0], "scale": [1.0, 1.0, 1.0]}
+    return {key: value for key, value in entity.items() if identity.get(key) != value}
+
+
+def _glb(entity_id: str, name: str, src: str, position, rotation=None, scale=None) -> dict:
+    entity = {"id": entity_id, "name": name, "position": position}
+    if rotation is not None:
+        entity["rotation"] = rotation
+    if scale is not None:
+        entity["scale"] = scale
+    entity.update({"assetType": "glb", "src": LIBRARY_SRC_PREFIX + src, "role": "prop"})
+    return entity
+
+
+def _primitive(entity_id: str, primitive: str, position, size, color: str, role: str, rotation=None) -> dict:
+    entity = {"id": entity_id, "position": position}
+    if rotation is not None:
+        entity["rotation"] = rotation
+    entity.update({"assetType": "primitive", "primitive": primitive, "size": size, "color": color, "role": role})
+    return entity
+
+
+def _world(name: str, size: float, entities: list[dict]) -> dict:
+    return {
+        "version": "1.0",
+        "name": name,
+        "space": {"type": "room", "size": [size, 4.0, size]},
+        "spawnpoint": [0.0, 1.6, 0.0],
+        "entities": entities,
+    }
+
+
+def classroom() -> dict:
+    """의자 6×5줄, 램프, 기둥, 애니메이션 캐릭터 (캐릭터는 묶이지 않음)"""
+    entities = []
+    for row in range(5):
+        for col in range(6):
+            entities.append(_glb(f"chair_{row}_{col}", "의자", "furniture/chair.glb",
+                                 [-4.0 + col * 1.4, 0.0, -3.0 + row * 1.4], rotation=[0.0, 3.1416, 0.0]))
+    for i in range(6):
+        entities.append(_glb(f"lamp_{i}", "램프", "lighting/lamp.glb", [-5.0 + i * 2.0, 0.0, -5.5]))
+    for i in range(8):
+        x, z = (-6.5 if i < 4 else 6.5), -5.0 + (i % 4) * 3.3
+        entities.append(_primitive(f"pillar_{i}", "cylinder", [x, 0.0, z], [0.4, 4.0, 0.4], "#d1d5db", "structure"))
+    entities.append(_glb("sofa", "소파", "furniture/sofa.glb", [0.0, 0.0, 5.5]))
+    for i in range(2):
+        entities.append(_glb(f"soldier_{i}", "군인", "decor/soldier.glb", [-2.0 + i * 4.0, 0.0, 4.0]))
+    return _world("classroom", 14.0, entities)
+
+
+def showroom() -> dict:
+    """자동차 8대, 진열대 위 선글라스, 조명, 색이 다른 받침대"""
+    entities = []
+    for i in range(8):
+        entities.append(_glb(f"car_{i}", "자동차", "outdoor/ferrari.glb",
+                             [-12.0 + (i % 4) * 8.0, 0.0, -6.0 + (i // 4) * 12.0], rotation=[0.0, 0.6 * i, 0.0]))
+    for i in range(40):
+        entities.append(_primitive(f"stand_{i}", "box", [-19.5 + i, 0.0, 14.0], [0.6, 1.0, 0.6],
+                                   "#111827" if i % 2 else "#f9fafb", "structure"))
+        entities.append(_glb(f"sunglasses_{i}", "선글라스", "decor/sunglasses.glb", [-19.5 + i, 1.0, 14.0],
+                             scale=[2.0, 2.0, 2.0] if i % 5 == 0 else None))
+    for i in range(12):
+        entities.append(_glb(f"lamp_{i}", "램프", "lighting/lamp.glb", [-16.5 + i * 3.0, 0.0, -14.0]))
+    return _world("showroom", 40.0, entities)
+
+
+def plaza() -> dict:
+    """가로등/벤치/화분이 격자로 반복되는 넓은 광장"""
+    entities = []
+    for i in range(20):
+        for j in range(20):
+            x, z = -95.0 + i * 10.0, -95.0 + j * 10.0
+            entities.append(_glb(f"lamp_{i}_{j}", "가로등", "lighting/lamp.glb", [x, 0.0, z], scale=[3.0, 3.0, 3.0]))
+            entities.append(_primitive(f"bench_{i}_{j}", "box", [x + 2.0, 0.0, z], [1.8, 0.45, 0.5], "#8B4513", "prop",
+                                       rotation=[0.0, 1.5708 * ((i + j) % 2), 0.0]))
+            entities.append(_primitive(f"planter_{i}_{j}", "cylinder", [x, 0.0, z + 2.0], [0.8, 0.6, 0.8], "#4b5563", "prop"))
+            entities.append(_glb(f"box_{i}_{j}", "상자", "furniture/box.glb", [x - 2.0, 0.0, z - 2.0], scale=[0.5, 0.5, 0.5]))
+    return _world("plaza", 200.0, entities)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Draw call / payload savings of the instancing pass")
+    parser.add_argument("--entities", type=int, default=10000, help="합성 월드(bench_world_store.make_world) 엔티티 수")
+    parser.add_argument("--min-count", type=int, default=INSTANCE_MIN_COUNT, help="그룹으로 묶을 최소 반복 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    worlds = [classroom(), showroom(), plaza(), make_world(args.entities, random.Random(args.seed))]
+
+    print("=" * 118)
+    print(f"{'world':>14} {'entities':>9} {'groups':>7} {'after':>7} {'draw calls':>15} {'reduction':>10} "
+          f"{'JSON KB':>17} {'gzip KB':>15} {'pass ms':>8} {'ok':>4}")
+    print("-" * 118)
+    failed = False
+    for world in worlds:
+        spec = WorldSpec.model_validate(world).model_dump(mode="json", by_alias=True, exclude_none=True)
+        start = time.perf_counter()
+        compiled = instance_world(spec, args.min_count)
+        seconds = time.perf_counter() - start
+
+        groups = sum(entity["assetType"] == "instanced" for entity in compiled["entities"])
+        calls_before, calls_after = draw_calls(spec), draw_calls(compiled)
+        (json_before, gzip_before), (json_after, gzip_after) = payload(spec), payload(compiled)
+
+        # 스키마 통과 + 펼치면 원래 엔티티와 같은지 (순서는 그룹 위치 때문에 달라질 수 있음)
+        restored = sorted(expand_instances(compiled)["entities"], key=lambda entity: entity["id"])
+        original = sorted(map(_without_identity, spec["entities"]), key=lambda entity: entity["id"])
+        ok = not validate_world_json(compiled) and restored == original
+        failed |= not ok
+
+        print(f"{spec['name']:>14} {len(spec['entities']):>9} {groups:>7} {len(compiled['entities']):>7} "
+              f"{calls_before:>7} → {calls_after:>5} {1 - calls_after / calls_before:9.1%} "
+              f"{json_before / 1024:7.1f} → {json_after / 1024:6.1f} {gzip_before / 1024:6.1f} → {gzip_after / 1024:5.1f} "
+              f"{seconds * 1000:8.1f} {'yes' if ok else 'NO':>4}")
+    print("=" * 118)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
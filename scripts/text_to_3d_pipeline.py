@@ -5,6 +5,7 @@ Text → Image → 3D Pipeline
 사용법:
     python text_to_3d_pipeline.py "A cute cartoon robot toy"
     python text_to_3d_pipeline.py --prompt "A medieval sword" --output sword.glb
+    python text_to_3d_pipeline.py --batch catalog.jsonl --resume > results.jsonl
 """
 
 import os
@@ -12,10 +13,19 @@ os.environ['OPENCV_IO_ENABLE_OPENEXR'] = '1'
 os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "expandable_segments:True"
 
 import argparse
+import asyncio
+import contextlib
+import csv
 import io
+import json
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+import numpy as np
 from PIL import Image
-import torch
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
 
 # ============================================================================
@@ -41,20 +51,220 @@ Style requirements:
 - Full object visible, not cropped
 - Clean isolated object for 3D conversion"""
 
+# 이미지 생성 모델 (시도 순서대로)
+IMAGE_MODELS = [
+    "gemini-2.0-flash-exp-image-generation",
+    "gemini-2.5-flash-image",
+    "imagen-4.0-generate-001",
+]
+
+# 이미지 모델 헤징: 앞선 모델이 지연되면 다음 모델을 병렬로 시작
+IMAGE_HEDGE = os.environ.get("IMAGE_HEDGE", "0") == "1"
+IMAGE_HEDGE_DELAY = float(os.environ.get("IMAGE_HEDGE_DELAY", "8.0"))
+
+# 모델별 타임아웃 (초)
+IMAGE_MODEL_TIMEOUTS = {
+    "gemini-2.0-flash-exp-image-generation": 30.0,
+    "gemini-2.5-flash-image": 30.0,
+    "imagen-4.0-generate-001": 45.0,
+}
+
+# 서킷 브레이커: 연속 실패 횟수 / 차단 유지 시간 (초)
+BREAKER_FAILURES = int(os.environ.get("IMAGE_BREAKER_FAILURES", "3"))
+BREAKER_COOLDOWN = float(os.environ.get("IMAGE_BREAKER_COOLDOWN", "120"))
+
+# GLB 내보내기 기본 옵션
+DEFAULT_DECIMATION_TARGET = 100000
+DEFAULT_TEXTURE_SIZE = 2048
+
+
+def parse_lod_levels(spec: str) -> list[tuple[int, int, float]]:
+    """
+    LOD 설정 문자열 파싱
+
+    "25000:1024:15,5000:512:40" → [(면 수, 텍스처 해상도, 전환 거리(m)), ...]
+    """
+    levels = []
+    for part in spec.split(","):
+        if part.strip():
+            faces, texture, distance = part.strip().split(":")
+            levels.append((int(faces), int(texture), float(distance)))
+    return levels
+
+
+# 기본 GLB(LOD0) 아래에 추가로 내보낼 LOD 단계 (빈 문자열이면 LOD 없음)
+LOD_LEVELS = parse_lod_levels(os.environ.get("LOD_LEVELS", "25000:1024:15,5000:512:40"))
+
+
+# ============================================================================
+# Stage Timing Hooks
+# ============================================================================
+
+# 단계 타이머 훅: hook(stage, seconds, labels) - GPU 없이도 동작하는 순수 시간 측정
+STAGE_HOOKS: list = []
+
+
+def add_stage_hook(hook):
+    """단계 소요 시간을 받을 콜백 등록"""
+    STAGE_HOOKS.append(hook)
+
+
+@contextlib.contextmanager
+def stage_timer(stage: str, **labels):
+    """
+    블록 실행 시간을 측정해 등록된 훅에 전달합니다.
+
+    yield되는 labels dict를 수정해 결과(outcome 등)를 추가할 수 있으며,
+    예외로 빠져나오면 outcome이 지정되지 않은 경우 "error"로 기록됩니다.
+    """
+    start = time.perf_counter()
+    try:
+        yield labels
+    except BaseException:
+        labels.setdefault("outcome", "error")
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        for hook in STAGE_HOOKS:
+            try:
+                hook(stage, elapsed, labels)
+            except Exception as e:
+                print(f"Stage hook failed: {e}")
+
+
+# 진행 상황 콜백: callback(stage, info)
+#   image          - 이미지 생성 완료 {image_path}
+#   sampler        - 샘플러 스텝 완료 {sampler, index, count, step, total}
+#   mesh_simplify  - 메시 단순화 시작
+#   glb_bake       - GLB 베이킹(to_glb) 시작
+#   glb_export     - GLB 파일 쓰기 시작
+ProgressCallback = Callable[[str, dict], None]
+
+
+def _notify(progress_callback: Optional[ProgressCallback], stage: str, **info):
+    """진행 상황 콜백 호출 - 콜백 오류가 생성 작업을 중단시키지 않도록 격리"""
+    if progress_callback is None:
+        return
+    try:
+        progress_callback(stage, info)
+    except Exception as e:
+        print(f"Progress callback failed: {e}")
+
 
 # ============================================================================
 # Text-to-Image Module (Gemini/Imagen)
 # ============================================================================
 
+class CircuitBreaker:
+    """
+    모델별 서킷 브레이커 - 연속 실패 시 일정 시간 동안 해당 모델을 건너뜀
+
+    차단 시간이 지나면(half-open) 시험 호출 하나만 허용하고, 그 결과가 기록되거나
+    release()될 때까지 다른 호출은 막습니다. 여러 스레드에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURES, cooldown: float = BREAKER_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """호출 허용 여부 - half-open이면 첫 호출만 시험 호출로 허용"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def release(self):
+        """결과 없이 끝난 호출(취소 등) - 시험 호출 자리를 비움"""
+        with self._lock:
+            self.probing = False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold or self.probing:
+                self.opened_at = time.monotonic()
+            self.probing = False
+
+
 class TextToImageGenerator:
     """Gemini/Imagen API를 사용한 텍스트-이미지 생성기"""
 
-    def __init__(self, api_key: str):
-        from google import genai
-        from google.genai import types
-        self.genai = genai
+    def __init__(
+        self,
+        api_key: str,
+        client=None,
+        types=None,
+        hedge: bool = IMAGE_HEDGE,
+        hedge_delay: float = IMAGE_HEDGE_DELAY,
+        model_timeouts: Optional[dict] = None,
+    ):
+        """
+        Args:
+            api_key: Gemini API 키
+            client: genai.Client 대체 객체 (테스트/벤치마크용)
+            types: google.genai.types 대체 모듈 (테스트/벤치마크용)
+            hedge: 지연 시 백업 모델을 병렬로 시작할지 여부
+            hedge_delay: 백업 모델을 시작하기까지 대기 시간 (초)
+            model_timeouts: 모델별 타임아웃 (초)
+        """
+        if client is None:
+            from google import genai
+            self.genai = genai
+            client = genai.Client(api_key=api_key)
+        if types is None:
+            from google.genai import types
         self.types = types
-        self.client = genai.Client(api_key=api_key)
+        self.client = client
+        self.hedge = hedge
+        self.hedge_delay = hedge_delay
+        self.model_timeouts = {**IMAGE_MODEL_TIMEOUTS, **(model_timeouts or {})}
+        self.breakers = {model: CircuitBreaker() for model in IMAGE_MODELS}
+        # client.aio 세션은 이 루프 하나에서만 사용 (이미지 단계 스레드들이 공유)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """헤징용 이벤트 루프 - 처음 호출될 때 전용 스레드에서 시작해 계속 재사용"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="image-hedging", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def close(self):
+        """헤징 루프 종료"""
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
 
     def generate(self, prompt: str, output_path: str = "generated_image.png") -> Optional[Image.Image]:
         """
@@ -66,34 +276,116 @@ class TextToImageGenerator:
 
         Returns:
             생성된 PIL Image 객체, 실패 시 None
+
+        어느 스레드에서 호출해도 (이벤트 루프가 돌고 있는 스레드 포함) 전용 루프에서 실행하고
+        결과를 기다립니다. 여러 스레드가 동시에 호출하면 같은 루프에서 함께 진행됩니다.
+        """
+        loop = self._event_loop()
+        return asyncio.run_coroutine_threadsafe(self.generate_async(prompt, output_path), loop).result()
+
+    async def generate_async(
+        self,
+        prompt: str,
+        output_path: str = "generated_image.png",
+        hedge: Optional[bool] = None,
+    ) -> Optional[Image.Image]:
         """
+        모델 폴백/헤징으로 이미지를 생성합니다.
+
+        헤징을 끄면 모델을 순서대로 시도하고, 켜면 앞선 모델이 hedge_delay 안에
+        끝나지 않을 때 다음 모델을 병렬로 시작합니다. 먼저 유효한 이미지를 반환한
+        모델이 이기고 나머지는 취소됩니다.
+        """
+        hedge = self.hedge if hedge is None else hedge
+
         # 3D 변환에 최적화된 프롬프트 생성
         full_prompt = PROMPT_TEMPLATE_3D.format(description=prompt)
 
-        # 여러 모델 순차 시도
-        models = [
-            ("gemini-2.0-flash-exp-image-generation", self._generate_gemini),
-            ("gemini-2.5-flash-image", self._generate_gemini),
-            ("imagen-4.0-generate-001", self._generate_imagen),
-        ]
+        pending: set[asyncio.Task] = set()
+        remaining = list(IMAGE_MODELS)
+
+        def launch():
+            # 최근 실패가 누적된 모델은 건너뜀 (half-open 시험 호출 자리는 시작할 때 차지)
+            while remaining:
+                model_name = remaining.pop(0)
+                if self.breakers[model_name].allow():
+                    print(f"Trying {model_name}...")
+                    task = asyncio.create_task(self._attempt(model_name, full_prompt))
+                    # 취소된 시도는 결과가 기록되지 않으므로 시험 호출 자리를 비움 (시작 전 취소 포함)
+                    task.add_done_callback(lambda t, breaker=self.breakers[model_name]: t.cancelled() and breaker.release())
+                    pending.add(task)
+                    return
+                print(f"Circuit open, skipping: {model_name}")
 
-        for model_name, generator_fn in models:
-            print(f"Trying {model_name}...")
+        try:
+            while remaining or pending:
+                if not pending:
+                    launch()
+                    if not pending:
+                        break
+                wait_timeout = self.hedge_delay if hedge and remaining else None
+                done, _ = await asyncio.wait(pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    # 헤징 지연 경과 - 백업 모델 병렬 시작
+                    launch()
+                    continue
+
+                for task in done:
+                    pending.discard(task)
+                    image = task.result()
+                    if image:
+                        image.save(output_path)
+                        print(f"Image saved to: {output_path}")
+                        return image
+                    # 실패한 시도가 있으면 헤징 지연을 기다리지 않고 다음 모델 시작
+                    if hedge and remaining:
+                        launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return None
+
+    async def _attempt(self, model_name: str, prompt: str) -> Optional[Image.Image]:
+        """타임아웃과 서킷 브레이커를 적용한 단일 모델 시도 (실패 시 None)"""
+        generator_fn = self._generate_imagen if model_name.startswith("imagen") else self._generate_gemini
+        breaker = self.breakers[model_name]
+        start = time.perf_counter()
+
+        with stage_timer("image_model", model=model_name) as labels:
             try:
-                image = generator_fn(model_name, full_prompt)
-                if image:
-                    image.save(output_path)
-                    print(f"Image saved to: {output_path}")
-                    return image
+                image = await asyncio.wait_for(generator_fn(model_name, prompt), self.model_timeouts.get(model_name))
+            except asyncio.CancelledError:
+                labels["outcome"] = "cancelled"
+                print(f"{model_name} cancelled after {time.perf_counter() - start:.1f}s")
+                raise
+            except asyncio.TimeoutError:
+                labels["outcome"] = "timeout"
+                print(f"{model_name} timed out after {time.perf_counter() - start:.1f}s")
+                breaker.record_failure()
+                return None
             except Exception as e:
+                labels["outcome"] = "error"
                 print(f"{model_name} failed: {e}")
-                continue
+                breaker.record_failure()
+                return None
 
-        return None
+            if image is None:
+                labels["outcome"] = "empty"
+                print(f"{model_name} returned no image")
+                breaker.record_failure()
+                return None
+
+            labels["outcome"] = "success"
+            breaker.record_success()
+            return image
 
-    def _generate_gemini(self, model: str, prompt: str) -> Optional[Image.Image]:
+    async def _generate_gemini(self, model: str, prompt: str) -> Optional[Image.Image]:
         """Gemini 모델로 이미지 생성"""
-        response = self.client.models.generate_content(
+        response = await self.client.aio.models.generate_content(
             model=model,
             contents=prompt,
             config=self.types.GenerateContentConfig(
@@ -108,9 +400,9 @@ class TextToImageGenerator:
 
         return None
 
-    def _generate_imagen(self, model: str, prompt: str) -> Optional[Image.Image]:
+    async def _generate_imagen(self, model: str, prompt: str) -> Optional[Image.Image]:
         """Imagen 모델로 이미지 생성"""
-        response = self.client.models.generate_images(
+        response = await self.client.aio.models.generate_images(
             model=model,
             prompt=prompt,
             config=self.types.GenerateImagesConfig(
@@ -126,6 +418,166 @@ class TextToImageGenerator:
         return None
 
 
+# ============================================================================
+# Mesh Cache
+# ============================================================================
+
+# to_glb에 필요한 원본 TRELLIS.2 출력 (배열은 각각 .npy, 나머지는 meta.json)
+MESH_ARRAYS = ("vertices", "faces", "attrs", "coords")
+MESH_META_FILE = "meta.json"
+
+
+def _encode_layout(layout: dict) -> dict:
+    """attr layout(이름 → slice)을 JSON으로 저장 가능한 형태로 변환"""
+    return {
+        name: {"slice": [value.start, value.stop, value.step]} if isinstance(value, slice) else value
+        for name, value in layout.items()
+    }
+
+
+def _decode_layout(layout: dict) -> dict:
+    return {
+        name: slice(*value["slice"]) if isinstance(value, dict) and "slice" in value else value
+        for name, value in layout.items()
+    }
+
+
+def save_mesh_cache(mesh, cache_dir: str) -> str:
+    """
+    재내보내기용으로 원본 메시/복셀 속성을 저장합니다.
+
+    배열은 np.load(mmap_mode="r")로 바로 매핑할 수 있도록 압축 없이 .npy로 저장하고,
+    임시 디렉토리에 쓴 뒤 교체하므로 중간에 실패해도 불완전한 캐시가 남지 않습니다.
+
+    Args:
+        mesh: reconstruct()가 반환한 메시 (torch 텐서 또는 numpy 배열)
+        cache_dir: 저장 디렉토리
+
+    Returns:
+        저장 디렉토리 경로
+    """
+    cache_dir = Path(cache_dir)
+    tmp_dir = cache_dir.with_name(cache_dir.name + ".partial")
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    dtypes = {}
+    for name in MESH_ARRAYS:
+        array = getattr(mesh, name)
+        if hasattr(array, "detach"):
+            dtypes[name] = str(array.dtype).replace("torch.", "")
+            # numpy에 없는 bfloat16은 float32로 저장하고 불러올 때 복원
+            if dtypes[name] == "bfloat16":
+                array = array.float()
+            array = array.detach().cpu().numpy()
+        else:
+            dtypes[name] = str(array.dtype)
+        np.save(tmp_dir / f"{name}.npy", np.ascontiguousarray(array))
+
+    meta = {
+        "layout": _encode_layout(mesh.layout),
+        "voxel_size": float(mesh.voxel_size),
+        "dtypes": dtypes,
+        "created_at": time.time(),
+    }
+    with open(tmp_dir / MESH_META_FILE, "w") as f:
+        json.dump(meta, f)
+
+    if cache_dir.exists():
+        for file in cache_dir.iterdir():
+            file.unlink()
+        cache_dir.rmdir()
+    os.replace(tmp_dir, cache_dir)
+    return str(cache_dir)
+
+
+def load_mesh_cache(cache_dir: str, device: Optional[str] = None):
+    """
+    save_mesh_cache()로 저장한 메시를 불러옵니다.
+
+    Args:
+        cache_dir: 저장 디렉토리
+        device: None이면 읽기 전용 memmap 배열, 지정하면 해당 장치의 torch 텐서로 반환
+
+    Returns:
+        vertices/faces/attrs/coords/layout/voxel_size 속성을 가진 객체
+    """
+    cache_dir = Path(cache_dir)
+    with open(cache_dir / MESH_META_FILE) as f:
+        meta = json.load(f)
+
+    arrays = {name: np.load(cache_dir / f"{name}.npy", mmap_mode="r") for name in MESH_ARRAYS}
+    if device is not None:
+        import torch
+
+        arrays = {
+            name: torch.tensor(array, device=device).to(getattr(torch, meta["dtypes"][name], None) or torch.float32)
+            for name, array in arrays.items()
+        }
+
+    return SimpleNamespace(**arrays, layout=_decode_layout(meta["layout"]), voxel_size=meta["voxel_size"])
+
+
+def has_mesh_cache(cache_dir: str) -> bool:
+    """재내보내기가 가능한 메시 캐시가 있는지 확인"""
+    return (Path(cache_dir) / MESH_META_FILE).exists()
+
+
+# ============================================================================
+# LOD Chain
+# ============================================================================
+
+def lod_chain(decimation_target: int, texture_size: int, lod_levels=()) -> list[tuple[int, int, float]]:
+    """LOD0(요청 옵션) + 그보다 면 수가 적은 추가 단계를 면 수 내림차순으로 반환"""
+    lower = sorted(
+        {(int(f), int(t), float(d)) for f, t, d in lod_levels if int(f) < decimation_target},
+        key=lambda level: -level[0],
+    )
+    return [(decimation_target, texture_size, 0.0)] + lower
+
+
+def lod_path(output_path: str, level: int) -> str:
+    """LOD 단계별 GLB 경로 (LOD0은 output_path 그대로, 나머지는 {이름}_lod{n}.glb)"""
+    if level == 0:
+        return output_path
+    path = Path(output_path)
+    return str(path.with_name(f"{path.stem}_lod{level}{path.suffix}"))
+
+
+def lod_manifest_path(output_path: str) -> str:
+    path = Path(output_path)
+    return str(path.with_name(f"{path.stem}.lod.json"))
+
+
+def write_lod_manifest(output_path: str, levels: list[tuple[int, int, float]]) -> dict:
+    """내보낸 LOD 파일 목록을 {이름}.lod.json으로 저장"""
+    manifest = {
+        "version": 1,
+        "levels": [
+            {
+                "level": i,
+                "file": Path(lod_path(output_path, i)).name,
+                "decimation_target": faces,
+                "texture_size": texture,
+                "distance": distance,
+                "bytes": os.path.getsize(lod_path(output_path, i)),
+            }
+            for i, (faces, texture, distance) in enumerate(levels)
+        ],
+    }
+    with open(lod_manifest_path(output_path), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_lod_manifest(output_path: str) -> Optional[dict]:
+    """LOD 매니페스트 (없으면 None)"""
+    try:
+        with open(lod_manifest_path(output_path)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
 # ============================================================================
 # Image-to-3D Module (TRELLIS.2)
 # ============================================================================
@@ -172,12 +624,65 @@ class ImageTo3DGenerator:
             self.pipeline.cuda()
             print("Pipeline loaded successfully")
 
+    @contextlib.contextmanager
+    def _sampler_progress(self, progress_callback: Optional[ProgressCallback]):
+        """
+        파이프라인의 *_sampler 객체를 잠시 감싸 샘플링 스텝마다 콜백을 호출합니다.
+
+        sample()에서 총 스텝 수를, sample_once()에서 완료 스텝을 얻으며
+        해당 속성이 없는 샘플러는 건너뜁니다.
+        """
+        samplers = []
+        if progress_callback is not None:
+            seen = set()
+            for name, sampler in vars(self.pipeline).items():
+                if name.endswith("_sampler") and hasattr(sampler, "sample_once") and id(sampler) not in seen:
+                    seen.add(id(sampler))
+                    samplers.append((name, sampler))
+
+        started: list[str] = []
+
+        def wrap(name: str, sampler):
+            original_sample, original_sample_once = sampler.sample, sampler.sample_once
+            state = {"step": 0, "total": None}
+
+            def sample(*args, **kwargs):
+                state["step"] = 0
+                state["total"] = kwargs.get("steps", args[3] if len(args) > 3 else None)
+                started.append(name)
+                return original_sample(*args, **kwargs)
+
+            def sample_once(*args, **kwargs):
+                out = original_sample_once(*args, **kwargs)
+                state["step"] += 1
+                _notify(
+                    progress_callback, "sampler",
+                    sampler=name, index=len(started) - 1, count=len(samplers),
+                    step=state["step"], total=state["total"],
+                )
+                return out
+
+            sampler.sample, sampler.sample_once = sample, sample_once
+
+        for name, sampler in samplers:
+            wrap(name, sampler)
+        try:
+            yield
+        finally:
+            # 인스턴스 속성을 지워 클래스 메서드로 복원
+            for _, sampler in samplers:
+                vars(sampler).pop("sample", None)
+                vars(sampler).pop("sample_once", None)
+
     def generate(
         self,
         image: Image.Image,
         output_path: str = "output.glb",
-        decimation_target: int = 100000,
-        texture_size: int = 2048,
+        decimation_target: int = DEFAULT_DECIMATION_TARGET,
+        texture_size: int = DEFAULT_TEXTURE_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        mesh_cache_dir: Optional[str] = None,
+        lod_levels=(),
     ) -> str:
         """
         이미지를 3D 모델로 변환합니다.
@@ -187,37 +692,127 @@ class ImageTo3DGenerator:
             output_path: 출력 GLB 파일 경로
             decimation_target: 메시 단순화 목표 면 수
             texture_size: 텍스처 해상도
+            progress_callback: 진행 상황 콜백 (sampler, mesh_simplify, glb_bake, glb_export)
+            mesh_cache_dir: 지정하면 재내보내기용 원본 메시를 저장
+            lod_levels: 추가 LOD 단계 (export_glb 참고)
 
         Returns:
             출력 파일 경로
         """
-        import o_voxel
+        mesh = self.reconstruct(image, progress_callback)
+        if mesh_cache_dir:
+            save_mesh_cache(mesh, mesh_cache_dir)
+        return self.export_glb(mesh, output_path, decimation_target, texture_size, progress_callback, lod_levels)
+
+    def reexport(
+        self,
+        mesh_cache_dir: str,
+        output_path: str = "output.glb",
+        decimation_target: int = DEFAULT_DECIMATION_TARGET,
+        texture_size: int = DEFAULT_TEXTURE_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        lod_levels=(),
+    ) -> str:
+        """
+        저장된 원본 메시에서 TRELLIS.2 재실행 없이 GLB를 다시 만듭니다.
+
+        Args:
+            mesh_cache_dir: save_mesh_cache()로 저장한 디렉토리
+            output_path: 출력 GLB 파일 경로
+            decimation_target: 메시 단순화 목표 면 수
+            texture_size: 텍스처 해상도
+            progress_callback: 진행 상황 콜백 (glb_bake, glb_export)
+            lod_levels: 추가 LOD 단계 (export_glb 참고)
+
+        Returns:
+            출력 파일 경로
+        """
+        with stage_timer("mesh_load"):
+            mesh = load_mesh_cache(mesh_cache_dir, device="cuda")
+        return self.export_glb(mesh, output_path, decimation_target, texture_size, progress_callback, lod_levels)
+
+    def reconstruct(self, image: Image.Image, progress_callback: Optional[ProgressCallback] = None):
+        """
+        이미지에서 TRELLIS.2 메시를 생성합니다. (GPU 단계)
+
+        Args:
+            image: 입력 PIL Image
+            progress_callback: 진행 상황 콜백 (sampler, mesh_simplify)
 
+        Returns:
+            단순화된 TRELLIS.2 메시
+        """
         self.load_pipeline()
 
         print(f"Generating 3D mesh from image ({image.size})...")
-        mesh = self.pipeline.run(image)[0]
+        with stage_timer("pipeline_run"), self._sampler_progress(progress_callback):
+            mesh = self.pipeline.run(image)[0]
 
         print(f"Mesh generated: {mesh.vertices.shape[0]} vertices, {mesh.faces.shape[0]} faces")
 
         # 메시 단순화
-        mesh.simplify(1000000)
-
-        # GLB 내보내기
-        print("Exporting to GLB...")
-        glb = o_voxel.postprocess.to_glb(
-            vertices=mesh.vertices,
-            faces=mesh.faces,
-            attr_volume=mesh.attrs,
-            coords=mesh.coords,
-            attr_layout=mesh.layout,
-            voxel_size=mesh.voxel_size,
-            aabb=[[-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]],
-            decimation_target=decimation_target,
-            texture_size=texture_size,
-            remesh=True,
-        )
-        glb.export(output_path, extension_webp=True)
+        _notify(progress_callback, "mesh_simplify")
+        with stage_timer("mesh_simplify"):
+            mesh.simplify(1000000)
+        return mesh
+
+    def export_glb(
+        self,
+        mesh,
+        output_path: str = "output.glb",
+        decimation_target: int = DEFAULT_DECIMATION_TARGET,
+        texture_size: int = DEFAULT_TEXTURE_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        lod_levels=(),
+    ) -> str:
+        """
+        메시를 GLB로 내보냅니다. (후처리 단계)
+
+        Args:
+            mesh: reconstruct()가 반환한 메시
+            output_path: 출력 GLB 파일 경로 (LOD0)
+            decimation_target: 메시 단순화 목표 면 수
+            texture_size: 텍스처 해상도
+            progress_callback: 진행 상황 콜백 (glb_bake, glb_export)
+            lod_levels: 추가 LOD 단계 [(면 수, 텍스처 해상도, 전환 거리), ...]
+                - 지정하면 {이름}_lod{n}.glb와 {이름}.lod.json 매니페스트도 생성
+
+        Returns:
+            출력 파일 경로 (LOD0)
+        """
+        import o_voxel
+        import torch
+
+        levels = lod_chain(decimation_target, texture_size, lod_levels)
+        for i, (faces, texture, _) in enumerate(levels):
+            path = lod_path(output_path, i)
+            lod = {"lod": i, "count": len(levels)}
+
+            # GLB 내보내기
+            print(f"Exporting to GLB (LOD{i}: {faces} faces, {texture}px)...")
+            _notify(progress_callback, "glb_bake", **lod)
+            with stage_timer("to_glb"):
+                glb = o_voxel.postprocess.to_glb(
+                    vertices=mesh.vertices,
+                    faces=mesh.faces,
+                    attr_volume=mesh.attrs,
+                    coords=mesh.coords,
+                    attr_layout=mesh.layout,
+                    voxel_size=mesh.voxel_size,
+                    aabb=[[-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]],
+                    decimation_target=faces,
+                    texture_size=texture,
+                    remesh=True,
+                )
+            _notify(progress_callback, "glb_export", **lod)
+            with stage_timer("glb_export"):
+                glb.export(path, extension_webp=True)
+
+        if len(levels) > 1:
+            write_lod_manifest(output_path, levels)
+        else:
+            # 같은 경로에 이전에 만든 매니페스트가 남지 않도록 정리
+            Path(lod_manifest_path(output_path)).unlink(missing_ok=True)
 
         print(f"3D model saved to: {output_path}")
         print(f"GPU Memory used: {torch.cuda.max_memory_allocated() / 1024**3:.2f} GB")
@@ -232,8 +827,8 @@ class ImageTo3DGenerator:
 class TextTo3DPipeline:
     """Text → Image → 3D 전체 파이프라인"""
 
-    def __init__(self, api_key: str = GEMINI_API_KEY):
-        self.text_to_image = TextToImageGenerator(api_key)
+    def __init__(self, api_key: str = GEMINI_API_KEY, hedge: bool = IMAGE_HEDGE):
+        self.text_to_image = TextToImageGenerator(api_key, hedge=hedge)
         self.image_to_3d = ImageTo3DGenerator()
 
     def generate(
@@ -241,6 +836,12 @@ class TextTo3DPipeline:
         text_prompt: str,
         output_path: str = "output.glb",
         keep_image: bool = True,
+        image_path: Optional[str] = None,
+        decimation_target: int = DEFAULT_DECIMATION_TARGET,
+        texture_size: int = DEFAULT_TEXTURE_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        mesh_cache_dir: Optional[str] = None,
+        lod_levels=(),
     ) -> dict:
         """
         텍스트 설명을 받아 3D 모델을 생성합니다.
@@ -249,6 +850,12 @@ class TextTo3DPipeline:
             text_prompt: 생성할 3D 모델에 대한 텍스트 설명
             output_path: 출력 GLB 파일 경로
             keep_image: 중간 이미지 파일 보존 여부
+            image_path: 중간 이미지 저장 경로 (기본: {출력 파일명}_image.png)
+            decimation_target: 메시 단순화 목표 면 수
+            texture_size: 텍스처 해상도
+            progress_callback: 진행 상황 콜백 (image, sampler, mesh_simplify, glb_bake, glb_export)
+            mesh_cache_dir: 지정하면 재내보내기용 원본 메시를 저장
+            lod_levels: 추가 LOD 단계 [(면 수, 텍스처 해상도, 전환 거리), ...]
 
         Returns:
             결과 정보 딕셔너리
@@ -262,8 +869,8 @@ class TextTo3DPipeline:
         }
 
         # 이미지 경로 설정
-        output_stem = Path(output_path).stem
-        image_path = f"{output_stem}_image.png"
+        if image_path is None:
+            image_path = f"{Path(output_path).stem}_image.png"
 
         # Step 1: Text → Image
         print("\n" + "=" * 60)
@@ -271,7 +878,7 @@ class TextTo3DPipeline:
         print("=" * 60)
         print(f"Prompt: {text_prompt}")
 
-        image = self.text_to_image.generate(text_prompt, image_path)
+        image = self.generate_image(text_prompt, image_path)
 
         if image is None:
             result["error"] = "Image generation failed"
@@ -280,6 +887,7 @@ class TextTo3DPipeline:
 
         result["image_path"] = image_path
         print(f"✅ Image generated: {image_path}")
+        _notify(progress_callback, "image", image_path=image_path)
 
         # Step 2: Image → 3D
         print("\n" + "=" * 60)
@@ -287,7 +895,15 @@ class TextTo3DPipeline:
         print("=" * 60)
 
         try:
-            model_path = self.image_to_3d.generate(image, output_path)
+            model_path = self.image_to_3d.generate(
+                image,
+                output_path,
+                decimation_target=decimation_target,
+                texture_size=texture_size,
+                progress_callback=progress_callback,
+                mesh_cache_dir=mesh_cache_dir,
+                lod_levels=lod_levels,
+            )
             result["model_path"] = model_path
             result["success"] = True
             print(f"✅ 3D model generated: {model_path}")
@@ -307,10 +923,28 @@ class TextTo3DPipeline:
 
         return result
 
+    def generate_image(self, text_prompt: str, image_path: str) -> Optional[Image.Image]:
+        """
+        Text → Image 단계만 실행합니다. (네트워크 단계)
+
+        Args:
+            text_prompt: 생성할 3D 모델에 대한 텍스트 설명
+            image_path: 생성된 이미지 저장 경로
+
+        Returns:
+            생성된 PIL Image 객체, 실패 시 None
+        """
+        return self.text_to_image.generate(text_prompt, image_path)
+
     def generate_from_image(
         self,
         image_path: str,
         output_path: str = "output.glb",
+        decimation_target: int = DEFAULT_DECIMATION_TARGET,
+        texture_size: int = DEFAULT_TEXTURE_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        mesh_cache_dir: Optional[str] = None,
+        lod_levels=(),
     ) -> dict:
         """
         기존 이미지에서 3D 모델을 생성합니다.
@@ -318,6 +952,11 @@ class TextTo3DPipeline:
         Args:
             image_path: 입력 이미지 경로
             output_path: 출력 GLB 파일 경로
+            decimation_target: 메시 단순화 목표 면 수
+            texture_size: 텍스처 해상도
+            progress_callback: 진행 상황 콜백 (sampler, mesh_simplify, glb_bake, glb_export)
+            mesh_cache_dir: 지정하면 재내보내기용 원본 메시를 저장
+            lod_levels: 추가 LOD 단계 [(면 수, 텍스처 해상도, 전환 거리), ...]
 
         Returns:
             결과 정보 딕셔너리
@@ -337,7 +976,15 @@ class TextTo3DPipeline:
             image = Image.open(image_path)
             print(f"Input image: {image_path} ({image.size})")
 
-            model_path = self.image_to_3d.generate(image, output_path)
+            model_path = self.image_to_3d.generate(
+                image,
+                output_path,
+                decimation_target=decimation_target,
+                texture_size=texture_size,
+                progress_callback=progress_callback,
+                mesh_cache_dir=mesh_cache_dir,
+                lod_levels=lod_levels,
+            )
             result["model_path"] = model_path
             result["success"] = True
             print(f"✅ 3D model generated: {model_path}")
@@ -348,6 +995,136 @@ class TextTo3DPipeline:
         return result
 
 
+# ============================================================================
+# Batch Mode
+# ============================================================================
+
+def load_batch(batch_path: str) -> list[dict]:
+    """
+    배치 매니페스트(JSONL/CSV)를 읽습니다.
+
+    각 항목은 prompt 또는 image 중 하나와 output을 가지며,
+    id, image_output, decimation_target, texture_size를 선택적으로 지정할 수 있습니다.
+    """
+    path = Path(batch_path)
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [{k: v for k, v in row.items() if v not in (None, "")} for row in csv.DictReader(f)]
+    else:
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    items = []
+    for index, row in enumerate(rows):
+        if not row.get("prompt") and not row.get("image"):
+            raise ValueError(f"Batch item {index}: 'prompt' or 'image' is required")
+        item_id = str(row.get("id", index))
+        output = row.get("output") or f"{item_id}.glb"
+        items.append({
+            "index": index,
+            "id": item_id,
+            "prompt": row.get("prompt"),
+            "image": row.get("image"),
+            "output": output,
+            "image_output": row.get("image_output") or str(Path(output).with_name(f"{Path(output).stem}_image.png")),
+            "decimation_target": int(row.get("decimation_target", DEFAULT_DECIMATION_TARGET)),
+            "texture_size": int(row.get("texture_size", DEFAULT_TEXTURE_SIZE)),
+        })
+    return items
+
+
+def run_batch(
+    pipeline: "TextTo3DPipeline",
+    items: list[dict],
+    results,
+    resume: bool = False,
+    prefetch: int = 2,
+) -> int:
+    """
+    파이프라인을 한 번만 로드한 상태로 여러 항목을 처리합니다.
+
+    이미지 생성/로드는 스레드 풀에서 최대 prefetch개 앞서 진행되므로
+    전체 시간은 GPU 재구성 시간에 수렴합니다.
+
+    Args:
+        pipeline: 로드된 TextTo3DPipeline
+        items: load_batch() 결과
+        results: 항목별 JSONL 결과를 쓸 스트림
+        resume: 출력 파일이 이미 있는 항목 건너뛰기
+        prefetch: 재구성보다 앞서 준비할 이미지 수
+
+    Returns:
+        실패한 항목 수
+    """
+    def emit(item: dict, status: str, started: float, error: Optional[str] = None):
+        record = {
+            "index": item["index"],
+            "id": item["id"],
+            "status": status,
+            "output": item["output"],
+            "image": item["image"] or item["image_output"],
+            "seconds": round(time.perf_counter() - started, 2),
+            "error": error,
+        }
+        results.write(json.dumps(record, ensure_ascii=False) + "\n")
+        results.flush()
+
+    def fetch_image(item: dict) -> Optional[Image.Image]:
+        if item["image"]:
+            image = Image.open(item["image"])
+            image.load()
+            return image
+        Path(item["image_output"]).parent.mkdir(parents=True, exist_ok=True)
+        return pipeline.generate_image(item["prompt"], item["image_output"])
+
+    failures = 0
+    todo = []
+    for item in items:
+        if resume and Path(item["output"]).exists():
+            emit(item, "skipped", time.perf_counter())
+        else:
+            todo.append(item)
+
+    with ThreadPoolExecutor(max_workers=max(1, prefetch)) as executor:
+        futures: dict[int, Future] = {}
+        next_index = 0
+
+        def schedule(upto: int):
+            nonlocal next_index
+            while next_index < min(upto, len(todo)):
+                futures[next_index] = executor.submit(fetch_image, todo[next_index])
+                next_index += 1
+
+        schedule(prefetch + 1)
+        for i, item in enumerate(todo):
+            started = time.perf_counter()
+            try:
+                image = futures.pop(i).result()
+                # 현재 항목 재구성 동안 다음 이미지들을 미리 준비
+                schedule(i + prefetch + 2)
+                if image is None:
+                    raise RuntimeError("Image generation failed")
+
+                # 중단 시 불완전한 파일이 --resume에서 완료로 취급되지 않도록 임시 파일에 쓴 뒤 교체
+                output = Path(item["output"])
+                output.parent.mkdir(parents=True, exist_ok=True)
+                partial = output.with_name(f"{output.stem}.partial{output.suffix}")
+                pipeline.image_to_3d.generate(
+                    image,
+                    str(partial),
+                    decimation_target=item["decimation_target"],
+                    texture_size=item["texture_size"],
+                )
+                os.replace(partial, output)
+                emit(item, "completed", started)
+            except Exception as e:
+                failures += 1
+                schedule(i + prefetch + 2)
+                emit(item, "failed", started, str(e))
+
+    return failures
+
+
 # ============================================================================
 # CLI Interface
 # ============================================================================
@@ -366,6 +1143,13 @@ Examples:
 
   # 기존 이미지에서 3D 모델 생성
   python text_to_3d_pipeline.py --image input.png --output model.glb
+
+  # 원본 메시를 저장해 두고 다른 옵션으로 다시 내보내기
+  python text_to_3d_pipeline.py --image input.png --output model.glb --save-mesh mesh_cache/
+  python text_to_3d_pipeline.py --reexport mesh_cache/ --output model_lo.glb --decimation-target 20000 --texture-size 1024
+
+  # 배치 (JSONL/CSV: prompt 또는 image, output, decimation_target, texture_size)
+  python text_to_3d_pipeline.py --batch catalog.jsonl --resume > results.jsonl
         """
     )
 
@@ -398,6 +1182,52 @@ Examples:
         action="store_true",
         help="중간 생성 이미지 보존"
     )
+    parser.add_argument(
+        "--decimation-target",
+        type=int,
+        default=DEFAULT_DECIMATION_TARGET,
+        help=f"메시 단순화 목표 면 수 (기본: {DEFAULT_DECIMATION_TARGET})"
+    )
+    parser.add_argument(
+        "--texture-size",
+        type=int,
+        default=DEFAULT_TEXTURE_SIZE,
+        help=f"텍스처 해상도 (기본: {DEFAULT_TEXTURE_SIZE})"
+    )
+    parser.add_argument(
+        "--lods",
+        default="",
+        help='추가 LOD 단계 "면수:텍스처:거리,..." (예: "25000:1024:15,5000:512:40")'
+    )
+    parser.add_argument(
+        "--save-mesh",
+        help="재내보내기용 원본 메시 저장 디렉토리"
+    )
+    parser.add_argument(
+        "--reexport",
+        help="--save-mesh로 저장한 원본 메시에서 GLB만 다시 생성"
+    )
+    parser.add_argument(
+        "--batch", "-b",
+        help="배치 매니페스트 경로 (JSONL/CSV) - 항목별 결과를 stdout에 JSONL로 출력"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="배치에서 출력 파일이 이미 있는 항목 건너뛰기"
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=2,
+        help="배치에서 3D 재구성보다 앞서 준비할 이미지 수 (기본: 2)"
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        default=IMAGE_HEDGE,
+        help="이미지 모델 헤징 (지연 시 다음 모델을 병렬로 시작)"
+    )
 
     args = parser.parse_args()
 
@@ -405,14 +1235,38 @@ Examples:
     prompt = args.prompt or args.prompt_arg
 
     # 파이프라인 초기화
-    pipeline = TextTo3DPipeline(api_key=args.api_key)
+    pipeline = TextTo3DPipeline(api_key=args.api_key, hedge=args.hedge)
+
+    if args.batch:
+        items = load_batch(args.batch)
+        results = sys.stdout
+        # 진행 로그는 stderr로 보내 stdout에는 JSONL 결과만 남김
+        with contextlib.redirect_stdout(sys.stderr):
+            pipeline.image_to_3d.load_pipeline()
+            failures = run_batch(pipeline, items, results, resume=args.resume, prefetch=args.prefetch)
+        print(f"\nBatch done: {len(items)} items, {failures} failed", file=sys.stderr)
+        if failures:
+            exit(1)
+        return
+
+    export = {
+        "decimation_target": args.decimation_target,
+        "texture_size": args.texture_size,
+        "lod_levels": parse_lod_levels(args.lods),
+    }
+
+    if args.reexport:
+        # 저장된 원본 메시에서 GLB 재생성 (TRELLIS.2 실행 없음)
+        model_path = pipeline.image_to_3d.reexport(args.reexport, args.output, **export)
+        print(f"\n🎉 Success! Output: {model_path}")
+        return
 
     if args.image:
         # 이미지에서 3D 생성
-        result = pipeline.generate_from_image(args.image, args.output)
+        result = pipeline.generate_from_image(args.image, args.output, mesh_cache_dir=args.save_mesh, **export)
     elif prompt:
         # 텍스트에서 3D 생성
-        result = pipeline.generate(prompt, args.output, args.keep_image)
+        result = pipeline.generate(prompt, args.output, args.keep_image, mesh_cache_dir=args.save_mesh, **export)
     else:
         parser.print_help()
         return
@@ -18,7 +18,11 @@ sys.path.insert(0, str(PROJECT_ROOT))
 sys.path.insert(0, str(PROJECT_ROOT / "trellis2"))
 
 # 라우터 import
-from routers import generate
+from routers import assets, generate, metrics, worlds
+from services.asset_metadata import asset_metadata
+from services.events import job_events
+from services.result_cache import result_cache
+from services.worker import worker_pool
 
 
 @asynccontextmanager
@@ -33,10 +37,21 @@ async def lifespan(app: FastAPI):
     (assets_dir / "models").mkdir(parents=True, exist_ok=True)
     (assets_dir / "images").mkdir(parents=True, exist_ok=True)
 
+    # 에셋 메타데이터 인덱스 (생성 파일 - 없거나 GLB가 바뀌었으면 여기서 증분 갱신)
+    asset_metadata.ensure_loaded()
+
+    # GPU 워커 시작 (각 워커 프로세스가 모델을 한 번만 로드)
+    worker_pool.start()
+    # 공유 이벤트 로그 폴링 (JOB_STORE=sqlite일 때만 - 다른 API 프로세스의 작업 이벤트 수신)
+    job_events.start()
+
     yield
 
     # 종료 시
     print("Shutting down...")
+    job_events.stop()
+    worker_pool.stop()
+    result_cache.flush()
 
 
 # FastAPI 앱 생성
@@ -68,6 +83,9 @@ if assets_path.exists():
 
 # 라우터 등록
 app.include_router(generate.router)
+app.include_router(metrics.router)
+app.include_router(assets.router)
+app.include_router(worlds.router)
 
 
 @app.get("/")
@@ -89,6 +107,7 @@ async def health_check():
         "status": "healthy",
         "cuda_available": torch.cuda.is_available(),
         "gpu_name": torch.cuda.get_device_name(0) if torch.cuda.is_available() else None,
+        "workers": worker_pool.stats(),
     }
 
 
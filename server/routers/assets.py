@@ -0,0 +1,48 @@
+"""
+에셋 라이브러리 API 라우터
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
+
+from services.asset_index import asset_index
+from services.asset_metadata import asset_metadata
+
+router = APIRouter(prefix="/api/assets", tags=["assets"])
+
+
+@router.get("")
+async def list_assets(
+    category: Optional[str] = None,
+    status: Optional[str] = Query(None, description="ok | placeholder | broken | missing"),
+    max_triangles: Optional[int] = Query(None, ge=0),
+    animated: Optional[bool] = None,
+):
+    """manifest 에셋 메타데이터 목록 (바운딩 박스, 삼각형 수, 텍스처 메모리 등)"""
+    assets = asset_metadata.query(category=category, status=status, max_triangles=max_triangles, animated=animated)
+    return {"assets": assets, "total": len(assets)}
+
+
+@router.get("/search")
+async def search_assets(
+    q: str = Query(..., min_length=1, description="검색어 (한국어/영어, 오타 허용)"),
+    k: int = Query(5, ge=1, le=50),
+    usable_only: bool = Query(False, description="자리표시/손상/없는 파일 제외"),
+):
+    """자유 텍스트 → 라이브러리 에셋 상위 k개"""
+    return {"query": q, "results": asset_index.search(q, k=k, usable_only=usable_only), "index": asset_index.stats()}
+
+
+@router.post("/reindex")
+async def reindex_assets(full: bool = False):
+    """사이드카 인덱스 갱신 (기본: 바뀐 파일만)"""
+    return asset_metadata.build(full=full)
+
+
+@router.get("/{path:path}")
+async def get_asset(path: str):
+    """단일 에셋 메타데이터 (path는 manifest의 models 기준 상대 경로)"""
+    asset = asset_metadata.get(path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    return asset
@@ -2,16 +2,33 @@
 3D 생성 API 라우터
 """
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import AsyncIterator, Optional
+import os
+import json
 import uuid
+import hashlib
 from pathlib import Path
 
+from services.events import job_events, TERMINAL_EVENTS
+from services.job_store import job_store, FINISHED_STATUSES
+from services.pipeline import has_mesh_cache
+from services.result_cache import result_cache, cache_key, export_options, lod_urls, RESULT_CACHE_ENABLED
+from services.single_flight import single_flight
+from services.worker import worker_pool, QueueFullError
+
 router = APIRouter(prefix="/api/generate", tags=["generate"])
 
-# 작업 상태 저장 (프로덕션에서는 Redis 사용 권장)
-jobs: dict = {}
+ASSETS_DIR = Path(__file__).parent.parent.parent / "assets"
+
+# 재내보내기용 원본 메시 캐시 (정적 파일로 노출되지 않도록 assets 밖에 저장)
+MESH_CACHE_ENABLED = os.environ.get("MESH_CACHE", "1") == "1"
+MESH_CACHE_DIR = Path(os.environ.get("MESH_CACHE_DIR", str(Path(__file__).parent.parent.parent / "data" / "meshes")))
+
+# 이벤트 스트림 keepalive 간격 (초)
+EVENT_KEEPALIVE_SECONDS = 15.0
 
 
 class GenerateRequest(BaseModel):
@@ -26,140 +43,375 @@ class GenerateFromImageRequest(BaseModel):
     options: dict = {}
 
 
+class ReexportRequest(BaseModel):
+    """GLB 재내보내기 요청"""
+    options: dict = {}
+
+
+class LodLevel(BaseModel):
+    """LOD 단계별 GLB"""
+    level: int
+    url: str
+    decimation_target: int
+    texture_size: int
+    distance: float  # 이 거리(m) 이상에서 사용
+    bytes: Optional[int] = None
+
+
 class GenerateResponse(BaseModel):
     """생성 응답"""
     job_id: str
     status: str  # pending, processing, completed, failed
     progress: int = 0
+    stage: Optional[str] = None  # 현재 파이프라인 단계 (image, sampler, mesh_simplify, glb_bake, glb_export ...)
     model_url: Optional[str] = None
     image_url: Optional[str] = None
+    lods: Optional[list[LodLevel]] = None  # LOD0(model_url)부터 거리순
     error: Optional[str] = None
+    cached: bool = False
+    coalesced: bool = False  # 실행 중인 동일 작업에 합류한 경우
 
 
-@router.post("", response_model=GenerateResponse)
-async def generate_3d(request: GenerateRequest, background_tasks: BackgroundTasks):
+class JobListResponse(BaseModel):
+    """작업 목록 응답"""
+    jobs: list[GenerateResponse]
+    total: int
+    offset: int
+    limit: int
+
+
+def to_response(job: dict) -> GenerateResponse:
+    """저장된 작업을 응답 모델로 변환"""
+    return GenerateResponse(
+        job_id=job["job_id"],
+        status=job["status"],
+        progress=job.get("progress", 0),
+        stage=job.get("stage"),
+        model_url=job.get("model_url"),
+        image_url=job.get("image_url"),
+        lods=job.get("lods"),
+        error=job.get("error"),
+        cached=job.get("cached", False),
+    )
+
+
+def mesh_cache_dir(job_id: str) -> Optional[str]:
+    """작업의 원본 메시 저장 경로 (비활성화 시 None)"""
+    return str(MESH_CACHE_DIR / job_id) if MESH_CACHE_ENABLED else None
+
+
+def submit_job(job_id: str, job: dict, payload: dict, dedup_key: str) -> GenerateResponse:
     """
-    텍스트 프롬프트에서 3D 모델 생성 (비동기)
+    작업을 워커 큐에 등록 - 큐가 가득 차면 503 + Retry-After
 
-    1. Gemini/Imagen으로 이미지 생성
-    2. TRELLIS.2로 3D 변환
+    같은 키의 작업이 이미 대기/실행 중이면 새 작업 대신 그 작업을 반환합니다.
     """
-    job_id = str(uuid.uuid4())
-    jobs[job_id] = {
-        "status": "pending",
-        "progress": 0,
-        "prompt": request.prompt,
-    }
+    # 다른 프로세스가 대표 작업을 조회할 수 있도록 등록 전에 작업 상태를 만들어 둠
+    # (워커 이벤트가 먼저 도착할 수 있으므로 큐 등록 전이기도 해야 함)
+    job_store.create(job_id, job)
+    while (leader_id := single_flight.claim(dedup_key, job_id)) is not None:
+        leader = job_store.get(leader_id)
+        if leader is not None and leader["status"] in ("pending", "processing"):
+            job_store.delete(job_id)
+            single_flight.attach()
+            return to_response(leader).model_copy(update={"coalesced": True})
+        # 해제되지 못한 대표 작업 (끝났거나 정리됨, 프로세스 종료 등) - 비우고 다시 등록
+        single_flight.release(leader_id)
 
-    background_tasks.add_task(run_text_to_3d_pipeline, job_id, request.prompt)
+    try:
+        worker_pool.submit({"job_id": job_id, **payload})
+    except QueueFullError as e:
+        single_flight.release(job_id)
+        job_store.delete(job_id)
+        raise HTTPException(
+            status_code=503,
+            detail="Generation queue is full",
+            headers={"Retry-After": str(e.retry_after)},
+        )
 
     return GenerateResponse(job_id=job_id, status="pending", progress=0)
 
 
-@router.post("/from-image", response_model=GenerateResponse)
-async def generate_from_image(request: GenerateFromImageRequest, background_tasks: BackgroundTasks):
+def submit_text_job(prompt: str, options: dict) -> GenerateResponse:
     """
-    기존 이미지에서 3D 모델 생성 (비동기)
+    텍스트 프롬프트 작업 등록 (결과 캐시 → 실행 중인 동일 작업 합류 → 워커 큐 순서)
+
+    월드 생성처럼 여러 오브젝트를 한 번에 요청하는 경로에서도 같은 중복 제거를 거칩니다.
     """
     job_id = str(uuid.uuid4())
-    jobs[job_id] = {
-        "status": "pending",
-        "progress": 0,
-        "image_path": request.image_path,
-    }
+    key = cache_key(prompt, options)
+
+    # 동일한 입력으로 이미 생성된 결과가 있으면 즉시 완료 처리
+    cached = result_cache.lookup(key) if RESULT_CACHE_ENABLED else None
+    if cached is not None:
+        job = {"status": "completed", "progress": 100, "prompt": prompt, "cached": True, **cached}
+        job_store.create(job_id, job)
+        return to_response({**job, "job_id": job_id})
+
+    mesh_dir = mesh_cache_dir(job_id)
+    return submit_job(
+        job_id,
+        {"status": "pending", "progress": 0, "prompt": prompt, "cache_key": key, "mesh_cache_dir": mesh_dir},
+        {
+            "kind": "text",
+            "prompt": prompt,
+            "output_path": str(ASSETS_DIR / "models" / f"{job_id}.glb"),
+            "image_output_path": str(ASSETS_DIR / "images" / f"{job_id}.png"),
+            "mesh_cache_dir": mesh_dir,
+            "export_options": export_options(options),
+        },
+        dedup_key=key,
+    )
 
-    background_tasks.add_task(run_image_to_3d_pipeline, job_id, request.image_path)
 
-    return GenerateResponse(job_id=job_id, status="pending", progress=0)
+@router.post("", response_model=GenerateResponse)
+async def generate_3d(request: GenerateRequest):
+    """
+    텍스트 프롬프트에서 3D 모델 생성 (비동기)
 
+    1. Gemini/Imagen으로 이미지 생성
+    2. TRELLIS.2로 3D 변환
+    """
+    return submit_text_job(request.prompt, request.options)
 
-@router.get("/{job_id}", response_model=GenerateResponse)
-async def get_job_status(job_id: str):
-    """작업 상태 조회"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs[job_id]
-    return GenerateResponse(
-        job_id=job_id,
-        status=job["status"],
-        progress=job.get("progress", 0),
-        model_url=job.get("model_url"),
-        image_url=job.get("image_url"),
-        error=job.get("error"),
+@router.post("/from-image", response_model=GenerateResponse)
+async def generate_from_image(request: GenerateFromImageRequest):
+    """
+    기존 이미지에서 3D 모델 생성 (비동기)
+    """
+    job_id = str(uuid.uuid4())
+    options = export_options(request.options)
+    key = hashlib.sha256(
+        json.dumps({"image_path": str(Path(request.image_path).resolve()), "export": options}, sort_keys=True).encode()
+    ).hexdigest()
+
+    mesh_dir = mesh_cache_dir(job_id)
+    return submit_job(
+        job_id,
+        {"status": "pending", "progress": 0, "image_path": request.image_path, "mesh_cache_dir": mesh_dir},
+        {
+            "kind": "image",
+            "image_path": request.image_path,
+            "output_path": str(ASSETS_DIR / "models" / f"{job_id}.glb"),
+            "mesh_cache_dir": mesh_dir,
+            "export_options": options,
+        },
+        dedup_key=key,
     )
 
 
-async def run_text_to_3d_pipeline(job_id: str, prompt: str):
-    """백그라운드에서 Text → Image → 3D 파이프라인 실행"""
-    from services.pipeline import TextTo3DPipeline
+@router.post("/{job_id}/reexport", response_model=GenerateResponse)
+async def reexport_job(job_id: str, request: ReexportRequest):
+    """
+    완료된 작업의 원본 메시에서 새 내보내기 옵션으로 GLB 재생성 (비동기)
+
+    TRELLIS.2를 다시 실행하지 않고 GLB 후처리만 수행합니다.
+    """
+    source = job_store.get(job_id)
+    if source is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if source["status"] != "completed":
+        raise HTTPException(status_code=409, detail="Job is not completed")
+    mesh_dir = source.get("mesh_cache_dir")
+    if not mesh_dir or not has_mesh_cache(mesh_dir):
+        raise HTTPException(status_code=409, detail="No cached mesh for this job")
+
+    new_job_id = str(uuid.uuid4())
+    options = export_options(request.options)
+    key = cache_key(source["prompt"], request.options) if source.get("prompt") else None
+
+    # 텍스트 작업은 같은 프롬프트 + 옵션의 결과가 이미 있으면 즉시 완료 처리
+    cached = result_cache.lookup(key) if key and RESULT_CACHE_ENABLED else None
+    if cached is not None:
+        job = {"status": "completed", "progress": 100, "prompt": source["prompt"], "cached": True, **cached}
+        job_store.create(new_job_id, job)
+        return to_response({**job, "job_id": new_job_id})
+
+    job = {"status": "pending", "progress": 0, "source_job_id": job_id, "mesh_cache_dir": mesh_dir}
+    if source.get("prompt"):
+        job.update(prompt=source["prompt"], cache_key=key)
+    # 원본 작업의 이미지를 그대로 사용
+    image_path = source.get("image_path")
+    if image_path is None and source.get("image_url"):
+        image_path = str(ASSETS_DIR / source["image_url"].removeprefix("/assets/"))
+    if image_path is not None:
+        job["image_path"] = image_path
+
+    dedup_key = hashlib.sha256(
+        json.dumps({"mesh_cache_dir": mesh_dir, "export": options}, sort_keys=True).encode()
+    ).hexdigest()
+
+    return submit_job(
+        new_job_id,
+        job,
+        {
+            "kind": "reexport",
+            "mesh_cache_dir": mesh_dir,
+            "image_path": image_path,
+            "output_path": str(ASSETS_DIR / "models" / f"{new_job_id}.glb"),
+            "export_options": options,
+        },
+        dedup_key=dedup_key,
+    )
 
-    try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["progress"] = 10
 
-        # 출력 경로 설정
-        assets_dir = Path(__file__).parent.parent.parent / "assets"
-        output_path = assets_dir / "models" / f"{job_id}.glb"
-        image_path = assets_dir / "images" / f"{job_id}.png"
+@router.get("", response_model=JobListResponse)
+async def list_jobs(
+    status: Optional[str] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """작업 목록 조회 (최신순, 상태 필터)"""
+    items, total = job_store.list(status=status, offset=offset, limit=limit)
+    return JobListResponse(
+        jobs=[to_response(job) for job in items],
+        total=total,
+        offset=offset,
+        limit=limit,
+    )
 
-        # 파이프라인 실행
-        pipeline = TextTo3DPipeline()
 
-        jobs[job_id]["progress"] = 20
+@router.get("/stats")
+async def get_stats():
+    """결과 캐시/큐/작업 상태 통계"""
+    flights = single_flight.stats()
+    queue = worker_pool.stats()
+    return {
+        "cache": result_cache.stats(),
+        "single_flight": {
+            **flights,
+            # 병합된 요청 수 × 평균 작업 시간 = 절약된 GPU 시간 추정치
+            "gpu_seconds_saved": round(flights["coalesced"] * queue["avg_job_seconds"], 1),
+        },
+        "queue": queue,
+        "jobs": job_store.count_by_status(),
+        "events": job_events.stats(),
+    }
 
-        result = pipeline.generate(
-            text_prompt=prompt,
-            output_path=str(output_path),
-            keep_image=True,
-        )
 
-        if result["success"]:
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["progress"] = 100
-            jobs[job_id]["model_url"] = f"/assets/models/{job_id}.glb"
-            if result.get("image_path"):
-                jobs[job_id]["image_url"] = f"/assets/images/{job_id}.png"
-        else:
-            jobs[job_id]["status"] = "failed"
-            jobs[job_id]["error"] = result.get("error", "Unknown error")
+@router.get("/{job_id}", response_model=GenerateResponse)
+async def get_job_status(job_id: str):
+    """작업 상태 조회"""
+    job = job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    except Exception as e:
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
+    return to_response(job)
 
 
-async def run_image_to_3d_pipeline(job_id: str, image_path: str):
-    """백그라운드에서 Image → 3D 파이프라인 실행"""
-    from services.pipeline import TextTo3DPipeline
+async def job_event_stream(job_id: str) -> AsyncIterator[Optional[dict]]:
+    """
+    작업 이벤트 스트림 - 현재 상태(snapshot)를 먼저 보낸 뒤 종료될 때까지 이벤트를 전달
 
+    keepalive 간격 동안 이벤트가 없으면 None을 yield 합니다.
+    """
+    # 구독을 먼저 등록해야 snapshot 조회와 구독 사이의 이벤트를 잃지 않음
+    subscription = job_events.subscribe(job_id)
     try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["progress"] = 10
-
-        # 출력 경로 설정
-        assets_dir = Path(__file__).parent.parent.parent / "assets"
-        output_path = assets_dir / "models" / f"{job_id}.glb"
+        job = job_store.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        yield {"event": "snapshot", **to_response(job).model_dump(), "detail": {}}
+        if job["status"] in FINISHED_STATUSES:
+            return
+
+        while True:
+            event = await subscription.get(timeout=EVENT_KEEPALIVE_SECONDS)
+            yield event
+            if event is not None and event["event"] in TERMINAL_EVENTS:
+                return
+    finally:
+        job_events.unsubscribe(subscription)
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """작업 진행 상황 Server-Sent Events 스트림"""
+    if job_store.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
 
-        # 파이프라인 실행
-        pipeline = TextTo3DPipeline()
+    async def sse():
+        async for event in job_event_stream(job_id):
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-        jobs[job_id]["progress"] = 30
 
-        result = pipeline.generate_from_image(
-            image_path=image_path,
-            output_path=str(output_path),
-        )
+@router.websocket("/{job_id}/events")
+async def websocket_job_events(websocket: WebSocket, job_id: str):
+    """작업 진행 상황 WebSocket 스트림 (SSE와 같은 이벤트를 JSON 메시지로 전송)"""
+    await websocket.accept()
+    if job_store.get(job_id) is None:
+        await websocket.close(code=4404, reason="Job not found")
+        return
 
-        if result["success"]:
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["progress"] = 100
-            jobs[job_id]["model_url"] = f"/assets/models/{job_id}.glb"
-            jobs[job_id]["image_url"] = f"/assets/images/{Path(image_path).name}"
-        else:
-            jobs[job_id]["status"] = "failed"
-            jobs[job_id]["error"] = result.get("error", "Unknown error")
-
-    except Exception as e:
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
+    try:
+        async for event in job_event_stream(job_id):
+            if event is not None:
+                await websocket.send_json(event)
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
+
+
+def handle_worker_event(event: dict):
+    """워커 이벤트를 작업 상태에 반영 (워커 풀 리스너 스레드에서 호출됨)"""
+    job_id = event.get("job_id")
+    if job_id is None:
+        return
+
+    event_type = event["type"]
+
+    if event_type == "started":
+        job_store.update(job_id, status="processing", progress=10)
+    elif event_type == "progress":
+        job_store.update(job_id, progress=event["progress"], stage=event.get("stage"))
+    elif event_type == "completed":
+        job = job_store.get(job_id)
+        if job is None:
+            return
+        fields = {"status": "completed", "progress": 100, "stage": None, "model_url": f"/assets/models/{job_id}.glb"}
+        if "image_path" in job:
+            fields["image_url"] = f"/assets/images/{Path(job['image_path']).name}"
+        elif event["result"].get("image_path"):
+            fields["image_url"] = f"/assets/images/{job_id}.png"
+        fields["lods"] = lod_urls(event["result"].get("lods"))
+        job_store.update(job_id, **fields)
+
+        if job.get("cache_key"):
+            result = event["result"]
+            result_cache.put(
+                job["cache_key"],
+                result["model_path"],
+                result.get("image_path"),
+                mesh_cache_dir=job.get("mesh_cache_dir"),
+                lods=result.get("lods"),
+            )
+        # 캐시 등록 이후에 해제해야 뒤따르는 동일 요청이 캐시에 적중함
+        single_flight.release(job_id)
+    elif event_type == "failed":
+        job_store.update(job_id, status="failed", error=event["error"])
+        single_flight.release(job_id)
+    else:
+        return
+
+    # 구독 중인 클라이언트에 변경된 상태 전달
+    job = job_store.get(job_id)
+    if job is not None:
+        job_events.publish(job_id, {
+            "event": event_type,
+            **to_response(job).model_dump(),
+            "detail": event.get("detail", {}),
+        })
+
+
+worker_pool.add_handler(handle_worker_event)
@@ -0,0 +1,34 @@
+"""
+Prometheus 메트릭 라우터
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from services.job_store import job_store
+from services.metrics import registry, record_worker_event, queue_depth, jobs_running, jobs_by_status, CONTENT_TYPE
+from services.worker import worker_pool
+
+router = APIRouter(tags=["metrics"])
+
+
+def collect_queue_metrics():
+    """스크레이프 시점의 큐/작업 상태 반영"""
+    queue = worker_pool.stats()
+    queue_depth.set(queue["queued"])
+    jobs_running.set(queue["running"])
+    jobs_by_status.replace({
+        (("status", status),): count for status, count in job_store.count_by_status().items()
+    })
+
+
+registry.add_collector(collect_queue_metrics)
+
+# 워커 프로세스에서 전달되는 단계 타이머/작업 결과 집계
+worker_pool.add_handler(record_worker_event)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
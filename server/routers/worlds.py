@@ -0,0 +1,632 @@
+"""
+월드 생성 API 라우터
+장면 설명을 WorldSpec으로 만들며, 라이브러리에 없는 오브젝트만 3D 생성 작업으로 보냅니다.
+"""
+
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Any, AsyncIterator, Callable, Optional
+import json
+import uuid
+
+from shared.types.world_spec import WorldSpec, ValidationResult
+from services.events import job_events, TERMINAL_EVENTS
+from services.job_store import job_store
+from services.scene_parser import split_scene, MAX_OBJECT_COUNT
+from services.world_builder import (
+    DEFAULT_ROOM_SIZE,
+    resolve_objects,
+    asset_bounds,
+    layout_entities,
+    library_entity,
+    placeholder_entity,
+    generated_entity_fields,
+    spawnpoint,
+)
+from services.json_patch import JsonPatchError, JsonPatchTestFailed
+from services.world_repository import world_repository, WorldVersionConflict
+from services.world_chunks import WORLD_CHUNK_RADIUS, ChunkCache, ChunkIndex, chunk_cache, parse_if_none_match
+from services.world_query import WorldQuery, query_cache
+from services.world_binary import WORLD_BINARY_MEDIA_TYPE, encode_world, wants_binary
+from services.world_instancing import instance_world
+from services.world_schema import validate_world_json
+from services.world_validator import MAX_ISSUES, validate_world
+from routers.generate import submit_text_job, ASSETS_DIR, EVENT_KEEPALIVE_SECONDS
+
+router = APIRouter(prefix="/api/worlds", tags=["worlds"])
+
+WORLD_TERMINAL_EVENTS = ("complete",)
+
+
+class WorldObject(BaseModel):
+    """장면 오브젝트 (개수만큼 엔티티로 배치)"""
+    prompt: str = Field(..., min_length=1)
+    count: int = Field(1, ge=1, le=MAX_OBJECT_COUNT)
+
+
+class WorldGenerateRequest(BaseModel):
+    """월드 생성 요청"""
+    prompt: str = ""
+    name: Optional[str] = None
+    size: Optional[tuple[float, float, float]] = None  # 방 크기 [x, y, z] (m)
+    objects: Optional[list[WorldObject]] = None  # 지정하면 prompt 분리 대신 사용 (예: LLM 파싱 결과)
+    options: dict = {}  # 생성 작업 내보내기 옵션
+    min_score: float = Field(0.6, ge=0.0, le=1.0)  # 라이브러리 매칭 최소 점수
+
+
+class PendingObject(BaseModel):
+    """생성 중인 오브젝트"""
+    job_id: str
+    prompt: str
+    entity_ids: list[str]
+    status: str  # pending, completed, failed
+    error: Optional[str] = None
+
+
+class WorldStats(BaseModel):
+    """라이브러리 해석/생성 집계"""
+    objects: int  # 서로 다른 오브젝트 문구 수
+    entities: int
+    library: int  # 라이브러리 에셋으로 배치된 엔티티 수
+    generated: int  # 생성 모델로 배치될 엔티티 수
+    jobs: int  # 생성이 필요한 서로 다른 문구 수
+    cached: int  # 결과 캐시에 이미 있던 문구 수
+    coalesced: int  # 실행 중인 동일 작업에 합류한 문구 수
+    gpu_runs: int  # 새로 큐에 넣은 생성 작업 수
+    gpu_runs_avoided: int  # 엔티티마다 생성했을 때 대비 줄어든 작업 수
+    rejected: int = 0  # 큐가 가득 차 자리표시로 남은 문구 수
+
+
+class WorldResponse(BaseModel):
+    """월드 응답"""
+    world_id: str
+    version: int
+    world_spec: dict
+    pending: list[PendingObject]
+    stats: WorldStats
+
+
+def to_world_response(world: dict) -> WorldResponse:
+    return WorldResponse(
+        world_id=world["world_id"],
+        version=world["version"],
+        world_spec=world["spec"],
+        pending=[PendingObject(job_id=job_id, **item) for job_id, item in world["pending"].items()],
+        stats=WorldStats(**world["stats"]),
+    )
+
+
+def negotiate_world(world: dict, request: Request, response: Response, instanced: bool = False):
+    """
+    Accept에 따라 WorldResponse(JSON) 또는 바이너리 WorldSpec 반환
+    바이너리에서는 world_spec 외 필드(world_id, version, pending, stats)를 meta로 함께 보냅니다.
+    instanced면 반복 엔티티를 InstancedEntity로 묶은 world_spec을 보내며 (JSON만), 엔티티 순서/인덱스가
+    저장된 월드와 다르므로 PATCH의 If-Match와 일치하지 않는 별도의 약한 ETag를 씁니다.
+    """
+    result = to_world_response(world)
+    if not wants_binary(request.headers.get("accept")):
+        if instanced:
+            result.world_spec = instance_world(world["spec"])
+        response.headers.update({"Vary": "Accept", "ETag": world_etag(world["version"], instanced)})
+        return result
+    if instanced:
+        raise HTTPException(status_code=406, detail="Instanced worlds are only available as JSON")
+    meta = result.model_dump(exclude={"world_spec"})
+    return Response(
+        encode_world(world["spec"], meta),
+        media_type=WORLD_BINARY_MEDIA_TYPE,
+        headers={"Vary": "Accept", "ETag": world_etag(world["version"])},
+    )
+
+
+def world_etag(version: int, instanced: bool = False) -> str:
+    """월드 버전 ETag - 저장된 표현의 강한 ETag만 PATCH의 If-Match에 사용 가능"""
+    if instanced:
+        return f'W/"{version}-instanced"'
+    return f'"{version}"'
+
+
+def parse_if_match(header: Optional[str]) -> Optional[list[Optional[int]]]:
+    """
+    If-Match → 허용 버전 목록 (None 원소는 "*", 헤더가 없으면 None)
+
+    강한 비교 (RFC 9110) - 약한 ETag(W/...)나 다른 표현의 ETag("3-instanced")는 어떤 버전과도
+    일치하지 않으므로 목록에서 빠짐 (모두 빠지면 빈 목록 → 412)
+    """
+    if header is None:
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        value = tag.strip('"')
+        if tag == "*":
+            versions.append(None)
+        elif value.isdigit() and not tag.startswith("W/"):
+            versions.append(int(value))
+        elif not (tag.removeprefix("W/").startswith('"') and tag.endswith('"') and len(tag.removeprefix("W/")) >= 2):
+            raise HTTPException(status_code=400, detail=f"Invalid If-Match value {tag!r}")
+    return versions
+
+
+@router.post("/generate", response_model=WorldResponse)
+async def generate_world(request: WorldGenerateRequest, http_request: Request, response: Response):
+    """
+    장면 설명 → WorldSpec (라이브러리 우선)
+
+    1. 설명을 오브젝트 문구와 개수로 분리
+    2. manifest 라이브러리에서 찾은 오브젝트는 GlbEntity로 즉시 배치
+    3. 찾지 못한 오브젝트는 문구별로 한 번만 생성 작업 등록 (결과 캐시/single-flight 적용),
+       완료될 때까지 자리표시 상자로 두고 작업이 끝나면 GlbEntity로 교체
+
+    Accept: application/vnd.worldspec+binary면 바이너리 WorldSpec으로 응답
+    """
+    objects = [obj.model_dump() for obj in request.objects] if request.objects else split_scene(request.prompt)
+    if not objects:
+        raise HTTPException(status_code=422, detail="No objects found in prompt")
+
+    room_size = tuple(request.size) if request.size else DEFAULT_ROOM_SIZE
+    resolved = resolve_objects(objects, request.min_score)
+
+    instances = []
+    for obj in resolved:
+        bounds = asset_bounds(obj["asset"]["path"]) if obj["asset"] else None
+        instances.extend({"object": obj, "bounds": bounds} for _ in range(obj["count"]))
+    placements = layout_entities(instances, room_size)
+
+    entities, waiting = [], {}  # waiting: 정규화 문구 → 엔티티 ID
+    for i, (instance, placement) in enumerate(zip(instances, placements)):
+        obj = instance["object"]
+        if obj["asset"]:
+            entity_id = f"{obj['asset']['path'].rsplit('/', 1)[-1].split('.')[0]}_{i}"
+            entities.append(library_entity(entity_id, obj["prompt"], obj["asset"], placement))
+        else:
+            entity_id = f"object_{i}"
+            entities.append(placeholder_entity(entity_id, obj["prompt"], placement))
+            waiting.setdefault(obj["key"], {"prompt": obj["prompt"], "entity_ids": []})["entity_ids"].append(entity_id)
+
+    world_id = str(uuid.uuid4())
+    spec = WorldSpec.model_validate({
+        "version": "1.0",
+        "name": request.name or request.prompt[:40] or "Generated World",
+        "space": {"type": "room", "size": room_size},
+        "spawnpoint": spawnpoint(room_size),
+        "entities": entities,
+    })
+    # 배치 후 검증 - 큰 에셋이 겹치거나 방 밖으로 나간 경우 자동 수정본을 저장
+    validation = validate_world(spec, auto_fix=True)
+    if validation.auto_fixed is not None:
+        print(f"World {world_id}: layout auto-fixed ({len(validation.errors)} issues)")
+        spec = validation.auto_fixed
+    spec = spec.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    stats = {
+        "objects": len(resolved),
+        "entities": len(entities),
+        "library": sum(obj["count"] for obj in resolved if obj["asset"]),
+        "generated": sum(len(item["entity_ids"]) for item in waiting.values()),
+        "jobs": len(waiting),
+        "cached": 0,
+        "coalesced": 0,
+        "gpu_runs": 0,
+        "gpu_runs_avoided": 0,
+        "rejected": 0,
+    }
+
+    # 문구별 생성 작업 등록 - 캐시에 있으면 바로 GLB로 교체
+    pending = {}
+    for item in waiting.values():
+        try:
+            job = submit_text_job(item["prompt"], request.options)
+        except HTTPException as e:
+            if e.status_code != 503:
+                raise
+            stats["rejected"] += 1
+            continue
+        if job.cached:
+            stats["cached"] += 1
+        elif job.coalesced:
+            stats["coalesced"] += 1
+        else:
+            stats["gpu_runs"] += 1
+        if job.job_id in pending:
+            pending[job.job_id]["entity_ids"].extend(item["entity_ids"])
+        else:
+            pending[job.job_id] = item
+    stats["gpu_runs_avoided"] = stats["entities"] - stats["gpu_runs"]
+
+    world_repository.create(world_id, spec, pending, stats)
+    print(f"World {world_id}: {stats['library']} library, {stats['generated']} generated entities, "
+          f"{stats['gpu_runs']} GPU runs ({stats['gpu_runs_avoided']} avoided)")
+
+    # 캐시 적중 작업과, 월드 등록 전에 이미 끝난 작업 반영
+    for job_id in pending:
+        job = job_store.get(job_id)
+        if job is not None and job["status"] in ("completed", "failed"):
+            apply_job_result(job_id, job)
+
+    return negotiate_world(world_repository.get(world_id), http_request, response)
+
+
+@router.post("/validate", response_model=ValidationResult, response_model_by_alias=True)
+def validate_world_spec(spec: WorldSpec, auto_fix: bool = True):
+    """
+    WorldSpec 검증 (겹침, 방 밖 엔티티, 지오메트리 안의 시작 위치, zone 불일치)
+
+    auto_fix면 겹친 엔티티를 밀어내고 방 안으로 옮긴 스펙을 autoFixed로 함께 반환합니다.
+    엔티티가 많으면 CPU를 오래 쓰므로 이벤트 루프 대신 스레드풀에서 실행되도록 동기 함수로 둡니다.
+    """
+    return validate_world(spec, auto_fix=auto_fix)
+
+
+@router.post("/validate/schema")
+def validate_world_schema(spec: Any = Body(...)):
+    """
+    WorldSpec JSON 스키마 검사만 수행 (world-spec.schema.json에서 생성한 검증기)
+
+    pydantic 모델을 만들지 않아 LLM 출력처럼 반복 검증하는 큰 월드에 빠르며,
+    모든 오류를 JSON Pointer와 함께 한 번에 돌려줍니다. 배치 검사(겹침 등)는 /validate를 사용합니다.
+    """
+    errors = validate_world_json(spec)
+    return {
+        "valid": not errors,
+        "error_count": len(errors),
+        "errors": [{"pointer": pointer, "message": message} for pointer, message in errors[:MAX_ISSUES]],
+    }
+
+
+@router.get("/{world_id}", response_model=WorldResponse)
+async def get_world(world_id: str, request: Request, response: Response, instanced: bool = False):
+    """
+    월드 조회 (생성이 끝난 오브젝트는 GlbEntity로 교체된 상태)
+
+    Accept: application/vnd.worldspec+binary면 바이너리 WorldSpec으로 응답
+    instanced=true면 같은 에셋을 반복하는 엔티티를 InstancedEntity로 묶어 응답 (저장된 월드는 그대로)
+    """
+    world = world_repository.get(world_id)
+    if world is None:
+        raise HTTPException(status_code=404, detail="World not found")
+    return negotiate_world(world, request, response, instanced)
+
+
+@router.patch("/{world_id}")
+def patch_world(world_id: str, request: Request, response: Response, operations: list[dict] = Body(...)):
+    """
+    RFC 6902 JSON Patch로 월드 편집 (Content-Type: application/json-patch+json)
+
+    바뀐 엔티티만 방/시작 위치/격자 이웃과 다시 검증하므로 편집 지연이 월드 크기와 무관합니다
+    (방 크기나 entities 전체를 바꾸면 전체 검증). If-Match에 GET 응답의 ETag를 넣으면 그 사이 다른
+    편집이 있었을 때 412로 거절합니다. 적용된 patch는 /events 구독자에게 patch 이벤트로 전달됩니다.
+    """
+    allowed = parse_if_match(request.headers.get("if-match"))
+    expected = None
+    if allowed is not None and None not in allowed:
+        current = world_repository.version(world_id)
+        if current is None:
+            raise HTTPException(status_code=404, detail="World not found")
+        if not allowed:
+            raise HTTPException(
+                status_code=412,
+                detail="If-Match must be the stored world's ETag (weak and instanced ETags never match)",
+                headers={"ETag": world_etag(current)},
+            )
+        # 여러 ETag 중 하나라도 현재 버전이면 그 버전을 기준으로 적용
+        expected = current if current in allowed else allowed[0]
+
+    try:
+        result = world_repository.patch(world_id, operations, expected)
+    except WorldVersionConflict as e:
+        raise HTTPException(
+            status_code=412,
+            detail=f"World was modified (current version {e.version})",
+            headers={"ETag": world_etag(e.version)},
+        )
+    except JsonPatchTestFailed as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except JsonPatchError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail="World not found")
+
+    validation = result["validation"].model_dump(by_alias=True, exclude_none=True)
+    if operations:
+        publish_world_event(world_id, {
+            "event": "patch",
+            "world_id": world_id,
+            "version": result["version"],
+            "patch": operations,
+            "validation": validation,
+        })
+    response.headers["ETag"] = world_etag(result["version"])
+    return {
+        "world_id": world_id,
+        "version": result["version"],
+        "touched": result["touched"],
+        "removed": result["removed"],
+        "full_validation": result["full"],
+        "validation": validation,
+    }
+
+
+def load_world_index(world_id: str, cache: ChunkCache, build: Callable[[dict], Any]) -> tuple[int, Any]:
+    """현재 버전의 월드 인덱스 (버전이 바뀌었을 때만 다시 구성)"""
+    version = world_repository.version(world_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="World not found")
+    index = cache.get(world_id, version)
+    if index is None:
+        world = world_repository.get(world_id)
+        if world is None:
+            raise HTTPException(status_code=404, detail="World not found")
+        version, index = world["version"], build(world["spec"])
+        cache.put(world_id, version, index)
+    return version, index
+
+
+def load_chunk_index(world_id: str) -> tuple[int, ChunkIndex]:
+    """현재 버전의 청크 인덱스"""
+    return load_world_index(world_id, chunk_cache, ChunkIndex)
+
+
+@router.get("/{world_id}/chunks")
+def get_world_chunks(
+    world_id: str,
+    request: Request,
+    x: Optional[float] = None,
+    y: Optional[float] = None,
+    z: Optional[float] = None,
+    radius: float = Query(WORLD_CHUNK_RADIUS, ge=0),
+):
+    """
+    (x, y, z)에서 radius 안에 걸치는 청크의 엔티티/zone (가까운 청크부터)
+
+    좌표를 생략하면 spawnpoint 기준입니다. If-None-Match에 이미 받은 청크 ETag들을 넣으면
+    해당 청크는 내용 없이 "unchanged": true로만 표시됩니다.
+    CPU를 쓰는 분할은 스레드풀에서 실행되도록 동기 함수로 둡니다.
+    """
+    version, index = load_chunk_index(world_id)
+    spawnpoint = index.header["spawnpoint"]
+    center = [float(v if v is not None else default) for v, default in zip((x, y, z), spawnpoint)]
+    known = parse_if_none_match(request.headers.get("if-none-match"))
+
+    chunks = []
+    for key, distance in index.nearest(center, radius):
+        etag = index.etag(key)
+        chunk = {"key": key, "etag": etag, "distance": round(distance, 3), "bounds": index.bounds(key)}
+        if etag in known:
+            chunk["unchanged"] = True
+        else:
+            chunk.update(index.chunk(key))
+        chunks.append(chunk)
+
+    return JSONResponse({
+        "world_id": world_id,
+        "version": version,
+        "chunk_size": index.chunk_size,
+        "world": index.header,
+        "center": center,
+        "radius": radius,
+        "total_chunks": len(index),
+        "chunks": chunks,
+    })
+
+
+@router.get("/{world_id}/chunks/{key}")
+def get_world_chunk(world_id: str, key: str, request: Request):
+    """청크 하나 ("cx,cz") - ETag가 같으면 304"""
+    _, index = load_chunk_index(world_id)
+    try:
+        etag = index.etag(key)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Chunk not found")
+    if etag in parse_if_none_match(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers={"ETag": etag})
+    return JSONResponse({"key": key, "bounds": index.bounds(key), **index.chunk(key)}, headers={"ETag": etag})
+
+
+def parse_floats(value: str, count: int, name: str) -> list[float]:
+    """"1,2,3" 형식 쿼리 값 → float 목록"""
+    try:
+        numbers = [float(v) for v in value.split(",")]
+    except ValueError:
+        numbers = []
+    if len(numbers) != count:
+        raise HTTPException(status_code=422, detail=f"{name} must be {count} comma-separated numbers")
+    return numbers
+
+
+@router.get("/{world_id}/query")
+def query_world(
+    world_id: str,
+    x: Optional[float] = None,
+    y: Optional[float] = None,
+    z: Optional[float] = None,
+    radius: Optional[float] = Query(None, ge=0),
+    k: Optional[int] = Query(None, ge=1, le=1000),
+    box: Optional[str] = Query(None, description="x0,y0,z0,x1,y1,z1"),
+    zone: Optional[str] = None,
+    within: bool = False,
+    role: Optional[list[str]] = Query(None),
+    asset_type: Optional[list[str]] = Query(None),
+    limit: int = Query(100, ge=1, le=10000),
+):
+    """
+    엔티티/zone 공간 질의 (R-tree)
+
+    - zone: zone과 겹치는 엔티티 (within=true면 완전히 들어간 엔티티)
+    - box: 상자와 겹치는 엔티티와 zone
+    - k: (x, y, z)에서 가장 가까운 엔티티 k개
+    - radius: (x, y, z)에서 반경 안의 엔티티 (가까운 순)
+    - 그 외: (x, y, z)를 포함하는 엔티티
+
+    좌표를 생략하면 spawnpoint 기준이며, 점 기준 질의는 그 점을 포함하는 zone도 돌려줍니다.
+    role / asset_type은 여러 번 지정할 수 있습니다. 결과의 index는 JSON Patch 경로(/entities/{index})에 씁니다.
+    """
+    version, index = load_world_index(world_id, query_cache, WorldQuery)
+    point = [float(v if v is not None else default) for v, default in zip((x, y, z), index.spawnpoint)]
+
+    distances: dict[str, float] = {}
+    try:
+        if zone is not None:
+            mode = "zone"
+            try:
+                ids = index.in_zone(zone, role, asset_type, within)
+            except KeyError:
+                raise HTTPException(status_code=404, detail=f"Zone '{zone}' not found")
+            zones = [zone]
+        elif box is not None:
+            mode = "box"
+            corners = parse_floats(box, 6, "box")
+            ids = index.box(corners[:3], corners[3:], role, asset_type, within)
+            zones = index.zones_in_box(corners[:3], corners[3:])
+        else:
+            if k is not None:
+                mode, hits = "nearest", index.nearest(point, k, role, asset_type, radius if radius is not None else float("inf"))
+            elif radius is not None:
+                mode, hits = "radius", index.radius(point, radius, role, asset_type)
+            else:
+                mode, hits = "point", [(entity_id, 0.0) for entity_id in index.point(point, role, asset_type)]
+            ids = [entity_id for entity_id, _ in hits]
+            distances = dict(hits)
+            zones = index.zones_at(point)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    entities = []
+    for entity_id in ids[:limit]:
+        entity = index.describe(entity_id)
+        if entity_id in distances:
+            entity["distance"] = round(distances[entity_id], 4)
+        entities.append(entity)
+
+    return JSONResponse({
+        "world_id": world_id,
+        "version": version,
+        "mode": mode,
+        "point": point if mode not in ("zone", "box") else None,
+        "zones": zones,
+        "total": len(ids),
+        "entities": entities,
+    })
+
+
+async def world_event_stream(world_id: str, follow: bool = False) -> AsyncIterator[Optional[dict]]:
+    """
+    월드 이벤트 스트림 - 현재 상태(snapshot)를 먼저 보낸 뒤 모든 생성 작업이 끝날 때까지 전달
+
+    follow면 생성이 끝난 뒤에도 편집(patch) 이벤트를 계속 전달합니다.
+    keepalive 간격 동안 이벤트가 없으면 None을 yield 합니다.
+    """
+    subscription = job_events.subscribe(f"world:{world_id}")
+    try:
+        world = world_repository.get(world_id)
+        if world is None:
+            raise HTTPException(status_code=404, detail="World not found")
+
+        yield {"event": "snapshot", **to_world_response(world).model_dump()}
+        if not has_pending(world):
+            yield {"event": "complete", "world_id": world_id, "version": world["version"]}
+            if not follow:
+                return
+
+        while True:
+            event = await subscription.get(timeout=EVENT_KEEPALIVE_SECONDS)
+            yield event
+            if not follow and event is not None and event["event"] in WORLD_TERMINAL_EVENTS:
+                return
+    finally:
+        job_events.unsubscribe(subscription)
+
+
+@router.get("/{world_id}/events")
+async def stream_world_events(world_id: str, follow: bool = False):
+    """
+    오브젝트 생성 완료(asset_ready/asset_failed) Server-Sent Events 스트림
+
+    follow=true면 연결을 유지하며 편집 delta(patch 이벤트)도 받습니다. 이벤트의 version이
+    마지막으로 받은 버전 + 1이 아니면 놓친 이벤트가 있으므로 월드를 다시 조회해야 합니다.
+    """
+    if world_repository.version(world_id) is None:
+        raise HTTPException(status_code=404, detail="World not found")
+
+    async def sse():
+        async for event in world_event_stream(world_id, follow):
+            if event is None:
+                yield ": keepalive\n\n"
+            else:
+                yield f"event: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/{world_id}/events")
+async def websocket_world_events(websocket: WebSocket, world_id: str):
+    """월드 이벤트 WebSocket 스트림 (SSE follow=true와 같은 이벤트를 JSON 메시지로 전송)"""
+    await websocket.accept()
+    if world_repository.version(world_id) is None:
+        await websocket.close(code=4404, reason="World not found")
+        return
+
+    try:
+        async for event in world_event_stream(world_id, follow=True):
+            if event is not None:
+                await websocket.send_json(event)
+    except WebSocketDisconnect:
+        return
+    await websocket.close()
+
+
+def has_pending(world: dict) -> bool:
+    return any(item["status"] == "pending" for item in world["pending"].values())
+
+
+def publish_world_event(world_id: str, event: dict, pending: bool = True):
+    """월드 구독자에게 이벤트 전달 - pending(대기 중인 작업)이 없으면 complete 이벤트도 전달"""
+    job_events.publish(f"world:{world_id}", event)
+    if not pending:
+        job_events.publish(f"world:{world_id}", {"event": "complete", "world_id": world_id, "version": event["version"]})
+
+
+def apply_job_result(job_id: str, job: dict):
+    """끝난 생성 작업을 기다리던 월드에 반영"""
+    if job["status"] == "completed":
+        model_path = str(ASSETS_DIR / job["model_url"].removeprefix("/assets/"))
+        fields, floor_offset = generated_entity_fields(job, model_path)
+        for state in world_repository.complete_job(job_id, fields, floor_offset):
+            publish_world_event(state["world_id"], {
+                "event": "asset_ready",
+                "world_id": state["world_id"],
+                "version": state["version"],
+                "job_id": job_id,
+                "entities": state["entities"],
+            }, state["pending"])
+    elif job["status"] == "failed":
+        for state in world_repository.fail_job(job_id, job.get("error") or "generation failed"):
+            publish_world_event(state["world_id"], {
+                "event": "asset_failed",
+                "world_id": state["world_id"],
+                "version": state["version"],
+                "job_id": job_id,
+                "error": job.get("error"),
+            }, state["pending"])
+
+
+def handle_job_event(job_id: str, event: dict):
+    """
+    생성 작업 완료/실패를 월드에 반영 (generate 라우터가 작업 상태를 갱신한 뒤 발행하는 작업 이벤트)
+
+    GPU 워커를 가진 다른 API 프로세스가 끝낸 작업도 이벤트 로그를 거쳐 전달되므로
+    월드를 가진 프로세스가 직접 반영합니다.
+    """
+    if job_id.startswith("world:") or event["event"] not in TERMINAL_EVENTS:
+        return
+    job = job_store.get(job_id)
+    if job is not None:
+        apply_job_result(job_id, job)
+
+
+job_events.add_listener(handle_job_event)
@@ -0,0 +1,381 @@
+"""
+키워드 → 에셋 검색
+manifest.json의 이름/키워드로 역색인을 만들어 자유 텍스트를 라이브러리 에셋으로 해석합니다.
+라이브러리에서 찾은 오브젝트는 GPU 생성 없이 바로 배치할 수 있습니다.
+
+- 정규화: NFKC + 대소문자 무시 + 구두점 제거
+- 한글은 자모로 분해해 비교 (한 글자 오타가 음절 전체가 아닌 자모 하나의 차이가 됨)
+- 자모/문자 3-gram 역색인 + Dice 계수로 유사도 점수
+- 짧은 키워드는 자모 오타 거리(인접 키 치환/삽입/삭제/인접 교환)로 다시 점수 - 한 글자 오타도 해석되도록
+- manifest가 바뀌면 다음 검색 시 자동으로 다시 색인
+"""
+
+import re
+import json
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from services.asset_metadata import ASSET_MANIFEST_PATH, asset_metadata
+
+
+NGRAM_SIZE = 3
+
+# 이 점수 미만의 후보는 버림 (Dice 계수 기준)
+MIN_SCORE = 0.3
+
+# 자모 오타 거리로 다시 점수를 매길 검색어 길이 (자모/문자 수)
+# 3-gram이 거의 겹치지 않는 짧은 단어의 오타 보정용 - 너무 짧으면 다른 단어와 구분되지 않음
+EDIT_MIN_LENGTH = 4
+EDIT_MAX_LENGTH = 12
+
+# 허용하는 오타 거리 (점수 = 1 - 거리 / 긴 쪽 길이)
+EDIT_MAX_DISTANCE = 1
+
+# 문구 중 일부 단어만 맞은 경우의 가중치 (전체 문구 일치 = 1.0)
+PARTIAL_MATCH_WEIGHT = 0.8
+
+# manifest 변경 확인 간격 (초)
+RELOAD_CHECK_SECONDS = 2.0
+
+# 정규화된 질의별 결과 캐시 크기
+QUERY_CACHE_SIZE = 4096
+
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+
+_PUNCTUATION = re.compile(r"[^\w\s]+")
+
+# 자판 배열 (QWERTY / 두벌식) - 오타로 보는 치환은 위아래/좌우로 붙은 키끼리만
+# ("의사"/"의자", "camp"/"lamp"처럼 멀리 떨어진 키의 치환은 다른 단어로 봄)
+_KEYBOARD_ROWS = [
+    ["qwertyuiop", "asdfghjkl", "zxcvbnm"],
+    ["ㅂㅈㄷㄱㅅㅛㅕㅑㅐㅔ", "ㅁㄴㅇㄹㅎㅗㅓㅏㅣ", "ㅋㅌㅊㅍㅠㅜㅡ"],
+]
+_SHIFTED_KEYS = ["ㅂㅃ", "ㅈㅉ", "ㄷㄸ", "ㄱㄲ", "ㅅㅆ", "ㅐㅒ", "ㅔㅖ"]
+
+
+def _adjacent_keys() -> set[frozenset]:
+    pairs = {frozenset(pair) for pair in _SHIFTED_KEYS}
+    for rows in _KEYBOARD_ROWS:
+        for r, row in enumerate(rows):
+            for c, key in enumerate(row):
+                neighbors = [row[c + 1]] if c + 1 < len(row) else []
+                if r + 1 < len(rows):
+                    neighbors += [rows[r + 1][i] for i in (c - 1, c) if 0 <= i < len(rows[r + 1])]
+                pairs.update(frozenset((key, other)) for other in neighbors)
+    return pairs
+
+
+_ADJACENT_KEYS = _adjacent_keys()
+
+
+def normalize_keyword(text: str) -> str:
+    """NFKC 정규화 + 대소문자 무시 + 구두점/공백 정리"""
+    text = _PUNCTUATION.sub(" ", unicodedata.normalize("NFKC", text).casefold())
+    return " ".join(text.replace("_", " ").split())
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 ("의자" → "ㅇㅢㅈㅏ"), 나머지 문자는 그대로"""
+    chars = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            chars.append(_CHOSEONG[code // 588])
+            chars.append(_JUNGSEONG[code % 588 // 28])
+            chars.append(_JONGSEONG[code % 28])
+        else:
+            chars.append(ch)
+    return "".join(chars)
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> set[str]:
+    """정규화된 텍스트의 자모 분해 n-gram (앞뒤 공백 패딩)"""
+    padded = f" {decompose_hangul(text)} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def typo_distance(a: str, b: str, limit: int) -> int:
+    """
+    오타 편집 거리 (OSA) - 삽입/삭제/인접 교환/붙은 키 치환은 1, 떨어진 키 치환은 2
+
+    limit을 넘으면 limit + 1
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1 if frozenset((a[i - 1], b[j - 1])) in _ADJACENT_KEYS else 2
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def deletion_variants(text: str) -> set[str]:
+    """한 글자를 지운 문자열들 ("chair" → "hair", "cair", ...) - 오타 거리 1 이내 후보 조회 키"""
+    return {text[:i] + text[i + 1:] for i in range(len(text))}
+
+
+def query_variants(phrase: str) -> list[str]:
+    """검색할 문구 변형: 전체 문구 + 단어 + 인접한 두 단어 ("red leather sofa" → ..., "leather sofa")"""
+    words = phrase.split()
+    variants = [phrase]
+    if len(words) > 1:
+        variants += words
+        variants += [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return list(dict.fromkeys(variants))
+
+
+class _Snapshot:
+    """한 번 만든 뒤 바뀌지 않는 색인 - 다시 색인할 때는 새 스냅샷으로 교체"""
+
+    def __init__(self, assets: list[dict]):
+        self.assets = assets
+        keywords: list[str] = []
+        keyword_assets: list[int] = []
+        self.exact: dict[str, list[int]] = {}
+        for asset_id, asset in enumerate(assets):
+            for keyword in dict.fromkeys(normalize_keyword(k) for k in [asset["name"], *asset["keywords"]]):
+                if not keyword:
+                    continue
+                self.exact.setdefault(keyword, []).append(len(keywords))
+                keywords.append(keyword)
+                keyword_assets.append(asset_id)
+
+        postings: dict[str, list[int]] = {}
+        gram_counts = []
+        for keyword_id, keyword in enumerate(keywords):
+            grams = ngrams(keyword)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(keyword_id)
+
+        # 짧은 키워드의 자모 원형/한 글자 삭제형 → 키워드 ID (오타 거리 1 이내 후보를 n-gram 겹침 없이 찾음)
+        self.jamo: dict[int, str] = {}
+        deletions: dict[str, list[int]] = {}
+        for keyword_id, keyword in enumerate(keywords):
+            jamo = decompose_hangul(keyword)
+            if EDIT_MIN_LENGTH - EDIT_MAX_DISTANCE <= len(jamo) <= EDIT_MAX_LENGTH + EDIT_MAX_DISTANCE:
+                self.jamo[keyword_id] = jamo
+                for variant in {jamo, *deletion_variants(jamo)}:
+                    deletions.setdefault(variant, []).append(keyword_id)
+
+        self.keywords = keywords
+        self.deletions = deletions
+        self.keyword_assets = np.asarray(keyword_assets, np.int32)
+        self.gram_counts = np.asarray(gram_counts, np.int32)
+        self.postings = {gram: np.asarray(ids, np.int32) for gram, ids in postings.items()}
+
+    def score_variant(self, variant: str, weight: float) -> tuple[np.ndarray, np.ndarray]:
+        """(키워드 ID, 점수) - 정확히 일치하면 1.0, 아니면 n-gram Dice 계수와 오타 거리 점수 중 큰 값"""
+        exact = self.exact.get(variant)
+        if exact:
+            return np.asarray(exact, np.int32), np.full(len(exact), weight)
+
+        grams = ngrams(variant)
+        lists = [self.postings[gram] for gram in grams if gram in self.postings]
+        if lists:
+            ids, overlap = np.unique(np.concatenate(lists), return_counts=True)
+            scores = 2.0 * overlap / (len(grams) + self.gram_counts[ids])
+            keep = scores >= MIN_SCORE
+            ids, scores = ids[keep], scores[keep]
+        else:
+            ids, scores = np.empty(0, np.int32), np.empty(0)
+
+        typo_ids, typo_scores = self.score_typos(variant)
+        if typo_ids:
+            ids = np.concatenate([ids, np.asarray(typo_ids, np.int32)])
+            scores = np.concatenate([scores, typo_scores])
+        return ids, scores * weight
+
+    def score_typos(self, variant: str) -> tuple[list[int], list[float]]:
+        """
+        짧은 단어의 오타 후보 (키워드 ID, 1 - 오타 거리 / 긴 쪽 길이)
+
+        한 글자 오타로 3-gram 대부분이 깨지는 짧은 단어 ("chiar" → "chair")를
+        삭제형 색인으로 찾아 오타 거리로 점수를 매김
+        """
+        jamo = decompose_hangul(variant)
+        if not EDIT_MIN_LENGTH <= len(jamo) <= EDIT_MAX_LENGTH:
+            return [], []
+        candidates = set()
+        for deleted in [jamo, *deletion_variants(jamo)]:
+            candidates.update(self.deletions.get(deleted, ()))
+        ids, scores = [], []
+        for keyword_id in candidates:
+            candidate = self.jamo[keyword_id]
+            distance = typo_distance(jamo, candidate, EDIT_MAX_DISTANCE)
+            if distance <= EDIT_MAX_DISTANCE:
+                ids.append(keyword_id)
+                scores.append(1.0 - distance / max(len(jamo), len(candidate)))
+        return ids, scores
+
+    def search(self, phrase: str, k: int) -> list[tuple[int, int, float]]:
+        """(에셋 ID, 키워드 ID, 점수) 상위 k개 - 에셋별 최고 점수 기준"""
+        id_parts, score_parts = [], []
+        for variant in query_variants(phrase):
+            # 일부 단어만 맞으면 문구에서 차지하는 길이만큼 가중치
+            coverage = len(variant) / len(phrase)
+            weight = 1.0 if variant == phrase else PARTIAL_MATCH_WEIGHT + (1 - PARTIAL_MATCH_WEIGHT) * coverage
+            ids, scores = self.score_variant(variant, weight)
+            id_parts.append(ids)
+            score_parts.append(scores)
+
+        ids = np.concatenate(id_parts)
+        if not len(ids):
+            return []
+        scores = np.concatenate(score_parts)
+        order = np.argsort(-scores, kind="stable")
+
+        results, seen = [], set()
+        for i in order:
+            asset_id = int(self.keyword_assets[ids[i]])
+            if asset_id in seen:
+                continue
+            seen.add(asset_id)
+            results.append((asset_id, int(ids[i]), float(scores[i])))
+            if len(results) == k:
+                break
+        return results
+
+
+def manifest_assets(manifest_path: Path) -> list[dict]:
+    """manifest.json → [{"path", "category", "name", "keywords"}]"""
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    return [
+        {"path": item["path"], "category": category, "name": name, "keywords": item.get("keywords", [])}
+        for category, items in manifest.get("assets", {}).items()
+        for name, item in items.items()
+    ]
+
+
+class AssetIndex:
+    """manifest 기반 에셋 검색 색인 (manifest 변경 시 자동 재색인)"""
+
+    def __init__(self, manifest_path: Path = ASSET_MANIFEST_PATH, assets: Optional[list[dict]] = None):
+        """
+        Args:
+            manifest_path: 색인할 manifest.json
+            assets: 지정하면 manifest 대신 이 목록으로 색인 (자동 재색인 없음)
+        """
+        self.manifest_path = Path(manifest_path)
+        self._static = assets is not None
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = _Snapshot(assets) if assets is not None else None
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._cache: OrderedDict = OrderedDict()
+        self.reloads = 0
+        self.build_seconds: Optional[float] = None
+
+    def reload(self):
+        """manifest를 다시 읽어 새 스냅샷으로 교체"""
+        start = time.perf_counter()
+        mtime = self.manifest_path.stat().st_mtime
+        snapshot = _Snapshot(manifest_assets(self.manifest_path))
+        with self._lock:
+            self._snapshot = snapshot
+            self._mtime = mtime
+            self._cache.clear()
+            self.reloads += 1
+        self.build_seconds = time.perf_counter() - start
+        print(f"Asset index built: {len(snapshot.assets)} assets, {len(snapshot.keywords)} keywords "
+              f"in {self.build_seconds * 1000:.1f}ms")
+
+    def _current(self) -> _Snapshot:
+        """현재 스냅샷 (RELOAD_CHECK_SECONDS마다 manifest mtime 확인)"""
+        if self._static:
+            return self._snapshot
+        now = time.monotonic()
+        if self._snapshot is None or now - self._checked_at >= RELOAD_CHECK_SECONDS:
+            self._checked_at = now
+            try:
+                changed = self.manifest_path.stat().st_mtime != self._mtime
+            except OSError:
+                changed = False
+            if changed or self._snapshot is None:
+                self.reload()
+        return self._snapshot
+
+    def search(self, phrase: str, k: int = 5, usable_only: bool = False) -> list[dict]:
+        """
+        자유 텍스트에 가장 가까운 에셋 상위 k개
+
+        Args:
+            phrase: 검색어 (한국어/영어, 여러 단어 가능)
+            usable_only: 자리표시/손상/없는 파일은 제외 (asset_metadata 인덱스 기준)
+
+        Returns:
+            [{"path", "category", "name", "keyword", "score"}] - 점수 내림차순
+        """
+        snapshot = self._current()
+        normalized = normalize_keyword(phrase)
+        if not normalized:
+            return []
+
+        key = (normalized, k, usable_only)
+        with self._lock:
+            if key in self._cache and self._snapshot is snapshot:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        # 사용할 수 없는 에셋을 거르면 k개가 모자랄 수 있으므로 넉넉히 조회
+        matches = snapshot.search(normalized, k * 4 if usable_only else k)
+        results = []
+        for asset_id, keyword_id, score in matches:
+            asset = snapshot.assets[asset_id]
+            if usable_only and not asset_metadata.is_usable(asset["path"]):
+                continue
+            results.append({
+                "path": asset["path"],
+                "category": asset["category"],
+                "name": asset["name"],
+                "keyword": snapshot.keywords[keyword_id],
+                "score": round(score, 4),
+            })
+            if len(results) == k:
+                break
+
+        with self._lock:
+            if self._snapshot is snapshot:
+                self._cache[key] = results
+                if len(self._cache) > QUERY_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return results
+
+    def resolve(self, phrase: str, min_score: float = 0.6) -> Optional[dict]:
+        """가장 잘 맞는 사용 가능한 에셋 하나 (min_score 미만이면 None)"""
+        results = self.search(phrase, k=1, usable_only=True)
+        if results and results[0]["score"] >= min_score:
+            return results[0]
+        return None
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "assets": len(snapshot.assets) if snapshot else 0,
+            "keywords": len(snapshot.keywords) if snapshot else 0,
+            "ngrams": len(snapshot.postings) if snapshot else 0,
+            "reloads": self.reloads,
+            "build_ms": round(self.build_seconds * 1000, 1) if self.build_seconds else None,
+        }
+
+
+# 프로세스 전역 색인 (첫 검색 시 manifest에서 생성)
+asset_index = AssetIndex()
@@ -0,0 +1,528 @@
+"""
+에셋 메타데이터 인덱스
+manifest.json과 models 디렉토리의 각 GLB/glTF에서 JSON 청크만 읽어(바이너리 버퍼는 읽지 않음) 바운딩 박스,
+삼각형/정점 수, 텍스처 크기, 애니메이션 여부를 추출하고 자리표시/손상 파일을 표시합니다.
+결과는 manifest 옆의 사이드카 인덱스(asset_index.json, 생성 파일이라 git에 넣지 않음)에 저장되며,
+파일 mtime/크기 → 내용 해시 순으로 변경 여부를 확인해 바뀐 파일만 다시 읽습니다.
+"""
+
+import os
+import json
+import time
+import struct
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ASSET_ROOT = PROJECT_ROOT / "client" / "public" / "assets"
+
+ASSET_MANIFEST_PATH = Path(os.environ.get("ASSET_MANIFEST_PATH", str(ASSET_ROOT / "manifest.json")))
+ASSET_MODELS_DIR = Path(os.environ.get("ASSET_MODELS_DIR", str(ASSET_ROOT / "models")))
+ASSET_INDEX_PATH = Path(os.environ.get("ASSET_INDEX_PATH", str(ASSET_ROOT / "asset_index.json")))
+
+INDEX_VERSION = 2
+
+GLB_MAGIC = b"glTF"
+CHUNK_JSON = 0x4E4F534A
+
+# 이미지 크기를 알아내기 위해 읽는 헤더 최대 크기 (JPEG SOF 마커 탐색용)
+IMAGE_HEADER_BYTES = 64 * 1024
+
+# 상태
+STATUS_OK = "ok"
+STATUS_PLACEHOLDER = "placeholder"  # 다운로드 실패로 남은 오류 페이지 등 glTF가 아닌 파일
+STATUS_BROKEN = "broken"  # glTF이지만 헤더/JSON이 손상되었거나 외부 파일이 없음
+STATUS_MISSING = "missing"
+
+# 프리미티브 모드별 삼각형 수
+_TRIANGLE_COUNTS = {
+    4: lambda n: n // 3,  # TRIANGLES
+    5: lambda n: max(n - 2, 0),  # TRIANGLE_STRIP
+    6: lambda n: max(n - 2, 0),  # TRIANGLE_FAN
+}
+
+
+class AssetFormatError(ValueError):
+    """glTF로 읽을 수 없는 파일"""
+
+    def __init__(self, status: str, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================================
+# Header Reading
+# ============================================================================
+
+def file_hash(path: Path) -> str:
+    """파일 내용 해시 (sha1, 청크 단위로 읽음)"""
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_signature(path: Path) -> Optional[dict]:
+    """파일 변경 확인용 서명 {mtime_ns, size} (없으면 None)"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _image_size(header: bytes) -> Optional[tuple[int, int]]:
+    """PNG/JPEG/WebP/KTX2 헤더에서 (너비, 높이)"""
+    if header.startswith(b"\x89PNG\r\n\x1a\n") and len(header) >= 24:
+        return struct.unpack(">II", header[16:24])
+
+    if header.startswith(b"\xff\xd8"):
+        offset = 2
+        while offset + 9 <= len(header):
+            if header[offset] != 0xFF:
+                offset += 1
+                continue
+            marker = header[offset + 1]
+            if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7 or marker == 0xFF:
+                offset += 1 if marker == 0xFF else 2
+                continue
+            length = struct.unpack(">H", header[offset + 2:offset + 4])[0]
+            # SOF0~SOF15 (DHT/JPG/DAC 제외)
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", header[offset + 5:offset + 9])
+                return width, height
+            offset += 2 + length
+        return None
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP" and len(header) >= 30:
+        chunk = header[12:16]
+        if chunk == b"VP8X":
+            return 1 + int.from_bytes(header[24:27], "little"), 1 + int.from_bytes(header[27:30], "little")
+        if chunk == b"VP8L":
+            bits = int.from_bytes(header[21:25], "little")
+            return 1 + (bits & 0x3FFF), 1 + ((bits >> 14) & 0x3FFF)
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", header[26:30])
+            return width & 0x3FFF, height & 0x3FFF
+        return None
+
+    if header.startswith(b"\xabKTX 20\xbb\r\n\x1a\n") and len(header) >= 28:
+        return struct.unpack("<II", header[20:28])
+    return None
+
+
+def read_gltf_json(path: Path) -> tuple[dict, Optional[int]]:
+    """
+    GLB는 JSON 청크만, .gltf는 JSON 파일을 읽음
+
+    Returns:
+        (glTF JSON, GLB BIN 청크 데이터의 파일 내 오프셋 - .gltf면 None)
+
+    Raises:
+        AssetFormatError: 자리표시 파일(STATUS_PLACEHOLDER) 또는 손상된 파일(STATUS_BROKEN)
+    """
+    with open(path, "rb") as f:
+        header = f.read(20)
+        if path.suffix.lower() == ".gltf":
+            f.seek(0)
+            try:
+                gltf = json.loads(f.read())
+            except (UnicodeDecodeError, ValueError) as e:
+                raise AssetFormatError(STATUS_PLACEHOLDER, f"not a glTF JSON file: {e}")
+            if not isinstance(gltf, dict) or "asset" not in gltf:
+                raise AssetFormatError(STATUS_PLACEHOLDER, "not a glTF JSON file")
+            return gltf, None
+
+        if header[:4] != GLB_MAGIC:
+            raise AssetFormatError(STATUS_PLACEHOLDER, "not a GLB file")
+        if len(header) < 20:
+            raise AssetFormatError(STATUS_BROKEN, "truncated GLB header")
+
+        version, length, json_length, chunk_type = struct.unpack("<IIII", header[4:20])
+        if version != 2 or chunk_type != CHUNK_JSON:
+            raise AssetFormatError(STATUS_BROKEN, f"unsupported GLB (version {version})")
+        if length > path.stat().st_size or 20 + json_length > length:
+            raise AssetFormatError(STATUS_BROKEN, "truncated GLB")
+
+        try:
+            gltf = json.loads(f.read(json_length))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise AssetFormatError(STATUS_BROKEN, f"invalid JSON chunk: {e}")
+
+    # 다음 청크(BIN) 헤더 8바이트 뒤가 데이터 시작
+    bin_offset = 20 + json_length + 8
+    return gltf, bin_offset if bin_offset <= length else None
+
+
+def _read_embedded_image_header(path: Path, gltf: dict, bin_offset: Optional[int], image: dict) -> Optional[bytes]:
+    """이미지 헤더 바이트 (GLB 내장 이미지는 해당 위치만 seek해서 읽음)"""
+    if "bufferView" in image:
+        view = gltf["bufferViews"][image["bufferView"]]
+        if bin_offset is None or view.get("buffer", 0) != 0:
+            return None
+        with open(path, "rb") as f:
+            f.seek(bin_offset + view.get("byteOffset", 0))
+            return f.read(min(view["byteLength"], IMAGE_HEADER_BYTES))
+
+    uri = image.get("uri", "")
+    if not uri or uri.startswith("data:"):
+        return None
+    image_path = path.parent / uri
+    if not image_path.is_file():
+        return None
+    with open(image_path, "rb") as f:
+        return f.read(IMAGE_HEADER_BYTES)
+
+
+# ============================================================================
+# Metadata Extraction
+# ============================================================================
+
+def _node_matrix(node: dict) -> np.ndarray:
+    """노드 로컬 변환 (matrix 또는 TRS)"""
+    if "matrix" in node:
+        return np.array(node["matrix"], dtype=np.float64).reshape(4, 4).T
+
+    x, y, z, w = node.get("rotation", [0.0, 0.0, 0.0, 1.0])
+    rotation = np.array([
+        [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+        [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+        [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+    ])
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation * np.array(node.get("scale", [1.0, 1.0, 1.0]))
+    matrix[:3, 3] = node.get("translation", [0.0, 0.0, 0.0])
+    return matrix
+
+
+def _mesh_instances(gltf: dict) -> list[tuple[int, np.ndarray]]:
+    """기본 씬에서 (메시 인덱스, 월드 변환) 목록"""
+    nodes = gltf.get("nodes", [])
+    scenes = gltf.get("scenes", [])
+    if scenes:
+        roots = scenes[gltf.get("scene", 0)].get("nodes", [])
+    else:
+        children = {child for node in nodes for child in node.get("children", [])}
+        roots = [i for i in range(len(nodes)) if i not in children]
+
+    instances = []
+    stack = [(root, np.eye(4)) for root in roots]
+    visited = set()
+    while stack:
+        index, parent = stack.pop()
+        if index in visited or index >= len(nodes):
+            continue
+        visited.add(index)
+        node = nodes[index]
+        world = parent @ _node_matrix(node)
+        if "mesh" in node:
+            instances.append((node["mesh"], world))
+        stack.extend((child, world) for child in node.get("children", []))
+    return instances
+
+
+def _mesh_bounds(gltf: dict, mesh: dict) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """메시 로컬 AABB (POSITION 접근자 min/max, 정규화 정수는 [-1, 1]/[0, 1]로 변환)"""
+    low, high = [], []
+    for primitive in mesh["primitives"]:
+        index = primitive.get("attributes", {}).get("POSITION")
+        if index is None:
+            continue
+        accessor = gltf["accessors"][index]
+        if "min" not in accessor or "max" not in accessor:
+            continue
+        lo, hi = np.array(accessor["min"][:3], np.float64), np.array(accessor["max"][:3], np.float64)
+        if accessor.get("normalized"):
+            scale = {5120: 127, 5121: 255, 5122: 32767, 5123: 65535}.get(accessor["componentType"], 1)
+            lo, hi = np.maximum(lo / scale, -1), np.maximum(hi / scale, -1)
+        low.append(lo)
+        high.append(hi)
+    if not low:
+        return None
+    return np.min(low, axis=0), np.max(high, axis=0)
+
+
+def extract_metadata(gltf: dict, path: Optional[Path] = None, bin_offset: Optional[int] = None) -> dict:
+    """
+    glTF JSON에서 메타데이터 추출 (바이너리 버퍼는 읽지 않음)
+
+    삼각형/정점 수는 씬에 배치된 메시 인스턴스 기준 (같은 메시가 두 노드에 있으면 두 번),
+    AABB는 스키닝/모프 변형 전의 월드 좌표 기준입니다.
+    """
+    meshes = gltf.get("meshes", [])
+    accessors = gltf.get("accessors", [])
+
+    mesh_triangles, mesh_vertices = [], []
+    for mesh in meshes:
+        triangles = vertices = 0
+        for primitive in mesh["primitives"]:
+            attributes = primitive.get("attributes", {})
+            if "POSITION" in attributes:
+                vertices += accessors[attributes["POSITION"]]["count"]
+            count = accessors[primitive["indices"]]["count"] if "indices" in primitive else (
+                accessors[attributes["POSITION"]]["count"] if "POSITION" in attributes else 0)
+            triangles += _TRIANGLE_COUNTS.get(primitive.get("mode", 4), lambda n: 0)(count)
+        mesh_triangles.append(triangles)
+        mesh_vertices.append(vertices)
+
+    instances = _mesh_instances(gltf)
+    corners = []
+    for mesh_index, world in instances:
+        bounds = _mesh_bounds(gltf, meshes[mesh_index])
+        if bounds is None:
+            continue
+        lo, hi = bounds
+        box = np.array([[x, y, z, 1.0] for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])])
+        corners.append((box @ world.T)[:, :3])
+    aabb = None
+    if corners:
+        points = np.concatenate(corners)
+        aabb = {"min": [round(float(v), 6) for v in points.min(axis=0)],
+                "max": [round(float(v), 6) for v in points.max(axis=0)]}
+
+    textures = []
+    for image in gltf.get("images", []):
+        size = None
+        if path is not None:
+            header = _read_embedded_image_header(path, gltf, bin_offset, image)
+            size = _image_size(header) if header else None
+        mime_type = image.get("mimeType") or Path(image.get("uri", "")).suffix.lstrip(".")
+        textures.append({"width": size[0], "height": size[1], "mime_type": mime_type} if size else
+                        {"width": None, "height": None, "mime_type": mime_type})
+
+    # 밉맵 포함 RGBA8 기준 추정 (KTX2 등 GPU 압축 텍스처는 픽셀당 1바이트)
+    texture_bytes = sum(
+        int(t["width"] * t["height"] * (1 if t["mime_type"] == "image/ktx2" else 4) * 4 / 3)
+        for t in textures if t["width"]
+    )
+
+    animations = gltf.get("animations", [])
+    return {
+        "aabb": aabb,
+        "triangles": sum(mesh_triangles[m] for m, _ in instances),
+        "vertices": sum(mesh_vertices[m] for m, _ in instances),
+        "meshes": len(meshes),
+        "materials": len(gltf.get("materials", [])),
+        "textures": textures,
+        "texture_bytes": texture_bytes,
+        "animated": bool(animations),
+        "animations": [a.get("name") or f"animation{i}" for i, a in enumerate(animations)],
+        "skinned": bool(gltf.get("skins")),
+        "morph_targets": any(p.get("targets") for mesh in meshes for p in mesh["primitives"]),
+        "extensions": sorted(gltf.get("extensionsUsed", [])),
+    }
+
+
+def _missing_external_files(path: Path, gltf: dict) -> list[str]:
+    """.gltf가 참조하는 외부 버퍼/이미지 중 없는 파일"""
+    uris = [b.get("uri") for b in gltf.get("buffers", [])] + [i.get("uri") for i in gltf.get("images", [])]
+    return [uri for uri in uris if uri and not uri.startswith("data:") and not (path.parent / uri).is_file()]
+
+
+def inspect_asset(path: Path) -> dict:
+    """단일 에셋 파일의 상태 + 메타데이터"""
+    if not path.is_file():
+        return {"status": STATUS_MISSING}
+
+    try:
+        gltf, bin_offset = read_gltf_json(path)
+        metadata = extract_metadata(gltf, path, bin_offset)
+    except AssetFormatError as e:
+        return {"status": e.status, "error": str(e)}
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return {"status": STATUS_BROKEN, "error": f"invalid glTF: {e}"}
+
+    missing = _missing_external_files(path, gltf)
+    if missing:
+        return {"status": STATUS_BROKEN, "error": f"missing external files: {', '.join(missing[:3])}", **metadata}
+    return {"status": STATUS_OK, **metadata}
+
+
+# ============================================================================
+# Sidecar Index
+# ============================================================================
+
+class AssetMetadataIndex:
+    """manifest.json 에셋의 메타데이터 사이드카 인덱스 (증분 갱신)"""
+
+    def __init__(
+        self,
+        manifest_path: Path = ASSET_MANIFEST_PATH,
+        models_dir: Path = ASSET_MODELS_DIR,
+        index_path: Path = ASSET_INDEX_PATH,
+    ):
+        self.manifest_path = Path(manifest_path)
+        self.models_dir = Path(models_dir)
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+        self._assets: dict[str, dict] = {}
+        self._loaded = False
+        self.built_at: Optional[float] = None
+
+    def _manifest_entries(self) -> dict[str, dict]:
+        """에셋 경로 → manifest 정보 (카테고리, 이름, 키워드, manifest에 없는 파일은 빈 정보)"""
+        with open(self.manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+
+        entries: dict[str, dict] = {}
+        for category, items in manifest.get("assets", {}).items():
+            for name, item in items.items():
+                entry = entries.setdefault(item["path"], {"category": category, "names": [], "keywords": []})
+                entry["names"].append(name)
+                entry["keywords"].extend(k for k in item.get("keywords", []) if k not in entry["keywords"])
+        for role, path in manifest.get("defaults", {}).items():
+            entries.setdefault(path, {"category": None, "names": [], "keywords": []}).setdefault("defaults", []).append(role)
+
+        # manifest에 없지만 models 디렉토리에 있는 파일도 상태 확인 대상
+        for pattern in ("*.glb", "*.gltf"):
+            for path in self.models_dir.rglob(pattern):
+                rel = path.relative_to(self.models_dir).as_posix()
+                entries.setdefault(rel, {"category": None, "names": [], "keywords": []})
+        return entries
+
+    def _read_index(self) -> dict:
+        """사이드카 인덱스 파일 (없거나 버전이 다르면 빈 인덱스)"""
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != INDEX_VERSION:
+            return {}
+        return index
+
+    def _is_current(self, index: dict) -> bool:
+        """
+        인덱스가 디스크와 일치하는지 - manifest와 각 GLB의 mtime/크기 서명을 비교
+        (파일 추가/삭제 포함, 내용은 읽지 않음)
+        """
+        if not index or index.get("manifest") != file_signature(self.manifest_path):
+            return False
+        assets = index.get("assets", {})
+        for pattern in ("*.glb", "*.gltf"):
+            for path in self.models_dir.rglob(pattern):
+                if path.relative_to(self.models_dir).as_posix() not in assets:
+                    return False
+        for rel, asset in assets.items():
+            signature = file_signature(self.models_dir / rel)
+            if signature is None:
+                if asset["status"] != STATUS_MISSING:
+                    return False
+            elif asset.get("mtime_ns") != signature["mtime_ns"] or asset.get("size") != signature["size"]:
+                return False
+        return True
+
+    def build(self, full: bool = False) -> dict:
+        """
+        manifest 기준으로 인덱스 갱신 후 사이드카 파일에 저장
+
+        파일 mtime/크기가 그대로면 기존 항목을 재사용하고, 달라졌어도 내용 해시가 같으면
+        헤더를 다시 읽지 않습니다.
+
+        Args:
+            full: 기존 인덱스를 무시하고 모든 파일을 다시 읽음
+
+        Returns:
+            {"assets", "inspected", "hashed", "reused", "seconds", "status": {상태: 개수}}
+        """
+        start = time.perf_counter()
+        previous = {} if full else self._read_index().get("assets", {})
+        manifest = file_signature(self.manifest_path)
+        entries = self._manifest_entries()
+        stats = {"inspected": 0, "hashed": 0, "reused": 0}
+
+        assets = {}
+        for rel, entry in entries.items():
+            path = self.models_dir / rel
+            old = previous.get(rel)
+            try:
+                stat = path.stat()
+            except OSError:
+                assets[rel] = {**entry, "status": STATUS_MISSING}
+                continue
+
+            signature = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+            if old and old.get("mtime_ns") == stat.st_mtime_ns and old.get("size") == stat.st_size:
+                assets[rel] = {**old, **entry}
+                stats["reused"] += 1
+                continue
+
+            digest = file_hash(path)
+            stats["hashed"] += 1
+            if old and old.get("sha1") == digest:
+                assets[rel] = {**old, **entry, **signature}
+                stats["reused"] += 1
+                continue
+
+            assets[rel] = {**entry, **signature, "sha1": digest, **inspect_asset(path)}
+            stats["inspected"] += 1
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "manifest": manifest, "assets": assets}, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+
+        with self._lock:
+            self._assets = assets
+            self._loaded = True
+            self.built_at = time.time()
+
+        status: dict[str, int] = {}
+        for asset in assets.values():
+            status[asset["status"]] = status.get(asset["status"], 0) + 1
+        return {"assets": len(assets), **stats, "seconds": round(time.perf_counter() - start, 3), "status": status}
+
+    def ensure_loaded(self):
+        """사이드카 인덱스 로드 (없거나 manifest/GLB 서명이 디스크와 다르면 증분 갱신)"""
+        if self._loaded:
+            return
+        index = self._read_index()
+        if not self._is_current(index):
+            self.build()
+            return
+        with self._lock:
+            self._assets = index["assets"]
+            self._loaded = True
+
+    def get(self, path: str) -> Optional[dict]:
+        self.ensure_loaded()
+        asset = self._assets.get(path)
+        return {"path": path, **asset} if asset else None
+
+    def query(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        max_triangles: Optional[int] = None,
+        animated: Optional[bool] = None,
+    ) -> list[dict]:
+        """조건에 맞는 에셋 목록 (경로순)"""
+        self.ensure_loaded()
+        results = []
+        for path, asset in sorted(self._assets.items()):
+            if category is not None and asset.get("category") != category:
+                continue
+            if status is not None and asset["status"] != status:
+                continue
+            if max_triangles is not None and (asset.get("triangles") is None or asset["triangles"] > max_triangles):
+                continue
+            if animated is not None and asset.get("animated", False) != animated:
+                continue
+            results.append({"path": path, **asset})
+        return results
+
+    def is_usable(self, path: str) -> bool:
+        """렌더링 가능한 에셋인지 (자리표시/손상/없는 파일이면 False)"""
+        asset = self.get(path)
+        return asset is not None and asset["status"] == STATUS_OK
+
+
+# 프로세스 전역 인덱스
+asset_metadata = AssetMetadataIndex()
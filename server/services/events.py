@@ -0,0 +1,189 @@
+"""
+작업 진행 이벤트 브로커
+워커 풀 리스너 스레드에서 발행된 이벤트를 구독자별 asyncio.Queue로 팬아웃합니다.
+구독자는 큐를 await 하므로 구독자별 폴링 루프가 필요 없습니다.
+
+JOB_STORE=sqlite이면 이벤트를 공유 DB의 이벤트 로그에 쓰고, 프로세스마다 폴링 스레드 하나가
+새 이벤트를 읽어 자기 구독자/리스너에게 전달합니다 (GPU 워커를 가진 프로세스가 아닌 API 프로세스의
+구독자도 이벤트를 받음, 지연은 최대 EVENT_POLL_SECONDS).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import threading
+from typing import Callable, Optional
+
+from services.shared_db import SHARED_STATE, SQLiteDatabase
+
+
+# 구독자별 대기 이벤트 최대 수 (느린 구독자는 오래된 진행 이벤트부터 버림)
+SUBSCRIBER_QUEUE_SIZE = 64
+
+# 공유 이벤트 로그 폴링 간격 / 보관 시간 (초)
+EVENT_POLL_SECONDS = float(os.environ.get("EVENT_POLL_SECONDS", "0.1"))
+EVENT_LOG_SECONDS = float(os.environ.get("EVENT_LOG_SECONDS", "300"))
+
+TERMINAL_EVENTS = ("completed", "failed")
+
+
+class Subscription:
+    """단일 구독자 - 자신의 이벤트 루프와 큐를 가짐"""
+
+    def __init__(self, job_id: str, loop: asyncio.AbstractEventLoop):
+        self.job_id = job_id
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def _offer(self, event: dict):
+        """이벤트 루프 스레드에서 실행 - 큐가 가득 차면 가장 오래된 이벤트를 버림"""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """다음 이벤트 (timeout 동안 없으면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class SQLiteEventLog:
+    """공유 DB의 이벤트 로그 (id 순서 = 발행 순서)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS job_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            topic TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_events_created ON job_events (created_at);
+    """
+
+    def __init__(self, db: Optional[SQLiteDatabase] = None):
+        self.db = db or SQLiteDatabase(schema=self.SCHEMA)
+
+    def append(self, topic: str, event: dict):
+        self.db.conn().execute(
+            "INSERT INTO job_events (topic, created_at, data) VALUES (?, ?, ?)",
+            (topic, time.time(), json.dumps(event)),
+        )
+
+    def last_id(self) -> int:
+        return self.db.conn().execute("SELECT COALESCE(MAX(id), 0) FROM job_events").fetchone()[0]
+
+    def read(self, after_id: int) -> list[tuple[int, str, dict]]:
+        rows = self.db.conn().execute(
+            "SELECT id, topic, data FROM job_events WHERE id > ? ORDER BY id", (after_id,)
+        ).fetchall()
+        return [(row["id"], row["topic"], json.loads(row["data"])) for row in rows]
+
+    def prune(self, before: float) -> int:
+        return self.db.conn().execute("DELETE FROM job_events WHERE created_at < ?", (before,)).rowcount
+
+
+class JobEventBroker:
+    """작업 ID별 구독자 목록 (log가 있으면 이벤트 로그를 거쳐 모든 API 프로세스에 전달)"""
+
+    def __init__(self, log: Optional[SQLiteEventLog] = None):
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, list[Subscription]] = {}
+        self._listeners: list[Callable[[str, dict], None]] = []
+        self.published = 0
+        self.log = log
+        self._poller: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def add_listener(self, listener: Callable[[str, dict], None]):
+        """
+        모든 이벤트를 받는 콜백 (job_id 또는 토픽, 이벤트) 등록
+
+        발행한 스레드(로그를 쓰면 폴링 스레드)에서 호출되며, 다른 프로세스에서 발행된 이벤트도 받습니다.
+        """
+        self._listeners.append(listener)
+
+    def start(self):
+        """이벤트 로그 폴링 시작 (로그가 없으면 할 일 없음, 시작 이후에 발행된 이벤트부터 전달)"""
+        if self.log is None or self._poller is not None:
+            return
+        self._stopping.clear()
+        last_id = self.log.last_id()
+        self._poller = threading.Thread(target=self._poll, args=(last_id,), name="job-event-log", daemon=True)
+        self._poller.start()
+
+    def stop(self):
+        if self._poller is not None:
+            self._stopping.set()
+            self._poller.join(5.0)
+            self._poller = None
+
+    def _poll(self, last_id: int):
+        pruned_at = time.monotonic()
+        while not self._stopping.wait(EVENT_POLL_SECONDS):
+            try:
+                for event_id, topic, event in self.log.read(last_id):
+                    last_id = event_id
+                    self._deliver(topic, event)
+                if time.monotonic() - pruned_at >= EVENT_LOG_SECONDS / 10:
+                    pruned_at = time.monotonic()
+                    self.log.prune(time.time() - EVENT_LOG_SECONDS)
+            except sqlite3.Error as e:
+                print(f"Event log poll failed: {e}")
+
+    def subscribe(self, job_id: str) -> Subscription:
+        """현재 이벤트 루프에서 작업 이벤트 구독 (async 컨텍스트에서 호출)"""
+        subscription = Subscription(job_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(job_id, []).append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.job_id, [])
+            if subscription in subscribers:
+                subscribers.remove(subscription)
+            if not subscribers:
+                self._subscribers.pop(subscription.job_id, None)
+
+    def publish(self, job_id: str, event: dict):
+        """이벤트 발행 (임의의 스레드에서 호출 가능)"""
+        with self._lock:
+            self.published += 1
+        if self.log is not None:
+            # 이 프로세스의 구독자도 폴링 스레드가 로그에서 읽어 전달 (모든 프로세스가 같은 순서로 받음)
+            self.log.append(job_id, event)
+        else:
+            self._deliver(job_id, event)
+
+    def _deliver(self, job_id: str, event: dict):
+        """이 프로세스의 리스너/구독자에게 전달"""
+        for listener in self._listeners:
+            try:
+                listener(job_id, event)
+            except Exception as e:
+                print(f"Job event listener failed: {e}")
+        with self._lock:
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독자
+                self.unsubscribe(subscription)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "jobs": len(self._subscribers),
+                "subscribers": sum(len(subs) for subs in self._subscribers.values()),
+                "published": self.published,
+                "shared": self.log is not None,
+            }
+
+
+# 프로세스 전역 브로커 (JOB_STORE=sqlite면 공유 이벤트 로그 사용)
+job_events = JobEventBroker(SQLiteEventLog() if SHARED_STATE else None)
@@ -0,0 +1,726 @@
+"""
+GLB 최적화
+GLB를 직접 파싱해 정점/접근자 중복 제거, 정점 속성 양자화(KHR_mesh_quantization),
+정점 캐시 지역성을 위한 인덱스 재정렬, 큰 텍스처 축소를 수행합니다.
+외부 도구 없이 numpy(+ 텍스처는 Pillow)만 사용합니다.
+"""
+
+import io
+import json
+import time
+import struct
+import hashlib
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+GLB_MAGIC = b"glTF"
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+TRIANGLES = 4
+
+COMPONENT_DTYPES = {
+    5120: np.dtype("<i1"),
+    5121: np.dtype("<u1"),
+    5122: np.dtype("<i2"),
+    5123: np.dtype("<u2"),
+    5125: np.dtype("<u4"),
+    5126: np.dtype("<f4"),
+}
+COMPONENT_TYPES = {dtype: component for component, dtype in COMPONENT_DTYPES.items()}
+
+TYPE_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16}
+
+# 이미 압축되어 있거나 접근자를 직접 참조하는 확장 - 이 파일들은 그대로 둠
+SKIP_EXTENSIONS = (
+    "KHR_draco_mesh_compression",
+    "EXT_meshopt_compression",
+    "KHR_mesh_quantization",
+    "EXT_mesh_gpu_instancing",
+)
+
+# 정점 캐시 시뮬레이션 크기 (GPU post-transform 캐시)
+VERTEX_CACHE_SIZE = 16
+
+# 텍스처 재인코딩 품질
+JPEG_QUALITY = 90
+
+
+class GlbError(ValueError):
+    """GLB 파싱 실패 (자리표시 파일, 손상된 파일 등)"""
+
+
+# ============================================================================
+# GLB I/O
+# ============================================================================
+
+def read_glb(data: bytes) -> tuple[dict, bytes]:
+    """GLB 바이트를 (glTF JSON, BIN 청크)로 분리"""
+    if len(data) < 20 or data[:4] != GLB_MAGIC:
+        raise GlbError("not a GLB file")
+    version, length = struct.unpack_from("<II", data, 4)
+    if version != 2 or length > len(data):
+        raise GlbError(f"unsupported GLB (version {version}, length {length})")
+
+    gltf, binary = None, b""
+    offset = 12
+    while offset + 8 <= length:
+        chunk_length, chunk_type = struct.unpack_from("<II", data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == CHUNK_JSON:
+            gltf = json.loads(chunk)
+        elif chunk_type == CHUNK_BIN and not binary:
+            binary = bytes(chunk)
+        offset += 8 + chunk_length
+
+    if gltf is None:
+        raise GlbError("missing JSON chunk")
+    return gltf, binary
+
+
+def write_glb(gltf: dict, binary: bytes) -> bytes:
+    """glTF JSON + BIN 청크를 GLB 바이트로 결합 (청크는 4바이트 정렬)"""
+    json_chunk = json.dumps(gltf, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    chunks = struct.pack("<II", len(json_chunk), CHUNK_JSON) + json_chunk
+    if binary:
+        binary += b"\0" * (-len(binary) % 4)
+        chunks += struct.pack("<II", len(binary), CHUNK_BIN) + binary
+    return GLB_MAGIC + struct.pack("<II", 2, 12 + len(chunks)) + chunks
+
+
+def read_accessor(gltf: dict, binary: bytes, index: int) -> np.ndarray:
+    """접근자를 (count, 성분 수) 배열로 읽기 (byteStride/sparse 처리)"""
+    accessor = gltf["accessors"][index]
+    dtype = COMPONENT_DTYPES[accessor["componentType"]]
+    components = TYPE_SIZES[accessor["type"]]
+    count = accessor["count"]
+
+    if "bufferView" in accessor:
+        view = gltf["bufferViews"][accessor["bufferView"]]
+        if view.get("buffer", 0) != 0:
+            raise GlbError("external buffers are not supported")
+        offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+        stride = view.get("byteStride") or dtype.itemsize * components
+        if count and offset + stride * (count - 1) + dtype.itemsize * components > len(binary):
+            raise GlbError(f"accessor {index} is out of bounds")
+        array = np.array(np.ndarray(
+            (count, components), dtype, buffer=binary, offset=offset, strides=(stride, dtype.itemsize)
+        ))
+    else:
+        array = np.zeros((count, components), dtype)
+
+    sparse = accessor.get("sparse")
+    if sparse:
+        indices_view = gltf["bufferViews"][sparse["indices"]["bufferView"]]
+        values_view = gltf["bufferViews"][sparse["values"]["bufferView"]]
+        indices = np.frombuffer(
+            binary,
+            COMPONENT_DTYPES[sparse["indices"]["componentType"]],
+            sparse["count"],
+            indices_view.get("byteOffset", 0) + sparse["indices"].get("byteOffset", 0),
+        )
+        values = np.frombuffer(
+            binary,
+            dtype,
+            sparse["count"] * components,
+            values_view.get("byteOffset", 0) + sparse["values"].get("byteOffset", 0),
+        )
+        array[indices] = values.reshape(-1, components)
+    return array
+
+
+class _BinaryBuilder:
+    """새 BIN 청크와 bufferView/accessor 목록 - 내용이 같은 뷰/접근자는 하나로 합침"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.views: list[dict] = []
+        self.accessors: list[dict] = []
+        self._view_keys: dict = {}
+        self._accessor_keys: dict = {}
+
+    def add_view(self, data: bytes, target: Optional[int] = None, stride: Optional[int] = None) -> int:
+        key = (hashlib.sha1(data).digest(), len(data), target, stride)
+        if key in self._view_keys:
+            return self._view_keys[key]
+
+        self.data += b"\0" * (-len(self.data) % 4)
+        view = {"buffer": 0, "byteOffset": len(self.data), "byteLength": len(data)}
+        if stride:
+            view["byteStride"] = stride
+        if target:
+            view["target"] = target
+        self.data += data
+        self.views.append(view)
+        self._view_keys[key] = len(self.views) - 1
+        return len(self.views) - 1
+
+    def add_accessor(
+        self,
+        array: np.ndarray,
+        accessor_type: str,
+        normalized: bool = False,
+        target: Optional[int] = None,
+        bounds: bool = False,
+        extra: Optional[dict] = None,
+    ) -> int:
+        """
+        배열을 접근자로 추가
+
+        Args:
+            array: (count, 성분 수) 배열
+            target: ARRAY_BUFFER면 정점 속성 - 요소 크기를 4바이트 배수로 패딩 (byteStride)
+            bounds: min/max 계산 여부 (POSITION은 필수)
+            extra: 원본에서 유지할 필드 (min/max, name 등)
+        """
+        array = np.ascontiguousarray(array)
+        count = len(array)
+        element = array.dtype.itemsize * TYPE_SIZES[accessor_type]
+        stride = None
+        if target == ARRAY_BUFFER and element % 4:
+            stride = element + (-element % 4)
+            padded = np.zeros((count, stride), np.uint8)
+            padded[:, :element] = array.view(np.uint8).reshape(count, element)
+            data = padded.tobytes()
+        else:
+            data = array.tobytes()
+
+        accessor = {
+            "bufferView": self.add_view(data, target, stride),
+            "componentType": COMPONENT_TYPES[array.dtype.newbyteorder("<")],
+            "count": count,
+            "type": accessor_type,
+        }
+        if normalized:
+            accessor["normalized"] = True
+        if extra:
+            accessor.update(extra)
+        if bounds and count:
+            cast = float if array.dtype.kind == "f" else int
+            accessor["min"] = [cast(v) for v in array.min(axis=0)]
+            accessor["max"] = [cast(v) for v in array.max(axis=0)]
+
+        key = json.dumps(accessor, sort_keys=True)
+        if key not in self._accessor_keys:
+            self.accessors.append(accessor)
+            self._accessor_keys[key] = len(self.accessors) - 1
+        return self._accessor_keys[key]
+
+
+# ============================================================================
+# Geometry
+# ============================================================================
+
+def weld_vertices(streams: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    모든 속성 바이트가 같은 정점을 하나로 합침
+
+    Returns:
+        (대표 정점 인덱스, 원래 정점 → 합친 정점 인덱스)
+    """
+    count = len(streams[0])
+    rows = np.concatenate([np.ascontiguousarray(s).view(np.uint8).reshape(count, -1) for s in streams], axis=1)
+    keys = np.ascontiguousarray(rows).view(np.dtype((np.void, rows.shape[1]))).ravel()
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+
+def optimize_vertex_cache(indices: np.ndarray, vertex_count: int, cache_size: int = VERTEX_CACHE_SIZE) -> np.ndarray:
+    """
+    Tipsify (Sander et al. 2007) - 삼각형 순서를 정점 캐시 적중이 높도록 재정렬
+
+    캐시에 남아 있을 정점을 중심으로 팬(fan) 단위로 삼각형을 내보냅니다.
+    """
+    triangles = indices.reshape(-1, 3)
+    if len(triangles) < 2:
+        return indices
+
+    flat = triangles.ravel()
+    degree = np.bincount(flat, minlength=vertex_count)
+    offsets = np.concatenate([[0], np.cumsum(degree)]).tolist()
+    adjacency = (np.argsort(flat, kind="stable") // 3).tolist()
+    tris = triangles.tolist()
+
+    live = degree.tolist()
+    cache_time = [0] * vertex_count
+    emitted = bytearray(len(tris))
+    dead_end: list[int] = []
+    output: list[list[int]] = []
+    timestamp = cache_size + 1
+    cursor = 0
+    fan = int(flat[0])
+
+    while fan >= 0:
+        candidates = []
+        for t in adjacency[offsets[fan]:offsets[fan + 1]]:
+            if emitted[t]:
+                continue
+            emitted[t] = 1
+            output.append(tris[t])
+            for v in tris[t]:
+                dead_end.append(v)
+                candidates.append(v)
+                live[v] -= 1
+                if timestamp - cache_time[v] > cache_size:
+                    cache_time[v] = timestamp
+                    timestamp += 1
+
+        # 다음 팬 정점: 인접 삼각형을 모두 내보내도 캐시에 남아 있을 정점 중 가장 오래된 것
+        fan, best = -1, -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = timestamp - cache_time[v]
+                if priority + 2 * live[v] > cache_size:
+                    priority = 0
+                if priority > best:
+                    fan, best = v, priority
+        if fan >= 0:
+            continue
+
+        # 막다른 곳 - 최근 내보낸 정점 → 아직 남은 정점 순으로 탐색
+        while dead_end:
+            v = dead_end.pop()
+            if live[v] > 0:
+                fan = v
+                break
+        else:
+            while cursor < vertex_count and live[cursor] == 0:
+                cursor += 1
+            fan = cursor if cursor < vertex_count else -1
+
+    return np.asarray(output, indices.dtype).ravel()
+
+
+def optimize_vertex_fetch(index_lists: list[np.ndarray], vertex_count: int) -> tuple[list[np.ndarray], np.ndarray]:
+    """
+    정점을 처음 사용되는 순서로 재배치 (사용되지 않는 정점은 제거)
+
+    Returns:
+        (새 인덱스 목록, 새 정점 순서의 원래 정점 인덱스)
+    """
+    flat = np.concatenate(index_lists)
+    used, first = np.unique(flat, return_index=True)
+    order = used[np.argsort(first, kind="stable")]
+    remap = np.full(vertex_count, -1, np.int64)
+    remap[order] = np.arange(len(order))
+    return [remap[indices] for indices in index_lists], order
+
+
+def cache_miss_ratio(indices: np.ndarray, cache_size: int = VERTEX_CACHE_SIZE) -> float:
+    """FIFO 정점 캐시 기준 삼각형당 평균 캐시 미스 (ACMR, 0.5~3.0)"""
+    if len(indices) < 3:
+        return 0.0
+    cache: deque = deque()
+    cached: set = set()
+    misses = 0
+    for v in indices.tolist():
+        if v in cached:
+            continue
+        misses += 1
+        cache.append(v)
+        cached.add(v)
+        if len(cache) > cache_size:
+            cached.discard(cache.popleft())
+    return misses / (len(indices) // 3)
+
+
+def quantize_positions(positions: np.ndarray, offset: np.ndarray, scale: float) -> np.ndarray:
+    """위치를 정규화 int16으로 양자화 (복원: offset + scale * q / 32767)"""
+    return np.round(np.clip((positions - offset) / scale, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def quantize_snorm8(vectors: np.ndarray) -> np.ndarray:
+    """[-1, 1] 범위 벡터(노멀/탄젠트)를 정규화 int8로 양자화"""
+    return np.round(np.clip(vectors, -1.0, 1.0) * 127).astype(np.int8)
+
+
+def quantize_texcoords(texcoords: np.ndarray) -> Optional[np.ndarray]:
+    """[0, 1] 범위 UV를 정규화 uint16으로 양자화 (범위를 벗어나면 None - 원본 유지)"""
+    if len(texcoords) and (texcoords.min() < 0.0 or texcoords.max() > 1.0):
+        return None
+    return np.round(texcoords * 65535).astype(np.uint16)
+
+
+# ============================================================================
+# Textures
+# ============================================================================
+
+def downscale_image(data: bytes, mime_type: str, max_size: int) -> Optional[bytes]:
+    """
+    긴 변이 max_size보다 큰 PNG/JPEG 텍스처를 축소해 같은 형식으로 재인코딩
+
+    Returns:
+        새 이미지 바이트 (축소할 필요가 없거나 더 커지면 None)
+    """
+    if not max_size or mime_type not in ("image/png", "image/jpeg"):
+        return None
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    with Image.open(io.BytesIO(data)) as image:
+        if max(image.size) <= max_size:
+            return None
+        ratio = max_size / max(image.size)
+        size = (max(1, round(image.width * ratio)), max(1, round(image.height * ratio)))
+        resized = image.resize(size, Image.LANCZOS)
+
+        output = io.BytesIO()
+        if mime_type == "image/jpeg":
+            resized.convert("RGB").save(output, "JPEG", quality=JPEG_QUALITY, optimize=True)
+        else:
+            resized.save(output, "PNG", optimize=True)
+
+    encoded = output.getvalue()
+    return encoded if len(encoded) < len(data) else None
+
+
+# ============================================================================
+# Optimizer
+# ============================================================================
+
+def _triangle_count(gltf: dict) -> int:
+    triangles = 0
+    for mesh in gltf.get("meshes", []):
+        for primitive in mesh["primitives"]:
+            if primitive.get("mode", TRIANGLES) != TRIANGLES:
+                continue
+            if "indices" in primitive:
+                triangles += gltf["accessors"][primitive["indices"]]["count"] // 3
+            elif "POSITION" in primitive["attributes"]:
+                triangles += gltf["accessors"][primitive["attributes"]["POSITION"]]["count"] // 3
+    return triangles
+
+
+def _vertex_count(gltf: dict) -> int:
+    """메시 정점 수 (여러 프리미티브가 공유하는 POSITION 접근자는 한 번만)"""
+    positions = {
+        primitive["attributes"]["POSITION"]
+        for mesh in gltf.get("meshes", [])
+        for primitive in mesh["primitives"]
+        if "POSITION" in primitive["attributes"]
+    }
+    return sum(gltf["accessors"][index]["count"] for index in positions)
+
+
+def _unsupported_reason(gltf: dict) -> Optional[str]:
+    """최적화하지 않고 그대로 둘 파일이면 그 이유"""
+    extensions = set(gltf.get("extensionsUsed", [])) | set(gltf.get("extensionsRequired", []))
+    for extension in SKIP_EXTENSIONS:
+        if extension in extensions:
+            return extension
+    if any("uri" in buffer for buffer in gltf.get("buffers", [])):
+        return "external buffer"
+    for accessor in gltf.get("accessors", []):
+        if accessor["type"].startswith("MAT") and COMPONENT_DTYPES[accessor["componentType"]].itemsize < 4:
+            return "padded matrix accessor"
+    return None
+
+
+class _MeshOptimizer:
+    """단일 GLB 최적화 상태 - 원본 접근자 캐시와 새 바이너리"""
+
+    def __init__(self, gltf: dict, binary: bytes, quantize: bool, reorder: bool):
+        self.gltf = gltf
+        self.binary = binary
+        self.quantize = quantize
+        self.reorder = reorder
+        self.builder = _BinaryBuilder()
+        self.quantized = False
+        self.acmr: list[tuple[int, float, float]] = []  # (삼각형 수, 이전, 이후)
+        self._arrays: dict[int, np.ndarray] = {}
+        self._copied: dict[int, int] = {}
+
+    def array(self, index: int) -> np.ndarray:
+        if index not in self._arrays:
+            self._arrays[index] = read_accessor(self.gltf, self.binary, index)
+        return self._arrays[index]
+
+    def copy_accessor(self, index: int, target: Optional[int] = None) -> int:
+        """접근자를 그대로 옮김 (min/max 등 원본 필드 유지)"""
+        if index not in self._copied:
+            accessor = self.gltf["accessors"][index]
+            extra = {key: accessor[key] for key in ("min", "max", "name") if key in accessor}
+            self._copied[index] = self.builder.add_accessor(
+                self.array(index), accessor["type"], accessor.get("normalized", False), target, extra=extra
+            )
+        return self._copied[index]
+
+    def copy_primitive(self, primitive: dict):
+        """최적화하지 않는 프리미티브(선/점 등)의 접근자를 그대로 옮김"""
+        primitive["attributes"] = {
+            name: self.copy_accessor(index, ARRAY_BUFFER) for name, index in primitive["attributes"].items()
+        }
+        if "targets" in primitive:
+            primitive["targets"] = [
+                {name: self.copy_accessor(index, ARRAY_BUFFER) for name, index in target.items()}
+                for target in primitive["targets"]
+            ]
+        if "indices" in primitive:
+            primitive["indices"] = self.copy_accessor(primitive["indices"], ELEMENT_ARRAY_BUFFER)
+
+    def position_transform(self, mesh_index: int, skinned: set, node_extensions: set) -> Optional[tuple]:
+        """위치 양자화에 쓸 (offset, scale) - 스킨/모프/인스턴싱 메시이거나 float가 아니면 None"""
+        mesh = self.gltf["meshes"][mesh_index]
+        if not self.quantize or mesh_index in skinned or mesh_index in node_extensions:
+            return None
+
+        positions = []
+        for primitive in mesh["primitives"]:
+            if primitive.get("mode", TRIANGLES) != TRIANGLES or primitive.get("targets"):
+                return None
+            index = primitive["attributes"].get("POSITION")
+            if index is None or self.gltf["accessors"][index]["componentType"] != 5126:
+                return None
+            positions.append(self.array(index))
+
+        points = np.concatenate(positions)
+        if not len(points) or not np.isfinite(points).all():
+            return None
+        low, high = points.min(axis=0).astype(np.float64), points.max(axis=0).astype(np.float64)
+        offset = (low + high) / 2
+        scale = float((high - low).max()) / 2 or 1.0
+        return offset, scale
+
+    def encode_attribute(self, name: str, array: np.ndarray, accessor: dict, transform: Optional[tuple]) -> int:
+        """정점 속성 양자화 후 접근자로 추가"""
+        float_values = accessor["componentType"] == 5126
+        if name == "POSITION" and transform is not None:
+            self.quantized = True
+            return self.builder.add_accessor(
+                quantize_positions(array, *transform), "VEC3", True, ARRAY_BUFFER, bounds=True
+            )
+        if self.quantize and float_values and name in ("NORMAL", "TANGENT"):
+            self.quantized = True
+            return self.builder.add_accessor(quantize_snorm8(array), accessor["type"], True, ARRAY_BUFFER)
+        if self.quantize and float_values and name.startswith("TEXCOORD_"):
+            texcoords = quantize_texcoords(array)
+            if texcoords is not None:
+                self.quantized = True
+                return self.builder.add_accessor(texcoords, "VEC2", True, ARRAY_BUFFER)
+        return self.builder.add_accessor(
+            array, accessor["type"], accessor.get("normalized", False), ARRAY_BUFFER, bounds=name == "POSITION"
+        )
+
+    def optimize_group(self, primitives: list[dict], transform: Optional[tuple]):
+        """같은 정점 속성 접근자를 공유하는 삼각형 프리미티브들을 함께 최적화"""
+        attributes = primitives[0]["attributes"]
+        targets = primitives[0].get("targets", [])
+        names = sorted(attributes)
+        streams = [self.array(attributes[name]) for name in names]
+        streams += [self.array(target[name]) for target in targets for name in sorted(target)]
+        vertex_count = len(streams[0])
+        if not vertex_count:
+            for primitive in primitives:
+                self.copy_primitive(primitive)
+            return
+
+        # 1. 정점 용접 + 퇴화 삼각형 제거
+        first, inverse = weld_vertices(streams)
+        index_lists = []
+        for primitive in primitives:
+            if "indices" in primitive:
+                indices = self.array(primitive["indices"]).ravel().astype(np.int64)
+            else:
+                indices = np.arange(vertex_count, dtype=np.int64)
+            indices = inverse[indices[:len(indices) - len(indices) % 3]]
+            triangles = indices.reshape(-1, 3)
+            keep = (triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) & (
+                triangles[:, 0] != triangles[:, 2])
+            if keep.any():
+                indices = triangles[keep].ravel()
+            index_lists.append(indices)
+
+        # 2. 삼각형 순서(정점 캐시) → 정점 순서(정점 fetch)
+        if self.reorder:
+            optimized = []
+            for indices in index_lists:
+                reordered = optimize_vertex_cache(indices, len(first))
+                self.acmr.append((len(indices) // 3, cache_miss_ratio(indices), cache_miss_ratio(reordered)))
+                optimized.append(reordered)
+            index_lists = optimized
+        index_lists, order = optimize_vertex_fetch(index_lists, len(first))
+        source = first[order]
+
+        # 3. 속성/모프 타깃/인덱스 쓰기
+        new_attributes = {
+            name: self.encode_attribute(name, stream[source], self.gltf["accessors"][attributes[name]], transform)
+            for name, stream in zip(names, streams)
+        }
+        new_targets = []
+        for target in targets:
+            new_targets.append({
+                name: self.builder.add_accessor(
+                    self.array(target[name])[source],
+                    self.gltf["accessors"][target[name]]["type"],
+                    self.gltf["accessors"][target[name]].get("normalized", False),
+                    ARRAY_BUFFER,
+                    bounds=name == "POSITION",
+                )
+                for name in sorted(target)
+            })
+
+        index_dtype = np.uint16 if len(source) <= 65535 else np.uint32
+        for primitive, indices in zip(primitives, index_lists):
+            primitive["attributes"] = dict(new_attributes)
+            if new_targets:
+                primitive["targets"] = [dict(target) for target in new_targets]
+            primitive["indices"] = self.builder.add_accessor(
+                indices.astype(index_dtype).reshape(-1, 1), "SCALAR", target=ELEMENT_ARRAY_BUFFER
+            )
+
+    def run(self, max_texture_size: int) -> tuple[dict, bytes, list[str]]:
+        gltf = self.gltf
+        nodes = gltf.get("nodes", [])
+        skinned = {node["mesh"] for node in nodes if "mesh" in node and "skin" in node}
+        node_extensions = {node["mesh"] for node in nodes if "mesh" in node and node.get("extensions")}
+
+        # 메시: 삼각형 프리미티브는 정점 공유 그룹 단위로 최적화, 나머지는 그대로 복사
+        transforms = {}
+        for mesh_index, mesh in enumerate(gltf.get("meshes", [])):
+            transform = self.position_transform(mesh_index, skinned, node_extensions)
+            groups: dict[str, list[dict]] = {}
+            for primitive in mesh["primitives"]:
+                if primitive.get("mode", TRIANGLES) == TRIANGLES and "POSITION" in primitive["attributes"]:
+                    key = json.dumps([primitive["attributes"], primitive.get("targets", [])], sort_keys=True)
+                    groups.setdefault(key, []).append(primitive)
+                else:
+                    self.copy_primitive(primitive)
+            for group in groups.values():
+                self.optimize_group(group, transform)
+            if transform is not None:
+                transforms[mesh_index] = transform
+
+        # 양자화된 위치 복원 변환은 메시를 자식 노드로 옮겨 적용
+        for node in list(nodes):
+            transform = transforms.get(node.get("mesh"))
+            if transform is None:
+                continue
+            offset, scale = transform
+            child = {"mesh": node.pop("mesh"), "translation": offset.tolist(), "scale": [scale] * 3}
+            if "name" in node:
+                child["name"] = f"{node['name']}_mesh"
+            nodes.append(child)
+            node.setdefault("children", []).append(len(nodes) - 1)
+
+        for skin in gltf.get("skins", []):
+            if "inverseBindMatrices" in skin:
+                skin["inverseBindMatrices"] = self.copy_accessor(skin["inverseBindMatrices"])
+        for animation in gltf.get("animations", []):
+            for sampler in animation["samplers"]:
+                sampler["input"] = self.copy_accessor(sampler["input"])
+                sampler["output"] = self.copy_accessor(sampler["output"])
+
+        # 이미지: 큰 텍스처는 축소, 같은 내용은 하나의 bufferView로
+        resized = []
+        for index, image in enumerate(gltf.get("images", [])):
+            if "bufferView" not in image:
+                continue
+            view = gltf["bufferViews"][image["bufferView"]]
+            data = self.binary[view.get("byteOffset", 0):view.get("byteOffset", 0) + view["byteLength"]]
+            smaller = downscale_image(data, image.get("mimeType", ""), max_texture_size)
+            if smaller is not None:
+                resized.append(image.get("name") or f"image{index}")
+                data = smaller
+            image["bufferView"] = self.builder.add_view(data)
+
+        gltf["accessors"] = self.builder.accessors
+        gltf["bufferViews"] = self.builder.views
+        gltf["buffers"] = [{"byteLength": len(self.builder.data) + (-len(self.builder.data) % 4)}]
+        for key in ("accessors", "bufferViews"):
+            if not gltf[key]:
+                del gltf[key]
+
+        if self.quantized:
+            for key in ("extensionsUsed", "extensionsRequired"):
+                gltf[key] = [*gltf.get(key, []), "KHR_mesh_quantization"]
+        return gltf, bytes(self.builder.data), resized
+
+
+def optimize_glb(
+    data: bytes,
+    max_texture_size: int = 0,
+    quantize: bool = True,
+    reorder: bool = True,
+) -> tuple[bytes, dict]:
+    """
+    GLB 최적화
+
+    Args:
+        data: 원본 GLB 바이트
+        max_texture_size: 텍스처 긴 변 최대 크기 (0이면 축소하지 않음)
+        quantize: 위치/노멀/탄젠트/UV 양자화 (KHR_mesh_quantization)
+        reorder: 정점 캐시/fetch 순서 재정렬
+
+    Returns:
+        (최적화된 GLB 바이트, 통계) - 최적화할 수 없는 파일이면 원본 그대로와 skipped 사유
+
+    Raises:
+        GlbError: GLB가 아니거나 손상된 파일
+    """
+    gltf, binary = read_glb(data)
+    report = {
+        "bytes_in": len(data),
+        "triangles_in": _triangle_count(gltf),
+        "vertices_in": _vertex_count(gltf),
+    }
+
+    reason = _unsupported_reason(gltf)
+    if reason is not None:
+        return data, {**report, "bytes_out": len(data), "skipped": reason}
+
+    optimizer = _MeshOptimizer(gltf, binary, quantize, reorder)
+    gltf, binary, resized = optimizer.run(max_texture_size)
+    output = write_glb(gltf, binary)
+
+    weighted = sum(count for count, _, _ in optimizer.acmr)
+    report.update(
+        bytes_out=len(output),
+        triangles_out=_triangle_count(gltf),
+        vertices_out=_vertex_count(gltf),
+        quantized=optimizer.quantized,
+        textures_resized=resized,
+        acmr_before=round(sum(c * before for c, before, _ in optimizer.acmr) / weighted, 3) if weighted else None,
+        acmr_after=round(sum(c * after for c, _, after in optimizer.acmr) / weighted, 3) if weighted else None,
+    )
+    return output, report
+
+
+def optimize_file(src: str, dst: Optional[str] = None, **options) -> dict:
+    """
+    GLB 파일 최적화 후 dst(기본: 원본 덮어쓰기)에 저장
+
+    최적화 결과가 원본보다 크면 원본을 그대로 복사합니다.
+    자리표시/손상 파일은 건드리지 않고 skipped로 보고합니다.
+    """
+    dst = dst or src
+    start = time.perf_counter()
+    data = Path(src).read_bytes()
+    try:
+        output, report = optimize_glb(data, **options)
+    except (GlbError, KeyError, IndexError, ValueError) as e:
+        return {"path": src, "bytes_in": len(data), "bytes_out": len(data), "skipped": str(e) or type(e).__name__}
+
+    if len(output) >= len(data):
+        output = data
+        report["bytes_out"] = len(data)
+        report.setdefault("skipped", "no reduction")
+
+    if dst != src or output is not data:
+        Path(dst).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = Path(f"{dst}.tmp")
+        tmp_path.write_bytes(output)
+        tmp_path.replace(dst)
+
+    report.update(path=src, output_path=dst, seconds=round(time.perf_counter() - start, 3))
+    return report
@@ -0,0 +1,294 @@
+"""
+작업 상태 저장소
+인메모리 백엔드와 SQLite(WAL) 백엔드를 제공합니다. SQLite는 작업 기록을 재시작 후에도 남기고
+다른 프로세스에서 읽고 쓸 수 있으며, JOB_STORE=sqlite이면 동일 작업 합류, 이벤트 로그, 결과 캐시 인덱스,
+GPU 작업 큐도 같은 DB에 두므로(services/shared_db.py) API 서버를 uvicorn 워커 여러 개로 실행할 수 있습니다.
+완료/실패한 작업은 TTL 및 최대 개수 기준으로 정리됩니다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# 저장소 설정
+JOB_STORE_BACKEND = os.environ.get("JOB_STORE", "memory")  # memory | sqlite
+JOB_STORE_PATH = os.environ.get("JOB_STORE_PATH", str(PROJECT_ROOT / "data" / "jobs.db"))
+JOB_TTL_SECONDS = float(os.environ.get("JOB_TTL_SECONDS", str(24 * 3600)))
+JOB_MAX_COUNT = int(os.environ.get("JOB_MAX_COUNT", "10000"))
+# 정리 작업 최소 간격 (초)
+EVICT_INTERVAL = 60.0
+
+FINISHED_STATUSES = ("completed", "failed")
+
+
+class JobStore(ABC):
+    """작업 저장소 인터페이스"""
+
+    def __init__(self, ttl_seconds: float = JOB_TTL_SECONDS, max_jobs: int = JOB_MAX_COUNT):
+        self.ttl_seconds = ttl_seconds
+        self.max_jobs = max_jobs
+        self._last_evict = 0.0
+
+    @abstractmethod
+    def create(self, job_id: str, job: dict):
+        """새 작업 저장"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[dict]:
+        """작업 조회 (없으면 None)"""
+
+    @abstractmethod
+    def update(self, job_id: str, **fields) -> Optional[dict]:
+        """작업 필드 갱신 후 갱신된 작업 반환 (없으면 None)"""
+
+    @abstractmethod
+    def delete(self, job_id: str):
+        """작업 삭제"""
+
+    @abstractmethod
+    def list(self, status: Optional[str] = None, offset: int = 0, limit: int = 50) -> tuple[list[dict], int]:
+        """최신순 작업 목록과 전체 개수"""
+
+    @abstractmethod
+    def count_by_status(self) -> dict[str, int]:
+        """상태별 작업 수"""
+
+    @abstractmethod
+    def evict(self, now: Optional[float] = None) -> int:
+        """만료/초과된 완료 작업 정리 후 삭제 개수 반환"""
+
+    def maybe_evict(self):
+        """마지막 정리 후 일정 시간이 지났으면 정리 실행"""
+        now = time.time()
+        if now - self._last_evict >= EVICT_INTERVAL:
+            self._last_evict = now
+            self.evict(now)
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 내 인메모리 저장소 (API 프로세스 하나일 때 사용)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._jobs: OrderedDict[str, dict] = OrderedDict()
+        self._by_status: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def _index(self, job_id: str, old_status: Optional[str], new_status: Optional[str]):
+        if old_status == new_status:
+            return
+        if old_status is not None:
+            self._by_status.get(old_status, set()).discard(job_id)
+        if new_status is not None:
+            self._by_status.setdefault(new_status, set()).add(job_id)
+
+    def create(self, job_id: str, job: dict):
+        now = time.time()
+        with self._lock:
+            self._jobs[job_id] = {**job, "job_id": job_id, "created_at": now, "updated_at": now}
+            self._index(job_id, None, job["status"])
+        self.maybe_evict()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        # update()가 워커 이벤트 스레드에서 새 키를 추가하는 중에 복사하지 않도록 lock 안에서 복사
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def update(self, job_id: str, **fields) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            self._index(job_id, job["status"], fields.get("status", job["status"]))
+            job.update(fields, updated_at=time.time())
+            return dict(job)
+
+    def delete(self, job_id: str):
+        with self._lock:
+            job = self._jobs.pop(job_id, None)
+            if job is not None:
+                self._index(job_id, job["status"], None)
+
+    def list(self, status: Optional[str] = None, offset: int = 0, limit: int = 50) -> tuple[list[dict], int]:
+        with self._lock:
+            if status is None:
+                ids = list(reversed(self._jobs))
+            else:
+                ids = sorted(
+                    self._by_status.get(status, ()),
+                    key=lambda job_id: self._jobs[job_id]["created_at"],
+                    reverse=True,
+                )
+            return [dict(self._jobs[job_id]) for job_id in ids[offset:offset + limit]], len(ids)
+
+    def count_by_status(self) -> dict[str, int]:
+        with self._lock:
+            return {status: len(ids) for status, ids in self._by_status.items() if ids}
+
+    def evict(self, now: Optional[float] = None) -> int:
+        now = now or time.time()
+        with self._lock:
+            finished = [
+                job_id for job_id, job in self._jobs.items()
+                if job["status"] in FINISHED_STATUSES
+            ]
+            expired = {job_id for job_id in finished if now - self._jobs[job_id]["updated_at"] > self.ttl_seconds}
+            # 최대 개수 초과분은 오래된 완료 작업부터 삭제 (삽입 순서 = 생성 순서)
+            overflow = len(self._jobs) - len(expired) - self.max_jobs
+            if overflow > 0:
+                remaining = [job_id for job_id in finished if job_id not in expired]
+                expired.update(remaining[:overflow])
+
+            for job_id in expired:
+                job = self._jobs.pop(job_id)
+                self._index(job_id, job["status"], None)
+        return len(expired)
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite(WAL) 저장소 - 재시작 후에도 작업 기록 유지, 여러 API 프로세스가 동시에 읽기/쓰기 가능"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (created_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_updated ON jobs (status, updated_at);
+    """
+
+    def __init__(self, path: str = JOB_STORE_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # sqlite3 연결은 스레드 간 공유 불가 - 스레드별 연결 사용
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> dict:
+        return {
+            **json.loads(row["data"]),
+            "job_id": row["job_id"],
+            "status": row["status"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    @staticmethod
+    def _data(job: dict) -> str:
+        fields = ("job_id", "status", "created_at", "updated_at")
+        return json.dumps({k: v for k, v in job.items() if k not in fields})
+
+    def create(self, job_id: str, job: dict):
+        now = time.time()
+        self._conn().execute(
+            "INSERT INTO jobs (job_id, status, created_at, updated_at, data) VALUES (?, ?, ?, ?, ?)",
+            (job_id, job["status"], now, now, self._data(job)),
+        )
+        self.maybe_evict()
+
+    def get(self, job_id: str) -> Optional[dict]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row is not None else None
+
+    def update(self, job_id: str, **fields) -> Optional[dict]:
+        conn = self._conn()
+        # 읽기-수정-쓰기를 하나의 쓰기 트랜잭션으로 묶어 다른 프로세스와의 경합 방지
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            if row is None:
+                conn.execute("ROLLBACK")
+                return None
+            job = {**self._row_to_job(row), **fields, "updated_at": time.time()}
+            conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = ?, data = ? WHERE job_id = ?",
+                (job["status"], job["updated_at"], self._data(job), job_id),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return job
+
+    def delete(self, job_id: str):
+        self._conn().execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    def list(self, status: Optional[str] = None, offset: int = 0, limit: int = 50) -> tuple[list[dict], int]:
+        conn = self._conn()
+        if status is None:
+            rows = conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+            total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        else:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                (status, limit, offset),
+            ).fetchall()
+            total = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (status,)).fetchone()[0]
+        return [self._row_to_job(row) for row in rows], total
+
+    def count_by_status(self) -> dict[str, int]:
+        rows = self._conn().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def evict(self, now: Optional[float] = None) -> int:
+        now = now or time.time()
+        conn = self._conn()
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        deleted = conn.execute(
+            f"DELETE FROM jobs WHERE status IN ({placeholders}) AND updated_at < ?",
+            (*FINISHED_STATUSES, now - self.ttl_seconds),
+        ).rowcount
+
+        total = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+        overflow = total - self.max_jobs
+        if overflow > 0:
+            deleted += conn.execute(
+                f"""DELETE FROM jobs WHERE job_id IN (
+                    SELECT job_id FROM jobs WHERE status IN ({placeholders})
+                    ORDER BY created_at LIMIT ?
+                )""",
+                (*FINISHED_STATUSES, overflow),
+            ).rowcount
+        return deleted
+
+
+def create_job_store(backend: str = JOB_STORE_BACKEND) -> JobStore:
+    """설정에 맞는 작업 저장소 생성"""
+    if backend == "sqlite":
+        return SQLiteJobStore()
+    if backend == "memory":
+        return MemoryJobStore()
+    raise ValueError(f"Unknown job store backend: {backend}")
+
+
+# 프로세스 전역 작업 저장소
+job_store = create_job_store()
@@ -0,0 +1,203 @@
+"""
+JSON Patch (RFC 6902)
+문서를 제자리에서 수정하며, 연산마다 되돌리기 기록을 남겨 중간에 실패하면 원래 상태로 돌립니다.
+(문서 전체를 복사하지 않으므로 수정 비용이 문서 크기와 무관함)
+"""
+
+import copy
+from typing import Any, Callable
+
+
+class JsonPatchError(ValueError):
+    """잘못된 patch 연산/경로"""
+
+
+class JsonPatchTestFailed(JsonPatchError):
+    """test 연산의 값이 다름"""
+
+
+OPERATIONS = ("add", "remove", "replace", "move", "copy", "test")
+
+
+def parse_pointer(pointer: str) -> list[str]:
+    """JSON Pointer (RFC 6901) → 토큰 목록"""
+    if not isinstance(pointer, str):
+        raise JsonPatchError(f"Invalid JSON pointer {pointer!r}")
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise JsonPatchError(f"JSON pointer must start with '/': {pointer!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+
+def format_pointer(tokens: list) -> str:
+    return "".join("/" + str(token).replace("~", "~0").replace("/", "~1") for token in tokens)
+
+
+def _index(container: list, token: str, allow_end: bool = False) -> int:
+    """배열 토큰 → 인덱스 ("-"는 add에서만 끝 위치)"""
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token[0] == "0"):
+        raise JsonPatchError(f"Invalid array index {token!r}")
+    index = int(token)
+    if index > len(container) or (index == len(container) and not allow_end):
+        raise JsonPatchError(f"Array index {index} out of range")
+    return index
+
+
+def _json_type(value: Any) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, (int, float)):
+        return "number"
+    if isinstance(value, str):
+        return "string"
+    if isinstance(value, (list, tuple)):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return "null" if value is None else type(value).__name__
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """
+    RFC 6902 §4.6 test 비교 - JSON 타입이 같아야 같은 값
+    (True와 1은 다르고, 숫자끼리는 수치로 비교하므로 1과 1.0은 같음)
+    """
+    kind = _json_type(a)
+    if kind != _json_type(b):
+        return False
+    if kind == "array":
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    if kind == "object":
+        return a.keys() == b.keys() and all(json_equal(a[key], b[key]) for key in a)
+    return a == b
+
+
+def resolve(document: Any, tokens: list[str]) -> Any:
+    """토큰 경로의 값 (없으면 JsonPatchError)"""
+    value = document
+    for token in tokens:
+        if isinstance(value, dict):
+            if token not in value:
+                raise JsonPatchError(f"Path {format_pointer(tokens)} does not exist")
+            value = value[token]
+        elif isinstance(value, list):
+            value = value[_index(value, token)]
+        else:
+            raise JsonPatchError(f"Path {format_pointer(tokens)} does not exist")
+    return value
+
+
+def _add(document: Any, tokens: list[str], value: Any, undo: list[Callable]):
+    if not tokens:
+        raise JsonPatchError("Cannot replace the document root")
+    parent, key = resolve(document, tokens[:-1]), tokens[-1]
+    if isinstance(parent, dict):
+        if key in parent:
+            old = parent[key]
+            undo.append(lambda: parent.__setitem__(key, old))
+        else:
+            undo.append(lambda: parent.pop(key))
+        parent[key] = value
+    elif isinstance(parent, list):
+        index = _index(parent, key, allow_end=True)
+        parent.insert(index, value)
+        undo.append(lambda: parent.pop(index))
+    else:
+        raise JsonPatchError(f"Path {format_pointer(tokens[:-1])} is not a container")
+
+
+def _remove(document: Any, tokens: list[str], undo: list[Callable]) -> Any:
+    if not tokens:
+        raise JsonPatchError("Cannot remove the document root")
+    parent, key = resolve(document, tokens[:-1]), tokens[-1]
+    if isinstance(parent, dict):
+        if key not in parent:
+            raise JsonPatchError(f"Path {format_pointer(tokens)} does not exist")
+        value = parent.pop(key)
+        undo.append(lambda: parent.__setitem__(key, value))
+    elif isinstance(parent, list):
+        index = _index(parent, key)
+        value = parent.pop(index)
+        undo.append(lambda: parent.insert(index, value))
+    else:
+        raise JsonPatchError(f"Path {format_pointer(tokens)} does not exist")
+    return value
+
+
+def apply_operation(document: Any, operation: dict, undo: list[Callable]):
+    """
+    연산 하나를 제자리에서 적용하고 되돌리기 함수를 undo에 추가
+
+    Raises:
+        JsonPatchError: 잘못된 연산/경로 (이 연산의 변경은 이미 되돌려진 상태)
+        JsonPatchTestFailed: test 실패
+    """
+    if not isinstance(operation, dict) or operation.get("op") not in OPERATIONS:
+        raise JsonPatchError(f"Invalid operation {operation!r}")
+    op = operation["op"]
+    if "path" not in operation:
+        raise JsonPatchError(f"'{op}' operation needs 'path'")
+    tokens = parse_pointer(operation["path"])
+    if op in ("add", "replace", "test") and "value" not in operation:
+        raise JsonPatchError(f"'{op}' operation needs 'value'")
+    if op in ("move", "copy") and "from" not in operation:
+        raise JsonPatchError(f"'{op}' operation needs 'from'")
+
+    if op == "add":
+        _add(document, tokens, copy.deepcopy(operation["value"]), undo)
+    elif op == "remove":
+        _remove(document, tokens, undo)
+    elif op == "replace":
+        resolve(document, tokens)  # 없는 경로면 실패
+        mark = len(undo)
+        try:
+            _remove(document, tokens, undo)
+            _add(document, tokens, copy.deepcopy(operation["value"]), undo)
+        except JsonPatchError:
+            rollback(undo, mark)
+            raise
+    elif op == "test":
+        if not json_equal(resolve(document, tokens), operation["value"]):
+            raise JsonPatchTestFailed(f"Test failed at {operation['path']}")
+    else:
+        source = parse_pointer(operation["from"])
+        if op == "move" and tokens[:len(source)] == source and tokens != source:
+            raise JsonPatchError("Cannot move a value into one of its children")
+        mark = len(undo)
+        try:
+            if op == "move":
+                value = _remove(document, source, undo)
+            else:
+                value = copy.deepcopy(resolve(document, source))
+            _add(document, tokens, value, undo)
+        except JsonPatchError:
+            rollback(undo, mark)
+            raise
+
+
+def rollback(undo: list[Callable], mark: int = 0):
+    """undo[mark:]를 역순으로 되돌림"""
+    while len(undo) > mark:
+        undo.pop()()
+
+
+def apply_patch(document: Any, operations: list[dict]) -> list[Callable]:
+    """
+    patch 전체를 제자리에서 적용 (하나라도 실패하면 모두 되돌린 뒤 예외)
+
+    Returns:
+        되돌리기 기록 - 적용 후 다른 검사에서 실패하면 rollback(undo)으로 되돌림
+    """
+    if not isinstance(operations, list):
+        raise JsonPatchError("Patch must be an array of operations")
+    undo: list[Callable] = []
+    try:
+        for operation in operations:
+            apply_operation(document, operation, undo)
+    except JsonPatchError:
+        rollback(undo)
+        raise
+    return undo
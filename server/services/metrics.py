@@ -0,0 +1,213 @@
+"""
+Prometheus 메트릭
+외부 의존성 없이 Counter/Gauge/Histogram을 집계하고 Prometheus text format(0.0.4)으로 출력합니다.
+워커 프로세스의 단계 타이머 값은 워커 이벤트로 전달받아 집계합니다.
+"""
+
+import math
+import threading
+from typing import Callable, Optional
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 단계 지연 (초)
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+# 작업 전체 소요 시간 (초)
+JOB_BUCKETS = (1, 5, 10, 30, 60, 90, 120, 180, 300, 600)
+# GLB 크기 (bytes)
+SIZE_BUCKETS = tuple(2 ** p for p in range(18, 30))  # 256KB ~ 512MB
+# 메모리 (bytes)
+MEMORY_BUCKETS = tuple(g * 1024 ** 3 for g in (1, 2, 4, 6, 8, 10, 12, 16, 20, 24, 32, 48, 80))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: tuple, extra: Optional[tuple] = None) -> str:
+    pairs = list(labels) + list(extra or ())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """레이블별 값을 가진 메트릭 기본 클래스"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = label_names
+        self._lock = threading.Lock()
+        self._values: dict[tuple, object] = {}
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple((name, str(labels.get(name, ""))) for name in self.label_names)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> list[str]:
+        with self._lock:
+            return self.header() + [
+                f"{self.name}{_format_labels(key)} {_format_value(value)}"
+                for key, value in self._values.items()
+            ]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def replace(self, values: dict[tuple, float]):
+        """모든 레이블 값을 한 번에 교체 (스크레이프 시점 집계용)"""
+        with self._lock:
+            self._values = dict(values)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple = (), buckets: tuple = STAGE_BUCKETS):
+        super().__init__(name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state["counts"][i] += 1
+                    break
+            state["sum"] += value
+            state["count"] += 1
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        with self._lock:
+            for key, state in self._values.items():
+                cumulative = 0
+                for bound, count in zip(self.buckets, state["counts"]):
+                    cumulative += count
+                    lines.append(f"{self.name}_bucket{_format_labels(key, (('le', _format_value(bound)),))} {cumulative}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(state['sum'])}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {state['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 모음 - 스크레이프 시 수집 콜백을 실행한 뒤 출력"""
+
+    def __init__(self):
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], None]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]):
+        """스크레이프 직전에 호출되어 Gauge 등을 갱신하는 콜백 등록"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        for collector in self._collectors:
+            try:
+                collector()
+            except Exception as e:
+                print(f"Metrics collector failed: {e}")
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 메트릭
+registry = MetricsRegistry()
+
+stage_seconds = registry.register(Histogram(
+    "generation_stage_seconds",
+    "Latency of pipeline stages (image model attempts, pipeline.run, mesh.simplify, to_glb, glb.export)",
+    ("stage", "model", "outcome"),
+))
+job_seconds = registry.register(Histogram(
+    "generation_job_seconds",
+    "End-to-end job duration inside the GPU worker",
+    ("kind", "status"),
+    buckets=JOB_BUCKETS,
+))
+output_glb_bytes = registry.register(Histogram(
+    "generation_output_glb_bytes",
+    "Size of exported GLB files",
+    buckets=SIZE_BUCKETS,
+))
+job_peak_memory_bytes = registry.register(Histogram(
+    "generation_job_peak_memory_bytes",
+    "Peak memory per job (gpu: torch max_memory_allocated, rss: worker resident set)",
+    ("device",),
+    buckets=MEMORY_BUCKETS,
+))
+queue_depth = registry.register(Gauge("generation_queue_depth", "Jobs waiting in the GPU worker queue"))
+jobs_running = registry.register(Gauge("generation_jobs_running", "Jobs currently inside GPU workers"))
+jobs_by_status = registry.register(Gauge("generation_jobs", "Jobs in the job store by status", ("status",)))
+worker_stage_queue_depth = registry.register(Gauge(
+    "generation_worker_stage_queue_depth",
+    "Queue depth in front of each worker pipeline stage",
+    ("worker", "stage"),
+))
+worker_stage_utilization = registry.register(Gauge(
+    "generation_worker_stage_utilization",
+    "Fraction of time each worker pipeline stage was busy",
+    ("worker", "stage"),
+))
+
+
+def record_worker_event(event: dict):
+    """워커 이벤트에서 메트릭 집계 (워커 풀 리스너 스레드에서 호출됨)"""
+    event_type = event["type"]
+
+    if event_type == "metric":
+        labels = event.get("labels", {})
+        stage_seconds.observe(
+            event["seconds"],
+            stage=event["stage"],
+            model=labels.get("model", ""),
+            outcome=labels.get("outcome", "success"),
+        )
+    elif event_type == "completed":
+        result = event["result"]
+        if result.get("model_bytes") is not None:
+            output_glb_bytes.observe(result["model_bytes"])
+        if result.get("peak_gpu_bytes") is not None:
+            job_peak_memory_bytes.observe(result["peak_gpu_bytes"], device="gpu")
+        if result.get("peak_rss_bytes") is not None:
+            job_peak_memory_bytes.observe(result["peak_rss_bytes"], device="rss")
+    elif event_type == "finished":
+        job_seconds.observe(event["duration"], kind=event.get("kind", ""), status=event.get("status", ""))
+        for stage_name, stage in event.get("stages", {}).items():
+            worker_stage_queue_depth.set(stage["queue_depth"], worker=event["worker_id"], stage=stage_name)
+            worker_stage_utilization.set(stage["utilization"], worker=event["worker_id"], stage=stage_name)
@@ -0,0 +1,150 @@
+"""
+프로세스 전역 모델 레지스트리
+TextTo3DPipeline을 프로세스당 한 번만 로드하고 모든 작업에서 공유하기 위한 모듈
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+def resident_memory_bytes() -> Optional[int]:
+    """현재 프로세스의 상주 메모리(RSS) 크기 (bytes)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+        # Linux는 KB, macOS는 bytes 단위의 최대 RSS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+    except ImportError:
+        return None
+
+
+def gpu_memory_bytes() -> Optional[int]:
+    """현재 할당된 GPU 메모리 (bytes), CUDA가 없으면 None"""
+    try:
+        import torch
+    except ImportError:
+        return None
+
+    if not torch.cuda.is_available():
+        return None
+    return torch.cuda.memory_allocated()
+
+
+def reset_peak_gpu_memory():
+    """GPU 최대 메모리 통계 초기화 (CUDA가 없으면 무시)"""
+    try:
+        import torch
+    except ImportError:
+        return
+
+    if torch.cuda.is_available():
+        torch.cuda.reset_peak_memory_stats()
+
+
+def peak_gpu_memory_bytes() -> Optional[int]:
+    """마지막 초기화 이후 최대 GPU 메모리 (bytes), CUDA가 없으면 None"""
+    try:
+        import torch
+    except ImportError:
+        return None
+
+    if not torch.cuda.is_available():
+        return None
+    return torch.cuda.max_memory_allocated()
+
+
+class ModelRegistry:
+    """TextTo3DPipeline을 한 번만 로드하여 공유하는 레지스트리"""
+
+    def __init__(self):
+        self._pipeline = None
+        self._lock = threading.Lock()
+        self.load_time: Optional[float] = None
+        self.warmup_time: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._pipeline is not None
+
+    def load(self, warmup: bool = False):
+        """
+        파이프라인을 로드합니다. 이미 로드된 경우 기존 인스턴스를 반환합니다.
+
+        Args:
+            warmup: 로드 후 더미 추론으로 워밍업 여부
+
+        Returns:
+            로드된 TextTo3DPipeline
+        """
+        with self._lock:
+            if self._pipeline is None:
+                from services.pipeline import TextTo3DPipeline
+
+                print("Loading model registry...")
+                start = time.perf_counter()
+                pipeline = TextTo3DPipeline()
+                pipeline.image_to_3d.load_pipeline()
+                self.load_time = time.perf_counter() - start
+                self.loaded_at = time.time()
+                self._pipeline = pipeline
+                print(f"Model registry loaded in {self.load_time:.1f}s")
+
+                if warmup:
+                    self._warmup()
+
+            return self._pipeline
+
+    def get_pipeline(self):
+        """로드된 파이프라인 반환 (아직 로드되지 않았다면 지금 로드)"""
+        if self._pipeline is None:
+            return self.load()
+        return self._pipeline
+
+    def _warmup(self):
+        """더미 이미지로 한 번 추론하여 CUDA 커널/할당자를 미리 초기화"""
+        from PIL import Image
+
+        print("Warming up pipeline with dummy inference...")
+        start = time.perf_counter()
+        dummy = Image.new("RGB", (512, 512), (255, 255, 255))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                self._pipeline.image_to_3d.generate(dummy, str(Path(tmp_dir) / "warmup.glb"))
+            except Exception as e:
+                # 빈 이미지는 메시가 비어 실패할 수 있음 - 워밍업 목적은 달성됨
+                print(f"Warmup inference failed (ignored): {e}")
+        self.warmup_time = time.perf_counter() - start
+        print(f"Warmup done in {self.warmup_time:.1f}s")
+
+    def stats(self) -> dict:
+        """로드 시간 및 메모리 사용량"""
+        return {
+            "loaded": self.is_loaded,
+            "load_time_s": self.load_time,
+            "warmup_time_s": self.warmup_time,
+            "loaded_at": self.loaded_at,
+            "rss_bytes": resident_memory_bytes(),
+            "gpu_allocated_bytes": gpu_memory_bytes(),
+        }
+
+
+# 프로세스 전역 레지스트리
+registry = ModelRegistry()
+
+# 앱 시작 시 모델 미리 로드 / 워밍업 여부
+PRELOAD_MODELS = os.environ.get("MODEL_PRELOAD", "1") == "1"
+WARMUP_MODELS = os.environ.get("MODEL_WARMUP", "0") == "1"
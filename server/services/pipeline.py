@@ -33,12 +33,46 @@ from text_to_3d_pipeline import (
     TextTo3DPipeline,
     ImageTo3DGenerator,
     TextToImageGenerator,
+    PROMPT_TEMPLATE_3D,
+    IMAGE_MODELS,
+    DEFAULT_DECIMATION_TARGET,
+    DEFAULT_TEXTURE_SIZE,
+    add_stage_hook,
+    stage_timer,
+    ProgressCallback,
+    save_mesh_cache,
+    load_mesh_cache,
+    has_mesh_cache,
+    LOD_LEVELS,
+    parse_lod_levels,
+    lod_chain,
+    lod_path,
+    lod_manifest_path,
+    write_lod_manifest,
+    read_lod_manifest,
 )
 
 __all__ = [
     'TextTo3DPipeline',
     'ImageTo3DGenerator',
     'TextToImageGenerator',
+    'PROMPT_TEMPLATE_3D',
+    'IMAGE_MODELS',
+    'DEFAULT_DECIMATION_TARGET',
+    'DEFAULT_TEXTURE_SIZE',
+    'add_stage_hook',
+    'stage_timer',
+    'ProgressCallback',
+    'save_mesh_cache',
+    'load_mesh_cache',
+    'has_mesh_cache',
+    'LOD_LEVELS',
+    'parse_lod_levels',
+    'lod_chain',
+    'lod_path',
+    'lod_manifest_path',
+    'write_lod_manifest',
+    'read_lod_manifest',
     'DINOV3_LOCAL_PATH',
     'RMBG_LOCAL_PATH',
 ]
@@ -0,0 +1,417 @@
+"""
+Text → 3D 결과 캐시
+정규화된 프롬프트, 렌더링된 프롬프트 템플릿, 이미지 모델, 내보내기 옵션의 해시를 키로
+이미 생성된 GLB/이미지를 재사용합니다. 전체 크기 기준 LRU로 오래된 결과를 삭제합니다.
+JOB_STORE=sqlite이면 인덱스를 공유 DB에 두어 여러 API 프로세스가 같은 캐시를 씁니다.
+"""
+
+import os
+import json
+import time
+import shutil
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Optional, Union
+
+from services.shared_db import SHARED_STATE, SQLiteDatabase
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+ASSETS_DIR = PROJECT_ROOT / "assets"
+
+# 캐시 설정
+RESULT_CACHE_ENABLED = os.environ.get("RESULT_CACHE", "1") == "1"
+RESULT_CACHE_INDEX = os.environ.get("RESULT_CACHE_INDEX", str(PROJECT_ROOT / "data" / "result_cache.json"))
+RESULT_CACHE_MAX_BYTES = int(os.environ.get("RESULT_CACHE_MAX_MB", "10240")) * 1024 * 1024
+# 적중 시 갱신한 last_access를 인덱스 파일에 모아서 쓰는 최소 간격 (초)
+RESULT_CACHE_FLUSH_SECONDS = float(os.environ.get("RESULT_CACHE_FLUSH_SECONDS", "30"))
+
+
+def normalize_prompt(prompt: str) -> str:
+    """유니코드 정규화 + 공백 정리 + 대소문자 무시"""
+    return " ".join(unicodedata.normalize("NFC", prompt).split()).casefold()
+
+
+def export_options(options: dict) -> dict:
+    """
+    요청 옵션에서 GLB 내보내기 옵션 추출 (기본값 적용)
+
+    lod_levels는 [[면 수, 텍스처 해상도, 전환 거리], ...] (기본: LOD_LEVELS, []이면 LOD 없음)이며
+    LOD0보다 면 수가 적은 단계만 남겨 캐시 키가 같은 결과에 대해 같아지도록 정규화합니다.
+    """
+    from services.pipeline import DEFAULT_DECIMATION_TARGET, DEFAULT_TEXTURE_SIZE, LOD_LEVELS, lod_chain
+
+    decimation_target = int(options.get("decimation_target", DEFAULT_DECIMATION_TARGET))
+    texture_size = int(options.get("texture_size", DEFAULT_TEXTURE_SIZE))
+    levels = lod_chain(decimation_target, texture_size, options.get("lod_levels", LOD_LEVELS))
+    return {
+        "decimation_target": decimation_target,
+        "texture_size": texture_size,
+        "lod_levels": [list(level) for level in levels[1:]],
+    }
+
+
+def cache_key(prompt: str, options: dict) -> str:
+    """결과에 영향을 주는 모든 입력의 해시"""
+    from services.pipeline import PROMPT_TEMPLATE_3D, IMAGE_MODELS
+
+    normalized = normalize_prompt(prompt)
+    payload = {
+        "prompt": normalized,
+        "rendered_prompt": PROMPT_TEMPLATE_3D.format(description=normalized),
+        "image_models": IMAGE_MODELS,
+        "export": export_options(options),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _dir_size(path: Path) -> int:
+    return sum(file.stat().st_size for file in path.iterdir() if file.is_file())
+
+
+def mesh_dirs_in_use() -> set[str]:
+    """대기/실행 중인 작업이 참조하는 원본 메시 디렉토리 (재내보내기가 읽는 중에 삭제하지 않도록)"""
+    from services.job_store import job_store
+
+    dirs = set()
+    for status in ("pending", "processing"):
+        jobs, _ = job_store.list(status=status, limit=job_store.max_jobs)
+        dirs.update(job["mesh_cache_dir"] for job in jobs if job.get("mesh_cache_dir"))
+    return dirs
+
+
+def asset_url(path: str) -> str:
+    """assets 디렉토리 내 파일 경로 → 정적 파일 URL"""
+    return "/assets/" + Path(path).resolve().relative_to(ASSETS_DIR.resolve()).as_posix()
+
+
+def lod_urls(lods: Optional[list[dict]]) -> Optional[list[dict]]:
+    """워커 결과의 LOD 목록(path 포함) → 응답용 목록(url 포함)"""
+    if not lods:
+        return None
+    return [
+        {
+            "level": lod["level"],
+            "url": asset_url(lod["path"]),
+            "decimation_target": lod["decimation_target"],
+            "texture_size": lod["texture_size"],
+            "distance": lod["distance"],
+            "bytes": lod.get("bytes"),
+        }
+        for lod in lods
+    ]
+
+
+def make_entry(
+    model_path: str,
+    image_path: Optional[str] = None,
+    mesh_cache_dir: Optional[str] = None,
+    lods: Optional[list[dict]] = None,
+) -> Optional[dict]:
+    """생성 결과 → 캐시 항목 (GLB가 없으면 None, 없는 이미지/LOD/원본 메시는 빼고 기록)"""
+    files = [path for path in (model_path, image_path) if path and Path(path).exists()]
+    if model_path not in files:
+        return None
+    # LOD0은 model_path와 같은 파일
+    lod_files = [lod["path"] for lod in lods or () if lod["level"] > 0 and Path(lod["path"]).exists()]
+    if lods and len(lod_files) != len(lods) - 1:
+        lods = None
+    if lods:
+        from services.pipeline import lod_manifest_path
+
+        files += lod_files + [path for path in (lod_manifest_path(model_path),) if Path(path).exists()]
+    if mesh_cache_dir and not Path(mesh_cache_dir).is_dir():
+        mesh_cache_dir = None
+    return {
+        "model_path": model_path,
+        "image_path": image_path if image_path in files else None,
+        "files": files,
+        "mesh_cache_dir": mesh_cache_dir,
+        "lods": lods,
+        "size": sum(Path(path).stat().st_size for path in files)
+        + (_dir_size(Path(mesh_cache_dir)) if mesh_cache_dir else 0),
+        "last_access": time.time(),
+    }
+
+
+def files_exist(entry: dict) -> bool:
+    return all(Path(path).exists() for path in entry["files"])
+
+
+def cached_result(entry: dict) -> dict:
+    """캐시 항목 → lookup 결과"""
+    mesh_cache_dir = entry.get("mesh_cache_dir")
+    return {
+        "model_url": asset_url(entry["model_path"]),
+        "image_url": asset_url(entry["image_path"]) if entry.get("image_path") else None,
+        "lods": lod_urls(entry.get("lods")),
+        # 원본 메시는 없어도 GLB는 유효 - 재내보내기만 불가
+        "mesh_cache_dir": mesh_cache_dir if mesh_cache_dir and Path(mesh_cache_dir).exists() else None,
+    }
+
+
+def delete_files(entry: dict):
+    """삭제된 캐시 항목의 GLB/이미지/LOD와 원본 메시"""
+    for path in entry["files"]:
+        Path(path).unlink(missing_ok=True)
+    if entry.get("mesh_cache_dir"):
+        shutil.rmtree(entry["mesh_cache_dir"], ignore_errors=True)
+
+
+class ResultCache:
+    """GLB/이미지 결과에 대한 크기 제한 LRU 캐시 (JSON 인덱스 파일, 단일 프로세스)"""
+
+    def __init__(
+        self,
+        index_path: str = RESULT_CACHE_INDEX,
+        max_bytes: int = RESULT_CACHE_MAX_BYTES,
+        flush_seconds: float = RESULT_CACHE_FLUSH_SECONDS,
+    ):
+        self.index_path = Path(index_path)
+        self.max_bytes = max_bytes
+        self.flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        self._dirty = False  # 저장되지 않은 last_access 갱신이 있음
+        self._saved_at = time.monotonic()
+        # key → {"files": [...], "mesh_cache_dir": str | None, "size": int, "last_access": float}
+        self._entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._load()
+
+    def _load(self):
+        if self.index_path.exists():
+            try:
+                self._entries = json.loads(self.index_path.read_text())
+            except (OSError, ValueError) as e:
+                print(f"Result cache index unreadable, starting empty: {e}")
+
+    def _save(self):
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries))
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+        self._saved_at = time.monotonic()
+
+    def flush(self):
+        """모아 둔 last_access 갱신을 인덱스 파일에 저장 (종료 시 호출)"""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry["size"] for entry in self._entries.values())
+
+    def lookup(self, key: str) -> Optional[dict]:
+        """
+        캐시 조회
+
+        Returns:
+            {"model_url", "image_url", "lods", "mesh_cache_dir"} 또는 None (파일이 사라진 항목은 무효화)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not files_exist(entry):
+                if entry is not None:
+                    del self._entries[key]
+                    self._save()
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            # 재시작 후에도 실제 사용 순서로 삭제되도록 저장 - 적중마다 쓰지 않고 간격을 두고 모아서 저장
+            entry["last_access"] = time.time()
+            self._dirty = True
+            if time.monotonic() - self._saved_at >= self.flush_seconds:
+                self._save()
+            return cached_result(entry)
+
+    def put(
+        self,
+        key: str,
+        model_path: str,
+        image_path: Optional[str] = None,
+        mesh_cache_dir: Optional[str] = None,
+        lods: Optional[list[dict]] = None,
+    ):
+        """생성 결과 등록 후 크기 제한 초과 시 LRU 삭제 (원본 메시 캐시도 크기에 포함)"""
+        entry = make_entry(model_path, image_path, mesh_cache_dir, lods)
+        if entry is None:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        """
+        크기 제한을 넘으면 오래 쓰지 않은 항목부터 삭제
+
+        원본 메시를 대기/실행 중인 작업(재내보내기 등)이 쓰고 있는 항목은 건너뛰고,
+        작업이 끝난 뒤의 다음 삭제 때 처리합니다 (그동안은 제한을 잠시 넘을 수 있음).
+        """
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        in_use = mesh_dirs_in_use()
+        for key in sorted(self._entries, key=lambda k: self._entries[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            if self._entries[key].get("mesh_cache_dir") in in_use:
+                continue
+            entry = self._entries.pop(key)
+            delete_files(entry)
+            total -= entry["size"]
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": RESULT_CACHE_ENABLED,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+class SQLiteResultCache:
+    """
+    공유 DB에 인덱스를 둔 결과 캐시 (ResultCache와 같은 인터페이스)
+    여러 API 프로세스가 같은 인덱스를 보므로 한 프로세스가 만든 결과에 다른 프로세스도 적중하고,
+    크기 제한/LRU 삭제도 전체 기준으로 한 번만 일어납니다. 처음 만들 때 JSON 인덱스가 있으면 가져옵니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS result_cache (
+            key TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_result_cache_access ON result_cache (last_access);
+    """
+
+    def __init__(
+        self,
+        db: Optional[SQLiteDatabase] = None,
+        max_bytes: int = RESULT_CACHE_MAX_BYTES,
+        json_index: str = RESULT_CACHE_INDEX,
+    ):
+        self.db = db or SQLiteDatabase(schema=self.SCHEMA)
+        self.max_bytes = max_bytes
+        self._import_json(Path(json_index))
+
+    def _import_json(self, path: Path):
+        """단일 프로세스 시절의 JSON 인덱스를 비어 있는 테이블로 가져옴"""
+        if not path.exists():
+            return
+        with self.db.transaction() as conn:
+            if conn.execute("SELECT COUNT(*) FROM result_cache").fetchone()[0]:
+                return
+            try:
+                entries = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                print(f"Result cache index unreadable, not imported: {e}")
+                return
+            conn.executemany(
+                "INSERT INTO result_cache (key, size, last_access, data) VALUES (?, ?, ?, ?)",
+                [(key, entry["size"], entry["last_access"], json.dumps(entry)) for key, entry in entries.items()],
+            )
+        print(f"Result cache: imported {len(entries)} entries from {path}")
+
+    def flush(self):
+        """적중 시 last_access를 바로 DB에 쓰므로 할 일 없음 (ResultCache와 인터페이스를 맞춤)"""
+
+    @property
+    def total_bytes(self) -> int:
+        return self.db.conn().execute("SELECT COALESCE(SUM(size), 0) FROM result_cache").fetchone()[0]
+
+    def lookup(self, key: str) -> Optional[dict]:
+        conn = self.db.conn()
+        row = conn.execute("SELECT data FROM result_cache WHERE key = ?", (key,)).fetchone()
+        entry = json.loads(row["data"]) if row is not None else None
+        if entry is None or not files_exist(entry):
+            if entry is not None:
+                conn.execute("DELETE FROM result_cache WHERE key = ?", (key,))
+            self.db.increment("result_cache.misses")
+            return None
+
+        self.db.increment("result_cache.hits")
+        conn.execute("UPDATE result_cache SET last_access = ? WHERE key = ?", (time.time(), key))
+        return cached_result(entry)
+
+    def put(
+        self,
+        key: str,
+        model_path: str,
+        image_path: Optional[str] = None,
+        mesh_cache_dir: Optional[str] = None,
+        lods: Optional[list[dict]] = None,
+    ):
+        entry = make_entry(model_path, image_path, mesh_cache_dir, lods)
+        if entry is None:
+            return
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO result_cache (key, size, last_access, data) VALUES (?, ?, ?, ?)",
+                (key, entry["size"], entry["last_access"], json.dumps(entry)),
+            )
+            evicted = self._evict(conn)
+        # 파일 삭제는 트랜잭션 밖에서 (다른 프로세스의 쓰기를 오래 막지 않도록)
+        for entry in evicted:
+            delete_files(entry)
+        if evicted:
+            self.db.increment("result_cache.evictions", len(evicted))
+
+    def _evict(self, conn: sqlite3.Connection) -> list[dict]:
+        """크기 제한을 넘으면 오래 쓰지 않은 항목부터 인덱스에서 빼고 반환 (ResultCache._evict와 같은 규칙)"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM result_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return []
+        in_use = mesh_dirs_in_use()
+        evicted = []
+        for row in conn.execute("SELECT key, data FROM result_cache ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            entry = json.loads(row["data"])
+            if entry.get("mesh_cache_dir") in in_use:
+                continue
+            conn.execute("DELETE FROM result_cache WHERE key = ?", (row["key"],))
+            evicted.append(entry)
+            total -= entry["size"]
+        return evicted
+
+    def stats(self) -> dict:
+        hits = int(self.db.counter("result_cache.hits"))
+        misses = int(self.db.counter("result_cache.misses"))
+        entries, total = self.db.conn().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM result_cache").fetchone()
+        return {
+            "enabled": RESULT_CACHE_ENABLED,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "evictions": int(self.db.counter("result_cache.evictions")),
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def create_result_cache() -> Union[ResultCache, SQLiteResultCache]:
+    """설정에 맞는 결과 캐시 (JOB_STORE=sqlite면 인덱스를 프로세스 간 공유)"""
+    return SQLiteResultCache() if SHARED_STATE else ResultCache()
+
+
+# 프로세스 전역 결과 캐시
+result_cache = create_result_cache()
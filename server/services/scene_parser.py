@@ -0,0 +1,115 @@
+"""
+장면 설명 → 오브젝트 목록
+"의자 4개와 소파, 빨간 램프 두 개 그리고 거대한 로봇" 같은 자유 텍스트를 오브젝트별 문구와 개수로 나눕니다.
+
+규칙 기반 분리기입니다 (LLM 호출 없음).
+- 쉼표/줄바꿈/그리고/및/하고/랑/and/with, 받침 규칙에 맞는 와/과로 분리
+- "4개", "두 대", "세 마리", "4 chairs", "two lamps" 형태의 개수 인식
+- 끝에 붙은 조사(을/를/은/는/가)와 "~이 있는 방" 같은 장소 수식어 제거
+"""
+
+import re
+from typing import Optional
+
+
+# 오브젝트 하나당 최대 개수 (오타/과도한 요청 방지)
+MAX_OBJECT_COUNT = 50
+
+_KOREAN_NUMBERS = {
+    "한": 1, "하나": 1, "두": 2, "둘": 2, "세": 3, "셋": 3, "석": 3, "네": 4, "넷": 4, "넉": 4,
+    "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10,
+}
+_ENGLISH_NUMBERS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "a couple of": 2, "a pair of": 2,
+}
+_COUNTERS = "개|대|마리|명|채|그루|점|장|권|병|잔|척|벌"
+
+_SEPARATORS = re.compile(r"\s*(?:[,;\n·]|\s그리고\s|\s및\s|\s하고\s|\s(?:and|with|plus)\s)\s*", re.IGNORECASE)
+# 명사 뒤에 붙는 접속 조사 (와/과는 받침으로 따로 판단)
+_CONJUNCTION_PARTICLES = re.compile(r"(\S+?)(하고|이랑|랑)\s+")
+_KOREAN_COUNT = re.compile(rf"\s*(\d+|{'|'.join(sorted(_KOREAN_NUMBERS, key=len, reverse=True))})\s*(?:{_COUNTERS})\s*$")
+_TRAILING_DIGITS = re.compile(r"\s+(?:x\s*)?(\d+)\s*$", re.IGNORECASE)
+_ENGLISH_COUNT = re.compile(
+    rf"^(\d+|{'|'.join(sorted(_ENGLISH_NUMBERS, key=len, reverse=True))})\s+", re.IGNORECASE
+)
+# "~이 있는 거실", "~가 놓인 방" 처럼 장소를 꾸미는 꼬리
+_PLACE_CLAUSE = re.compile(r"\s*(?:이|가)?\s*(?:있는|놓인|놓여\s*있는|가득한)\s*\S*$")
+_TRAILING_PARTICLE = re.compile(r"(?<=\S)(을|를|은|는|가)$")
+
+
+def _has_batchim(ch: str) -> Optional[bool]:
+    """한글 음절의 받침 유무 (한글이 아니면 None)"""
+    code = ord(ch) - 0xAC00
+    if 0 <= code < 11172:
+        return code % 28 != 0
+    return None
+
+
+def _split_wa_gwa(segment: str) -> list[str]:
+    """받침 규칙에 맞는 '와/과' 뒤에서만 분리 ("사과"는 그대로, "책상과 의자"는 분리)"""
+    parts, start = [], 0
+    for match in re.finditer(r"(\S)(와|과)(?=\s)", segment):
+        batchim = _has_batchim(match.group(1))
+        if batchim is None or batchim != (match.group(2) == "과"):
+            continue
+        parts.append(segment[start:match.start(2)])
+        start = match.end()
+    parts.append(segment[start:])
+    return parts
+
+
+def _strip_particle(text: str) -> str:
+    """끝 단어의 목적격/주격/보조사 조사 제거 (받침 규칙이 맞을 때만)"""
+    match = _TRAILING_PARTICLE.search(text)
+    if not match or len(text.split()[-1]) < 2:
+        return text
+    batchim = _has_batchim(text[match.start() - 1])
+    if batchim is None:
+        return text
+    if match.group(1) in ("을", "은") and batchim or match.group(1) in ("를", "는", "가") and not batchim:
+        return text[:match.start()]
+    return text
+
+
+def parse_count(segment: str) -> tuple[str, int]:
+    """문구에서 개수를 떼어냄 → (오브젝트 문구, 개수)"""
+    text = segment.strip()
+    count = 1
+
+    match = _KOREAN_COUNT.search(text) or _TRAILING_DIGITS.search(text)
+    if match:
+        value = match.group(1)
+        count = int(value) if value.isdigit() else _KOREAN_NUMBERS[value]
+        text = text[:match.start()]
+    else:
+        match = _ENGLISH_COUNT.match(text)
+        if match:
+            value = match.group(1).lower()
+            count = int(value) if value.isdigit() else _ENGLISH_NUMBERS[value]
+            text = text[match.end():]
+
+    return text.strip(), max(1, min(count, MAX_OBJECT_COUNT))
+
+
+def split_scene(description: str) -> list[dict]:
+    """
+    장면 설명을 오브젝트 목록으로 분리
+
+    Returns:
+        [{"prompt": 오브젝트 문구, "count": 개수}] - 같은 문구는 개수를 합침
+    """
+    segments = []
+    for part in _SEPARATORS.split(description):
+        part = _CONJUNCTION_PARTICLES.sub(r"\1, ", part + " ")
+        for piece in part.split(","):
+            segments.extend(_split_wa_gwa(piece.strip() + " "))
+
+    objects: dict[str, int] = {}
+    for segment in segments:
+        segment = _PLACE_CLAUSE.sub("", segment.strip())
+        prompt, count = parse_count(_strip_particle(segment.strip()))
+        prompt = _strip_particle(prompt)
+        if prompt:
+            objects[prompt] = objects.get(prompt, 0) + count
+    return [{"prompt": prompt, "count": count} for prompt, count in objects.items()]
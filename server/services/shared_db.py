@@ -0,0 +1,68 @@
+"""
+프로세스 간 공유 SQLite 상태
+JOB_STORE=sqlite이면 작업 저장소와 같은 DB 파일(WAL)에 동일 작업 합류 테이블, 작업 이벤트 로그,
+결과 캐시 인덱스, GPU 작업 큐를 두어 uvicorn 워커 여러 개가 같은 상태를 봅니다.
+JOB_STORE=memory(기본)이면 모두 프로세스 내 상태를 사용합니다 (단일 프로세스 전용).
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from services.job_store import JOB_STORE_BACKEND, JOB_STORE_PATH
+
+
+# 여러 API 프로세스가 상태를 공유하는지 (작업 저장소 백엔드를 따름)
+SHARED_STATE = JOB_STORE_BACKEND == "sqlite"
+
+_COUNTERS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS counters (
+        name TEXT PRIMARY KEY,
+        value REAL NOT NULL
+    );
+"""
+
+
+class SQLiteDatabase:
+    """스레드별 연결을 쓰는 SQLite(WAL) DB (sqlite3 연결은 스레드 간 공유 불가)"""
+
+    def __init__(self, path: str = JOB_STORE_PATH, schema: str = ""):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self.conn().executescript(_COUNTERS_SCHEMA + schema)
+
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE - 읽기-수정-쓰기를 다른 프로세스와 경합 없이 수행)"""
+        conn = self.conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def increment(self, name: str, amount: float = 1):
+        """공유 카운터 증가"""
+        self.conn().execute(
+            "INSERT INTO counters (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def counter(self, name: str) -> float:
+        row = self.conn().execute("SELECT value FROM counters WHERE name = ?", (name,)).fetchone()
+        return row[0] if row is not None else 0
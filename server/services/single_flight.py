@@ -0,0 +1,95 @@
+"""
+동일 요청 single-flight 병합
+같은 키의 작업이 실행 중이면 새 작업을 만들지 않고 실행 중인 작업에 합류시킵니다.
+JOB_STORE=sqlite이면 대표 작업 테이블을 공유 DB에 두어 다른 API 프로세스의 작업에도 합류합니다.
+"""
+
+import time
+import threading
+from typing import Optional, Union
+
+from services.shared_db import SHARED_STATE, SQLiteDatabase
+
+
+class SingleFlight:
+    """키별 실행 중 작업 추적 (프로세스 내)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leaders: dict[str, str] = {}  # key → job_id
+        self._keys: dict[str, str] = {}  # job_id → key
+        self.coalesced = 0
+
+    def claim(self, key: str, job_id: str) -> Optional[str]:
+        """
+        job_id를 키의 대표 작업으로 등록 (원자적)
+
+        Returns:
+            None이면 등록됨, 아니면 이미 등록된 대표 작업 ID
+        """
+        with self._lock:
+            leader = self._leaders.get(key)
+            if leader is not None:
+                return leader
+            self._leaders[key] = job_id
+            self._keys[job_id] = key
+            return None
+
+    def attach(self):
+        """실행 중인 작업에 합류한 요청 수 집계"""
+        with self._lock:
+            self.coalesced += 1
+
+    def release(self, job_id: str):
+        """작업 종료 시 등록 해제"""
+        with self._lock:
+            key = self._keys.pop(job_id, None)
+            if key is not None and self._leaders.get(key) == job_id:
+                del self._leaders[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"coalesced": self.coalesced, "inflight": len(self._leaders)}
+
+
+class SQLiteSingleFlight:
+    """공유 DB의 키별 대표 작업 테이블 - 여러 API 프로세스가 같은 작업에 합류 (SingleFlight와 같은 인터페이스)"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS single_flight (
+            key TEXT PRIMARY KEY,
+            job_id TEXT NOT NULL,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_single_flight_job ON single_flight (job_id);
+    """
+
+    def __init__(self, db: Optional[SQLiteDatabase] = None):
+        self.db = db or SQLiteDatabase(schema=self.SCHEMA)
+
+    def claim(self, key: str, job_id: str) -> Optional[str]:
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT job_id FROM single_flight WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                return row["job_id"]
+            conn.execute("INSERT INTO single_flight (key, job_id, created_at) VALUES (?, ?, ?)", (key, job_id, time.time()))
+            return None
+
+    def attach(self):
+        self.db.increment("single_flight.coalesced")
+
+    def release(self, job_id: str):
+        self.db.conn().execute("DELETE FROM single_flight WHERE job_id = ?", (job_id,))
+
+    def stats(self) -> dict:
+        inflight = self.db.conn().execute("SELECT COUNT(*) FROM single_flight").fetchone()[0]
+        return {"coalesced": int(self.db.counter("single_flight.coalesced")), "inflight": inflight}
+
+
+def create_single_flight() -> Union[SingleFlight, SQLiteSingleFlight]:
+    """설정에 맞는 single-flight 테이블 (JOB_STORE=sqlite면 프로세스 간 공유)"""
+    return SQLiteSingleFlight() if SHARED_STATE else SingleFlight()
+
+
+# 프로세스 전역 single-flight 테이블
+single_flight = create_single_flight()
@@ -0,0 +1,121 @@
+"""
+단계별 파이프라인 스케줄러
+Text → Image (네트워크), Image → 3D (GPU), GLB Export (후처리)를 각자의 큐와 워커로 분리하여
+작업 N이 GPU를 쓰는 동안 작업 N+1의 이미지를 미리 받아올 수 있도록 합니다.
+"""
+
+import time
+import queue
+import threading
+from typing import Callable, Optional
+
+
+class Stage:
+    """단일 파이프라인 단계 - bounded 입력 큐와 워커 스레드"""
+
+    def __init__(self, name: str, fn: Callable[[dict], Optional[dict]], workers: int = 1, queue_size: int = 1):
+        self.name = name
+        self.fn = fn
+        self.num_workers = workers
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.next: Optional["Stage"] = None
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+
+        # 통계
+        self.busy = 0
+        self.busy_seconds = 0.0
+        self.processed = 0
+        self.started_at = time.monotonic()
+
+    def stats(self) -> dict:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started_at, 1e-9)
+            busy_seconds = self.busy_seconds
+            return {
+                "workers": self.num_workers,
+                "busy": self.busy,
+                "queue_depth": self.queue.qsize(),
+                "processed": self.processed,
+                # 워커 수 대비 실제 작업 시간 비율
+                "utilization": round(busy_seconds / (elapsed * self.num_workers), 3),
+                "avg_seconds": round(busy_seconds / self.processed, 3) if self.processed else None,
+            }
+
+
+class StagedPipeline:
+    """
+    여러 Stage를 큐로 연결한 파이프라인
+
+    각 단계 함수는 작업 컨텍스트(dict)를 받아 다음 단계로 넘길 컨텍스트를 반환합니다.
+    None을 반환하면 해당 작업은 거기서 종료되고, 예외는 실패한 단계 이름과 함께 on_error로 전달됩니다.
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        on_done: Callable[[dict], None],
+        on_error: Callable[[dict, Exception, str], None],
+    ):
+        self.stages = stages
+        self.on_done = on_done
+        self.on_error = on_error
+        for stage, next_stage in zip(stages, stages[1:]):
+            stage.next = next_stage
+
+    def start(self):
+        for stage in self.stages:
+            for i in range(stage.num_workers):
+                thread = threading.Thread(target=self._run, args=(stage,), name=f"stage-{stage.name}-{i}", daemon=True)
+                thread.start()
+                stage._threads.append(thread)
+
+    def stop(self):
+        """진행 중인 작업이 모두 빠져나간 뒤 워커 종료"""
+        for stage in self.stages:
+            for _ in stage._threads:
+                stage.queue.put(None)
+            for thread in stage._threads:
+                thread.join()
+            stage._threads = []
+
+    def submit(self, item: dict, stage: Optional[str] = None):
+        """
+        단계 큐에 작업 추가 (큐가 가득 차면 대기 - 상위 큐로 backpressure 전달)
+
+        Args:
+            item: 작업 컨텍스트
+            stage: 시작할 단계 이름 (기본: 첫 단계) - 앞 단계가 필요 없는 작업용
+        """
+        target = self.stages[0] if stage is None else next(s for s in self.stages if s.name == stage)
+        target.queue.put(item)
+
+    def stats(self) -> dict:
+        return {stage.name: stage.stats() for stage in self.stages}
+
+    def _run(self, stage: Stage):
+        while True:
+            item = stage.queue.get()
+            if item is None:
+                break
+
+            with stage._lock:
+                stage.busy += 1
+            start = time.perf_counter()
+            try:
+                result = stage.fn(item)
+            except Exception as e:
+                result = None
+                self.on_error(item, e, stage.name)
+            finally:
+                with stage._lock:
+                    stage.busy -= 1
+                    stage.busy_seconds += time.perf_counter() - start
+                    stage.processed += 1
+
+            if result is None:
+                continue
+            if stage.next is not None:
+                stage.next.queue.put(result)
+            else:
+                self.on_done(result)
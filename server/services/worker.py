@@ -0,0 +1,860 @@
+"""
+GPU 워커 프로세스 풀
+API 프로세스는 작업을 bounded 큐에 넣기만 하고, 별도 프로세스가 파이프라인을 실행합니다.
+워커 → API 방향의 진행 상황/결과는 이벤트 큐로 전달됩니다.
+
+JOB_STORE=sqlite이면 API 프로세스(uvicorn 워커)가 여러 개여도 GPU 워커 풀은 하나만 뜹니다.
+잠금 파일을 잡은 프로세스가 풀을 소유하고, 모든 프로세스는 공유 DB의 작업 큐에 작업을 넣습니다.
+소유 프로세스가 종료되면 다른 프로세스가 잠금을 넘겨받아 풀을 시작합니다.
+"""
+
+import os
+import json
+import math
+import time
+import fcntl
+import queue
+import shutil
+import sqlite3
+import tempfile
+import threading
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+from services.job_store import JOB_STORE_PATH
+from services.shared_db import SHARED_STATE, SQLiteDatabase
+from services.staged_pipeline import Stage, StagedPipeline
+
+
+# 워커 설정
+NUM_WORKERS = int(os.environ.get("GPU_WORKERS", "1"))
+QUEUE_SIZE = int(os.environ.get("GPU_QUEUE_SIZE", "8"))
+# "trellis": 실제 파이프라인, "stub": CPU 테스트용 더미 파이프라인
+PIPELINE_KIND = os.environ.get("WORKER_PIPELINE", "trellis")
+STUB_DELAY = float(os.environ.get("WORKER_STUB_DELAY", "2.0"))
+# 스텁 작업 중 GIL을 잡고 Python 연산으로 보내는 비율 (나머지는 sleep)
+STUB_CPU_FRACTION = float(os.environ.get("WORKER_STUB_CPU_FRACTION", "0.0"))
+# 단계별 파이프라인: 이미지 단계 동시 요청 수 / 단계 간 큐 크기
+IMAGE_STAGE_WORKERS = int(os.environ.get("IMAGE_STAGE_WORKERS", "2"))
+STAGE_QUEUE_SIZE = int(os.environ.get("STAGE_QUEUE_SIZE", "1"))
+# GLB 후처리(베이킹/인코딩/쓰기) 프로세스 수 - 0이면 워커 프로세스의 스레드에서 실행
+EXPORT_PROCESSES = int(os.environ.get("EXPORT_PROCESSES", "1"))
+# 재구성 → 내보내기 프로세스 간 메시 전달 디렉토리 (메모리 기반 /dev/shm 우선)
+EXPORT_HANDOFF_DIR = os.environ.get(
+    "EXPORT_HANDOFF_DIR",
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+)
+# 내보낸 GLB(+ LOD) 최적화 - 정점 용접/양자화/정점 캐시 재정렬 (텍스처 최대 크기 0이면 축소하지 않음)
+GLB_OPTIMIZE = os.environ.get("GLB_OPTIMIZE", "1") == "1"
+GLB_MAX_TEXTURE_SIZE = int(os.environ.get("GLB_MAX_TEXTURE_SIZE", "0"))
+# 스텁 파이프라인의 샘플러 구성 (이름, 스텝 수) - 진행 이벤트 확인용
+STUB_SAMPLERS = [("sparse_structure_sampler", 4), ("shape_slat_sampler", 4), ("tex_slat_sampler", 4)]
+# 생성 작업 소요 시간 초기 추정치 (Retry-After 계산용, 실제 완료 시간으로 갱신됨)
+INITIAL_JOB_SECONDS = float(os.environ.get("GPU_JOB_SECONDS", "90"))
+# 소요 시간 추정에 쓰는 작업 종류 - 재내보내기는 GPU 단계 없이 끝나므로 제외
+GENERATE_KINDS = ("text", "image")
+# 공유 작업 큐 (JOB_STORE=sqlite): 풀 소유 잠금 파일 / 소유권 재시도·큐 폴링 간격 (초)
+GPU_LOCK_PATH = os.environ.get("GPU_LOCK_PATH", f"{JOB_STORE_PATH}.gpu.lock")
+GPU_OWNER_RETRY_SECONDS = float(os.environ.get("GPU_OWNER_RETRY_SECONDS", "2.0"))
+GPU_DISPATCH_POLL_SECONDS = float(os.environ.get("GPU_DISPATCH_POLL_SECONDS", "0.05"))
+
+
+class QueueFullError(Exception):
+    """작업 큐가 가득 찬 경우"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Job queue is full, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+# ============================================================================
+# Stub Pipeline (CPU 테스트용)
+# ============================================================================
+
+def _stub_work(seconds: float, cpu_fraction: float):
+    """지정 시간 중 cpu_fraction 만큼은 GIL을 잡은 채 Python 연산, 나머지는 대기 (GPU 커널 대기 흉내)"""
+    time.sleep(seconds * (1 - cpu_fraction))
+    deadline = time.perf_counter() + seconds * cpu_fraction
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+class StubImageTo3D:
+    """GPU 없이 동작하는 더미 Image → 3D 단계"""
+
+    def __init__(self, reconstruct_delay: float, export_delay: float, cpu_fraction: float = 0.0):
+        self.reconstruct_delay = reconstruct_delay
+        self.export_delay = export_delay
+        self.cpu_fraction = cpu_fraction
+
+    def reconstruct(self, image, progress_callback=None):
+        from services.pipeline import stage_timer
+
+        total_steps = sum(steps for _, steps in STUB_SAMPLERS)
+        with stage_timer("pipeline_run"):
+            for index, (name, steps) in enumerate(STUB_SAMPLERS):
+                for step in range(1, steps + 1):
+                    _stub_work(self.reconstruct_delay * 0.9 / total_steps, self.cpu_fraction)
+                    if progress_callback:
+                        progress_callback("sampler", {
+                            "sampler": name, "index": index, "count": len(STUB_SAMPLERS),
+                            "step": step, "total": steps,
+                        })
+        if progress_callback:
+            progress_callback("mesh_simplify", {})
+        with stage_timer("mesh_simplify"):
+            _stub_work(self.reconstruct_delay * 0.1, self.cpu_fraction)
+        return self._dummy_mesh()
+
+    @staticmethod
+    def _dummy_mesh():
+        """TRELLIS.2 메시와 같은 속성을 가진 작은 더미 메시"""
+        import numpy as np
+
+        return SimpleNamespace(
+            vertices=np.random.rand(8, 3).astype(np.float32),
+            faces=np.arange(12, dtype=np.int32).reshape(4, 3) % 8,
+            attrs=np.random.rand(16, 6).astype(np.float16),
+            coords=np.random.randint(0, 64, (16, 3)).astype(np.int32),
+            layout={"base_color": slice(0, 3), "metallic": slice(3, 4), "roughness": slice(4, 5), "alpha": slice(5, 6)},
+            voxel_size=1 / 64,
+        )
+
+    def reexport(
+        self,
+        mesh_cache_dir: str,
+        output_path: str = "output.glb",
+        decimation_target: int = 0,
+        texture_size: int = 0,
+        progress_callback=None,
+        lod_levels=(),
+    ) -> str:
+        from services.pipeline import stage_timer, load_mesh_cache
+
+        with stage_timer("mesh_load"):
+            mesh = load_mesh_cache(mesh_cache_dir)
+        return self.export_glb(mesh, output_path, decimation_target, texture_size, progress_callback, lod_levels)
+
+    def export_glb(
+        self,
+        mesh,
+        output_path: str = "output.glb",
+        decimation_target: int = 0,
+        texture_size: int = 0,
+        progress_callback=None,
+        lod_levels=(),
+    ) -> str:
+        from services.pipeline import stage_timer, lod_chain, lod_path, lod_manifest_path, write_lod_manifest
+
+        levels = lod_chain(decimation_target, texture_size, lod_levels)
+        # 단계별 소요 시간은 면 수에 비례한다고 가정 (전체 = export_delay)
+        total_faces = sum(faces for faces, _, _ in levels)
+        for i, (faces, _, _) in enumerate(levels):
+            share = faces / total_faces if total_faces else 1 / len(levels)
+            lod = {"lod": i, "count": len(levels)}
+            if progress_callback:
+                progress_callback("glb_bake", lod)
+            with stage_timer("to_glb"):
+                _stub_work(self.export_delay * 0.8 * share, self.cpu_fraction)
+            if progress_callback:
+                progress_callback("glb_export", lod)
+            with stage_timer("glb_export"):
+                _stub_work(self.export_delay * 0.2 * share, self.cpu_fraction)
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                Path(lod_path(output_path, i)).write_bytes(b"glTF" + bytes(faces // 1000))
+
+        if len(levels) > 1:
+            write_lod_manifest(output_path, levels)
+        else:
+            Path(lod_manifest_path(output_path)).unlink(missing_ok=True)
+        return output_path
+
+
+class StubPipeline:
+    """GPU 없이 동작하는 더미 파이프라인 - 단계별로 지정된 시간만큼 대기 후 더미 파일 생성"""
+
+    def __init__(self, delay: float = STUB_DELAY, cpu_fraction: float = STUB_CPU_FRACTION):
+        # 실제 비율에 가깝게 이미지 : 3D : 내보내기 = 3 : 5 : 2
+        self.image_delay = delay * 0.3
+        self.image_to_3d = StubImageTo3D(delay * 0.5, delay * 0.2, cpu_fraction)
+
+    def generate_image(self, text_prompt: str, image_path: str):
+        from PIL import Image
+        from services.pipeline import stage_timer
+
+        with stage_timer("image_model", model="stub", outcome="success"):
+            time.sleep(self.image_delay)
+        image = Image.new("RGB", (64, 64), (255, 255, 255))
+        Path(image_path).parent.mkdir(parents=True, exist_ok=True)
+        image.save(image_path)
+        return image
+
+
+# ============================================================================
+# Worker Process
+# ============================================================================
+
+def _load_pipeline(kind: str):
+    """워커 프로세스에서 파이프라인 로드"""
+    if kind == "stub":
+        return StubPipeline(), {"loaded": True, "kind": "stub"}
+
+    from services.model_registry import registry, PRELOAD_MODELS, WARMUP_MODELS
+
+    if PRELOAD_MODELS:
+        registry.load(warmup=WARMUP_MODELS)
+    return registry.get_pipeline(), registry.stats()
+
+
+def stage_progress(stage: str, info: dict) -> int:
+    """
+    파이프라인 진행 콜백을 작업 진행률(%)로 변환
+
+    이미지 완료 30 → 샘플러 스텝 30~65 → 단순화 66 → 재구성 완료 70 → 베이킹 75 → 파일 쓰기 90 → 최적화 98
+    (LOD가 여러 단계면 베이킹/쓰기를 단계별로 72~98에 분배)
+    """
+    if stage == "sampler":
+        count = max(info.get("count") or 1, 1)
+        index = min(info.get("index", 0), count - 1)
+        step_fraction = info["step"] / info["total"] if info.get("total") else 0.0
+        return 30 + int(35 * (index + min(step_fraction, 1.0)) / count)
+    if stage in ("glb_bake", "glb_export") and info.get("count"):
+        # LOD 단계별 베이킹(60%) → 쓰기(40%)를 72~98로 분배
+        fraction = (info.get("lod", 0) + (0.0 if stage == "glb_bake" else 0.6)) / info["count"]
+        return 72 + int(26 * fraction)
+    return {
+        "image": 30,
+        "mesh_simplify": 66,
+        "reconstruct": 70,
+        "glb_bake": 75,
+        "glb_export": 90,
+        "glb_optimize": 98,
+    }.get(stage, 0)
+
+
+def _progress_event(job_id: str, stage: str, info: Optional[dict] = None) -> dict:
+    return {
+        "type": "progress",
+        "job_id": job_id,
+        "progress": stage_progress(stage, info or {}),
+        "stage": stage,
+        "detail": info or {},
+    }
+
+
+def optimize_outputs(output_path: str, progress_callback=None) -> list[dict]:
+    """내보낸 GLB와 LOD 파일을 제자리에서 최적화하고 LOD 매니페스트의 파일 크기 갱신"""
+    from services.glb_optimizer import optimize_file
+    from services.pipeline import stage_timer, read_lod_manifest, lod_manifest_path
+
+    manifest = read_lod_manifest(output_path)
+    model_dir = Path(output_path).parent
+    paths = [str(model_dir / level["file"]) for level in manifest["levels"]] if manifest else [output_path]
+
+    if progress_callback:
+        progress_callback("glb_optimize", {})
+    with stage_timer("glb_optimize"):
+        reports = [optimize_file(path, max_texture_size=GLB_MAX_TEXTURE_SIZE) for path in paths]
+
+    if manifest:
+        for level, report in zip(manifest["levels"], reports):
+            level["bytes"] = report["bytes_out"]
+        with open(lod_manifest_path(output_path), "w") as f:
+            json.dump(manifest, f, indent=2)
+    return reports
+
+
+# ============================================================================
+# Export Process Pool
+# ============================================================================
+
+# 내보내기 프로세스 전역 상태 (initializer에서 설정)
+_export_state: dict = {}
+
+
+def _export_process_init(kind: str, event_queue, stub_options: dict):
+    """
+    내보내기 프로세스 초기화 - GLB 후처리에 필요한 부분만 준비 (TRELLIS.2 모델은 로드하지 않음)
+
+    o_voxel.postprocess.to_glb는 CUDA를 사용하므로 실제 파이프라인에서는
+    이 프로세스도 별도의 CUDA 컨텍스트를 가집니다.
+    """
+    if kind == "stub":
+        generator = StubImageTo3D(0.0, stub_options.get("export_delay", 0.0), stub_options.get("cpu_fraction", 0.0))
+    else:
+        from services.pipeline import ImageTo3DGenerator
+        generator = ImageTo3DGenerator()
+
+    emit = event_queue.put if event_queue is not None else (lambda event: None)
+    _export_state.update(generator=generator, emit=emit)
+
+    from services.pipeline import add_stage_hook
+
+    add_stage_hook(lambda stage, seconds, labels: emit({
+        "type": "metric",
+        "stage": stage,
+        "seconds": seconds,
+        "labels": labels,
+    }))
+
+
+def _export_process_run(job_id: str, mesh_dir: str, output_path: str, export_options: dict) -> str:
+    """내보내기 프로세스에서 실행 - memmap으로 메시를 읽어 GLB 베이킹/인코딩/쓰기"""
+    emit = _export_state["emit"]
+
+    def callback(stage: str, info: dict):
+        emit(_progress_event(job_id, stage, info))
+
+    _export_state["generator"].reexport(mesh_dir, output_path, **export_options, progress_callback=callback)
+    if GLB_OPTIMIZE:
+        optimize_outputs(output_path, callback)
+    return output_path
+
+
+def create_export_pool(
+    kind: str,
+    event_queue=None,
+    processes: int = EXPORT_PROCESSES,
+    stub_options: Optional[dict] = None,
+) -> Optional[ProcessPoolExecutor]:
+    """GLB 후처리 프로세스 풀 생성 (processes가 0이면 None - 워커 스레드에서 직접 실행)"""
+    if processes <= 0:
+        return None
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=mp.get_context("spawn"),
+        initializer=_export_process_init,
+        initargs=(kind, event_queue, stub_options or {}),
+    )
+
+
+def build_generation_pipeline(
+    pipeline,
+    emit: Callable[[dict], None],
+    on_finished: Callable[[dict, str], None],
+    export_pool: Optional[ProcessPoolExecutor] = None,
+    export_workers: int = 1,
+) -> StagedPipeline:
+    """
+    Text → Image / Image → 3D / GLB Export 단계로 구성된 파이프라인 생성
+
+    Args:
+        pipeline: TextTo3DPipeline (또는 StubPipeline)
+        emit: 진행/결과 이벤트 전달 함수
+        on_finished: 작업 종료 시 (job, status)로 호출
+        export_pool: 지정하면 GLB 후처리를 이 프로세스 풀에서 실행
+            (재구성 단계는 메시를 .npy로 저장해 경로만 넘기므로 큰 배열을 pickle하지 않음)
+        export_workers: 내보내기 단계 동시 실행 수 (프로세스 풀 크기와 맞춤)
+    """
+    from services.model_registry import reset_peak_gpu_memory, peak_gpu_memory_bytes, resident_memory_bytes
+    from services.pipeline import save_mesh_cache, stage_timer, read_lod_manifest
+
+    def progress(job: dict, stage: str, info: Optional[dict] = None):
+        emit(_progress_event(job["job_id"], stage, info))
+
+    def fetch_image(job: dict) -> Optional[dict]:
+        from PIL import Image
+
+        if job["kind"] == "text":
+            image = pipeline.generate_image(job["prompt"], job["image_output_path"])
+            if image is None:
+                emit({"type": "failed", "job_id": job["job_id"], "error": "Image generation failed"})
+                on_finished(job, "failed")
+                return None
+        else:
+            image = Image.open(job["image_path"])
+            image.load()
+
+        progress(job, "image")
+        return {**job, "image": image}
+
+    def reconstruct(job: dict) -> dict:
+        reset_peak_gpu_memory()
+        mesh = pipeline.image_to_3d.reconstruct(
+            job.pop("image"),
+            progress_callback=lambda stage, info: progress(job, stage, info),
+        )
+        progress(job, "reconstruct")
+        peak_gpu_bytes = peak_gpu_memory_bytes()
+
+        if export_pool is None:
+            return {**job, "mesh": mesh, "peak_gpu_bytes": peak_gpu_bytes}
+
+        # 내보내기 프로세스로 넘길 메시 저장 - 메시 캐시가 꺼져 있으면 임시 디렉토리 사용
+        mesh_dir = job.get("mesh_cache_dir") or str(Path(EXPORT_HANDOFF_DIR) / f"mesh-{job['job_id']}")
+        with stage_timer("mesh_save"):
+            save_mesh_cache(mesh, mesh_dir)
+        return {**job, "mesh_handoff": mesh_dir, "peak_gpu_bytes": peak_gpu_bytes}
+
+    def export(job: dict) -> dict:
+        def callback(stage: str, info: dict):
+            progress(job, stage, info)
+
+        mesh_dir = job["mesh_cache_dir"] if job["kind"] == "reexport" else job.get("mesh_handoff")
+        if export_pool is not None and mesh_dir:
+            try:
+                export_pool.submit(
+                    _export_process_run, job["job_id"], mesh_dir, job["output_path"], job.get("export_options", {})
+                ).result()
+            finally:
+                # 메시 캐시가 아닌 임시 전달 디렉토리는 내보내기 후 삭제
+                if mesh_dir != job.get("mesh_cache_dir"):
+                    shutil.rmtree(mesh_dir, ignore_errors=True)
+        else:
+            if job["kind"] == "reexport":
+                # 저장된 원본 메시에서 GLB만 다시 생성
+                pipeline.image_to_3d.reexport(
+                    mesh_dir, job["output_path"], **job.get("export_options", {}), progress_callback=callback
+                )
+            else:
+                mesh = job.pop("mesh")
+                if job.get("mesh_cache_dir"):
+                    with stage_timer("mesh_save"):
+                        save_mesh_cache(mesh, job["mesh_cache_dir"])
+                pipeline.image_to_3d.export_glb(
+                    mesh, job["output_path"], **job.get("export_options", {}), progress_callback=callback
+                )
+            # 프로세스 풀에서는 _export_process_run이 최적화까지 실행
+            if GLB_OPTIMIZE:
+                optimize_outputs(job["output_path"], callback)
+        return {**job, "model_bytes": os.path.getsize(job["output_path"])}
+
+    def on_done(job: dict):
+        manifest = read_lod_manifest(job["output_path"])
+        lods = None
+        if manifest is not None:
+            model_dir = Path(job["output_path"]).parent
+            lods = [{**level, "path": str(model_dir / level["file"])} for level in manifest["levels"]]
+
+        result = {
+            "success": True,
+            "image_path": job["image_output_path"] if job["kind"] == "text" else job.get("image_path"),
+            "model_path": job["output_path"],
+            "model_bytes": job.get("model_bytes"),
+            "lods": lods,
+            "peak_gpu_bytes": job.get("peak_gpu_bytes"),
+            "peak_rss_bytes": resident_memory_bytes(),
+        }
+        emit({"type": "completed", "job_id": job["job_id"], "result": result})
+        on_finished(job, "completed")
+
+    def on_error(job: dict, error: Exception, stage_name: str):
+        label = "Image generation" if stage_name == "image" else "3D generation"
+        emit({"type": "failed", "job_id": job["job_id"], "error": f"{label} failed: {error}"})
+        on_finished(job, "failed")
+
+    stages = [
+        Stage("image", fetch_image, workers=IMAGE_STAGE_WORKERS, queue_size=STAGE_QUEUE_SIZE),
+        Stage("reconstruct", reconstruct, workers=1, queue_size=STAGE_QUEUE_SIZE),
+        Stage("export", export, workers=export_workers, queue_size=STAGE_QUEUE_SIZE),
+    ]
+    return StagedPipeline(stages, on_done=on_done, on_error=on_error)
+
+
+def _worker_main(worker_id: int, job_queue, event_queue, kind: str):
+    """워커 프로세스 엔트리포인트"""
+    emit = event_queue.put
+
+    try:
+        pipeline, model_stats = _load_pipeline(kind)
+    except Exception as e:
+        emit({"type": "worker_error", "worker_id": worker_id, "error": str(e)})
+        return
+
+    emit({"type": "ready", "worker_id": worker_id, "models": model_stats})
+
+    # 단계 타이머 측정값을 API 프로세스로 전달
+    from services.pipeline import add_stage_hook
+
+    add_stage_hook(lambda stage, seconds, labels: emit({
+        "type": "metric",
+        "stage": stage,
+        "seconds": seconds,
+        "labels": labels,
+    }))
+
+    def on_finished(job: dict, status: str):
+        emit({
+            "type": "finished",
+            "job_id": job["job_id"],
+            "kind": job["kind"],
+            "status": status,
+            "worker_id": worker_id,
+            "duration": time.perf_counter() - job["started_at"],
+            "stages": staged.stats(),
+        })
+
+    # GLB 후처리는 별도 프로세스에서 실행해 GIL/CPU 경합 없이 다음 작업의 재구성을 진행
+    stub_options = {}
+    if kind == "stub":
+        stub_options = {"export_delay": pipeline.image_to_3d.export_delay, "cpu_fraction": pipeline.image_to_3d.cpu_fraction}
+    export_pool = create_export_pool(kind, event_queue, stub_options=stub_options)
+
+    staged = build_generation_pipeline(
+        pipeline, emit, on_finished, export_pool=export_pool, export_workers=max(1, EXPORT_PROCESSES)
+    )
+    staged.start()
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+
+        emit({"type": "started", "job_id": job["job_id"], "kind": job["kind"], "worker_id": worker_id})
+        # 첫 단계 큐가 가득 차면 여기서 대기 → 공유 작업 큐에 backpressure 유지
+        # 재내보내기는 이미지/재구성 단계 없이 내보내기 단계로 바로 투입
+        stage = "export" if job["kind"] == "reexport" else None
+        staged.submit({**job, "started_at": time.perf_counter()}, stage=stage)
+
+    staged.stop()
+    if export_pool is not None:
+        export_pool.shutdown()
+
+
+# ============================================================================
+# Worker Pool (API 프로세스 측)
+# ============================================================================
+
+class GenerationWorkerPool:
+    """bounded 큐를 소비하는 워커 프로세스 풀"""
+
+    def __init__(
+        self,
+        num_workers: int = NUM_WORKERS,
+        queue_size: int = QUEUE_SIZE,
+        kind: str = PIPELINE_KIND,
+        initial_job_seconds: float = INITIAL_JOB_SECONDS,
+    ):
+        self.num_workers = max(1, num_workers)
+        self.queue_size = queue_size
+        self.kind = kind
+        self._ctx = mp.get_context("spawn")
+        self._job_queue = None
+        self._event_queue = None
+        self._processes: list = []
+        self._listener: Optional[threading.Thread] = None
+        self._handlers: list[Callable[[dict], None]] = []
+        self._lock = threading.Lock()
+
+        # 큐 상태 (mp.Queue.qsize()는 플랫폼에 따라 지원되지 않으므로 직접 집계)
+        self.queued = 0
+        self.running = 0
+        # 완료된 생성 작업(GENERATE_KINDS)만으로 갱신하는 평균 소요 시간 (첫 완료 전까지는 초기 추정치)
+        # 종류별 평균은 통계용
+        self.avg_job_seconds = initial_job_seconds
+        self._measured = False
+        self.job_seconds: dict[str, float] = {}
+        self._started_at: dict[str, float] = {}  # 실행 중인 생성 작업 → 시작 시각
+        self.workers: dict[int, dict] = {}
+
+    def add_handler(self, handler: Callable[[dict], None]):
+        """워커 이벤트 핸들러 등록 (리스너 스레드에서 호출됨)"""
+        self._handlers.append(handler)
+
+    def start(self):
+        """워커 프로세스 및 이벤트 리스너 시작"""
+        if self._processes:
+            return
+
+        self._job_queue = self._ctx.Queue(maxsize=self.queue_size)
+        self._event_queue = self._ctx.Queue()
+
+        for worker_id in range(self.num_workers):
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(worker_id, self._job_queue, self._event_queue, self.kind),
+                name=f"gpu-worker-{worker_id}",
+                # daemon 프로세스는 자식 프로세스를 만들 수 없으므로 내보내기 풀 사용 시 non-daemon
+                daemon=EXPORT_PROCESSES <= 0,
+            )
+            process.start()
+            self._processes.append(process)
+            self.workers[worker_id] = {"status": "loading", "pid": process.pid}
+
+        self._listener = threading.Thread(target=self._listen, name="gpu-worker-events", daemon=True)
+        self._listener.start()
+        print(f"Started {self.num_workers} {self.kind} worker(s), queue size {self.queue_size}")
+
+    def stop(self, timeout: float = 5.0):
+        """워커 종료 (남은 큐 작업은 버려짐)"""
+        if not self._processes:
+            return
+
+        for _ in self._processes:
+            try:
+                self._job_queue.put_nowait(None)
+            except queue.Full:
+                pass
+
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+
+        self._event_queue.put(None)
+        if self._listener is not None:
+            self._listener.join(timeout)
+        self._processes = []
+
+    def submit(self, job: dict):
+        """
+        작업을 큐에 추가합니다.
+
+        Raises:
+            QueueFullError: 큐가 가득 찬 경우 (Retry-After 추정치 포함)
+        """
+        with self._lock:
+            try:
+                self._job_queue.put_nowait(job)
+            except queue.Full:
+                raise QueueFullError(self.retry_after())
+            self.queued += 1
+
+    def retry_after(self) -> int:
+        """큐에 빈 슬롯이 생기기까지의 예상 대기 시간 (초)"""
+        # 실행 중인 생성 작업 중 가장 먼저 끝날 작업의 예상 종료 시점에 슬롯이 빔
+        now = time.monotonic()
+        if self._started_at:
+            remaining = min(started + self.avg_job_seconds - now for started in self._started_at.values())
+        else:
+            remaining = self.avg_job_seconds
+        return max(1, math.ceil(remaining))
+
+    def _listen(self):
+        """워커 이벤트 수신 루프"""
+        while True:
+            event = self._event_queue.get()
+            if event is None:
+                break
+            self._update_state(event)
+            for handler in self._handlers:
+                try:
+                    handler(event)
+                except Exception as e:
+                    print(f"Worker event handler failed: {e}")
+
+    def _update_state(self, event: dict):
+        with self._lock:
+            event_type = event["type"]
+            if event_type == "ready":
+                self.workers[event["worker_id"]].update(status="idle", models=event["models"])
+            elif event_type == "worker_error":
+                self.workers[event["worker_id"]].update(status="error", error=event["error"])
+            elif event_type == "started":
+                self.queued = max(0, self.queued - 1)
+                self.running += 1
+                if event.get("kind") in GENERATE_KINDS:
+                    self._started_at[event["job_id"]] = time.monotonic()
+                worker = self.workers[event["worker_id"]]
+                # 단계별 파이프라인이므로 워커 하나가 여러 작업을 동시에 처리할 수 있음
+                worker["active"] = worker.get("active", 0) + 1
+                worker["status"] = "busy"
+            elif event_type == "finished":
+                self.running = max(0, self.running - 1)
+                self._started_at.pop(event["job_id"], None)
+                worker = self.workers[event["worker_id"]]
+                worker["stages"] = event["stages"]
+                worker["active"] = max(0, worker.get("active", 0) - 1)
+                worker["status"] = "busy" if worker["active"] else "idle"
+                # 완료된 작업만 지수 이동 평균에 반영 (실패는 단계 도중 끝나 추정치를 낮춤)
+                if event["status"] == "completed":
+                    kind, duration = event["kind"], event["duration"]
+                    previous = self.job_seconds.get(kind)
+                    self.job_seconds[kind] = duration if previous is None else 0.8 * previous + 0.2 * duration
+                    if kind in GENERATE_KINDS:
+                        self.avg_job_seconds = 0.8 * self.avg_job_seconds + 0.2 * duration if self._measured else duration
+                        self._measured = True
+
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "num_workers": self.num_workers,
+            "queue_size": self.queue_size,
+            "queued": self.queued,
+            "running": self.running,
+            "avg_job_seconds": round(self.avg_job_seconds, 2),
+            "job_seconds": {kind: round(seconds, 2) for kind, seconds in self.job_seconds.items()},
+            "workers": self.workers,
+        }
+
+
+class SharedGenerationWorkerPool(GenerationWorkerPool):
+    """
+    여러 API 프로세스가 공유하는 워커 풀 (JOB_STORE=sqlite)
+
+    submit은 공유 DB의 작업 큐(gpu_queue)에 넣고, 잠금 파일을 잡은 소유 프로세스만 워커를 띄워
+    디스패치 스레드가 큐의 작업을 워커 큐로 옮깁니다. 워커 이벤트 핸들러(작업 상태 갱신 등)는
+    소유 프로세스에서만 호출되며, 구독자에게는 공유 이벤트 로그로 전달됩니다.
+    통계/Retry-After는 소유 프로세스가 기록한 상태 행(gpu_pool)을 읽습니다.
+
+    소유 프로세스가 종료되면 아직 시작되지 않은 작업은 다음 소유 프로세스가 이어서 실행하지만,
+    실행 중이던 작업은 processing 상태로 남습니다.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS gpu_queue (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL UNIQUE,
+            sent INTEGER NOT NULL DEFAULT 0,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS gpu_pool (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            owner_pid INTEGER NOT NULL,
+            updated_at REAL NOT NULL,
+            data TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, db: Optional[SQLiteDatabase] = None, lock_path: str = GPU_LOCK_PATH, **kwargs):
+        super().__init__(**kwargs)
+        self._db = db
+        self.lock_path = lock_path
+        self._lock_file = None
+        self._stopping = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def db(self) -> SQLiteDatabase:
+        # 워커 프로세스(spawn)도 이 모듈을 import하므로 DB는 처음 쓸 때 연결
+        if self._db is None:
+            self._db = SQLiteDatabase(schema=self.SCHEMA)
+        return self._db
+
+    @property
+    def is_owner(self) -> bool:
+        return self._lock_file is not None
+
+    def start(self):
+        """풀 소유를 시도하고, 못 잡으면 소유 프로세스가 사라질 때까지 주기적으로 재시도"""
+        if self._threads:
+            return
+        self._stopping.clear()
+        if self._acquire():
+            self._become_owner()
+        else:
+            print(f"GPU worker pool is owned by another process, submitting through {self.db.path}")
+            self._spawn(self._standby, "gpu-pool-standby")
+
+    def stop(self, timeout: float = 5.0):
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        super().stop(timeout)
+        if self._lock_file is not None:
+            self._lock_file.close()  # 잠금 해제 - 대기 중인 프로세스가 넘겨받음
+            self._lock_file = None
+
+    def _spawn(self, target: Callable[[], None], name: str):
+        thread = threading.Thread(target=target, name=name, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _acquire(self) -> bool:
+        Path(self.lock_path).parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    def _become_owner(self):
+        # 이전 소유 프로세스의 워커 큐에 들어갔지만 시작되지 못한 작업을 다시 보냄
+        self.db.conn().execute("UPDATE gpu_queue SET sent = 0")
+        super().start()
+        self._publish_state()
+        self._spawn(self._dispatch, "gpu-queue-dispatch")
+
+    def _standby(self):
+        while not self._stopping.wait(GPU_OWNER_RETRY_SECONDS):
+            if self._acquire():
+                print("Took over GPU worker pool ownership")
+                self._become_owner()
+                return
+
+    def _dispatch(self):
+        """공유 작업 큐 → 워커 큐 (워커 큐가 가득 차면 빌 때까지 대기)"""
+        while not self._stopping.is_set():
+            try:
+                row = self.db.conn().execute(
+                    "SELECT seq, data FROM gpu_queue WHERE sent = 0 ORDER BY seq LIMIT 1"
+                ).fetchone()
+            except sqlite3.Error as e:
+                print(f"GPU queue dispatch failed: {e}")
+                row = None
+            if row is None:
+                self._stopping.wait(GPU_DISPATCH_POLL_SECONDS)
+                continue
+            try:
+                self._job_queue.put(json.loads(row["data"]), timeout=GPU_DISPATCH_POLL_SECONDS * 10)
+            except queue.Full:
+                continue
+            self.db.conn().execute("UPDATE gpu_queue SET sent = 1 WHERE seq = ?", (row["seq"],))
+            with self._lock:
+                self.queued += 1
+
+    def submit(self, job: dict):
+        with self.db.transaction() as conn:
+            pending = conn.execute("SELECT COUNT(*) FROM gpu_queue").fetchone()[0]
+            if pending >= self.queue_size:
+                raise QueueFullError(self.retry_after())
+            conn.execute("INSERT INTO gpu_queue (job_id, data) VALUES (?, ?)", (job["job_id"], json.dumps(job)))
+
+    def _update_state(self, event: dict):
+        super()._update_state(event)
+        if event["type"] == "started":
+            self.db.conn().execute("DELETE FROM gpu_queue WHERE job_id = ?", (event["job_id"],))
+        if event["type"] in ("ready", "worker_error", "started", "finished"):
+            self._publish_state()
+
+    def _publish_state(self):
+        """소유 프로세스의 풀 상태를 공유 DB에 기록 (시작 시각은 프로세스 간 비교를 위해 벽시계 기준)"""
+        with self._lock:
+            offset = time.time() - time.monotonic()
+            state = {
+                **super().stats(),
+                "started_at": [started + offset for started in self._started_at.values()],
+            }
+        self.db.conn().execute(
+            "INSERT OR REPLACE INTO gpu_pool (id, owner_pid, updated_at, data) VALUES (1, ?, ?, ?)",
+            (os.getpid(), time.time(), json.dumps(state)),
+        )
+
+    def _shared_state(self) -> Optional[dict]:
+        row = self.db.conn().execute("SELECT owner_pid, data FROM gpu_pool WHERE id = 1").fetchone()
+        return None if row is None else {**json.loads(row["data"]), "owner_pid": row["owner_pid"]}
+
+    def retry_after(self) -> int:
+        if self.is_owner:
+            return super().retry_after()
+        state = self._shared_state()
+        if state is None:
+            return max(1, math.ceil(self.avg_job_seconds))
+        now = time.time()
+        remaining = min((started + state["avg_job_seconds"] - now for started in state["started_at"]), default=state["avg_job_seconds"])
+        return max(1, math.ceil(remaining))
+
+    def stats(self) -> dict:
+        state = self._shared_state() if not self.is_owner else None
+        stats = super().stats() if state is None else {key: value for key, value in state.items() if key != "started_at"}
+        stats.update(
+            queued=self.db.conn().execute("SELECT COUNT(*) FROM gpu_queue").fetchone()[0],
+            owner=self.is_owner,
+        )
+        return stats
+
+
+def create_worker_pool() -> GenerationWorkerPool:
+    """설정에 맞는 워커 풀 (JOB_STORE=sqlite면 API 프로세스 간 공유)"""
+    return SharedGenerationWorkerPool() if SHARED_STATE else GenerationWorkerPool()
+
+
+# 프로세스 전역 워커 풀
+worker_pool = create_worker_pool()
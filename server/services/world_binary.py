@@ -0,0 +1,273 @@
+"""
+WorldSpec 바이너리 전송 형식
+Accept: application/vnd.worldspec+binary 요청에 JSON 대신 보내는 압축 형식입니다.
+엔티티마다 반복되는 키 이름과 텍스트 숫자 대신 열 단위 배열을 쓰며, 클라이언트는
+TypedArray 뷰로 바로 읽습니다 (디코더: client/src/types/world_spec.ts).
+
+레이아웃 (little-endian, 모든 구역은 4바이트 정렬):
+    헤더 72B     magic "WSPB", u16 형식 버전, u16 플래그(bit0: zones 있음), u32 × 16 개수/문자열 인덱스
+    월드 24B     f32 space.size[3], f32 spawnpoint[3]
+    문자열       u32 오프셋[문자열 수 + 1], UTF-8 바이트 (id/name/src/color/lod/zone 문자열을 한 번씩만 저장)
+    엔티티 태그  u8 assetType[n], u8 필드 플래그[n], u8 primitive/format 코드[n], u8 role 코드[n]
+    문자열 참조  u32 id[n], name[name 수], src[glb/splat 수], color[color 수]
+    벡터         f32 position[n×3], rotation/scale/size[있는 엔티티 수×3]
+    LOD          u32 엔티티별 LOD 수, u32 src, f32 distance
+    zone         u32 (id, name)[zone 수], f32 bounds[zone 수×6]
+    meta         UTF-8 JSON (world_id, version, pending 등 스펙 밖의 응답 필드, 선택)
+
+벡터는 float32로 보내므로 JSON 대비 소수 7자리 정도까지만 같습니다.
+"""
+
+import json
+import struct
+from typing import Optional, Union
+
+import numpy as np
+
+from shared.types.world_store import (
+    ASSET_TYPES,
+    PRIMITIVES,
+    ROLES,
+    SPLAT_FORMATS,
+    VECTOR_COLUMNS,
+    StringTable,
+    WorldStore,
+)
+
+
+WORLD_BINARY_MEDIA_TYPE = "application/vnd.worldspec+binary"
+WORLD_BINARY_MAGIC = b"WSPB"
+WORLD_BINARY_VERSION = 1
+
+_HEADER = struct.Struct("<4sHH16I")
+_WORLD = struct.Struct("<6f")
+_HAS_ZONES = 1
+
+# 엔티티 필드 플래그 (src는 glb/splat이면 항상 있음)
+FLAG_NAME = 1
+FLAG_ROTATION = 2
+FLAG_SCALE = 4
+FLAG_SIZE = 8
+FLAG_COLOR = 16
+FLAG_ROLE = 32
+FLAG_FORMAT = 64
+FLAG_LODS = 128
+
+_PRIMITIVE = ASSET_TYPES.index("primitive")
+
+
+def _pad(size: int) -> bytes:
+    return b"\0" * (-size % 4)
+
+
+def encode_world(spec: Union[dict, WorldStore], meta: Optional[dict] = None) -> bytes:
+    """
+    WorldSpec(alias 기준 dict 또는 WorldStore) → 바이너리
+
+    Args:
+        meta: 함께 보낼 스펙 밖의 응답 필드 (JSON으로 직렬화 가능해야 함)
+    """
+    store = spec if isinstance(spec, WorldStore) else WorldStore.from_dict(spec)
+    count = len(store)
+
+    # 엔티티 열이 쓰는 인덱스를 유지한 채 월드/LOD/zone 문자열 추가
+    strings = StringTable(store.strings.values)
+    version_str, name_str = strings.intern(store.version), strings.intern(store.name)
+    space_type_str = strings.intern(store.space["type"])
+    lod_indices = sorted(store.lods)
+    lods = [lod for i in lod_indices for lod in store.lods[i]]
+    lod_srcs = [strings.intern(lod["src"]) for lod in lods]
+    zones = store.zones or []
+    zone_strings = [strings.intern(value) for zone in zones for value in (zone["id"], zone["name"])]
+
+    encoded = [value.encode("utf-8") for value in strings.values]
+    offsets = np.zeros(len(encoded) + 1, np.uint32)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    blob = b"".join(encoded)
+
+    present = {column: ~np.isnan(getattr(store, column)[:, 0]) for column in VECTOR_COLUMNS[1:]}
+    lod_mask = np.zeros(count, bool)
+    lod_mask[lod_indices] = True
+    flags = (
+        (store.entity_name >= 0) * FLAG_NAME
+        | present["rotation"] * FLAG_ROTATION
+        | present["scale"] * FLAG_SCALE
+        | present["size"] * FLAG_SIZE
+        | (store.color >= 0) * FLAG_COLOR
+        | (store.role >= 0) * FLAG_ROLE
+        | (store.format >= 0) * FLAG_FORMAT
+        | lod_mask * FLAG_LODS
+    ).astype(np.uint8)
+    codes = np.where(store.asset_type == _PRIMITIVE, store.primitive, np.maximum(store.format, 0))
+    has_src = store.asset_type != _PRIMITIVE
+
+    sections = [
+        offsets.tobytes(), blob, _pad(len(blob)),
+        store.asset_type.astype(np.uint8).tobytes(), _pad(count),
+        flags.tobytes(), _pad(count),
+        codes.astype(np.uint8).tobytes(), _pad(count),
+        np.maximum(store.role, 0).astype(np.uint8).tobytes(), _pad(count),
+        store.entity_id.astype(np.uint32).tobytes(),
+        store.entity_name[store.entity_name >= 0].astype(np.uint32).tobytes(),
+        store.src[has_src].astype(np.uint32).tobytes(),
+        store.color[store.color >= 0].astype(np.uint32).tobytes(),
+        store.position.astype(np.float32).tobytes(),
+    ]
+    sections += [getattr(store, column)[present[column]].astype(np.float32).tobytes() for column in VECTOR_COLUMNS[1:]]
+    sections += [
+        np.array([len(store.lods[i]) for i in lod_indices], np.uint32).tobytes(),
+        np.array(lod_srcs, np.uint32).tobytes(),
+        np.array([lod["distance"] for lod in lods], np.float32).tobytes(),
+        np.array(zone_strings, np.uint32).tobytes(),
+        np.array([zone["bounds"] for zone in zones], np.float32).tobytes(),
+    ]
+    meta_bytes = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8") if meta is not None else b""
+    sections.append(meta_bytes)
+
+    header = _HEADER.pack(
+        WORLD_BINARY_MAGIC, WORLD_BINARY_VERSION, _HAS_ZONES if store.zones is not None else 0,
+        count, len(strings), len(blob),
+        int((store.entity_name >= 0).sum()), int(has_src.sum()), int((store.color >= 0).sum()),
+        int(present["rotation"].sum()), int(present["scale"].sum()), int(present["size"].sum()),
+        len(lod_indices), len(lods), len(zones),
+        version_str, name_str, space_type_str, len(meta_bytes),
+    )
+    world = _WORLD.pack(*store.space["size"], *store.spawnpoint)
+    return b"".join([header, world, *sections])
+
+
+class _Reader:
+    """정렬된 구역을 차례로 읽는 커서"""
+
+    def __init__(self, data: bytes, offset: int):
+        self.data = data
+        self.offset = offset
+
+    def array(self, dtype, count: int) -> np.ndarray:
+        size = np.dtype(dtype).itemsize * count
+        if self.offset + size > len(self.data):
+            raise ValueError("Truncated binary WorldSpec")
+        values = np.frombuffer(self.data, dtype, count, self.offset)
+        self.offset += size + (-size % 4)
+        return values
+
+
+def decode_world(data: bytes) -> tuple[WorldStore, Optional[dict]]:
+    """
+    바이너리 → (WorldStore, meta)
+
+    Raises:
+        ValueError: 형식이 다르거나 잘린 데이터
+    """
+    if len(data) < _HEADER.size + _WORLD.size:
+        raise ValueError("Truncated binary WorldSpec")
+    magic, version, header_flags, *fields = _HEADER.unpack_from(data)
+    if magic != WORLD_BINARY_MAGIC or version != WORLD_BINARY_VERSION:
+        raise ValueError("Not a binary WorldSpec (version 1)")
+    (count, string_count, string_bytes, name_count, src_count, color_count,
+     rotation_count, scale_count, size_count, lod_entity_count, lod_count, zone_count,
+     version_str, name_str, space_type_str, meta_size) = fields
+    world = _WORLD.unpack_from(data, _HEADER.size)
+
+    reader = _Reader(data, _HEADER.size + _WORLD.size)
+    offsets = reader.array(np.uint32, string_count + 1).tolist()
+    blob = bytes(reader.array(np.uint8, string_bytes))
+    strings = StringTable(blob[start:end].decode("utf-8") for start, end in zip(offsets, offsets[1:]))
+    if len(strings) != string_count:
+        raise ValueError("Duplicate strings in binary WorldSpec")
+
+    asset_type = reader.array(np.uint8, count)
+    flags = reader.array(np.uint8, count)
+    codes = reader.array(np.uint8, count)
+    roles = reader.array(np.uint8, count)
+    is_primitive = asset_type == _PRIMITIVE
+    has_format = (flags & FLAG_FORMAT) > 0
+    has_role = (flags & FLAG_ROLE) > 0
+    for name, values, limit in (
+        ("assetType", asset_type, len(ASSET_TYPES)),
+        ("primitive", codes[is_primitive], len(PRIMITIVES)),
+        ("format", codes[has_format], len(SPLAT_FORMATS)),
+        ("role", roles[has_role], len(ROLES)),
+    ):
+        if np.any(values >= limit):
+            raise ValueError(f"Invalid {name} code")
+
+    columns = WorldStore.empty(count)
+    columns["asset_type"][:] = asset_type
+    columns["primitive"][is_primitive] = codes[is_primitive]
+    columns["format"][has_format] = codes[has_format]
+    columns["role"][has_role] = roles[has_role]
+
+    for column, mask, size in (
+        ("entity_id", slice(None), count),
+        ("entity_name", (flags & FLAG_NAME) > 0, name_count),
+        ("src", ~is_primitive, src_count),
+        ("color", (flags & FLAG_COLOR) > 0, color_count),
+    ):
+        values = reader.array(np.uint32, size)
+        if np.any(values >= string_count):
+            raise ValueError(f"Invalid {column} string index")
+        columns[column][mask] = values
+
+    columns["position"][:] = reader.array(np.float32, count * 3).reshape(-1, 3)
+    for column, flag, size in (
+        ("rotation", FLAG_ROTATION, rotation_count),
+        ("scale", FLAG_SCALE, scale_count),
+        ("size", FLAG_SIZE, size_count),
+    ):
+        columns[column][(flags & flag) > 0] = reader.array(np.float32, size * 3).reshape(-1, 3)
+
+    lod_sizes = reader.array(np.uint32, lod_entity_count).tolist()
+    lod_srcs = reader.array(np.uint32, lod_count).tolist()
+    lod_distances = reader.array(np.float32, lod_count).tolist()
+    zone_strings = reader.array(np.uint32, zone_count * 2).tolist()
+    zone_bounds = reader.array(np.float32, zone_count * 6).reshape(-1, 2, 3).tolist()
+    if max([version_str, name_str, space_type_str, *lod_srcs, *zone_strings], default=0) >= string_count:
+        raise ValueError("Invalid string index")
+    if sum(lod_sizes) != lod_count or len(lod_sizes) != int(np.count_nonzero(flags & FLAG_LODS)):
+        raise ValueError("Invalid LOD counts")
+    lods, start = {}, 0
+    for i, size in zip(np.flatnonzero(flags & FLAG_LODS).tolist(), lod_sizes):
+        lods[i] = [
+            {"src": strings.values[src], "distance": distance}
+            for src, distance in zip(lod_srcs[start:start + size], lod_distances[start:start + size])
+        ]
+        start += size
+
+    zones = [
+        {"id": strings.values[zone_strings[2 * i]], "name": strings.values[zone_strings[2 * i + 1]], "bounds": bounds}
+        for i, bounds in enumerate(zone_bounds)
+    ]
+    meta = json.loads(bytes(reader.array(np.uint8, meta_size))) if meta_size else None
+
+    store = WorldStore(
+        version=strings.values[version_str],
+        name=strings.values[name_str],
+        space={"type": strings.values[space_type_str], "size": [float(v) for v in world[:3]]},
+        spawnpoint=world[3:],
+        columns=columns,
+        strings=strings,
+        lods=lods,
+        zones=zones if header_flags & _HAS_ZONES else None,
+    )
+    return store, meta
+
+
+def wants_binary(accept: Optional[str]) -> bool:
+    """Accept 헤더가 JSON보다 바이너리 WorldSpec을 (같거나 높은 q로) 원하는지"""
+    if not accept:
+        return False
+    quality = {}
+    for item in accept.split(","):
+        media_type, *params = [part.strip() for part in item.split(";")]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        quality[media_type.lower()] = q
+    binary = quality.get(WORLD_BINARY_MEDIA_TYPE, 0.0)
+    return binary > 0 and binary >= quality.get("application/json", 0.0)
@@ -0,0 +1,180 @@
+"""
+라이브러리 우선 월드 구성
+장면의 오브젝트를 manifest 라이브러리 에셋으로 먼저 해석하고, 찾지 못한 오브젝트만 생성 대상으로 남깁니다.
+배치는 방 바닥에 행 단위로 채워 넣는 단순 패킹이며, 크기는 에셋 메타데이터 인덱스의 바운딩 박스를 사용합니다.
+
+좌표계: 방 중심이 x/z = 0, 바닥이 y = 0
+"""
+
+from pathlib import Path
+from typing import Optional
+
+from services.asset_index import asset_index, normalize_keyword
+from services.asset_metadata import asset_metadata, inspect_asset
+
+
+DEFAULT_ROOM_SIZE = (10.0, 3.0, 10.0)
+
+# 벽/오브젝트 사이 여백 (m)
+LAYOUT_MARGIN = 0.5
+
+# 시작 위치와 뒷벽(+z) 사이 거리 - 배치는 시작 위치 앞(이 거리 + 여백)을 비워 둠
+SPAWN_WALL_DISTANCE = 1.0
+
+# 행이 방 깊이를 넘으면 오브젝트 크기를 이 비율씩 줄여 다시 배치
+LAYOUT_SHRINK = 0.9
+LAYOUT_MIN_FACTOR = 0.05
+
+# 생성 모델(TRELLIS.2 출력)의 예상 크기 - 원점 중심의 약 1m 정육면체
+GENERATED_SIZE = (1.0, 1.0, 1.0)
+
+# 라이브러리 에셋의 src 접두어 (클라이언트 public 디렉토리 기준)
+LIBRARY_SRC_PREFIX = "assets/models/"
+
+
+def resolve_objects(objects: list[dict], min_score: float) -> list[dict]:
+    """
+    오브젝트별 라이브러리 해석
+
+    Args:
+        objects: [{"prompt", "count"}]
+        min_score: 이 점수 미만이면 라이브러리에 없는 오브젝트로 간주
+
+    Returns:
+        [{"prompt", "count", "asset": 검색 결과 또는 None, "key": 정규화된 문구}]
+    """
+    return [
+        {**obj, "asset": asset_index.resolve(obj["prompt"], min_score=min_score), "key": normalize_keyword(obj["prompt"])}
+        for obj in objects
+    ]
+
+
+def asset_bounds(path: str) -> Optional[tuple[list[float], list[float]]]:
+    """라이브러리 에셋의 바운딩 박스 (메타데이터가 없으면 None)"""
+    metadata = asset_metadata.get(path)
+    aabb = metadata.get("aabb") if metadata else None
+    return (aabb["min"], aabb["max"]) if aabb else None
+
+
+def spawnpoint(room_size: tuple[float, float, float]) -> list[float]:
+    """생성 월드의 시작 위치 (눈높이, 뒷벽 앞)"""
+    return [0.0, 1.6, room_size[2] / 2 - SPAWN_WALL_DISTANCE]
+
+
+def _fit_scale(extent: list[float], limits: tuple[float, float, float]) -> float:
+    """배치 영역보다 큰 에셋은 영역에 들어가도록 균등 축소"""
+    scale = min([1.0] + [limit / size for limit, size in zip(limits, extent) if size > 0])
+    return max(scale, 1e-3)
+
+
+def layout_entities(items: list[dict], room_size: tuple[float, float, float]) -> list[dict]:
+    """
+    오브젝트 인스턴스를 방 바닥에 배치
+
+    -z 벽부터 행 단위로 채우며, 행이 시작 위치 앞 빈 공간까지 넘어가면 모든 오브젝트를
+    같은 비율로 줄여 다시 배치합니다 (오브젝트가 많으면 방 밖으로 나가거나 시작 위치를 막지 않도록).
+
+    Args:
+        items: [{"bounds": (min, max) 또는 None}] - None이면 생성 모델 크기(GENERATED_SIZE)로 가정
+
+    Returns:
+        항목별 {"position", "scale", "footprint"} - position은 모델 원점 위치
+        (바운딩 박스 바닥이 y = 0에 닿도록 보정됨)
+    """
+    factor = 1.0
+    while True:
+        placements, z_end = _layout_rows(items, room_size, factor)
+        if z_end <= room_size[2] / 2 - SPAWN_WALL_DISTANCE - LAYOUT_MARGIN or factor <= LAYOUT_MIN_FACTOR:
+            return placements
+        factor = max(factor * LAYOUT_SHRINK, LAYOUT_MIN_FACTOR)
+
+
+def _layout_rows(items: list[dict], room_size: tuple[float, float, float], factor: float) -> tuple[list[dict], float]:
+    """factor배 크기로 행 단위 배치 → (배치 목록, 마지막 행의 +z 끝)"""
+    width, _, depth = room_size
+    x_min, x_max = -width / 2 + LAYOUT_MARGIN, width / 2 - LAYOUT_MARGIN
+    z_min = -depth / 2 + LAYOUT_MARGIN
+    limits = (x_max - x_min, room_size[1], depth / 2 - SPAWN_WALL_DISTANCE - LAYOUT_MARGIN - z_min)
+    x, z, row_depth = x_min, z_min, 0.0
+
+    placements = []
+    for item in items:
+        low, high = item.get("bounds") or ([-s / 2 for s in GENERATED_SIZE], [s / 2 for s in GENERATED_SIZE])
+        extent = [h - l for l, h in zip(low, high)]
+        scale = _fit_scale(extent, limits) * factor
+        size_x, size_z = extent[0] * scale, extent[2] * scale
+
+        # 현재 행에 들어가지 않으면 다음 행으로
+        if x > x_min and x + size_x > x_max:
+            x, z, row_depth = x_min, z + row_depth + LAYOUT_MARGIN, 0.0
+
+        center_x, center_z = x + size_x / 2, z + size_z / 2
+        placements.append({
+            "position": [
+                round(center_x - (low[0] + high[0]) / 2 * scale, 4),
+                round(-low[1] * scale, 4) + 0.0,  # -0.0 방지
+                round(center_z - (low[2] + high[2]) / 2 * scale, 4),
+            ],
+            "scale": round(scale, 4),
+            "footprint": [round(size_x, 4), round(size_z, 4)],
+        })
+        x += size_x + LAYOUT_MARGIN
+        row_depth = max(row_depth, size_z)
+    return placements, z + row_depth
+
+
+def library_entity(entity_id: str, name: str, asset: dict, placement: dict) -> dict:
+    """라이브러리 에셋 GlbEntity (WorldSpec alias 기준 dict)"""
+    entity = {
+        "id": entity_id,
+        "name": name,
+        "assetType": "glb",
+        "src": LIBRARY_SRC_PREFIX + asset["path"],
+        "position": placement["position"],
+        "role": "prop",
+    }
+    if placement["scale"] != 1.0:
+        entity["scale"] = [placement["scale"]] * 3
+    return entity
+
+
+def placeholder_entity(entity_id: str, name: str, placement: dict) -> dict:
+    """
+    생성 중인 오브젝트 자리표시 (바닥 기준 위치의 상자)
+    축소 배치된 경우 size도 같은 비율로 줄이며, 완성된 GLB는 이 비율로 스케일됩니다 (placeholder_scale).
+    """
+    x, _, z = placement["position"]
+    return {
+        "id": entity_id,
+        "name": name,
+        "assetType": "primitive",
+        "primitive": "box",
+        "position": [x, 0.0, z],
+        "size": [round(s * placement["scale"], 4) for s in GENERATED_SIZE],
+        "color": "#9ca3af",
+        "role": "prop",
+    }
+
+
+def placeholder_scale(entity: dict) -> float:
+    """자리표시 size → 생성 모델에 적용할 균등 스케일 (축소 배치되지 않았으면 1)"""
+    size = entity.get("size")
+    return round(size[1] / GENERATED_SIZE[1], 4) if size else 1.0
+
+
+def generated_entity_fields(job: dict, model_path: Optional[str] = None) -> tuple[dict, float]:
+    """
+    완료된 생성 작업 → 자리표시를 대체할 GlbEntity 필드와 바닥 보정 높이
+
+    모델 파일을 읽을 수 있으면 실제 바운딩 박스 바닥을 y = 0에 맞춥니다.
+    """
+    fields = {"assetType": "glb", "src": job["model_url"]}
+    if job.get("lods") and len(job["lods"]) > 1:
+        fields["lods"] = [{"src": lod["url"], "distance": lod["distance"]} for lod in job["lods"][1:]]
+
+    floor_offset = GENERATED_SIZE[1] / 2
+    if model_path and Path(model_path).is_file():
+        aabb = inspect_asset(Path(model_path)).get("aabb")
+        if aabb:
+            floor_offset = -aabb["min"][1]
+    return fields, round(floor_offset, 4)
@@ -0,0 +1,139 @@
+"""
+월드 청크 분할
+큰 월드를 x/z 격자 청크로 나눠 플레이어 주변 청크만 가까운 순서로 보낼 수 있게 합니다.
+
+- 엔티티/zone은 AABB 중심이 속한 청크 하나에만 들어감 (중복 없음)
+- 청크 bounds는 소속 엔티티/zone AABB의 합집합이라 청크 칸 밖으로 삐져나온 큰 엔티티도 반경 검사에 걸림
+- ETag는 청크 내용의 해시라서 월드 버전이 올라가도 내용이 같은 청크는 ETag가 유지됨
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+from shared.types.world_spec import WorldSpec
+from shared.types.world_instances import expand_instances
+from services.world_validator import EntityBounds
+
+
+# 청크 한 변 길이 (m)
+WORLD_CHUNK_SIZE = float(os.environ.get("WORLD_CHUNK_SIZE", "16"))
+# 반경을 지정하지 않은 청크 요청의 기본 반경 (m)
+WORLD_CHUNK_RADIUS = float(os.environ.get("WORLD_CHUNK_RADIUS", "32"))
+# 청크 인덱스를 보관할 (월드, 버전) 수
+WORLD_CHUNK_CACHE_SIZE = int(os.environ.get("WORLD_CHUNK_CACHE_SIZE", "64"))
+
+
+def chunk_key(cx: int, cz: int) -> str:
+    return f"{cx},{cz}"
+
+
+class ChunkIndex:
+    """월드 한 버전의 청크 분할 결과 (InstancedEntity 그룹은 인스턴스별 엔티티로 펼쳐서 분할)"""
+
+    def __init__(self, spec: dict, chunk_size: float = WORLD_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        spec = expand_instances(spec)
+        # 청크 밖의 월드 정보 (클라이언트가 방/시작 위치를 먼저 그릴 수 있도록 함께 보냄)
+        self.header = {key: spec[key] for key in ("version", "name", "space", "spawnpoint")}
+        entities = spec["entities"]
+        zones = spec.get("zones") or []
+
+        bounds = EntityBounds(WorldSpec.model_validate(spec))
+        mins, maxs = bounds.mins, bounds.maxs
+        if zones:
+            zone_bounds = np.array([zone["bounds"] for zone in zones], np.float64)
+            mins = np.vstack([mins, zone_bounds.min(axis=1)])
+            maxs = np.vstack([maxs, zone_bounds.max(axis=1)])
+        centers = (mins + maxs) / 2
+        cells = np.floor(centers[:, [0, 2]] / chunk_size).astype(np.int64)
+
+        # 청크 키로 정렬한 뒤 같은 키 구간마다 bounds 합집합
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        sorted_cells = cells[order]
+        starts = np.flatnonzero(np.r_[True, np.any(sorted_cells[1:] != sorted_cells[:-1], axis=1)]) if len(order) else np.zeros(0, int)
+        self.keys = [chunk_key(cx, cz) for cx, cz in sorted_cells[starts].tolist()]
+        self.mins = np.minimum.reduceat(mins[order], starts) if len(starts) else np.zeros((0, 3))
+        self.maxs = np.maximum.reduceat(maxs[order], starts) if len(starts) else np.zeros((0, 3))
+
+        count = len(entities)
+        self._members: dict[str, tuple[list[dict], list[dict]]] = {}
+        for key, members in zip(self.keys, np.split(order, starts[1:])):
+            members = members.tolist()
+            self._members[key] = (
+                [entities[i] for i in members if i < count],
+                [zones[i - count] for i in members if i >= count],
+            )
+        self._slots = {key: i for i, key in enumerate(self.keys)}
+        self._etags: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def nearest(self, point, radius: float) -> list[tuple[str, float]]:
+        """점에서 radius 안에 bounds가 걸치는 청크 [(키, 거리)] - 가까운 순"""
+        point = np.asarray(point, np.float64)
+        gap = np.maximum(np.maximum(self.mins - point, point - self.maxs), 0.0)
+        distance = np.sqrt((gap ** 2).sum(axis=1))
+        selected = np.flatnonzero(distance <= radius)
+        selected = selected[np.argsort(distance[selected], kind="stable")]
+        return [(self.keys[i], float(distance[i])) for i in selected.tolist()]
+
+    def bounds(self, key: str) -> list[list[float]]:
+        """청크 bounds [[min], [max]] (없는 키면 KeyError)"""
+        i = self._slots[key]
+        return [self.mins[i].tolist(), self.maxs[i].tolist()]
+
+    def chunk(self, key: str) -> dict:
+        """청크 내용 {"entities", "zones"} (없는 키면 KeyError)"""
+        entities, zones = self._members[key]
+        return {"entities": entities, "zones": zones}
+
+    def etag(self, key: str) -> str:
+        """청크 내용 해시 (처음 요청될 때 계산)"""
+        etag = self._etags.get(key)
+        if etag is None:
+            body = json.dumps(self.chunk(key), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+            etag = self._etags[key] = f'"{hashlib.sha1(body.encode("utf-8")).hexdigest()[:20]}"'
+        return etag
+
+
+class ChunkCache:
+    """(world_id, version) → ChunkIndex LRU (월드가 바뀌면 새 버전으로 다시 분할)"""
+
+    def __init__(self, max_entries: int = WORLD_CHUNK_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[tuple[str, int], ChunkIndex] = OrderedDict()
+
+    def get(self, world_id: str, version: int) -> Optional[ChunkIndex]:
+        with self._lock:
+            index = self._indexes.get((world_id, version))
+            if index is not None:
+                self._indexes.move_to_end((world_id, version))
+            return index
+
+    def put(self, world_id: str, version: int, index: ChunkIndex):
+        with self._lock:
+            # 같은 월드의 이전 버전은 더 이상 쓰지 않음
+            for key in [key for key in self._indexes if key[0] == world_id]:
+                del self._indexes[key]
+            self._indexes[(world_id, version)] = index
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+
+
+def parse_if_none_match(header: Optional[str]) -> set[str]:
+    """If-None-Match 헤더의 ETag 목록 (약한 ETag 접두어 W/는 무시)"""
+    if not header:
+        return set()
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+# 프로세스 전역 캐시
+chunk_cache = ChunkCache()
@@ -0,0 +1,332 @@
+"""
+월드 증분 검증
+엔티티 AABB를 x/z 균등 격자(dict)에 보관해 두고, JSON Patch로 바뀐 엔티티만 방/시작 위치/이웃 엔티티와
+다시 검사합니다. 엔티티 하나를 옮기는 patch의 검증 비용은 월드 크기와 무관합니다.
+방 크기나 엔티티 목록 전체를 바꾸는 patch는 전체 검증으로 처리합니다.
+"""
+
+from types import SimpleNamespace
+from typing import Callable, Optional
+
+import numpy as np
+from pydantic import TypeAdapter, ValidationError
+
+from shared.types.world_spec import WorldSpec, Entity, Vector3, Zone, ValidationResult
+from services.json_patch import JsonPatchError, apply_operation, parse_pointer, rollback
+from services.world_validator import (
+    OVERLAP_EPSILON,
+    GRID_CELL_FACTOR,
+    LARGE_ENTITY_CELLS,
+    MAX_ISSUES,
+    EntityBounds,
+    glb_local_bounds,
+    room_bounds,
+    validate_world,
+    _player_box,
+    _zone_issues,
+)
+
+
+_ENTITY = TypeAdapter(Entity)
+_VECTOR3 = TypeAdapter(Vector3)
+_ZONES = TypeAdapter(Optional[list[Zone]])
+
+# 이름/버전처럼 다른 검사와 무관한 최상위 필드
+_PLAIN_FIELDS = ("name", "version")
+
+
+def _reject_instanced(entities):
+    """저장된 월드에는 인스턴스 그룹을 두지 않음 (전달용 형식 - services.world_instancing)"""
+    for entity in entities:
+        if entity.asset_type == "instanced":
+            raise JsonPatchError(f"Entity '{entity.id}': instanced groups are a delivery format; patch individual entities instead")
+
+
+class _Box:
+    """격자에 들어 있는 엔티티 하나의 AABB"""
+
+    __slots__ = ("low", "high", "solid", "structure", "cells")
+
+    def __init__(self, low: np.ndarray, high: np.ndarray, solid: bool, structure: bool):
+        self.low = low
+        self.high = high
+        self.solid = solid
+        self.structure = structure
+        self.cells: Optional[list[tuple[int, int]]] = None  # None이면 격자 대신 large 목록
+
+
+class DeltaIndex:
+    """월드 하나의 엔티티 AABB 격자 (엔티티 ID 기준, ID는 월드 안에서 유일해야 함)"""
+
+    def __init__(self, spec: dict, bounds_resolver: Callable = glb_local_bounds):
+        self.bounds_resolver = bounds_resolver
+        self._build(WorldSpec.model_validate(spec))
+
+    def _build(self, model: WorldSpec):
+        bounds = EntityBounds(model, self.bounds_resolver)
+        footprint = (bounds.maxs - bounds.mins)[:, [0, 2]].max(axis=1) if len(bounds) else np.ones(1)
+        self.cell_size = max(float(np.median(footprint)) * GRID_CELL_FACTOR, 0.5)
+        self.room_min, self.room_max = room_bounds(model)
+        self.spawnpoint = tuple(model.spawnpoint)
+        self.boxes: dict[str, _Box] = {}
+        self.grid: dict[tuple[int, int], set[str]] = {}
+        self.large: set[str] = set()
+        for i, entity_id in enumerate(bounds.ids):
+            self._insert(entity_id, _Box(bounds.mins[i], bounds.maxs[i], bool(bounds.solid[i]), bool(bounds.structure[i])))
+
+    # ------------------------------------------------------------------
+    # 격자
+    # ------------------------------------------------------------------
+
+    def _cells(self, low: np.ndarray, high: np.ndarray) -> Optional[list[tuple[int, int]]]:
+        x0, z0 = np.floor(low[[0, 2]] / self.cell_size).astype(int)
+        x1, z1 = np.floor(high[[0, 2]] / self.cell_size).astype(int)
+        if (x1 - x0 + 1) * (z1 - z0 + 1) > LARGE_ENTITY_CELLS:
+            return None
+        return [(x, z) for x in range(x0, x1 + 1) for z in range(z0, z1 + 1)]
+
+    def _insert(self, entity_id: str, box: _Box):
+        box.cells = self._cells(box.low, box.high)
+        if box.cells is None:
+            self.large.add(entity_id)
+        else:
+            for cell in box.cells:
+                self.grid.setdefault(cell, set()).add(entity_id)
+        self.boxes[entity_id] = box
+
+    def _discard(self, entity_id: str):
+        box = self.boxes.pop(entity_id, None)
+        if box is None:
+            return
+        if box.cells is None:
+            self.large.discard(entity_id)
+        else:
+            for cell in box.cells:
+                members = self.grid[cell]
+                members.discard(entity_id)
+                if not members:
+                    del self.grid[cell]
+
+    def neighbours(self, low: np.ndarray, high: np.ndarray) -> set[str]:
+        """AABB와 같은 칸에 있는 엔티티 ID (큰 엔티티 포함, 실제 겹침은 따로 확인)"""
+        cells = self._cells(low, high)
+        if cells is None:
+            return set(self.boxes)
+        found = set(self.large)
+        for cell in cells:
+            found |= self.grid.get(cell, set())
+        return found
+
+    def refresh(self, entities: list[dict]):
+        """엔티티 내용이 patch 밖에서 바뀌었을 때 (생성 작업 완료 등) 해당 AABB만 갱신"""
+        models = [_ENTITY.validate_python(entity) for entity in entities]
+        bounds = EntityBounds(models, self.bounds_resolver)
+        for i, entity_id in enumerate(bounds.ids):
+            self._discard(entity_id)
+            self._insert(entity_id, _Box(bounds.mins[i], bounds.maxs[i], bool(bounds.solid[i]), bool(bounds.structure[i])))
+
+    # ------------------------------------------------------------------
+    # patch
+    # ------------------------------------------------------------------
+
+    def apply(self, spec: dict, operations: list[dict]) -> dict:
+        """
+        patch를 spec에 제자리 적용하고 바뀐 부분만 다시 검증
+
+        Returns:
+            {"validation": ValidationResult, "touched": [ID], "removed": [ID], "full": 전체 검증 여부}
+
+        Raises:
+            JsonPatchError: 잘못된 patch, 스키마에 맞지 않는 결과, 중복 엔티티 ID (spec은 원래대로 되돌려짐)
+        """
+        if not isinstance(operations, list):
+            raise JsonPatchError("Patch must be an array of operations")
+        undo: list[Callable] = []
+        tracked: dict[int, list] = {}  # id(엔티티 dict) → [dict, patch 전 ID, 남아 있는지]
+        scope = {"full": False, "zones": False, "spawnpoint": False, "plain": False}
+        try:
+            for operation in operations:
+                self._apply_tracked(spec, operation, undo, tracked, scope)
+            if scope["full"]:
+                return self._apply_full(spec)
+            return self._apply_delta(spec, tracked, scope)
+        except (JsonPatchError, ValidationError) as e:
+            rollback(undo)
+            if isinstance(e, ValidationError):
+                raise JsonPatchError(f"Patched world is not a valid WorldSpec: {e}") from None
+            raise
+
+    def _apply_tracked(self, spec: dict, operation: dict, undo: list, tracked: dict, scope: dict):
+        """연산 하나를 적용하며 어떤 엔티티/필드가 바뀌었는지 기록"""
+        if not isinstance(operation, dict):
+            raise JsonPatchError(f"Invalid operation {operation!r}")
+        op = operation.get("op")
+        targets = []  # (토큰, 제거 쪽인지)
+        if "from" in operation and op in ("move", "copy"):
+            targets.append((parse_pointer(operation["from"]), op == "move"))
+        if "path" in operation and op != "test":
+            targets.append((parse_pointer(operation["path"]), op == "remove"))
+
+        entity_targets = []
+        for tokens, removing in targets:
+            if not tokens or tokens[0] not in ("entities", "zones", "spawnpoint", *_PLAIN_FIELDS) or tokens == ["entities"]:
+                scope["full"] = True
+            elif tokens[0] in ("zones", "spawnpoint"):
+                scope[tokens[0]] = True
+            elif tokens[0] in _PLAIN_FIELDS:
+                scope["plain"] = True
+            elif tokens[0] == "entities" and not scope["full"]:
+                # 목록에 끼워 넣는 경우 기존 엔티티는 밀리기만 하므로 제외
+                inserting = op in ("add", "copy", "move") and not removing and len(tokens) == 2
+                before = None if inserting else self._entity_at(spec, tokens[1])
+                if before is not None:
+                    self._track(tracked, before, present=not (removing and len(tokens) == 2))
+                # 교체는 기존 엔티티를 지우고 새 엔티티를 넣음
+                if op == "replace" and len(tokens) == 2 and before is not None:
+                    tracked[id(before)][2] = False
+                entity_targets.append((tokens, removing))
+
+        apply_operation(spec, operation, undo)
+
+        for tokens, removing in entity_targets:
+            if removing and len(tokens) == 2:
+                continue
+            index = len(spec["entities"]) - 1 if tokens[1] == "-" else tokens[1]
+            after = self._entity_at(spec, str(index))
+            if after is not None:
+                # 처음 보는 dict는 새로 들어온 엔티티 (patch 전 ID 없음)
+                self._track(tracked, after, present=True, new=True)
+
+    @staticmethod
+    def _entity_at(spec: dict, token: str) -> Optional[dict]:
+        entities = spec.get("entities")
+        if isinstance(entities, list) and token.isdigit() and int(token) < len(entities):
+            return entities[int(token)]
+        return None
+
+    @staticmethod
+    def _track(tracked: dict, entity, present: bool, new: bool = False):
+        if id(entity) not in tracked:
+            old_id = entity.get("id") if isinstance(entity, dict) and not new else None
+            tracked[id(entity)] = [entity, old_id, present]
+        else:
+            tracked[id(entity)][2] = present
+
+    def _apply_full(self, spec: dict) -> dict:
+        """방 크기/엔티티 목록 전체가 바뀐 경우 - 전체 검증 후 격자 재구성"""
+        model = WorldSpec.model_validate(spec)
+        _reject_instanced(model.entities)
+        ids = [entity.id for entity in model.entities]
+        if len(set(ids)) != len(ids):
+            raise JsonPatchError("Patched world has duplicate entity ids")
+        self._normalize(spec, model)
+        self._build(model)
+        result = validate_world(model, auto_fix=False, bounds_resolver=self.bounds_resolver)
+        return {"validation": result, "touched": ids, "removed": [], "full": True}
+
+    @staticmethod
+    def _normalize(spec: dict, model: WorldSpec):
+        """저장 형식을 WorldSpec JSON 덤프로 맞춤"""
+        spec.clear()
+        spec.update(model.model_dump(mode="json", by_alias=True, exclude_none=True))
+
+    def _apply_delta(self, spec: dict, tracked: dict, scope: dict) -> dict:
+        errors: list[str] = []
+        warnings: list[str] = []
+
+        # 바뀐 엔티티만 스키마 검증 (실패하면 patch를 되돌려야 하므로 정규화는 모든 검증 뒤에)
+        old_ids = {item[1] for item in tracked.values() if isinstance(item[1], str) and item[1] in self.boxes}
+        present = [item[0] for item in tracked.values() if item[2]]
+        models = []
+        for entity in present:
+            if not isinstance(entity, dict):
+                raise JsonPatchError(f"Invalid entity {entity!r}")
+            try:
+                models.append(_ENTITY.validate_python(entity))
+            except ValidationError as e:
+                raise JsonPatchError(f"Invalid entity '{entity.get('id')}': {e}") from None
+        _reject_instanced(models)
+
+        new_ids = [model.id for model in models]
+        duplicates = sorted({
+            entity_id for entity_id in new_ids
+            if (entity_id in self.boxes and entity_id not in old_ids) or new_ids.count(entity_id) > 1
+        })
+        if duplicates:
+            raise JsonPatchError(f"Duplicate entity ids: {', '.join(duplicates[:10])}")
+
+        if scope["plain"] and not all(isinstance(spec.get(field), str) for field in _PLAIN_FIELDS):
+            raise JsonPatchError(f"{' and '.join(_PLAIN_FIELDS)} must be strings")
+        spawnpoint = tuple(_VECTOR3.validate_python(spec.get("spawnpoint"))) if scope["spawnpoint"] else None
+        zones = _ZONES.validate_python(spec.get("zones")) if scope["zones"] else None
+
+        # 검증 통과 - 같은 dict 객체를 WorldSpec JSON 덤프로 정규화해 목록 위치는 그대로 둠
+        for entity, model in zip(present, models):
+            entity.clear()
+            entity.update(model.model_dump(mode="json", by_alias=True, exclude_none=True))
+        if scope["spawnpoint"]:
+            self.spawnpoint = spawnpoint
+            spec["spawnpoint"] = list(spawnpoint)
+        if scope["zones"]:
+            if zones is None:
+                spec.pop("zones", None)
+            else:
+                spec["zones"] = [zone.model_dump(mode="json") for zone in zones]
+            _zone_issues(SimpleNamespace(zones=zones), self.room_min, self.room_max, errors, warnings)
+
+        # 격자 갱신 후 바뀐 엔티티와 이웃만 검사
+        for entity_id in old_ids:
+            self._discard(entity_id)
+        bounds = EntityBounds(models, self.bounds_resolver)
+        for i, entity_id in enumerate(bounds.ids):
+            self._insert(entity_id, _Box(bounds.mins[i], bounds.maxs[i], bool(bounds.solid[i]), bool(bounds.structure[i])))
+        self._check_entities(new_ids, errors, warnings)
+        if scope["spawnpoint"] or models:
+            self._check_spawnpoint(None if scope["spawnpoint"] else set(new_ids), errors)
+
+        removed = sorted(old_ids - set(new_ids))
+        return {
+            "validation": ValidationResult(valid=not errors, errors=errors[:MAX_ISSUES], warnings=warnings[:MAX_ISSUES]),
+            "touched": new_ids,
+            "removed": removed,
+            "full": False,
+        }
+
+    def _check_entities(self, entity_ids: list[str], errors: list[str], warnings: list[str]):
+        """방 밖/겹침 검사 (바뀐 엔티티끼리의 쌍은 한 번만 보고)"""
+        reported = set()
+        for entity_id in entity_ids:
+            box = self.boxes[entity_id]
+            extent = box.high - box.low
+            if np.any(extent > (self.room_max - self.room_min) + OVERLAP_EPSILON):
+                warnings.append(f"entity '{entity_id}': larger than the room")
+            if np.any(box.low < self.room_min - OVERLAP_EPSILON) or np.any(box.high > self.room_max + OVERLAP_EPSILON):
+                errors.append(f"entity '{entity_id}': extends outside the room")
+            if not box.solid:
+                continue
+            for other_id in sorted(self.neighbours(box.low, box.high) - {entity_id}):
+                other = self.boxes[other_id]
+                pair = tuple(sorted((entity_id, other_id)))
+                if not other.solid or pair in reported:
+                    continue
+                depth = np.minimum(box.high, other.high) - np.maximum(box.low, other.low)
+                if np.all(depth > OVERLAP_EPSILON):
+                    reported.add(pair)
+                    if box.structure or other.structure:
+                        structure, moved = (entity_id, other_id) if box.structure else (other_id, entity_id)
+                        warnings.append(f"entity '{moved}' intersects structure '{structure}'")
+                    else:
+                        errors.append(f"entity '{entity_id}' overlaps entity '{other_id}'")
+
+    def _check_spawnpoint(self, entity_ids: Optional[set[str]], errors: list[str]):
+        """시작 위치가 방 밖이거나 막혔는지 (entity_ids가 있으면 그 엔티티에 막혔는지만)"""
+        spawn = np.array(self.spawnpoint, float)
+        if entity_ids is None and (np.any(spawn < self.room_min) or np.any(spawn > self.room_max)):
+            errors.append("spawnpoint is outside the room")
+        low, high = _player_box(self.spawnpoint)
+        candidates = self.neighbours(low, high) if entity_ids is None else entity_ids
+        for entity_id in sorted(candidates):
+            box = self.boxes[entity_id]
+            if box.solid and np.all(np.minimum(box.high, high) - np.maximum(box.low, low) > OVERLAP_EPSILON):
+                errors.append(f"spawnpoint is inside entity '{entity_id}'")
+                return
@@ -0,0 +1,118 @@
+"""
+월드 인스턴싱 패스
+같은 에셋을 반복하는 엔티티(같은 GLB src, 또는 같은 primitive/size/color)를 InstancedEntity 하나로 묶습니다.
+그룹은 공유 template과 인스턴스 변환을 stride개씩 이어 붙인 transforms 배열만 가지므로
+JSON이 작아지고, 클라이언트는 그룹마다 InstancedMesh 하나(GLB는 메시마다 하나)로 그려 draw call이
+인스턴스 수와 무관해집니다.
+
+- 저장된 월드는 그대로 두고 전달할 때만 적용 (GET /api/worlds/{id}?instanced=true)
+- 묶지 않는 것: 스플랫, LOD가 있는 GLB(인스턴스별 LOD 전환 불가), 애니메이션/스키닝/모프 GLB
+- name/role까지 같아야 같은 그룹 - expand_instances(shared/types/world_instances.py)로 원래 엔티티를 그대로 복원할 수 있음
+  (없던 rotation/scale은 stride를 맞추려 넣은 항등값이므로 복원할 때 다시 뺌)
+- 그룹은 첫 번째 인스턴스 자리에 들어가고 나머지 엔티티 순서는 유지
+"""
+
+import os
+from typing import Optional
+
+from shared.types.world_instances import IDENTITY_TRANSFORM
+from services.asset_metadata import asset_metadata
+from services.world_builder import LIBRARY_SRC_PREFIX
+
+
+# 이보다 적게 반복되는 에셋은 묶지 않음
+INSTANCE_MIN_COUNT = int(os.environ.get("INSTANCE_MIN_COUNT", "4"))
+
+
+def _static_glb(src: str) -> bool:
+    """인스턴싱해도 되는 GLB인지 - 애니메이션/스키닝/모프가 있는 라이브러리 에셋은 제외"""
+    if not src.lstrip("/").startswith(LIBRARY_SRC_PREFIX):
+        return True  # 생성 모델은 정적 메시
+    asset = asset_metadata.get(src.lstrip("/")[len(LIBRARY_SRC_PREFIX):])
+    return not asset or not (asset.get("animated") or asset.get("skinned") or asset.get("morph_targets"))
+
+
+def _template(entity: dict) -> Optional[dict]:
+    """엔티티 → 공유 template (묶을 수 없으면 None)"""
+    if entity["assetType"] == "primitive":
+        fields = ("assetType", "primitive", "size", "color", "role")
+    elif entity["assetType"] == "glb" and not entity.get("lods") and _static_glb(entity["src"]):
+        fields = ("assetType", "src", "role")
+    else:
+        return None
+    return {field: entity[field] for field in fields if entity.get(field) is not None}
+
+
+def _group_key(template: dict, entity: dict) -> tuple:
+    return tuple((key, tuple(value) if isinstance(value, list) else value) for key, value in template.items()) + (
+        ("name", entity.get("name")),
+    )
+
+
+def instance_world(spec: dict, min_count: int = INSTANCE_MIN_COUNT) -> dict:
+    """
+    반복되는 엔티티를 InstancedEntity로 묶은 새 월드 dict (WorldSpec JSON, alias 기준)
+
+    Args:
+        spec: 엔티티 dict가 WorldSpec JSON 덤프 형태인 월드 (입력은 바꾸지 않음)
+        min_count: 그룹으로 묶을 최소 반복 수
+    """
+    entities = spec["entities"]
+    templates = {}
+    groups: dict[tuple, list[int]] = {}
+    for i, entity in enumerate(entities):
+        template = _template(entity)
+        if template is not None:
+            key = _group_key(template, entity)
+            templates.setdefault(key, template)
+            groups.setdefault(key, []).append(i)
+
+    used_ids = {entity["id"] for entity in entities}
+    grouped: dict[int, dict] = {}  # 첫 인스턴스 인덱스 → 그룹
+    members: set[int] = set()
+    for key, indices in groups.items():
+        if len(indices) < max(min_count, 2):
+            continue
+        group_id = f"{entities[indices[0]]['id']}__instances"
+        while group_id in used_ids:
+            group_id += "_"
+        used_ids.add(group_id)
+        grouped[indices[0]] = _group(group_id, templates[key], [entities[i] for i in indices])
+        members.update(indices)
+
+    compiled = []
+    for i, entity in enumerate(entities):
+        if i in grouped:
+            compiled.append(grouped[i])
+        elif i not in members:
+            compiled.append(entity)
+    return {**spec, "entities": compiled}
+
+
+def _group(group_id: str, template: dict, entities: list[dict]) -> dict:
+    """같은 template 엔티티들 → InstancedEntity dict (그룹 원점은 월드 원점)"""
+    if any(entity.get("scale") is not None for entity in entities):
+        stride = 9
+    elif any(entity.get("rotation") is not None for entity in entities):
+        stride = 6
+    else:
+        stride = 3
+    fields = ("position", "rotation", "scale")[:stride // 3]
+    transforms = []
+    for entity in entities:
+        for field in fields:
+            value = entity.get(field)
+            transforms.extend(IDENTITY_TRANSFORM[field] if value is None else value)
+
+    group = {"id": group_id}
+    if entities[0].get("name") is not None:
+        group["name"] = entities[0]["name"]
+    group.update({
+        "position": [0.0, 0.0, 0.0],
+        "assetType": "instanced",
+        "template": template,
+        "stride": stride,
+        "transforms": transforms,
+        "instanceIds": [entity["id"] for entity in entities],
+    })
+    return group
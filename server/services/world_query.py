@@ -0,0 +1,280 @@
+"""
+월드 공간 질의
+엔티티/zone AABB를 Hilbert 곡선 순서로 묶은 R-tree(정적, 한 번에 구성)에 넣어
+"이 점은 어느 zone인가", "zone X 안의 엔티티", "가장 가까운 role Y 엔티티"를 선형 탐색 없이 답합니다.
+
+- point / box / radius / nearest(k) 질의, role/assetType 필터 (노드별 tags로 맞는 항목이 없는 하위 트리는 건너뜀)
+- 노드는 연속 구간이라 (레벨, 인덱스)만으로 자식 범위가 정해지며 레벨 단위로 numpy 벡터 연산
+- 월드 한 버전에 대한 인덱스 (월드가 바뀌면 다시 구성)
+
+좌표계: 방 중심이 x/z = 0, 바닥이 y = 0
+"""
+
+import os
+import heapq
+from typing import Callable, Iterable, Optional, Union
+
+import numpy as np
+
+from shared.types.world_spec import WorldSpec
+from shared.types.world_instances import expand_instances
+from services.world_chunks import ChunkCache
+from services.world_validator import EntityBounds, glb_local_bounds
+
+
+# R-tree 노드 하나의 자식 수
+QUERY_NODE_CAPACITY = int(os.environ.get("QUERY_NODE_CAPACITY", "16"))
+# 질의 인덱스를 보관할 (월드, 버전) 수
+WORLD_QUERY_CACHE_SIZE = int(os.environ.get("WORLD_QUERY_CACHE_SIZE", "64"))
+
+# Hilbert 곡선 좌표 비트 수 (x/z 각각)
+_HILBERT_BITS = 16
+
+ROLES = ("character", "prop", "structure")
+ASSET_TYPES = ("primitive", "glb", "splat")
+# tags에서 assetType 비트 시작 위치 (앞쪽은 role 없음 + ROLES)
+_ASSET_TYPE_BIT = len(ROLES) + 1
+
+
+def hilbert_keys(points: np.ndarray, bits: int = _HILBERT_BITS) -> np.ndarray:
+    """(n, 2) 좌표 → Hilbert 곡선 위 순서 (가까운 점이 가까운 순서를 갖도록 정렬할 때 사용)"""
+    n = 1 << bits
+    low, high = points.min(axis=0), points.max(axis=0)
+    span = np.where(high > low, high - low, 1.0)
+    x, y = ((points - low) / span * (n - 1)).astype(np.int64).T
+    keys = np.zeros(len(points), np.int64)
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        keys += s * s * ((3 * rx) ^ ry)
+        # 사분면 회전
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return keys
+
+
+class RTree:
+    """
+    AABB 정적 R-tree (Hilbert packed)
+
+    levels[0]은 정렬된 항목, levels[-1]은 루트. 레벨 L의 노드 k는 레벨 L-1의
+    [k * capacity, (k + 1) * capacity) 구간을 감쌉니다.
+    노드마다 하위 항목 tags(비트마스크)의 OR를 두어, 필터(masks)에 맞는 항목이 없는 노드는 내려가지 않습니다.
+    """
+
+    def __init__(self, mins: np.ndarray, maxs: np.ndarray, tags: Optional[np.ndarray] = None,
+                 capacity: int = QUERY_NODE_CAPACITY):
+        self.capacity = capacity
+        count = len(mins)
+        if count:
+            self.order = np.argsort(hilbert_keys(((mins + maxs) / 2)[:, [0, 2]]), kind="stable")
+        else:
+            self.order = np.zeros(0, np.int64)
+        tags = np.zeros(count, np.int64) if tags is None else np.asarray(tags, np.int64)
+        self.levels = [(mins[self.order], maxs[self.order], tags[self.order])]
+        while len(self.levels[-1][0]) > 1:
+            low, high, tag = self.levels[-1]
+            starts = np.arange(0, len(low), capacity)
+            self.levels.append((
+                np.minimum.reduceat(low, starts),
+                np.maximum.reduceat(high, starts),
+                np.bitwise_or.reduceat(tag, starts),
+            ))
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def _children(self, level: int, nodes: np.ndarray) -> np.ndarray:
+        children = (nodes[:, None] * self.capacity + np.arange(self.capacity)).ravel()
+        return children[children < len(self.levels[level - 1][0])]
+
+    @staticmethod
+    def _matches(tags: np.ndarray, masks: tuple[int, ...]) -> np.ndarray:
+        """masks 각각과 한 비트 이상 겹치는지"""
+        keep = np.ones(len(tags), bool)
+        for mask in masks:
+            keep &= (tags & mask) != 0
+        return keep
+
+    def search(self, low, high, masks: tuple[int, ...] = ()) -> np.ndarray:
+        """AABB [low, high]와 닿거나 겹치는 항목 (원래 인덱스)"""
+        if not len(self):
+            return np.zeros(0, np.int64)
+        low, high = np.asarray(low, np.float64), np.asarray(high, np.float64)
+        nodes = np.arange(len(self.levels[-1][0]))
+        for level in range(len(self.levels) - 1, -1, -1):
+            node_min, node_max, node_tags = self.levels[level]
+            hit = np.all(node_min[nodes] <= high, axis=1) & np.all(node_max[nodes] >= low, axis=1)
+            if masks:
+                hit &= self._matches(node_tags[nodes], masks)
+            nodes = nodes[hit]
+            if level == 0 or not len(nodes):
+                break
+            nodes = self._children(level, nodes)
+        return self.order[nodes] if len(nodes) else np.zeros(0, np.int64)
+
+    def nearest(self, point, k: int, masks: tuple[int, ...] = (),
+                max_distance: float = np.inf) -> list[tuple[int, float]]:
+        """
+        점에서 가까운 항목 k개 [(원래 인덱스, AABB까지 거리)] - 가까운 순
+
+        노드를 AABB까지 최소 거리 순으로 펼치는 best-first 탐색입니다.
+        """
+        if not len(self) or k <= 0:
+            return []
+        point = np.asarray(point, np.float64)
+        top = len(self.levels) - 1
+        root_min, root_max, root_tags = self.levels[top]
+        if not self._matches(root_tags, masks)[0]:
+            return []
+        heap = [(float(_box_distance(point, root_min, root_max)[0]), top, 0)]
+        found = []
+        while heap and len(found) < k:
+            distance, level, node = heapq.heappop(heap)
+            if distance > max_distance:
+                break
+            if level == 0:
+                found.append((int(self.order[node]), distance))
+                continue
+            children = self._children(level, np.array([node]))
+            node_min, node_max, node_tags = self.levels[level - 1]
+            if masks:
+                children = children[self._matches(node_tags[children], masks)]
+            distances = _box_distance(point, node_min[children], node_max[children])
+            for child, child_distance in zip(children.tolist(), distances.tolist()):
+                heapq.heappush(heap, (child_distance, level - 1, child))
+        return found
+
+
+def _box_distance(point: np.ndarray, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+    """점에서 AABB까지 거리 (안에 있으면 0)"""
+    gap = np.maximum(np.maximum(mins - point, point - maxs), 0.0)
+    return np.sqrt((gap ** 2).sum(axis=1))
+
+
+class WorldQuery:
+    """월드 한 버전의 엔티티/zone 공간 인덱스 (InstancedEntity 그룹은 인스턴스별 엔티티로 펼쳐서 색인)"""
+
+    def __init__(self, spec: Union[WorldSpec, dict], bounds_resolver: Callable = glb_local_bounds):
+        model = spec if isinstance(spec, WorldSpec) else WorldSpec.model_validate(spec)
+        if any(entity.asset_type == "instanced" for entity in model.entities):
+            model = WorldSpec.model_validate(expand_instances(model.model_dump(mode="json", by_alias=True, exclude_none=True)))
+        bounds = EntityBounds(model, bounds_resolver)
+        self.spawnpoint = list(model.spawnpoint)
+        self.ids = bounds.ids
+        self.mins, self.maxs = bounds.mins, bounds.maxs
+        # 필터용 코드 (role 없음 = -1)
+        self.roles = np.array([ROLES.index(getattr(e, "role", None)) if getattr(e, "role", None) else -1
+                               for e in model.entities], np.int8)
+        self.asset_types = np.array([ASSET_TYPES.index(e.asset_type) for e in model.entities], np.int8)
+        # 엔티티마다 role 비트 하나(0번은 role 없음) + assetType 비트 하나
+        tags = (1 << (self.roles.astype(np.int64) + 1)) | (1 << (self.asset_types.astype(np.int64) + _ASSET_TYPE_BIT))
+        self.entities = RTree(self.mins, self.maxs, tags)
+        self._slots: dict[str, int] = {}
+        for i, entity_id in enumerate(self.ids):
+            self._slots.setdefault(entity_id, i)
+
+        zones = model.zones or []
+        self.zone_ids = [zone.id for zone in zones]
+        zone_bounds = np.array([zone.bounds for zone in zones], np.float64).reshape(-1, 2, 3)
+        # 뒤집힌 bounds도 같은 상자로 취급
+        self.zone_mins, self.zone_maxs = zone_bounds.min(axis=1), zone_bounds.max(axis=1)
+        self.zones = RTree(self.zone_mins, self.zone_maxs)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    # ------------------------------------------------------------------
+    # 필터
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _masks(roles: Optional[Iterable[str]], asset_types: Optional[Iterable[str]]) -> tuple[int, ...]:
+        """role/assetType 필터 → R-tree tags 마스크 (지정한 값 중 하나와 맞아야 함)"""
+        masks = []
+        for values, names, offset in ((roles, ROLES, 1), (asset_types, ASSET_TYPES, _ASSET_TYPE_BIT)):
+            if not values:
+                continue
+            unknown = set(values) - set(names)
+            if unknown:
+                raise ValueError(f"Unknown filter value(s): {', '.join(sorted(unknown))}")
+            masks.append(sum(1 << (names.index(value) + offset) for value in set(values)))
+        return tuple(masks)
+
+    def _search(self, low, high, roles, asset_types) -> np.ndarray:
+        return np.sort(self.entities.search(low, high, self._masks(roles, asset_types)))
+
+    # ------------------------------------------------------------------
+    # 엔티티 질의
+    # ------------------------------------------------------------------
+
+    def point(self, point, roles=None, asset_types=None) -> list[str]:
+        """AABB가 점을 포함하는 엔티티 ID (entities 순서)"""
+        indices = self._search(point, point, roles, asset_types)
+        return [self.ids[i] for i in indices.tolist()]
+
+    def box(self, low, high, roles=None, asset_types=None, within: bool = False) -> list[str]:
+        """상자와 겹치는 (within이면 상자 안에 완전히 들어간) 엔티티 ID"""
+        low, high = np.minimum(low, high), np.maximum(low, high)
+        indices = self._search(low, high, roles, asset_types)
+        if within:
+            inside = np.all(self.mins[indices] >= low, axis=1) & np.all(self.maxs[indices] <= high, axis=1)
+            indices = indices[inside]
+        return [self.ids[i] for i in indices.tolist()]
+
+    def radius(self, center, radius: float, roles=None, asset_types=None) -> list[tuple[str, float]]:
+        """AABB가 반경 안에 걸치는 엔티티 [(ID, 거리)] - 가까운 순"""
+        center = np.asarray(center, np.float64)
+        indices = self._search(center - radius, center + radius, roles, asset_types)
+        distances = _box_distance(center, self.mins[indices], self.maxs[indices])
+        keep = distances <= radius
+        indices, distances = indices[keep], distances[keep]
+        order = np.argsort(distances, kind="stable")
+        return [(self.ids[i], float(d)) for i, d in zip(indices[order].tolist(), distances[order].tolist())]
+
+    def nearest(self, point, k: int = 1, roles=None, asset_types=None,
+                max_distance: float = np.inf) -> list[tuple[str, float]]:
+        """가장 가까운 엔티티 k개 [(ID, AABB까지 거리)] - 가까운 순"""
+        masks = self._masks(roles, asset_types)
+        return [(self.ids[i], d) for i, d in self.entities.nearest(point, k, masks, max_distance)]
+
+    def in_zone(self, zone_id: str, roles=None, asset_types=None, within: bool = False) -> list[str]:
+        """zone과 겹치는 (within이면 zone 안에 완전히 들어간) 엔티티 ID (없는 zone이면 KeyError)"""
+        if zone_id not in self.zone_ids:
+            raise KeyError(zone_id)
+        i = self.zone_ids.index(zone_id)
+        return self.box(self.zone_mins[i], self.zone_maxs[i], roles, asset_types, within)
+
+    # ------------------------------------------------------------------
+    # zone 질의
+    # ------------------------------------------------------------------
+
+    def zones_at(self, point) -> list[str]:
+        """점을 포함하는 zone ID (zones 순서)"""
+        return [self.zone_ids[i] for i in np.sort(self.zones.search(point, point)).tolist()]
+
+    def zones_in_box(self, low, high) -> list[str]:
+        """상자와 겹치는 zone ID"""
+        low, high = np.minimum(low, high), np.maximum(low, high)
+        return [self.zone_ids[i] for i in np.sort(self.zones.search(low, high)).tolist()]
+
+    # ------------------------------------------------------------------
+
+    def describe(self, entity_id: str) -> dict:
+        """엔티티 요약 {"id", "index", "assetType", "role", "bounds"} (JSON Patch 경로에 index 사용)"""
+        i = self._slots[entity_id]
+        return {
+            "id": entity_id,
+            "index": i,
+            "assetType": ASSET_TYPES[self.asset_types[i]],
+            "role": ROLES[self.roles[i]] if self.roles[i] >= 0 else None,
+            "bounds": [self.mins[i].tolist(), self.maxs[i].tolist()],
+        }
+
+
+# 프로세스 전역 캐시 ((월드, 버전) LRU는 청크 인덱스와 같은 구현)
+query_cache = ChunkCache(WORLD_QUERY_CACHE_SIZE)
@@ -0,0 +1,193 @@
+"""
+월드 저장소
+생성된 WorldSpec과 아직 생성 중인 오브젝트(작업 ID → 엔티티 ID)를 보관합니다.
+생성 작업이 끝나면 해당 작업을 기다리던 모든 월드의 자리표시 엔티티를 GLB 엔티티로 교체합니다.
+JSON Patch 편집은 버전을 확인한 뒤 바뀐 엔티티만 다시 검증합니다.
+월드는 프로세스 메모리에만 있으므로 API 프로세스가 여러 개면 월드 요청은 만든 프로세스로 보내야 합니다.
+"""
+
+import os
+import copy
+import time
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from services.world_builder import placeholder_scale
+from services.world_delta import DeltaIndex
+
+
+# 보관할 최대 월드 수 (초과 시 오래된 월드부터 정리)
+WORLD_MAX_COUNT = int(os.environ.get("WORLD_MAX_COUNT", "1000"))
+
+
+class WorldVersionConflict(Exception):
+    """If-Match 버전이 현재 월드 버전과 다름"""
+
+    def __init__(self, version: int):
+        super().__init__(f"World is at version {version}")
+        self.version = version
+
+
+class WorldRepository:
+    """프로세스 내 인메모리 월드 저장소"""
+
+    def __init__(self, max_worlds: int = WORLD_MAX_COUNT):
+        self.max_worlds = max_worlds
+        self._lock = threading.Lock()
+        self._worlds: OrderedDict[str, dict] = OrderedDict()
+        self._job_worlds: dict[str, set[str]] = {}  # job_id → 기다리는 world_id
+        self._deltas: dict[str, DeltaIndex] = {}  # world_id → 증분 검증 격자 (월드를 만들 때 생성)
+
+    def create(self, world_id: str, spec: dict, pending: dict[str, dict], stats: dict) -> dict:
+        """
+        새 월드 저장
+
+        Args:
+            spec: WorldSpec (alias 기준 dict)
+            pending: {job_id: {"prompt", "entity_ids"}} - 생성 작업이 끝나면 교체할 엔티티
+            stats: 라이브러리/생성/캐시 집계
+        """
+        # 증분 검증 격자와 반환용 복사본은 lock 밖에서 준비 (spec이 아직 공유되기 전이라 다른 스레드가 바꿀 수 없음)
+        delta = DeltaIndex(spec)
+        now = time.time()
+        world = {
+            "world_id": world_id,
+            "spec": spec,
+            "version": 1,
+            "pending": {job_id: {**item, "status": "pending", "error": None} for job_id, item in pending.items()},
+            "stats": stats,
+            "created_at": now,
+            "updated_at": now,
+        }
+        snapshot = copy.deepcopy(world)
+        with self._lock:
+            self._worlds[world_id] = world
+            self._deltas[world_id] = delta
+            for job_id in pending:
+                self._job_worlds.setdefault(job_id, set()).add(world_id)
+            while len(self._worlds) > self.max_worlds:
+                evicted_id, evicted = self._worlds.popitem(last=False)
+                self._forget_jobs(evicted)
+                self._deltas.pop(evicted_id, None)
+        return snapshot
+
+    def get(self, world_id: str) -> Optional[dict]:
+        with self._lock:
+            world = self._worlds.get(world_id)
+            return copy.deepcopy(world) if world is not None else None
+
+    def version(self, world_id: str) -> Optional[int]:
+        """월드 버전만 조회 (스펙 복사 없음)"""
+        with self._lock:
+            world = self._worlds.get(world_id)
+            return world["version"] if world is not None else None
+
+    def complete_job(self, job_id: str, entity_fields: dict, floor_offset: float = 0.0) -> list[dict]:
+        """
+        작업 완료 반영 - 기다리던 엔티티를 GLB 엔티티로 교체
+
+        Args:
+            entity_fields: 엔티티에 덮어쓸 필드 ({"assetType": "glb", "src", "lods"} 등)
+            floor_offset: 자리표시 바닥 위치에서 모델 원점까지의 높이
+
+        Returns:
+            [{"world_id", "version", "pending": 아직 대기 중인 작업이 있는지, "entities": 교체된 엔티티 목록}]
+            (이미 반영된 작업이면 빈 목록)
+        """
+        results = []
+        with self._lock:
+            for world_id in sorted(self._job_worlds.pop(job_id, ())):
+                world = self._worlds.get(world_id)
+                item = world["pending"].get(job_id) if world else None
+                if item is None or item["status"] != "pending":
+                    continue
+                entity_ids = set(item["entity_ids"])
+                updated = []
+                for i, entity in enumerate(world["spec"]["entities"]):
+                    if entity["id"] in entity_ids:
+                        # 축소 배치된 자리표시면 모델도 같은 비율로 축소
+                        shrink = placeholder_scale(entity)
+                        if shrink != 1.0:
+                            entity = {**entity, "scale": [round(v * shrink, 4) for v in entity.get("scale", (1.0, 1.0, 1.0))]}
+                        # 자리표시 전용 필드(primitive/size/color)는 버리고 위치/이름/역할만 유지
+                        kept = {k: entity[k] for k in ("id", "name", "position", "rotation", "scale", "role") if k in entity}
+                        entity = {**kept, **entity_fields}
+                        x, y, z = entity["position"]
+                        entity["position"] = [x, round(y + floor_offset * entity.get("scale", (1.0, 1.0, 1.0))[1], 4), z]
+                        world["spec"]["entities"][i] = entity
+                        updated.append(copy.deepcopy(entity))
+                if updated:
+                    self._deltas[world_id].refresh(updated)
+                item["status"] = "completed"
+                world["version"] += 1
+                world["updated_at"] = time.time()
+                results.append({**self._state(world), "entities": updated})
+        return results
+
+    def patch(self, world_id: str, operations: list[dict], expected_version: Optional[int] = None) -> Optional[dict]:
+        """
+        JSON Patch 적용 - 바뀐 엔티티와 이웃만 다시 검증
+
+        Args:
+            expected_version: 지정하면 현재 버전과 같을 때만 적용 (동시 편집 충돌 방지)
+
+        Returns:
+            {"version", "validation", "touched", "removed", "full"} (월드가 없으면 None)
+
+        Raises:
+            WorldVersionConflict: expected_version이 현재 버전과 다름
+            JsonPatchError: 잘못된 patch (월드는 바뀌지 않음)
+        """
+        with self._lock:
+            world = self._worlds.get(world_id)
+            if world is None:
+                return None
+            if expected_version is not None and expected_version != world["version"]:
+                raise WorldVersionConflict(world["version"])
+            result = self._deltas[world_id].apply(world["spec"], operations)
+            if operations:
+                world["version"] += 1
+                world["updated_at"] = time.time()
+            return {"version": world["version"], **result}
+
+    def fail_job(self, job_id: str, error: str) -> list[dict]:
+        """작업 실패 반영 - 엔티티는 자리표시로 남김, 영향받은 월드의 [{"world_id", "version", "pending"}] 반환"""
+        results = []
+        with self._lock:
+            for world_id in sorted(self._job_worlds.pop(job_id, ())):
+                world = self._worlds.get(world_id)
+                item = world["pending"].get(job_id) if world else None
+                if item is None or item["status"] != "pending":
+                    continue
+                item.update(status="failed", error=error)
+                world["version"] += 1
+                world["updated_at"] = time.time()
+                results.append(self._state(world))
+        return results
+
+    @staticmethod
+    def _state(world: dict) -> dict:
+        """이벤트에 쓸 월드 상태 (스펙 복사 없음, lock 보유 상태에서 호출)"""
+        return {
+            "world_id": world["world_id"],
+            "version": world["version"],
+            "pending": any(item["status"] == "pending" for item in world["pending"].values()),
+        }
+
+    def _forget_jobs(self, world: dict):
+        """정리된 월드를 작업 대기 목록에서 제거 (lock 보유 상태에서 호출)"""
+        for job_id in world["pending"]:
+            waiting = self._job_worlds.get(job_id)
+            if waiting is not None:
+                waiting.discard(world["world_id"])
+                if not waiting:
+                    del self._job_worlds[job_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"worlds": len(self._worlds), "waiting_jobs": len(self._job_worlds)}
+
+
+# 프로세스 전역 저장소
+world_repository = WorldRepository()
@@ -0,0 +1,386 @@
+"""
+WorldSpec JSON Schema 검증기 (코드 생성)
+shared/schemas/world-spec.schema.json을 import 시점에 파이썬 함수 소스로 컴파일해 두고,
+파싱된 JSON(dict/list)을 pydantic 모델을 만들지 않고 한 번에 검사합니다.
+
+- 모든 오류를 (JSON Pointer, 메시지)로 모음 (첫 오류에서 멈추지 않음)
+- $ref/allOf는 컴파일 시 펼치고, 모든 분기가 같은 필드의 const로 구분되는 oneOf는
+  그 필드 값으로 분기 하나만 검사 (entities의 assetType)
+- 경로 문자열은 오류가 났을 때만 만듦
+- 지원하지 않는 키워드가 스키마에 들어오면 컴파일 단계에서 SchemaCompileError
+"""
+
+import re
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+WORLD_SCHEMA_PATH = PROJECT_ROOT / "shared" / "schemas" / "world-spec.schema.json"
+
+# 검사에 영향이 없는 키워드
+_ANNOTATIONS = {"$schema", "$id", "title", "description", "definitions", "$comment", "examples", "default"}
+_KEYWORDS = {
+    "$ref", "allOf", "oneOf", "anyOf", "type", "enum", "const",
+    "properties", "required", "additionalProperties",
+    "items", "minItems", "maxItems",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+    "minLength", "maxLength", "pattern",
+}
+
+# JSON 타입 → 생성 코드의 검사식 (bool은 int의 하위 타입이라 type()으로 정확히 비교)
+_TYPE_CHECKS = {
+    "object": "type({v}) is dict",
+    "array": "(type({v}) is list or type({v}) is tuple)",
+    "string": "type({v}) is str",
+    "number": "(type({v}) is float or type({v}) is int)",
+    "integer": "type({v}) is int",
+    "boolean": "type({v}) is bool",
+    "null": "{v} is None",
+}
+
+
+class SchemaCompileError(ValueError):
+    """컴파일할 수 없는 스키마 (지원하지 않는 키워드, 순환 $ref 등)"""
+
+
+def _pointer_token(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _child_path(path: str, suffix: str) -> str:
+    """경로 식 + 문자열 식 (루트면 접두어 생략)"""
+    return suffix if path == '""' else f"{path} + {suffix}"
+
+
+def _describe(values) -> str:
+    return ", ".join(json.dumps(value, ensure_ascii=False) for value in values)
+
+
+class _Compiler:
+    """스키마 → 파이썬 소스 (스키마 노드마다 검사 코드를 그 자리에 펼침)"""
+
+    def __init__(self, schema: dict):
+        self.root = schema
+        self.lines: list[str] = []
+        self.constants: dict[str, Any] = {}
+        self._names = 0
+        self._refs: list[str] = []
+
+    def name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def constant(self, value: Any) -> str:
+        name = self.name("_C")
+        self.constants[name] = value
+        return name
+
+    def emit(self, indent: int, line: str):
+        self.lines.append("    " * indent + line)
+
+    def error(self, indent: int, path: str, message: str, dynamic: bool = False):
+        text = message if dynamic else repr(message)
+        self.emit(indent, f"errors.append(({path}, {text}))")
+
+    # ------------------------------------------------------------------
+    # 스키마 정리 ($ref / allOf 펼치기)
+    # ------------------------------------------------------------------
+
+    def resolve(self, schema: dict) -> dict:
+        """$ref를 따라가고 allOf를 한 스키마로 합침"""
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"Schema must be an object: {schema!r}")
+        while "$ref" in schema:
+            ref = schema["$ref"]
+            if not ref.startswith("#/"):
+                raise SchemaCompileError(f"Only local $ref is supported: {ref}")
+            if ref in self._refs:
+                raise SchemaCompileError(f"Recursive $ref is not supported: {ref}")
+            target = self.root
+            for token in ref[2:].split("/"):
+                target = target[token.replace("~1", "/").replace("~0", "~")]
+            schema = target
+        unknown = set(schema) - _KEYWORDS - _ANNOTATIONS
+        if unknown:
+            raise SchemaCompileError(f"Unsupported keyword(s): {', '.join(sorted(unknown))}")
+        if "allOf" in schema:
+            merged = {key: value for key, value in schema.items() if key != "allOf"}
+            for part in schema["allOf"]:
+                merged = self.merge(merged, self.resolve(part))
+            return merged
+        return schema
+
+    def merge(self, a: dict, b: dict) -> dict:
+        """allOf 두 스키마 합치기 - 같은 필드는 allOf로 남김"""
+        merged = dict(a)
+        for key, value in b.items():
+            if key not in merged:
+                merged[key] = value
+            elif key == "required":
+                merged[key] = list(dict.fromkeys(merged[key] + value))
+            elif key == "properties":
+                properties = dict(merged[key])
+                for name, schema in value.items():
+                    properties[name] = {"allOf": [properties[name], schema]} if name in properties else schema
+                merged[key] = properties
+            elif merged[key] != value and key not in _ANNOTATIONS:
+                raise SchemaCompileError(f"Conflicting '{key}' in allOf")
+        return merged
+
+    # ------------------------------------------------------------------
+    # 코드 생성
+    # ------------------------------------------------------------------
+
+    def node(self, schema: dict, var: str, path: str, indent: int):
+        """var 값을 schema로 검사하는 코드 (path는 오류 시에만 평가되는 경로 식)"""
+        ref = schema.get("$ref") if isinstance(schema, dict) else None
+        schema = self.resolve(schema)
+        if ref:
+            self._refs.append(ref)
+        try:
+            if "oneOf" in schema or "anyOf" in schema:
+                self.union(schema, var, path, indent)
+            else:
+                self.typed(schema, var, path, indent)
+        finally:
+            if ref:
+                self._refs.pop()
+
+    def typed(self, schema: dict, var: str, path: str, indent: int):
+        types = schema.get("type")
+        if types is None:
+            # 타입 없이 const/enum만 있는 경우 (또는 아무 값)
+            self.values(schema, var, path, indent)
+            for kind in ("object", "array", "string", "number"):
+                if self.has_checks(schema, kind):
+                    self.emit(indent, f"if {_TYPE_CHECKS[kind].format(v=var)}:")
+                    self.checks(schema, kind, var, path, indent + 1)
+            return
+        types = [types] if isinstance(types, str) else list(types)
+        for kind in types:
+            if kind not in _TYPE_CHECKS:
+                raise SchemaCompileError(f"Unknown type {kind!r}")
+        if "integer" in types and "number" in types:
+            types.remove("integer")
+
+        expected = f"expected {' or '.join(types)}"
+        if len(types) == 1 and not self.has_checks(schema, types[0]) and not self.has_values(schema):
+            self.emit(indent, f"if not {_TYPE_CHECKS[types[0]].format(v=var)}:")
+            self.error(indent + 1, path, expected)
+            return
+        keyword = "if"
+        for kind in types:
+            self.emit(indent, f"{keyword} {_TYPE_CHECKS[kind].format(v=var)}:")
+            before = len(self.lines)
+            self.values(schema, var, path, indent + 1)
+            self.checks(schema, kind, var, path, indent + 1)
+            if len(self.lines) == before:
+                self.emit(indent + 1, "pass")
+            keyword = "elif"
+        self.emit(indent, "else:")
+        self.error(indent + 1, path, expected)
+
+    @staticmethod
+    def has_values(schema: dict) -> bool:
+        return "const" in schema or "enum" in schema
+
+    @staticmethod
+    def has_checks(schema: dict, kind: str) -> bool:
+        keys = {
+            "object": ("properties", "required", "additionalProperties"),
+            "array": ("items", "minItems", "maxItems"),
+            "string": ("minLength", "maxLength", "pattern"),
+            "number": ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"),
+            "integer": ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum"),
+        }.get(kind, ())
+        return any(key in schema for key in keys)
+
+    def values(self, schema: dict, var: str, path: str, indent: int):
+        if "const" in schema:
+            value = schema["const"]
+            self.emit(indent, f"if not (type({var}) is {type(value).__name__} and {var} == {value!r}):")
+            self.error(indent + 1, path, f"must be {_describe([value])}")
+        if "enum" in schema:
+            values = schema["enum"]
+            try:
+                allowed = self.constant(frozenset(values))
+            except TypeError:
+                allowed = self.constant(tuple(values))
+            # True == 1 이므로 값 타입도 비교
+            value_types = sorted({type(value).__name__ for value in values})
+            type_check = " or ".join(f"type({var}) is {name}" for name in value_types)
+            self.emit(indent, f"if not (({type_check}) and {var} in {allowed}):")
+            self.error(indent + 1, path, f"must be one of {_describe(values)}")
+
+    def checks(self, schema: dict, kind: str, var: str, path: str, indent: int):
+        if kind == "object":
+            self.object(schema, var, path, indent)
+        elif kind == "array":
+            self.array(schema, var, path, indent)
+        elif kind == "string":
+            self.string(schema, var, path, indent)
+        elif kind in ("number", "integer"):
+            self.number(schema, var, path, indent)
+
+    def object(self, schema: dict, var: str, path: str, indent: int):
+        properties = schema.get("properties", {})
+        required = schema.get("required", [])
+        for key in required:
+            if key not in properties:
+                self.emit(indent, f"if {key!r} not in {var}:")
+                self.error(indent + 1, path, f"missing required property '{key}'")
+        for key, child in properties.items():
+            value = self.name("v")
+            child_path = _child_path(path, f'"/{_pointer_token(key)}"')
+            self.emit(indent, f"{value} = {var}.get({key!r}, _MISSING)")
+            if key in required:
+                self.emit(indent, f"if {value} is _MISSING:")
+                self.error(indent + 1, path, f"missing required property '{key}'")
+                self.emit(indent, "else:")
+            else:
+                self.emit(indent, f"if {value} is not _MISSING:")
+            self.node(child, value, child_path, indent + 1)
+        additional = schema.get("additionalProperties", True)
+        if additional is False:
+            allowed = self.constant(frozenset(properties))
+            key = self.name("k")
+            self.emit(indent, f"for {key} in {var}:")
+            self.emit(indent + 1, f"if {key} not in {allowed}:")
+            self.error(indent + 2, path, f"f\"unexpected property '{{{key}}}'\"", dynamic=True)
+        elif additional is not True:
+            raise SchemaCompileError("additionalProperties must be true or false")
+
+    def array(self, schema: dict, var: str, path: str, indent: int):
+        low, high = schema.get("minItems"), schema.get("maxItems")
+        if low is not None and low == high:
+            self.emit(indent, f"if len({var}) != {low}:")
+            self.error(indent + 1, path, f"f\"expected {low} items, got {{len({var})}}\"", dynamic=True)
+        else:
+            if low is not None:
+                self.emit(indent, f"if len({var}) < {low}:")
+                self.error(indent + 1, path, f"expected at least {low} items")
+            if high is not None:
+                self.emit(indent, f"if len({var}) > {high}:")
+                self.error(indent + 1, path, f"expected at most {high} items")
+        if "items" in schema:
+            if not isinstance(schema["items"], dict):
+                raise SchemaCompileError("Only a single 'items' schema is supported")
+            index, item = self.name("i"), self.name("v")
+            self.emit(indent, f"for {index}, {item} in enumerate({var}):")
+            self.node(schema["items"], item, _child_path(path, f'"/" + str({index})'), indent + 1)
+
+    def string(self, schema: dict, var: str, path: str, indent: int):
+        if "minLength" in schema:
+            self.emit(indent, f"if len({var}) < {schema['minLength']}:")
+            self.error(indent + 1, path, f"must be at least {schema['minLength']} characters")
+        if "maxLength" in schema:
+            self.emit(indent, f"if len({var}) > {schema['maxLength']}:")
+            self.error(indent + 1, path, f"must be at most {schema['maxLength']} characters")
+        if "pattern" in schema:
+            pattern = self.constant(re.compile(schema["pattern"]))
+            self.emit(indent, f"if {pattern}.search({var}) is None:")
+            self.error(indent + 1, path, f"must match {schema['pattern']}")
+
+    def number(self, schema: dict, var: str, path: str, indent: int):
+        for keyword, operator, text in (
+            ("minimum", "<", ">="), ("maximum", ">", "<="),
+            ("exclusiveMinimum", "<=", ">"), ("exclusiveMaximum", ">=", "<"),
+        ):
+            if keyword in schema:
+                self.emit(indent, f"if {var} {operator} {schema[keyword]!r}:")
+                self.error(indent + 1, path, f"must be {text} {schema[keyword]}")
+
+    def union(self, schema: dict, var: str, path: str, indent: int):
+        keyword = "oneOf" if "oneOf" in schema else "anyOf"
+        branches = [self.resolve(branch) for branch in schema[keyword]]
+        if set(schema) - _ANNOTATIONS - {keyword}:
+            raise SchemaCompileError(f"'{keyword}' must not be combined with other keywords")
+
+        tag = self.discriminator(branches)
+        if tag is not None:
+            # const로 구분되는 분기는 서로 배타적이라 oneOf/anyOf 모두 그 분기 하나만 검사하면 됨
+            values = [branch["properties"][tag]["const"] for branch in branches]
+            found = self.name("d")
+            self.emit(indent, f"if type({var}) is dict:")
+            self.emit(indent + 1, f"{found} = {var}.get({tag!r}, _MISSING)")
+            for i, (branch, value) in enumerate(zip(branches, values)):
+                self.emit(indent + 1, f"{'if' if i == 0 else 'elif'} {found} == {value!r} and type({found}) is {type(value).__name__}:")
+                self.typed(branch, var, path, indent + 2)
+            self.emit(indent + 1, f"elif {found} is _MISSING:")
+            self.error(indent + 2, path, f"missing required property '{tag}'")
+            self.emit(indent + 1, "else:")
+            self.error(indent + 2, _child_path(path, f'"/{_pointer_token(tag)}"'), f"must be one of {_describe(values)}")
+            self.emit(indent, "else:")
+            self.error(indent + 1, path, "expected object")
+            return
+
+        # 일반 oneOf: 분기마다 따로 검사해 통과한 분기 수를 셈
+        passed = self.name("n")
+        self.emit(indent, f"{passed} = 0")
+        for branch in branches:
+            scratch = self.name("e")
+            self.emit(indent, f"{scratch} = []")
+            saved, self.lines = self.lines, []
+            self.typed(branch, var, path, 0)
+            body = [line.replace("errors.append", f"{scratch}.append") for line in self.lines]
+            self.lines = saved
+            for line in body:
+                self.emit(indent, line)
+            self.emit(indent, f"if not {scratch}:")
+            self.emit(indent + 1, f"{passed} += 1")
+        if keyword == "oneOf":
+            self.emit(indent, f"if {passed} != 1:")
+            self.error(indent + 1, path, f"f\"must match exactly one schema in oneOf (matched {{{passed}}})\"", dynamic=True)
+        else:
+            self.emit(indent, f"if {passed} == 0:")
+            self.error(indent + 1, path, "must match at least one schema in anyOf")
+
+    @staticmethod
+    def discriminator(branches: list[dict]) -> Any:
+        """모든 분기에서 required이고 서로 다른 const를 갖는 필드"""
+        if not branches or not all(isinstance(branch.get("properties"), dict) for branch in branches):
+            return None
+        for name, schema in branches[0]["properties"].items():
+            if not isinstance(schema, dict) or "const" not in schema:
+                continue
+            values = []
+            for branch in branches:
+                schema = branch["properties"].get(name)
+                if not isinstance(schema, dict) or "const" not in schema or name not in branch.get("required", []):
+                    break
+                values.append(schema["const"])
+            else:
+                if len(set(map(repr, values))) == len(values):
+                    return name
+        return None
+
+
+def compile_schema(schema: dict, name: str = "validate") -> tuple[Callable[[Any, list], None], str]:
+    """
+    JSON Schema(draft-07 중 WorldSpec이 쓰는 범위) → (검사 함수, 생성된 소스)
+
+    검사 함수는 (값, errors)를 받아 errors에 (JSON Pointer, 메시지)를 추가합니다.
+    """
+    compiler = _Compiler(schema)
+    compiler.emit(0, f"def {name}(v0, errors):")
+    compiler.node(schema, "v0", '""', 1)
+    source = "\n".join(compiler.lines) + "\n"
+    namespace = {"_MISSING": object(), **compiler.constants}
+    exec(compile(source, f"<schema {schema.get('title', name)}>", "exec"), namespace)
+    return namespace[name], source
+
+
+def load_world_schema() -> dict:
+    return json.loads(WORLD_SCHEMA_PATH.read_text(encoding="utf-8"))
+
+
+_validate, WORLD_SCHEMA_SOURCE = compile_schema(load_world_schema(), "validate_world_spec")
+
+
+def validate_world_json(data: Any) -> list[tuple[str, str]]:
+    """파싱된 WorldSpec JSON 검사 → [(JSON Pointer, 메시지)] (비어 있으면 유효)"""
+    errors: list[tuple[str, str]] = []
+    _validate(data, errors)
+    return errors
@@ -0,0 +1,483 @@
+"""
+WorldSpec 검증 + 자동 수정
+엔티티 AABB(position/rotation/scale/size, GLB는 에셋 메타데이터의 바운딩 박스)를 균등 격자(x/z 평면)에
+넣어 겹칠 수 있는 쌍만 비교하므로 모든 쌍을 비교하는 O(n²) 대신 O(n log n)으로 검사합니다.
+
+- 엔티티끼리 겹침 (structure와의 겹침은 경고)
+- 방(Space.size) 밖으로 나간 엔티티
+- 시작 위치가 방 밖이거나 지오메트리 안에 있는 경우
+- 중복 ID, 뒤집힌/방 밖/부피 없는 zone
+- auto_fixed: 겹친 엔티티를 x/z로 밀어내고 방 안으로 옮긴 스펙
+
+좌표계: 방 중심이 x/z = 0, 바닥이 y = 0
+"""
+
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from shared.types.world_spec import WorldSpec, Entity, ValidationResult
+from shared.types.world_instances import expand_instances, rotation_matrices
+from services.asset_metadata import asset_metadata
+from services.world_builder import GENERATED_SIZE, LIBRARY_SRC_PREFIX
+
+
+# 이 깊이(m) 이하로 닿은 것은 겹침으로 보지 않음
+OVERLAP_EPSILON = 1e-3
+
+# 격자 칸 크기 = 엔티티 x/z 크기 중앙값 × 이 값
+GRID_CELL_FACTOR = 2.0
+
+# 이보다 많은 칸에 걸치는 엔티티는 격자에 넣지 않고 전체와 직접 비교
+LARGE_ENTITY_CELLS = 256
+
+# 자동 수정 시 밀어내기 반복 횟수와 쌍마다 각 엔티티를 미는 거리 (겹친 깊이 대비)
+FIX_ITERATIONS = 16
+SEPARATION_FACTOR = 1.0
+
+# 종류별 오류/경고 메시지 최대 개수 (나머지는 개수만 표시)
+MAX_ISSUES = 200
+
+# 시작 위치 주변 플레이어 부피 (반지름, 눈높이 아래 몸 높이)
+PLAYER_RADIUS = 0.3
+PLAYER_HEIGHT = 1.6
+
+# TS PrimitiveEntity의 getDefaultSize와 같은 기본 크기
+_ROLE_SIZES = {"character": (0.5, 1.8, 0.5), "prop": (1.0, 1.0, 1.0)}
+_PRIMITIVE_SIZES = {
+    "capsule": (0.5, 1.8, 0.5),
+    "sphere": (1.0, 1.0, 1.0),
+    "cylinder": (0.5, 1.0, 0.5),
+    "plane": (1.0, 0.01, 1.0),
+}
+
+
+def primitive_size(primitive: str, role: Optional[str]) -> tuple[float, float, float]:
+    """size가 없는 프리미티브의 기본 크기 (클라이언트 렌더링과 동일)"""
+    return _ROLE_SIZES.get(role) or _PRIMITIVE_SIZES.get(primitive, (1.0, 1.0, 1.0))
+
+
+def glb_local_bounds(src: str) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """GLB 모델 좌표계 바운딩 박스 - 라이브러리 에셋은 메타데이터, 나머지는 생성 모델 크기로 가정"""
+    if src.lstrip("/").startswith(LIBRARY_SRC_PREFIX):
+        asset = asset_metadata.get(src.lstrip("/")[len(LIBRARY_SRC_PREFIX):])
+        if asset and asset.get("aabb"):
+            return tuple(asset["aabb"]["min"]), tuple(asset["aabb"]["max"])
+    half = tuple(s / 2 for s in GENERATED_SIZE)
+    return tuple(-h for h in half), half
+
+
+class EntityBounds:
+    """엔티티별 월드 AABB와 검사 대상 플래그 (배열 인덱스 = entities 인덱스)"""
+
+    def __init__(self, spec: Union[WorldSpec, list[Entity]], bounds_resolver: Callable = glb_local_bounds):
+        entities = spec.entities if isinstance(spec, WorldSpec) else spec
+        n = len(entities)
+        positions = np.zeros((n, 3))
+        centers = np.zeros((n, 3))  # 모델 좌표계 중심 (position 기준, 회전/스케일 전)
+        halves = np.zeros((n, 3))
+        scales = np.ones((n, 3))
+        rotations = np.zeros((n, 3))
+        self.solid = np.ones(n, bool)  # 겹침 검사 대상
+        self.structure = np.zeros(n, bool)
+        is_primitive = np.zeros(n, bool)
+        self.ids = []
+
+        glb_cache: dict[str, tuple] = {}
+        for i, entity in enumerate(entities):
+            self.ids.append(entity.id)
+            positions[i] = entity.position
+            if entity.scale is not None:
+                scales[i] = entity.scale
+            if entity.rotation is not None:
+                rotations[i] = entity.rotation
+            role = getattr(entity, "role", None)
+            self.structure[i] = role == "structure"
+
+            if entity.asset_type == "primitive":
+                is_primitive[i] = True
+                size = entity.size or primitive_size(entity.primitive, role)
+                # 클라이언트는 position.y + size.y / 2에 메시 중심을 둠 (바닥 기준 위치)
+                centers[i] = (0.0, size[1] / 2, 0.0)
+                halves[i] = (size[0] / 2, size[1] / 2, size[2] / 2)
+                self.solid[i] = entity.primitive != "plane"
+            elif entity.asset_type == "glb":
+                if entity.src not in glb_cache:
+                    glb_cache[entity.src] = bounds_resolver(entity.src)
+                low, high = glb_cache[entity.src]
+                centers[i] = [(l + h) / 2 for l, h in zip(low, high)]
+                halves[i] = [(h - l) / 2 for l, h in zip(low, high)]
+            else:
+                # 스플랫은 크기를 알 수 없으므로 위치만 검사
+                self.solid[i] = False
+
+        # 프리미티브는 메시 중심 기준으로 스케일/회전, GLB는 모델 원점 기준
+        pivot = np.where(is_primitive[:, None], centers, 0.0)
+        local = (centers - pivot) * scales
+        extent = np.abs(halves * scales)
+
+        rotated = np.flatnonzero(np.any(rotations != 0, axis=1))
+        if len(rotated):
+            matrices = rotation_matrices(rotations[rotated])
+            local[rotated] = np.einsum("nij,nj->ni", matrices, local[rotated])
+            extent[rotated] = np.einsum("nij,nj->ni", np.abs(matrices), extent[rotated])
+
+        world_center = positions + pivot + local
+        self.positions = positions
+        self.mins = world_center - extent
+        self.maxs = world_center + extent
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def translate(self, offsets: np.ndarray):
+        """엔티티 이동 (AABB도 같이 이동)"""
+        self.positions += offsets
+        self.mins += offsets
+        self.maxs += offsets
+
+
+def candidate_pairs(mins: np.ndarray, maxs: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """
+    x/z 균등 격자로 같은 칸을 공유하는 엔티티 쌍 (i < j, 중복 없음, 정렬되지 않음)
+
+    칸을 너무 많이 차지하는 큰 엔티티는 격자 대신 모든 엔티티와 직접 비교합니다.
+    """
+    ids = np.flatnonzero(active)
+    if len(ids) < 2:
+        return np.empty((0, 2), np.int64)
+
+    footprint = np.maximum(maxs[ids][:, [0, 2]] - mins[ids][:, [0, 2]], 0).max(axis=1)
+    cell = max(float(np.median(footprint)) * GRID_CELL_FACTOR, 1e-3)
+    origin = mins[ids][:, [0, 2]].min(axis=0)
+    low = np.floor((mins[ids][:, [0, 2]] - origin) / cell).astype(np.int64)
+    high = np.floor((maxs[ids][:, [0, 2]] - origin) / cell).astype(np.int64)
+    spans = high - low + 1
+    counts = spans[:, 0] * spans[:, 1]
+
+    large = counts > LARGE_ENTITY_CELLS
+    pair_parts = []
+
+    # 각 엔티티를 걸친 모든 칸에 등록 → 칸 키로 정렬
+    small = np.flatnonzero(~large)
+    if len(small):
+        rep = np.repeat(small, counts[small])
+        starts = np.repeat(np.cumsum(counts[small]) - counts[small], counts[small])
+        offsets = np.arange(len(rep)) - starts
+        cell_x = low[rep, 0] + offsets % spans[rep, 0]
+        cell_z = low[rep, 1] + offsets // spans[rep, 0]
+        keys = cell_x * (int(high[:, 1].max()) + 2) + cell_z
+        order = np.argsort(keys, kind="stable")
+        keys, members = keys[order], ids[rep[order]]
+        cell_x, cell_z = cell_x[order], cell_z[order]
+
+        # 같은 칸 안의 쌍: 정렬된 배열에서 k칸 떨어진 원소가 같은 키인 경우 (k = 1 .. 최대 칸 인원 - 1)
+        # 여러 칸을 공유하는 쌍은 두 AABB 최솟값 모서리의 최댓값이 들어 있는 칸에서만 남겨 중복 제거
+        k = 1
+        while k < len(keys):
+            same = np.flatnonzero(keys[k:] == keys[:-k])
+            if not len(same):
+                break
+            a, b = members[same], members[same + k]
+            corner = np.floor((np.maximum(mins[a][:, [0, 2]], mins[b][:, [0, 2]]) - origin) / cell).astype(np.int64)
+            own = (corner[:, 0] == cell_x[same]) & (corner[:, 1] == cell_z[same])
+            a, b = a[own], b[own]
+            pair_parts.append(np.stack([np.minimum(a, b), np.maximum(a, b)], axis=1))
+            k += 1
+
+    large_ids = ids[large]
+    for index in large_ids:
+        # 큰 엔티티끼리의 쌍은 인덱스가 작은 쪽에서만 추가
+        others = ids[(ids != index) & ~(np.isin(ids, large_ids) & (ids < index))]
+        hit = np.all((mins[others] <= maxs[index]) & (maxs[others] >= mins[index]), axis=1)
+        a = np.full(int(hit.sum()), index)
+        b = others[hit]
+        pair_parts.append(np.stack([np.minimum(a, b), np.maximum(a, b)], axis=1))
+
+    if not pair_parts:
+        return np.empty((0, 2), np.int64)
+    return np.concatenate(pair_parts)
+
+
+def overlapping_pairs(bounds: EntityBounds, active: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    실제로 겹친 쌍과 축별 겹침 깊이
+
+    Returns:
+        (pairs (m, 2), depth (m, 3))
+    """
+    active = bounds.solid if active is None else active
+    pairs = candidate_pairs(bounds.mins, bounds.maxs, active)
+    if not len(pairs):
+        return pairs, np.empty((0, 3))
+    a, b = pairs[:, 0], pairs[:, 1]
+    depth = np.minimum(bounds.maxs[a], bounds.maxs[b]) - np.maximum(bounds.mins[a], bounds.mins[b])
+    hit = np.all(depth > OVERLAP_EPSILON, axis=1)
+    return pairs[hit], depth[hit]
+
+
+def naive_overlapping_pairs(bounds: EntityBounds) -> np.ndarray:
+    """모든 쌍을 비교하는 기준 구현 (벤치마크/정확도 확인용)"""
+    ids = np.flatnonzero(bounds.solid)
+    pairs = []
+    for n, i in enumerate(ids):
+        others = ids[n + 1:]
+        depth = np.minimum(bounds.maxs[i], bounds.maxs[others]) - np.maximum(bounds.mins[i], bounds.mins[others])
+        for j in others[np.all(depth > OVERLAP_EPSILON, axis=1)]:
+            pairs.append((i, j))
+    return np.array(pairs, np.int64).reshape(-1, 2)
+
+
+def room_bounds(spec: WorldSpec) -> tuple[np.ndarray, np.ndarray]:
+    width, height, depth = spec.space.size
+    return np.array([-width / 2, 0.0, -depth / 2]), np.array([width / 2, height, depth / 2])
+
+
+def clamp_offsets(bounds: EntityBounds, room_min: np.ndarray, room_max: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    AABB를 방 안으로 옮기는 이동량
+
+    Returns:
+        (offsets (n, 3), 방보다 커서 가운데 정렬한 엔티티 마스크)
+    """
+    extent = bounds.maxs - bounds.mins
+    too_big = extent > (room_max - room_min) + OVERLAP_EPSILON
+    offsets = np.maximum(room_min - bounds.mins, 0) + np.minimum(room_max - bounds.maxs, 0)
+    # 방보다 큰 축은 방 가운데에 맞춤 (y는 바닥에 맞춤)
+    centered = (room_min + room_max) / 2 - (bounds.mins + bounds.maxs) / 2
+    centered[:, 1] = room_min[1] - bounds.mins[:, 1]
+    offsets = np.where(too_big, centered, offsets)
+    return offsets, too_big.any(axis=1)
+
+
+def separation_offsets(bounds: EntityBounds, pairs: np.ndarray, depth: np.ndarray) -> np.ndarray:
+    """
+    겹친 쌍을 x/z 중 덜 겹친 축으로 서로 반대 방향으로 밀어내는 이동량
+
+    한 엔티티가 여러 쌍에 걸치면 이동량을 합칩니다. 쌍마다 겹친 깊이만큼(절반이 아니라) 밀어
+    이웃끼리 다시 부딪히는 경우를 흡수하므로 반복 횟수가 크게 줄어듭니다.
+    """
+    offsets = np.zeros_like(bounds.positions)
+    a, b = pairs[:, 0], pairs[:, 1]
+    axis = np.where(depth[:, 0] <= depth[:, 2], 0, 2)
+    push = (depth[np.arange(len(pairs)), axis] + OVERLAP_EPSILON) * SEPARATION_FACTOR
+
+    center_a = (bounds.mins[a, axis] + bounds.maxs[a, axis]) / 2
+    center_b = (bounds.mins[b, axis] + bounds.maxs[b, axis]) / 2
+    # 중심이 같으면 인덱스가 작은 쪽을 음의 방향으로
+    direction = np.where(center_a <= center_b, -1.0, 1.0)
+
+    for index, sign in ((a, direction), (b, -direction)):
+        for ax in (0, 2):
+            sel = axis == ax
+            np.add.at(offsets[:, ax], index[sel], push[sel] * sign[sel])
+    return offsets
+
+
+def _limited(messages: list[str], total: int, label: str) -> list[str]:
+    if total > len(messages):
+        messages.append(f"... and {total - len(messages)} more {label}")
+    return messages
+
+
+def _describe(bounds: EntityBounds, i: int) -> str:
+    return f"entities[{i}] '{bounds.ids[i]}'"
+
+
+def _player_box(spawnpoint) -> tuple[np.ndarray, np.ndarray]:
+    x, y, z = spawnpoint
+    return (
+        np.array([x - PLAYER_RADIUS, max(y - PLAYER_HEIGHT, 0.0) + OVERLAP_EPSILON, z - PLAYER_RADIUS]),
+        np.array([x + PLAYER_RADIUS, y, z + PLAYER_RADIUS]),
+    )
+
+
+def _blocking(bounds: EntityBounds, box_min: np.ndarray, box_max: np.ndarray) -> np.ndarray:
+    """상자와 겹치는 엔티티 인덱스 (스폰 위치 검사는 한 번뿐이라 전체 비교)"""
+    depth = np.minimum(bounds.maxs, box_max) - np.maximum(bounds.mins, box_min)
+    return np.flatnonzero(bounds.solid & np.all(depth > OVERLAP_EPSILON, axis=1))
+
+
+def _free_spawnpoint(bounds: EntityBounds, spawnpoint, room_min: np.ndarray, room_max: np.ndarray) -> Optional[list]:
+    """기존 시작 위치에서 가장 가까운 빈 자리 (x/z 나선형 탐색, 없으면 None)"""
+    x, y, z = spawnpoint
+    y = float(np.clip(y, room_min[1], room_max[1]))
+    step = PLAYER_RADIUS * 2
+    max_ring = int(np.ceil(max(room_max - room_min) / step))
+    for ring in range(max_ring + 1):
+        count = max(1, ring * 8)
+        for k in range(count):
+            angle = 2 * np.pi * k / count
+            cx = float(np.clip(x + ring * step * np.cos(angle), room_min[0] + PLAYER_RADIUS, room_max[0] - PLAYER_RADIUS))
+            cz = float(np.clip(z + ring * step * np.sin(angle), room_min[2] + PLAYER_RADIUS, room_max[2] - PLAYER_RADIUS))
+            if not len(_blocking(bounds, *_player_box((cx, y, cz)))):
+                return [round(cx, 4), round(y, 4), round(cz, 4)]
+    return None
+
+
+def _zone_issues(spec: WorldSpec, room_min: np.ndarray, room_max: np.ndarray, errors: list, warnings: list) -> Optional[list]:
+    """zone 검사 - 수정이 필요하면 수정된 zone 목록 반환"""
+    if not spec.zones:
+        return None
+    fixed, changed, seen = [], False, set()
+    for i, zone in enumerate(spec.zones):
+        low, high = np.array(zone.bounds[0], float), np.array(zone.bounds[1], float)
+        zone_id = zone.id
+        if zone_id in seen:
+            errors.append(f"zones[{i}] '{zone.id}': duplicate zone id")
+            suffix = 2
+            while f"{zone.id}_{suffix}" in seen:
+                suffix += 1
+            zone_id, changed = f"{zone.id}_{suffix}", True
+        seen.add(zone_id)
+
+        if np.any(low > high):
+            errors.append(f"zones[{i}] '{zone.id}': bounds min is greater than max")
+            low, high, changed = np.minimum(low, high), np.maximum(low, high), True
+        if np.any(low < room_min - OVERLAP_EPSILON) or np.any(high > room_max + OVERLAP_EPSILON):
+            warnings.append(f"zones[{i}] '{zone.id}': extends outside the room")
+            low, high, changed = np.clip(low, room_min, room_max), np.clip(high, room_min, room_max), True
+        if np.any((high - low)[[0, 2]] <= OVERLAP_EPSILON):
+            warnings.append(f"zones[{i}] '{zone.id}': zone has no floor area")
+
+        fixed.append(zone.model_copy(update={
+            "id": zone_id,
+            "bounds": (tuple(float(v) for v in low), tuple(float(v) for v in high)),
+        }))
+    return fixed if changed else None
+
+
+def validate_world(
+    spec: WorldSpec,
+    auto_fix: bool = True,
+    bounds_resolver: Callable = glb_local_bounds,
+) -> ValidationResult:
+    """
+    WorldSpec 검증
+
+    Args:
+        auto_fix: 문제가 있으면 수정한 스펙을 auto_fixed로 반환
+        bounds_resolver: GLB src → 모델 좌표계 (min, max)
+
+    Returns:
+        ValidationResult (valid는 원본 스펙 기준, 인스턴스 그룹이 있으면 auto_fixed는 펼친 스펙)
+    """
+    if any(entity.asset_type == "instanced" for entity in spec.entities):
+        # 인스턴스 그룹은 원래 엔티티로 펼쳐서 검사
+        try:
+            spec = WorldSpec.model_validate(expand_instances(spec.model_dump(mode="json", by_alias=True, exclude_none=True)))
+        except ValueError as e:
+            return ValidationResult(valid=False, errors=[str(e)])
+
+    errors: list[str] = []
+    warnings: list[str] = []
+    bounds = EntityBounds(spec, bounds_resolver)
+    room_min, room_max = room_bounds(spec)
+
+    # 중복 엔티티 ID
+    seen: dict[str, int] = {}
+    duplicates = []
+    for i, entity_id in enumerate(bounds.ids):
+        if entity_id in seen:
+            duplicates.append(i)
+        else:
+            seen[entity_id] = i
+    errors += _limited(
+        [f"{_describe(bounds, i)}: duplicate id (first used by entities[{seen[bounds.ids[i]]}])" for i in duplicates[:MAX_ISSUES]],
+        len(duplicates), "duplicate ids",
+    )
+
+    # 방 밖
+    offsets, too_big = clamp_offsets(bounds, room_min, room_max)
+    outside = np.flatnonzero(np.any(np.abs(offsets) > OVERLAP_EPSILON, axis=1))
+    errors += _limited(
+        [f"{_describe(bounds, i)}: extends outside the room" for i in outside[:MAX_ISSUES]],
+        len(outside), "entities outside the room",
+    )
+    for i in np.flatnonzero(too_big)[:MAX_ISSUES]:
+        warnings.append(f"{_describe(bounds, i)}: larger than the room")
+
+    # 겹침 (structure와 겹친 것은 경고)
+    pairs, depth = overlapping_pairs(bounds)
+    with_structure = bounds.structure[pairs[:, 0]] | bounds.structure[pairs[:, 1]]
+    hard = pairs[~with_structure]
+    errors += _limited(
+        [f"{_describe(bounds, a)} overlaps {_describe(bounds, b)}" for a, b in hard[:MAX_ISSUES]],
+        len(hard), "overlaps",
+    )
+    soft = pairs[with_structure]
+    warnings += _limited(
+        [f"{_describe(bounds, a)} intersects structure {_describe(bounds, b)}" for a, b in soft[:MAX_ISSUES]],
+        len(soft), "structure intersections",
+    )
+
+    # 시작 위치
+    spawn = np.array(spec.spawnpoint, float)
+    spawn_outside = bool(np.any(spawn < room_min) or np.any(spawn > room_max))
+    if spawn_outside:
+        errors.append("spawnpoint is outside the room")
+    blocking = _blocking(bounds, *_player_box(spec.spawnpoint))
+    if len(blocking):
+        errors.append(f"spawnpoint is inside {_describe(bounds, blocking[0])}")
+
+    zones = _zone_issues(spec, room_min, room_max, errors, warnings)
+    needs_fix = bool(duplicates) or len(outside) or len(hard) or spawn_outside or len(blocking) or zones is not None
+
+    result = ValidationResult(valid=not errors, errors=errors, warnings=warnings)
+    if auto_fix and needs_fix:
+        result.auto_fixed = _auto_fix(spec, bounds, room_min, room_max, duplicates, zones, result.warnings)
+    return result
+
+
+def _auto_fix(
+    spec: WorldSpec,
+    bounds: EntityBounds,
+    room_min: np.ndarray,
+    room_max: np.ndarray,
+    duplicates: list[int],
+    zones: Optional[list],
+    warnings: list[str],
+) -> WorldSpec:
+    """겹친 엔티티 밀어내기 + 방 안으로 이동 + 시작 위치/ID/zone 정리"""
+    original = bounds.positions.copy()
+    movable = bounds.solid & ~bounds.structure
+
+    for _ in range(FIX_ITERATIONS):
+        offsets, _ = clamp_offsets(bounds, room_min, room_max)
+        bounds.translate(offsets)
+        pairs, depth = overlapping_pairs(bounds, movable)
+        if not len(pairs):
+            break
+        bounds.translate(separation_offsets(bounds, pairs, depth))
+    offsets, _ = clamp_offsets(bounds, room_min, room_max)
+    bounds.translate(offsets)
+
+    remaining, _ = overlapping_pairs(bounds, movable)
+    if len(remaining):
+        warnings.append(f"auto-fix left {len(remaining)} overlaps (room too crowded)")
+
+    entities = list(spec.entities)
+    for i in np.flatnonzero(np.any(np.abs(bounds.positions - original) > 1e-9, axis=1)):
+        entities[i] = entities[i].model_copy(update={"position": tuple(round(float(v), 4) for v in bounds.positions[i])})
+
+    used = set(bounds.ids)
+    for i in duplicates:
+        suffix = 2
+        while f"{bounds.ids[i]}_{suffix}" in used:
+            suffix += 1
+        new_id = f"{bounds.ids[i]}_{suffix}"
+        used.add(new_id)
+        entities[i] = entities[i].model_copy(update={"id": new_id})
+
+    update = {"entities": entities}
+    blocked = len(_blocking(bounds, *_player_box(spec.spawnpoint))) > 0
+    inside = np.all(np.array(spec.spawnpoint) >= room_min) and np.all(np.array(spec.spawnpoint) <= room_max)
+    if blocked or not inside:
+        spawnpoint = _free_spawnpoint(bounds, spec.spawnpoint, room_min, room_max)
+        if spawnpoint is None:
+            warnings.append("auto-fix found no free spawnpoint")
+        else:
+            update["spawnpoint"] = tuple(spawnpoint)
+    if zones is not None:
+        update["zones"] = zones
+    return spec.model_copy(update=update)
@@ -0,0 +1,97 @@
+"""
+InstancedEntity 펼치기
+인스턴스 그룹(공유 template + stride개씩 이어 붙인 transforms)을 원래 엔티티로 되돌립니다.
+저장 형식(WorldStore)과 서버 질의/검증이 모두 쓰므로 shared에 둡니다 (묶는 쪽은 services/world_instancing.py).
+"""
+
+from typing import Any
+
+import numpy as np
+
+
+# stride별 인스턴스 변환 구성: position, +rotation, +scale
+STRIDES = (3, 6, 9)
+
+IDENTITY_TRANSFORM = {"rotation": [0.0, 0.0, 0.0], "scale": [1.0, 1.0, 1.0]}
+
+
+def rotation_matrices(rotations: np.ndarray) -> np.ndarray:
+    """오일러 각(XYZ 순서, three.js 기본) → (n, 3, 3) 회전 행렬"""
+    cx, cy, cz = np.cos(rotations).T
+    sx, sy, sz = np.sin(rotations).T
+    matrices = np.empty((len(rotations), 3, 3))
+    matrices[:, 0] = np.stack([cy * cz, -cy * sz, sy], axis=1)
+    matrices[:, 1] = np.stack([cx * sz + sx * sy * cz, cx * cz - sx * sy * sz, -sx * cy], axis=1)
+    matrices[:, 2] = np.stack([sx * sz - cx * sy * cz, sx * cz + cx * sy * sz, cx * cy], axis=1)
+    return matrices
+
+
+def _euler_xyz(matrices: np.ndarray) -> np.ndarray:
+    """(n, 3, 3) 회전 행렬 → 오일러 각 (XYZ 순서, three.js Euler.setFromRotationMatrix와 동일)"""
+    y = np.arcsin(np.clip(matrices[:, 0, 2], -1.0, 1.0))
+    regular = np.abs(matrices[:, 0, 2]) < 0.9999999
+    x = np.where(regular, np.arctan2(-matrices[:, 1, 2], matrices[:, 2, 2]), np.arctan2(matrices[:, 2, 1], matrices[:, 1, 1]))
+    z = np.where(regular, np.arctan2(-matrices[:, 0, 1], matrices[:, 0, 0]), 0.0)
+    return np.stack([x, y, z], axis=1)
+
+
+def expand_group(group: dict) -> list[dict]:
+    """
+    InstancedEntity dict → 인스턴스별 엔티티 dict
+
+    그룹 rotation/scale이 있으면 인스턴스 변환에 합성합니다 (회전된 인스턴스에 비균등 그룹 스케일을
+    곱한 경우는 TRS로 정확히 표현할 수 없어 축별 곱으로 근사).
+
+    Raises:
+        ValueError: transforms 길이가 stride의 배수가 아니거나 instanceIds 수와 맞지 않는 경우
+    """
+    stride = group["stride"]
+    transforms = np.asarray(group["transforms"], float)
+    if stride not in STRIDES or len(transforms) % stride:
+        raise ValueError(f"Instanced entity '{group['id']}': transforms length {len(transforms)} is not a multiple of stride {stride}")
+    transforms = transforms.reshape(-1, stride)
+    count = len(transforms)
+    ids = group.get("instanceIds")
+    if ids is None:
+        ids = [f"{group['id']}_{i}" for i in range(count)]
+    elif len(ids) != count:
+        raise ValueError(f"Instanced entity '{group['id']}': {len(ids)} instanceIds for {count} transforms")
+
+    positions = transforms[:, 0:3]
+    rotations = transforms[:, 3:6] if stride >= 6 else None
+    scales = transforms[:, 6:9] if stride == 9 else None
+    if group.get("rotation") is not None or group.get("scale") is not None:
+        group_scale = np.asarray(group.get("scale") or IDENTITY_TRANSFORM["scale"], float)
+        group_rotation = rotation_matrices(np.asarray([group.get("rotation") or IDENTITY_TRANSFORM["rotation"]], float))[0]
+        positions = (positions * group_scale) @ group_rotation.T
+        local = rotation_matrices(rotations) if rotations is not None else np.broadcast_to(np.eye(3), (count, 3, 3))
+        rotations = _euler_xyz(group_rotation @ local)
+        scales = (scales if scales is not None else np.ones((count, 3))) * group_scale
+    positions = positions + np.asarray(group["position"], float)
+
+    template = {key: value for key, value in group["template"].items()}
+    entities = []
+    for i in range(count):
+        entity = {"id": ids[i]}
+        if group.get("name") is not None:
+            entity["name"] = group["name"]
+        entity["position"] = positions[i].tolist()
+        for field, values in (("rotation", rotations), ("scale", scales)):
+            if values is not None and values[i].tolist() != IDENTITY_TRANSFORM[field]:
+                entity[field] = values[i].tolist()
+        entity.update(template)
+        entities.append(entity)
+    return entities
+
+
+def expand_instances(spec: dict) -> dict:
+    """InstancedEntity를 모두 원래 엔티티로 펼친 새 월드 dict (그룹이 없으면 spec 그대로)"""
+    if not any(entity.get("assetType") == "instanced" for entity in spec["entities"]):
+        return spec
+    entities: list[dict[str, Any]] = []
+    for entity in spec["entities"]:
+        if entity.get("assetType") == "instanced":
+            entities.extend(expand_group(entity))
+        else:
+            entities.append(entity)
+    return {**spec, "entities": entities}
@@ -33,10 +33,16 @@ class PrimitiveEntity(BaseEntity):
     model_config = {"populate_by_name": True}
 
 
+class GlbLod(BaseModel):
+    src: str
+    distance: float = Field(ge=0)
+
+
 class GlbEntity(BaseEntity):
     asset_type: Literal["glb"] = Field(alias="assetType")
     src: str
     role: Literal["character", "prop", "structure"] | None = None
+    lods: list[GlbLod] | None = None
 
     model_config = {"populate_by_name": True}
 
@@ -49,7 +55,35 @@ class SplatEntity(BaseEntity):
     model_config = {"populate_by_name": True}
 
 
-Entity = Union[PrimitiveEntity, GlbEntity, SplatEntity]
+class PrimitiveTemplate(BaseModel):
+    asset_type: Literal["primitive"] = Field(alias="assetType")
+    primitive: Literal["box", "plane", "capsule", "sphere", "cylinder"]
+    size: Vector3 | None = None
+    color: str | None = None
+    role: Literal["character", "prop", "structure"] | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class GlbTemplate(BaseModel):
+    asset_type: Literal["glb"] = Field(alias="assetType")
+    src: str
+    role: Literal["character", "prop", "structure"] | None = None
+
+    model_config = {"populate_by_name": True}
+
+
+class InstancedEntity(BaseEntity):
+    asset_type: Literal["instanced"] = Field(alias="assetType")
+    template: Union[PrimitiveTemplate, GlbTemplate]
+    stride: Literal[3, 6, 9]
+    transforms: list[float]
+    instance_ids: list[str] | None = Field(default=None, alias="instanceIds")
+
+    model_config = {"populate_by_name": True}
+
+
+Entity = Union[PrimitiveEntity, GlbEntity, SplatEntity, InstancedEntity]
 
 
 class Zone(BaseModel):
@@ -26,10 +26,16 @@ export interface PrimitiveEntity extends BaseEntity {
   role?: "character" | "prop" | "structure";
 }
 
+export interface GlbLod {
+  src: string;
+  distance: number;
+}
+
 export interface GlbEntity extends BaseEntity {
   assetType: "glb";
   src: string;
   role?: "character" | "prop" | "structure";
+  lods?: GlbLod[];
 }
 
 export interface SplatEntity extends BaseEntity {
@@ -38,7 +44,33 @@ export interface SplatEntity extends BaseEntity {
   format?: "ply" | "splat" | "ksplat" | "spz";
 }
 
-export type Entity = PrimitiveEntity | GlbEntity | SplatEntity;
+export interface PrimitiveTemplate {
+  assetType: "primitive";
+  primitive: "box" | "plane" | "capsule" | "sphere" | "cylinder";
+  size?: Vector3;
+  color?: string;
+  role?: "character" | "prop" | "structure";
+}
+
+export interface GlbTemplate {
+  assetType: "glb";
+  src: string;
+  role?: "character" | "prop" | "structure";
+}
+
+/**
+ * 같은 에셋을 반복하는 엔티티 묶음 (server/services/world_instancing.py)
+ * transforms는 인스턴스마다 stride개(position, +rotation, +scale)씩 이어 붙인 배열
+ */
+export interface InstancedEntity extends BaseEntity {
+  assetType: "instanced";
+  template: PrimitiveTemplate | GlbTemplate;
+  stride: 3 | 6 | 9;
+  transforms: number[];
+  instanceIds?: string[];
+}
+
+export type Entity = PrimitiveEntity | GlbEntity | SplatEntity | InstancedEntity;
 
 export interface Zone {
   id: string;
@@ -70,3 +102,179 @@ export interface ValidationResult {
   warnings: string[];
   autoFixed?: WorldSpec;
 }
+
+/**
+ * Binary WorldSpec (Accept: application/vnd.worldspec+binary)
+ * 레이아웃은 server/services/world_binary.py 참고 - 벡터는 float32
+ */
+export const WORLD_BINARY_MEDIA_TYPE = "application/vnd.worldspec+binary";
+
+const WORLD_BINARY_MAGIC = 0x42505357; // "WSPB" (little-endian)
+const WORLD_BINARY_VERSION = 1;
+const WORLD_BINARY_HEADER_BYTES = 72;
+const WORLD_BINARY_WORLD_BYTES = 24;
+
+const PRIMITIVES: PrimitiveEntity["primitive"][] = ["box", "plane", "capsule", "sphere", "cylinder"];
+const ROLES: NonNullable<PrimitiveEntity["role"]>[] = ["character", "prop", "structure"];
+const SPLAT_FORMATS: NonNullable<SplatEntity["format"]>[] = ["ply", "splat", "ksplat", "spz"];
+
+const FLAG_NAME = 1;
+const FLAG_ROTATION = 2;
+const FLAG_SCALE = 4;
+const FLAG_SIZE = 8;
+const FLAG_COLOR = 16;
+const FLAG_ROLE = 32;
+const FLAG_FORMAT = 64;
+const FLAG_LODS = 128;
+
+export interface DecodedWorld {
+  worldSpec: WorldSpec;
+  /** 스펙 밖의 응답 필드 (world_id, version, pending, stats 등) */
+  meta?: Record<string, unknown>;
+}
+
+export function decodeWorldSpecBinary(buffer: ArrayBuffer): DecodedWorld {
+  const view = new DataView(buffer);
+  if (
+    buffer.byteLength < WORLD_BINARY_HEADER_BYTES + WORLD_BINARY_WORLD_BYTES ||
+    view.getUint32(0, true) !== WORLD_BINARY_MAGIC ||
+    view.getUint16(4, true) !== WORLD_BINARY_VERSION
+  ) {
+    throw new Error("Not a binary WorldSpec (version 1)");
+  }
+  const hasZones = (view.getUint16(6, true) & 1) !== 0;
+  const [
+    count, stringCount, stringBytes, nameCount, srcCount, colorCount,
+    rotationCount, scaleCount, sizeCount, lodEntityCount, lodCount, zoneCount,
+    versionStr, nameStr, spaceTypeStr, metaBytes,
+  ] = new Uint32Array(buffer, 8, 16);
+  const world = new Float32Array(buffer, WORLD_BINARY_HEADER_BYTES, 6);
+
+  // 모든 구역은 4바이트 정렬 - TypedArray 뷰로 복사 없이 읽음
+  let offset = WORLD_BINARY_HEADER_BYTES + WORLD_BINARY_WORLD_BYTES;
+  const take = <T>(make: (start: number, length: number) => T, length: number, itemBytes: number): T => {
+    if (offset + length * itemBytes > buffer.byteLength) throw new Error("Truncated binary WorldSpec");
+    const array = make(offset, length);
+    offset += Math.ceil((length * itemBytes) / 4) * 4;
+    return array;
+  };
+  const u8 = (length: number) => take((start, n) => new Uint8Array(buffer, start, n), length, 1);
+  const u32 = (length: number) => take((start, n) => new Uint32Array(buffer, start, n), length, 4);
+  const f32 = (length: number) => take((start, n) => new Float32Array(buffer, start, n), length, 4);
+
+  // 문자열 테이블 - ASCII면 한 번에 디코딩한 뒤 잘라서 사용
+  const stringOffsets = u32(stringCount + 1);
+  const blob = u8(stringBytes);
+  const decoder = new TextDecoder();
+  const text = decoder.decode(blob);
+  const ascii = text.length === blob.length;
+  const strings = new Array<string>(stringCount);
+  for (let i = 0; i < stringCount; i++) {
+    const start = stringOffsets[i];
+    const end = stringOffsets[i + 1];
+    strings[i] = ascii ? text.slice(start, end) : decoder.decode(blob.subarray(start, end));
+  }
+  const str = (index: number) => {
+    if (!(index < stringCount)) throw new Error("Invalid string index in binary WorldSpec");
+    return strings[index];
+  };
+  const enumValue = <T>(values: T[], code: number, name: string): T => {
+    if (code >= values.length) throw new Error(`Invalid ${name} code ${code} in binary WorldSpec`);
+    return values[code];
+  };
+
+  const tags = u8(count);
+  const flags = u8(count);
+  const codes = u8(count);
+  const roles = u8(count);
+  const ids = u32(count);
+  const names = u32(nameCount);
+  const srcs = u32(srcCount);
+  const colors = u32(colorCount);
+  const positions = f32(count * 3);
+  const rotations = f32(rotationCount * 3);
+  const scales = f32(scaleCount * 3);
+  const sizes = f32(sizeCount * 3);
+  const lodSizes = u32(lodEntityCount);
+  const lodSrcs = u32(lodCount);
+  const lodDistances = f32(lodCount);
+  const zoneStrings = u32(zoneCount * 2);
+  const zoneBounds = f32(zoneCount * 6);
+  const meta = metaBytes > 0 ? JSON.parse(decoder.decode(u8(metaBytes))) : undefined;
+
+  const vec = (array: Float32Array, index: number): Vector3 => [
+    array[index * 3], array[index * 3 + 1], array[index * 3 + 2],
+  ];
+
+  // 선택 필드는 플래그가 있는 엔티티 순서대로 채워져 있음
+  // (객체 전개 대신 리터럴로 만들어야 10만 엔티티에서도 JSON.parse보다 빠름)
+  let name = 0, src = 0, color = 0, rotation = 0, scale = 0, size = 0, lodEntity = 0, lod = 0;
+  const entities = new Array<Entity>(count);
+  for (let i = 0; i < count; i++) {
+    const flag = flags[i];
+    const id = str(ids[i]);
+    const position = vec(positions, i);
+    let entity: Entity;
+    switch (tags[i]) { // 0: primitive, 1: glb, 2: splat
+      case 0: {
+        const primitive: PrimitiveEntity = { id, position, assetType: "primitive", primitive: enumValue(PRIMITIVES, codes[i], "primitive") };
+        if (flag & FLAG_SIZE) primitive.size = vec(sizes, size++);
+        if (flag & FLAG_COLOR) primitive.color = str(colors[color++]);
+        if (flag & FLAG_ROLE) primitive.role = enumValue(ROLES, roles[i], "role");
+        entity = primitive;
+        break;
+      }
+      case 1: {
+        const glb: GlbEntity = { id, position, assetType: "glb", src: str(srcs[src++]) };
+        if (flag & FLAG_ROLE) glb.role = enumValue(ROLES, roles[i], "role");
+        if (flag & FLAG_LODS) {
+          const end = lod + lodSizes[lodEntity++];
+          if (!(end <= lodCount)) throw new Error("Invalid LOD counts in binary WorldSpec");
+          const lods: GlbLod[] = [];
+          for (; lod < end; lod++) lods.push({ src: str(lodSrcs[lod]), distance: lodDistances[lod] });
+          glb.lods = lods;
+        }
+        entity = glb;
+        break;
+      }
+      case 2: {
+        const splat: SplatEntity = { id, position, assetType: "splat", src: str(srcs[src++]) };
+        if (flag & FLAG_FORMAT) splat.format = enumValue(SPLAT_FORMATS, codes[i], "format");
+        entity = splat;
+        break;
+      }
+      default:
+        throw new Error(`Invalid assetType code ${tags[i]} in binary WorldSpec`);
+    }
+    if (flag & FLAG_NAME) entity.name = str(names[name++]);
+    if (flag & FLAG_ROTATION) entity.rotation = vec(rotations, rotation++);
+    if (flag & FLAG_SCALE) entity.scale = vec(scales, scale++);
+    entities[i] = entity;
+  }
+  // 플래그 수와 헤더의 개수가 다르면 손상된 데이터
+  if (
+    name !== nameCount || src !== srcCount || color !== colorCount || rotation !== rotationCount ||
+    scale !== scaleCount || size !== sizeCount || lodEntity !== lodEntityCount || lod !== lodCount
+  ) {
+    throw new Error("Invalid field counts in binary WorldSpec");
+  }
+
+  const worldSpec: WorldSpec = {
+    version: str(versionStr),
+    name: str(nameStr),
+    space: { type: str(spaceTypeStr) as Space["type"], size: [world[0], world[1], world[2]] },
+    spawnpoint: [world[3], world[4], world[5]],
+    entities,
+  };
+  if (hasZones) {
+    worldSpec.zones = [];
+    for (let i = 0; i < zoneCount; i++) {
+      worldSpec.zones.push({
+        id: str(zoneStrings[i * 2]),
+        name: str(zoneStrings[i * 2 + 1]),
+        bounds: [vec(zoneBounds, i * 2), vec(zoneBounds, i * 2 + 1)],
+      });
+    }
+  }
+  return { worldSpec, meta };
+}
@@ -0,0 +1,344 @@
+"""
+World Store - columnar WorldSpec representation
+엔티티를 pydantic 모델 목록 대신 열(column) 단위 NumPy 배열로 보관합니다.
+
+- position/rotation/scale/size: (n, 3) float64 (없는 값은 NaN)
+- entity_id/entity_name/src/color: 공유 문자열 테이블의 인덱스 (없는 값은 -1)
+- assetType/primitive/role/format: enum 코드 (없는 값은 -1)
+- lods: 드물게 쓰이므로 엔티티 인덱스 → 목록의 희소 dict
+
+WorldSpec/JSON과 손실 없이 상호 변환되며 (model_dump(mode="json", by_alias=True, exclude_none=True) 기준),
+이동/스케일/역할 필터/바운딩 박스 같은 일괄 연산은 벡터화되어 있습니다.
+"""
+
+import gc
+import json
+from contextlib import contextmanager
+from typing import Any, Iterable, Optional, Union, get_args
+
+import numpy as np
+
+from shared.types.world_spec import WorldSpec, PrimitiveEntity, SplatEntity
+from shared.types.world_instances import expand_instances
+
+
+def _literal_values(annotation) -> tuple[str, ...]:
+    """Literal[...] | None 어노테이션 → 허용 값 (pydantic 모델과 enum 코드를 일치시킴)"""
+    values = []
+    for arg in get_args(annotation):
+        values.extend([arg] if isinstance(arg, str) else _literal_values(arg))
+    return tuple(values)
+
+
+ASSET_TYPES = ("primitive", "glb", "splat")
+PRIMITIVES = _literal_values(PrimitiveEntity.model_fields["primitive"].annotation)
+ROLES = _literal_values(PrimitiveEntity.model_fields["role"].annotation)
+SPLAT_FORMATS = _literal_values(SplatEntity.model_fields["format"].annotation)
+
+_ASSET_CODES = {name: i for i, name in enumerate(ASSET_TYPES)}
+_PRIMITIVE_CODES = {name: i for i, name in enumerate(PRIMITIVES)}
+_ROLE_CODES = {name: i for i, name in enumerate(ROLES)}
+_FORMAT_CODES = {name: i for i, name in enumerate(SPLAT_FORMATS)}
+
+VECTOR_COLUMNS = ("position", "rotation", "scale", "size")
+
+# assetType별로만 의미가 있는 필드 (다른 타입에 붙은 값은 WorldSpec처럼 버림)
+_COLUMN_ASSET_TYPES = {
+    "size": ("primitive",),
+    "color": ("primitive",),
+    "primitive": ("primitive",),
+    "src": ("glb", "splat"),
+    "role": ("primitive", "glb"),
+    "format": ("splat",),
+}
+_MISSING_VECTOR = (np.nan, np.nan, np.nan)
+# 월드 이름(name)과 겹치지 않도록 엔티티 id/name 열은 entity_ 접두어 사용
+STRING_COLUMNS = ("entity_id", "entity_name", "src", "color")
+CODE_COLUMNS = ("asset_type", "primitive", "role", "format")
+
+
+@contextmanager
+def _gc_paused():
+    """
+    대량의 dict/list를 만드는 동안 순환 GC 일시 중지
+    (엔티티 dict에는 순환 참조가 없어 안전하며, 10만 엔티티에서 변환 시간이 절반 가까이 줄어듦)
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class StringTable:
+    """문자열 인터닝 테이블 (같은 문자열은 한 번만 저장)"""
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: list[str] = []
+        self._index: dict[str, int] = {}
+        for value in values:
+            self.intern(value)
+
+    def intern(self, value: Optional[str]) -> int:
+        """문자열 → 인덱스 (None이면 -1)"""
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def lookup(self, index: int) -> Optional[str]:
+        return self.values[index] if index >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class WorldStore:
+    """열 단위 WorldSpec - 수만 개 이상의 엔티티를 다룰 때 사용"""
+
+    def __init__(
+        self,
+        version: str,
+        name: str,
+        space: dict,
+        spawnpoint: Iterable[float],
+        columns: dict[str, np.ndarray],
+        strings: StringTable,
+        lods: Optional[dict[int, list[dict]]] = None,
+        zones: Optional[list[dict]] = None,
+    ):
+        self.version = version
+        self.name = name
+        self.space = space
+        self.spawnpoint = [float(v) for v in spawnpoint]
+        self.strings = strings
+        self.lods = lods or {}
+        self.zones = zones
+        for column in VECTOR_COLUMNS + STRING_COLUMNS + CODE_COLUMNS:
+            setattr(self, column, columns[column])
+
+    # ------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls, count: int) -> dict[str, np.ndarray]:
+        """엔티티 count개 분량의 빈 열 (벡터는 NaN, 문자열/코드는 -1)"""
+        columns = {column: np.full((count, 3), np.nan) for column in VECTOR_COLUMNS}
+        columns.update({column: np.full(count, -1, np.int32) for column in STRING_COLUMNS})
+        columns.update({column: np.full(count, -1, np.int8) for column in CODE_COLUMNS})
+        return columns
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WorldStore":
+        """
+        JSON dict(alias 기준)에서 바로 생성 - pydantic 모델을 거치지 않음
+        (구조/enum 값만 확인하며 필드 타입 검증은 pydantic 경로보다 느슨함)
+        InstancedEntity 그룹은 원래 엔티티로 펼쳐서 저장 (저장 형식에는 그룹이 없음)
+
+        Raises:
+            ValueError: 알 수 없는 assetType/enum 값, 필수 필드 누락, 잘못된 인스턴스 그룹
+        """
+        entities = expand_instances(data)["entities"]
+        columns = cls.empty(len(entities))
+        strings = StringTable()
+        intern = strings.intern
+
+        # 엔티티 루프 하나 대신 열마다 컴프리헨션으로 채우고, 타입별 필드는 마스크로 정리
+        try:
+            kinds = [e["assetType"] for e in entities]
+            columns["asset_type"][:] = [_ASSET_CODES[kind] for kind in kinds]
+            columns["entity_id"][:] = [intern(e["id"]) for e in entities]
+            # (n, 3)으로 맞춰야 엔티티가 없을 때도 대입됨 (길이가 다른 벡터는 여전히 ValueError)
+            vectors = (len(entities), 3)
+            columns["position"][:] = np.reshape([e["position"] for e in entities], vectors)
+            for column in VECTOR_COLUMNS[1:]:
+                columns[column][:] = np.reshape([e.get(column) or _MISSING_VECTOR for e in entities], vectors)
+            columns["entity_name"][:] = [intern(e.get("name")) for e in entities]
+            for key in ("src", "color"):
+                columns[key][:] = [intern(e.get(key)) for e in entities]
+            for key, codes in (("primitive", _PRIMITIVE_CODES), ("role", _ROLE_CODES), ("format", _FORMAT_CODES)):
+                columns[key][:] = [codes[v] if (v := e.get(key)) is not None else -1 for e in entities]
+            lods = {
+                i: [{"src": lod["src"], "distance": float(lod["distance"])} for lod in e["lods"]]
+                for i, (e, kind) in enumerate(zip(entities, kinds))
+                if kind == "glb" and e.get("lods") is not None
+            }
+        except KeyError as e:
+            raise ValueError(f"invalid or missing entity value {e}") from None
+
+        # 다른 assetType에 붙은 필드는 WorldSpec처럼 버림
+        asset_type = columns["asset_type"]
+        for key, allowed in _COLUMN_ASSET_TYPES.items():
+            other = ~np.isin(asset_type, [_ASSET_CODES[kind] for kind in allowed])
+            columns[key][other] = np.nan if key in VECTOR_COLUMNS else -1
+        if np.any(columns["primitive"][asset_type == _ASSET_CODES["primitive"]] < 0):
+            raise ValueError("every primitive entity needs primitive")
+        if np.any(columns["src"][asset_type != _ASSET_CODES["primitive"]] < 0):
+            raise ValueError("every glb/splat entity needs src")
+
+        return cls(
+            version=data["version"],
+            name=data["name"],
+            space={"type": data["space"]["type"], "size": [float(v) for v in data["space"]["size"]]},
+            spawnpoint=data["spawnpoint"],
+            columns=columns,
+            strings=strings,
+            lods=lods,
+            zones=[
+                {"id": z["id"], "name": z["name"], "bounds": [[float(v) for v in b] for b in z["bounds"]]}
+                for z in data["zones"]
+            ] if data.get("zones") is not None else None,
+        )
+
+    @classmethod
+    def from_json(cls, text: Union[str, bytes]) -> "WorldStore":
+        with _gc_paused():
+            return cls.from_dict(json.loads(text))
+
+    @classmethod
+    def from_spec(cls, spec: WorldSpec) -> "WorldStore":
+        """pydantic WorldSpec에서 생성"""
+        return cls.from_dict(spec.model_dump(by_alias=True, exclude_none=True))
+
+    # ------------------------------------------------------------------
+    # 변환
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """JSON dict - WorldSpec.model_dump(mode="json", by_alias=True, exclude_none=True)와 같은 값"""
+        lookup = self.strings.values
+        kinds = [ASSET_TYPES[code] for code in self.asset_type.tolist()]
+        entities: list[dict[str, Any]] = [{"id": lookup[i]} for i in self.entity_id.tolist()]
+
+        def fill(key: str, column: np.ndarray, decode):
+            """값이 있는 엔티티에만 필드 추가 (열 순서 = 출력 키 순서)"""
+            present = ~np.isnan(column[:, 0]) if column.ndim == 2 else column >= 0
+            index = np.flatnonzero(present)
+            for i, value in zip(index.tolist(), column[index].tolist()):
+                entities[i][key] = decode(value)
+
+        fill("name", self.entity_name, lookup.__getitem__)
+        for entity, position in zip(entities, self.position.tolist()):
+            entity["position"] = position
+        fill("rotation", self.rotation, list)
+        fill("scale", self.scale, list)
+        for entity, kind in zip(entities, kinds):
+            entity["assetType"] = kind
+        fill("primitive", self.primitive, PRIMITIVES.__getitem__)
+        fill("size", self.size, list)
+        fill("color", self.color, lookup.__getitem__)
+        fill("src", self.src, lookup.__getitem__)
+        fill("format", self.format, SPLAT_FORMATS.__getitem__)
+        fill("role", self.role, ROLES.__getitem__)
+        for i, lods in sorted(self.lods.items()):
+            entities[i]["lods"] = [dict(lod) for lod in lods]
+
+        data = {
+            "version": self.version,
+            "name": self.name,
+            "space": {"type": self.space["type"], "size": list(self.space["size"])},
+            "spawnpoint": list(self.spawnpoint),
+            "entities": entities,
+        }
+        if self.zones is not None:
+            data["zones"] = [{"id": z["id"], "name": z["name"], "bounds": [list(b) for b in z["bounds"]]} for z in self.zones]
+        return data
+
+    def to_json(self) -> str:
+        with _gc_paused():
+            return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":"))
+
+    def to_spec(self) -> WorldSpec:
+        return WorldSpec.model_validate(self.to_dict())
+
+    # ------------------------------------------------------------------
+    # 조회 / 일괄 연산
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.entity_id)
+
+    def entity_ids(self) -> list[str]:
+        return [self.strings.values[i] for i in self.entity_id.tolist()]
+
+    def mask(
+        self,
+        role: Optional[str] = None,
+        asset_type: Optional[str] = None,
+        primitive: Optional[str] = None,
+        src: Optional[str] = None,
+    ) -> np.ndarray:
+        """조건에 맞는 엔티티 불리언 마스크 (지정한 조건은 모두 만족해야 함)"""
+        selected = np.ones(len(self), bool)
+        if role is not None:
+            selected &= self.role == _ROLE_CODES[role]
+        if asset_type is not None:
+            selected &= self.asset_type == _ASSET_CODES[asset_type]
+        if primitive is not None:
+            selected &= self.primitive == _PRIMITIVE_CODES[primitive]
+        if src is not None:
+            code = self.strings._index.get(src)
+            selected &= self.src == (code if code is not None else -2)
+        return selected
+
+    def filter(self, mask: np.ndarray) -> "WorldStore":
+        """마스크(또는 인덱스 배열)로 고른 엔티티만 담은 새 스토어 (문자열 테이블 공유)"""
+        indices = np.flatnonzero(mask) if np.asarray(mask).dtype == bool else np.asarray(mask)
+        remap = {int(old): new for new, old in enumerate(indices.tolist()) if int(old) in self.lods}
+        columns = {
+            column: getattr(self, column)[indices].copy()
+            for column in VECTOR_COLUMNS + STRING_COLUMNS + CODE_COLUMNS
+        }
+        return WorldStore(
+            version=self.version,
+            name=self.name,
+            space=dict(self.space),
+            spawnpoint=self.spawnpoint,
+            columns=columns,
+            strings=self.strings,
+            lods={new: self.lods[old] for old, new in remap.items()},
+            zones=self.zones,
+        )
+
+    def translate(self, offset: Iterable[float], mask: Optional[np.ndarray] = None):
+        """엔티티 위치 이동 (mask가 없으면 전체)"""
+        offset = np.asarray(offset, np.float64)
+        if mask is None:
+            self.position += offset
+        else:
+            self.position[mask] += offset
+
+    def scale_by(self, factor: Union[float, Iterable[float]], mask: Optional[np.ndarray] = None,
+                 pivot: Optional[Iterable[float]] = None):
+        """
+        엔티티 스케일 곱하기 (scale이 없던 엔티티는 [1, 1, 1]에서 시작)
+
+        Args:
+            pivot: 지정하면 위치도 pivot 기준으로 함께 스케일
+        """
+        factor = np.broadcast_to(np.asarray(factor, np.float64), (3,))
+        rows = slice(None) if mask is None else mask
+        scale = self.scale[rows]
+        self.scale[rows] = np.where(np.isnan(scale), 1.0, scale) * factor
+        if pivot is not None:
+            pivot = np.asarray(pivot, np.float64)
+            self.position[rows] = pivot + (self.position[rows] - pivot) * factor
+
+    def bounds(self, mask: Optional[np.ndarray] = None) -> Optional[tuple[list[float], list[float]]]:
+        """엔티티 위치의 바운딩 박스 (엔티티가 없으면 None)"""
+        positions = self.position if mask is None else self.position[mask]
+        if not len(positions):
+            return None
+        return positions.min(axis=0).tolist(), positions.max(axis=0).tolist()
+
+    def nbytes(self) -> int:
+        """열 배열 + 문자열 테이블이 차지하는 대략적인 메모리 (bytes)"""
+        arrays = sum(getattr(self, c).nbytes for c in VECTOR_COLUMNS + STRING_COLUMNS + CODE_COLUMNS)
+        strings = sum(len(s.encode("utf-8")) + 49 for s in self.strings.values)
+        return arrays + strings
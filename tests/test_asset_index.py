@@ -0,0 +1,80 @@
+"""
+키워드 → 에셋 검색(services/asset_index.py) 오타 보정 테스트
+자모 하나/붙은 키 치환/자리 바뀜/삽입/삭제 오타가 기본 min_score로 해석되고,
+떨어진 키 치환처럼 다른 단어가 되는 경우는 해석되지 않는지 확인합니다.
+
+사용법:
+    python -m pytest tests/test_asset_index.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+
+from services import asset_index as asset_index_module  # noqa: E402
+from services.asset_index import AssetIndex, typo_distance  # noqa: E402
+
+ASSETS = [
+    {"path": "furniture/chair.glb", "category": "furniture", "name": "의자", "keywords": ["chair"]},
+    {"path": "furniture/sofa.glb", "category": "furniture", "name": "소파", "keywords": ["sofa", "couch"]},
+    {"path": "furniture/desk.glb", "category": "furniture", "name": "책상", "keywords": ["desk"]},
+    {"path": "lighting/lamp.glb", "category": "lighting", "name": "램프", "keywords": ["lamp"]},
+    {"path": "furniture/bed.glb", "category": "furniture", "name": "침대", "keywords": ["bed"]},
+]
+
+
+@pytest.fixture
+def index(monkeypatch):
+    # 테스트 경로는 asset_metadata 인덱스에 없으므로 모두 사용 가능으로 취급
+    monkeypatch.setattr(asset_index_module.asset_metadata, "is_usable", lambda path: True)
+    return AssetIndex(assets=ASSETS)
+
+
+@pytest.mark.parametrize("phrase, expected", [
+    ("의쟈", "furniture/chair.glb"),     # 중성 ㅏ → ㅑ
+    ("소퍄", "furniture/sofa.glb"),      # 중성 ㅏ → ㅑ
+    ("책샹", "furniture/desk.glb"),      # 중성 ㅏ → ㅑ
+    ("의ㅈ자", "furniture/chair.glb"),   # 자모 삽입
+    ("chiar", "furniture/chair.glb"),    # 자리 바뀜
+    ("chari", "furniture/chair.glb"),    # 자리 바뀜
+    ("hcair", "furniture/chair.glb"),    # 첫 글자 자리 바뀜
+    ("chaor", "furniture/chair.glb"),    # 붙은 키 치환 (i → o)
+    ("chir", "furniture/chair.glb"),     # 삭제
+    ("sofaa", "furniture/sofa.glb"),     # 삽입
+    ("red chiar", "furniture/chair.glb"),
+])
+def test_single_typo_resolves(index, phrase, expected):
+    result = index.resolve(phrase)
+    assert result is not None, f"{phrase}: not resolved"
+    assert result["path"] == expected
+
+
+@pytest.mark.parametrize("phrase", [
+    "의사",   # ㅈ → ㅅ: 떨어진 키 치환은 다른 단어
+    "camp",   # l → c
+    "bad",    # 짧은 단어는 오타 보정 안 함
+    "chxyr",  # 두 글자 이상 차이
+])
+def test_other_words_do_not_resolve(index, phrase):
+    assert index.resolve(phrase) is None
+
+
+def test_exact_match_wins_over_typo(index):
+    assert index.search("chair", k=1)[0]["score"] == 1.0
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    ("chair", "chair", 0),
+    ("chair", "chiar", 1),
+    ("chair", "chaor", 1),
+    ("chair", "chalr", 2),
+    ("chair", "chai", 1),
+    ("ㅇㅢㅈㅏ", "ㅇㅢㅈㅑ", 1),
+    ("ㅇㅢㅈㅏ", "ㅇㅢㅅㅏ", 2),
+])
+def test_typo_distance(a, b, expected):
+    assert typo_distance(a, b, limit=1) == min(expected, 2)
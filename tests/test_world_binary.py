@@ -0,0 +1,280 @@
+"""
+바이너리 WorldSpec(services/world_binary.py) 왕복 변환 테스트
+파이썬 인코더/디코더와 클라이언트 디코더(decodeWorldSpecBinary)가 같은 결과를 내는지,
+잘리거나 잘못된 코드가 들어간 데이터를 거부하는지 확인합니다.
+
+사용법:
+    python -m pytest tests/test_world_binary.py
+    # 클라이언트 디코더는 node (>= 22.6 타입 제거, 또는 client/node_modules의 typescript)가 있어야 실행됨
+"""
+
+import sys
+import json
+import shutil
+import struct
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "server"))
+
+from shared.types.world_spec import WorldSpec  # noqa: E402
+from shared.types.world_store import PRIMITIVES, ROLES, SPLAT_FORMATS, WorldStore  # noqa: E402
+from services.world_binary import _HEADER, _WORLD, decode_world, encode_world  # noqa: E402
+from services.world_instancing import instance_world  # noqa: E402
+
+CLIENT_DIR = PROJECT_ROOT / "client"
+DECODERS = [CLIENT_DIR / "src" / "types" / "world_spec.ts", PROJECT_ROOT / "shared" / "types" / "world_spec.ts"]
+NODE_HARNESS = Path(__file__).parent / "world_binary_decoder.mjs"
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def full_world() -> dict:
+    """모든 assetType/primitive/role/format과 LOD, zone, 선택 필드 조합을 담은 월드"""
+    entities = []
+    for i, primitive in enumerate(PRIMITIVES):
+        entity = {"id": f"primitive_{i}", "position": [i * 1.1, 0.0, -0.3], "assetType": "primitive", "primitive": primitive}
+        if i % 2 == 0:
+            entity.update(size=[0.5 + i, 1.25, 0.1], color="#aabbcc", role=ROLES[i % len(ROLES)])
+        if i % 3 == 0:
+            entity.update(name=f"상자 {i}", rotation=[0.1, 3.1416, -0.2])
+        entities.append(entity)
+    for i, role in enumerate([*ROLES, None]):
+        entity = {"id": f"glb_{i}", "position": [-1.0, 0.25, i * 0.7], "assetType": "glb", "src": f"/assets/models/m{i % 2}.glb"}
+        if role is not None:
+            entity["role"] = role
+        if i == 1:
+            entity["lods"] = [{"src": "/assets/models/m1_lod1.glb", "distance": 15.0}]
+        if i == 2:
+            entity["lods"] = [
+                {"src": "/assets/models/m0_lod1.glb", "distance": 12.5},
+                {"src": "/assets/models/m0_lod2.glb", "distance": 40.0},
+            ]
+        if i == 3:
+            entity.update(scale=[2.0, 2.0, 2.0], name="의자")
+        entities.append(entity)
+    for i, format_ in enumerate([*SPLAT_FORMATS, None]):
+        entity = {"id": f"splat_{i}", "position": [3.0, 0.0, i * 0.3], "assetType": "splat", "src": f"/assets/splats/s{i}.bin"}
+        if format_ is not None:
+            entity["format"] = format_
+        entities.append(entity)
+    return {
+        "version": "1.0",
+        "name": "바이너리 테스트 월드",
+        "space": {"type": "room", "size": [20.0, 4.0, 20.0]},
+        "spawnpoint": [0.0, 1.6, 9.0],
+        "entities": entities,
+        "zones": [
+            {"id": "zone_a", "name": "거실", "bounds": [[-10.0, 0.0, -10.0], [0.0, 4.0, 0.0]]},
+            {"id": "zone_b", "name": "kitchen", "bounds": [[0.0, 0.0, 0.0], [10.0, 4.0, 10.0]]},
+        ],
+    }
+
+
+def without_zones(world: dict) -> dict:
+    return {key: value for key, value in world.items() if key != "zones"}
+
+
+WORLDS = {
+    "full": full_world(),
+    "no_zones": without_zones(full_world()),
+    "empty_zones": {**full_world(), "zones": []},
+    "empty": {**without_zones(full_world()), "entities": []},
+}
+
+META = {"world_id": "w-1", "version": 3, "pending": False, "stats": {"이름": "값"}}
+
+
+def float32_rounded(value):
+    """바이너리 전송 후 기대값 (모든 실수를 float32로 반올림)"""
+    if isinstance(value, float):
+        return float(np.float32(value))
+    if isinstance(value, (list, tuple)):
+        return [float32_rounded(v) for v in value]
+    if isinstance(value, dict):
+        return {k: float32_rounded(v) for k, v in value.items()}
+    return value
+
+
+def expected_dict(world: dict) -> dict:
+    spec = WorldSpec.model_validate(world)
+    return float32_rounded(spec.model_dump(mode="json", by_alias=True, exclude_none=True))
+
+
+def tag_offsets(data: bytes) -> dict[str, int]:
+    """엔티티 태그 구역(assetType/flags/codes/roles)과 id 참조 구역의 시작 오프셋"""
+    _, _, _, count, string_count, string_bytes, *_ = _HEADER.unpack_from(data)
+    offset = _HEADER.size + _WORLD.size + 4 * (string_count + 1)
+    offset += string_bytes + (-string_bytes % 4)
+    step = count + (-count % 4)
+    return {name: offset + i * step for i, name in enumerate(("asset_type", "flags", "codes", "roles", "ids"))}
+
+
+def patched(data: bytes, offset: int, value: int) -> bytes:
+    data = bytearray(data)
+    data[offset] = value
+    return bytes(data)
+
+
+def invalid_inputs() -> dict[str, bytes]:
+    """디코더가 거부해야 하는 입력 (이름 → 바이너리)"""
+    world = full_world()
+    data = encode_world(world)
+    tags = tag_offsets(data)
+    kinds = [entity["assetType"] for entity in world["entities"]]
+    primitive, splat = kinds.index("primitive"), len(kinds) - 2  # 마지막 앞 splat은 format 있음
+    role = next(i for i, entity in enumerate(world["entities"]) if entity.get("role"))
+    header = _HEADER.unpack_from(data)
+    string_count = header[4]
+    return {
+        "magic": b"XXXX" + data[4:],
+        "version": data[:4] + struct.pack("<H", 99) + data[6:],
+        "asset_type": patched(data, tags["asset_type"], 3),
+        "primitive": patched(data, tags["codes"] + primitive, len(PRIMITIVES)),
+        "role": patched(data, tags["roles"] + role, len(ROLES)),
+        "format": patched(data, tags["codes"] + splat, len(SPLAT_FORMATS)),
+        # 첫 엔티티 id가 문자열 테이블 밖을 가리킴
+        "string_index": data[:tags["ids"]] + struct.pack("<I", string_count) + data[tags["ids"] + 4:],
+        # 헤더의 name 개수와 FLAG_NAME 엔티티 수가 다름
+        "name_count": _HEADER.pack(*header[:6], header[6] - 1, *header[7:]) + data[_HEADER.size:],
+    }
+
+
+# ============================================================================
+# Python encoder / decoder
+# ============================================================================
+
+@pytest.mark.parametrize("name", WORLDS)
+def test_round_trip(name):
+    world = WORLDS[name]
+    expected = expected_dict(world)
+    store, meta = decode_world(encode_world(world))
+    assert meta is None
+    assert store.to_dict() == expected
+    assert store.to_spec() == WorldSpec.model_validate(expected)
+
+
+def test_zones_presence_is_kept():
+    assert decode_world(encode_world(WORLDS["no_zones"]))[0].zones is None
+    assert decode_world(encode_world(WORLDS["empty_zones"]))[0].zones == []
+
+
+def test_every_enum_value_survives():
+    store, _ = decode_world(encode_world(full_world()))
+    entities = store.to_dict()["entities"]
+    assert {entity["primitive"] for entity in entities if entity["assetType"] == "primitive"} == set(PRIMITIVES)
+    assert {entity.get("role") for entity in entities} >= set(ROLES)
+    assert {entity.get("format") for entity in entities if entity["assetType"] == "splat"} == {*SPLAT_FORMATS, None}
+    assert [len(entity.get("lods", [])) for entity in entities if entity["assetType"] == "glb"] == [0, 1, 2, 0]
+
+
+def test_meta_round_trip():
+    _, meta = decode_world(encode_world(full_world(), META))
+    assert meta == META
+
+
+def test_encode_store_matches_dict():
+    world = full_world()
+    assert encode_world(WorldStore.from_dict(world), META) == encode_world(world, META)
+
+
+def test_reencode_is_stable():
+    data = encode_world(full_world(), META)
+    store, meta = decode_world(data)
+    assert encode_world(store, meta) == data
+
+
+def test_instanced_world_is_expanded():
+    world = full_world()
+    world["entities"] += [
+        {"id": f"row_{i}", "position": [i * 1.5, 0.0, 4.0], "rotation": [0.0, (i + 1) * 0.25, 0.0], "assetType": "glb", "src": "/assets/models/m0.glb"}
+        for i in range(5)
+    ]
+    world = expected_dict(world)
+    instanced = instance_world(world, min_count=4)
+    assert any(entity["assetType"] == "instanced" for entity in instanced["entities"])
+    by_id = lambda entities: sorted(entities, key=lambda entity: entity["id"])  # noqa: E731
+    for store in (WorldStore.from_dict(instanced), WorldStore.from_spec(WorldSpec.model_validate(instanced))):
+        assert by_id(store.to_dict()["entities"]) == by_id(world["entities"])
+
+
+@pytest.mark.parametrize("with_meta", [False, True])
+def test_truncated_input_is_rejected(with_meta):
+    data = encode_world(full_world(), META if with_meta else None)
+    for size in range(len(data)):
+        with pytest.raises(ValueError):
+            decode_world(data[:size])
+
+
+@pytest.mark.parametrize("name", invalid_inputs())
+def test_invalid_input_is_rejected(name):
+    with pytest.raises(ValueError):
+        decode_world(invalid_inputs()[name])
+
+
+# ============================================================================
+# Client decoder (client/src/types/world_spec.ts)
+# ============================================================================
+
+def node_command() -> list[str]:
+    """TS 디코더를 불러올 수 있는 node 명령 (없으면 테스트 건너뜀)"""
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node not found")
+    if (CLIENT_DIR / "node_modules" / "typescript").is_dir():
+        return [node]
+    probe = subprocess.run([node, "--experimental-strip-types", "-e", ""], capture_output=True)
+    if probe.returncode == 0:
+        return [node, "--experimental-strip-types", "--no-warnings"]
+    pytest.skip("node < 22.6 without client/node_modules/typescript (run npm install in client/)")
+
+
+@pytest.fixture(scope="module")
+def client_cases(tmp_path_factory) -> tuple[Path, dict]:
+    """node 하네스 입력 - 이름 → (바이너리 파일, 기대 결과 또는 None=오류)"""
+    tmp = tmp_path_factory.mktemp("world_binary")
+    cases = {}
+    for name, world in WORLDS.items():
+        cases[name] = (encode_world(world), {"worldSpec": expected_dict(world)})
+    cases["meta"] = (encode_world(full_world(), META), {"worldSpec": expected_dict(full_world()), "meta": META})
+    data = encode_world(full_world(), META)
+    for size in range(0, len(data), 7):
+        cases[f"truncated_{size}"] = (data[:size], None)
+    cases["truncated_last"] = (data[:-1], None)
+    for name, invalid in invalid_inputs().items():
+        cases[f"invalid_{name}"] = (invalid, None)
+
+    manifest = {}
+    for name, (binary, expected) in cases.items():
+        path = tmp / f"{name}.bin"
+        path.write_bytes(binary)
+        manifest[name] = str(path)
+    manifest_path = tmp / "cases.json"
+    manifest_path.write_text(json.dumps(manifest))
+    return manifest_path, {name: expected for name, (_, expected) in cases.items()}
+
+
+@pytest.mark.parametrize("decoder", DECODERS, ids=lambda path: path.relative_to(PROJECT_ROOT).as_posix())
+def test_client_decoder(decoder, client_cases):
+    manifest_path, expected = client_cases
+    result = subprocess.run(
+        [*node_command(), str(NODE_HARNESS), str(decoder), str(CLIENT_DIR), str(manifest_path)],
+        capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    decoded = json.loads(result.stdout)
+
+    assert decoded.keys() == expected.keys()
+    for name, want in expected.items():
+        got = decoded[name]
+        if want is None:
+            assert "error" in got, f"{name}: decoded without error"
+        else:
+            assert got == want, f"{name}: decoded world differs"
@@ -0,0 +1,47 @@
+// 바이너리 WorldSpec 클라이언트 디코더 하네스 (tests/test_world_binary.py에서 실행)
+//   node world_binary_decoder.mjs <decoder.ts> <client 디렉토리> <cases.json>
+// cases.json(이름 → .bin 경로)의 각 파일을 decodeWorldSpecBinary로 읽어
+// 이름 → {worldSpec, meta} 또는 {error}를 JSON으로 출력합니다.
+// client/node_modules에 typescript가 있으면 트랜스파일해서 불러오고 (node 20),
+// 없으면 .ts를 그대로 import합니다 (node >= 22.6 --experimental-strip-types).
+import { mkdtempSync, readFileSync, rmSync, writeFileSync } from "node:fs";
+import { createRequire } from "node:module";
+import { tmpdir } from "node:os";
+import { join, resolve } from "node:path";
+import { pathToFileURL } from "node:url";
+
+const [decoderPath, clientDir, casesPath] = process.argv.slice(2);
+
+async function loadDecoder() {
+  let ts;
+  try {
+    ts = createRequire(join(resolve(clientDir), "package.json"))("typescript");
+  } catch {
+    return import(pathToFileURL(resolve(decoderPath)).href);
+  }
+  const { outputText } = ts.transpileModule(readFileSync(decoderPath, "utf8"), {
+    compilerOptions: { module: ts.ModuleKind.ESNext, target: ts.ScriptTarget.ES2022 },
+  });
+  const dir = mkdtempSync(join(tmpdir(), "world-spec-"));
+  try {
+    const file = join(dir, "world_spec.mjs");
+    writeFileSync(file, outputText);
+    return await import(pathToFileURL(file).href);
+  } finally {
+    rmSync(dir, { recursive: true, force: true });
+  }
+}
+
+const { decodeWorldSpecBinary } = await loadDecoder();
+const results = {};
+for (const [name, path] of Object.entries(JSON.parse(readFileSync(casesPath, "utf8")))) {
+  const file = readFileSync(path);
+  const buffer = file.buffer.slice(file.byteOffset, file.byteOffset + file.byteLength);
+  try {
+    const { worldSpec, meta } = decodeWorldSpecBinary(buffer);
+    results[name] = meta === undefined ? { worldSpec } : { worldSpec, meta };
+  } catch (error) {
+    results[name] = { error: String(error) };
+  }
+}
+console.log(JSON.stringify(results));